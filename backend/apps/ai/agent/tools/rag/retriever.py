@@ -6,14 +6,22 @@ import re
 from typing import Any
 
 import openai
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db import connection, transaction
+from django.db.models import OuterRef, Q, Subquery, prefetch_related_objects
 from pgvector.django.functions import CosineDistance
 
 from apps.ai.common.constants import (
     DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
+    DEFAULT_HNSW_EF_SEARCH,
     DEFAULT_SIMILARITY_THRESHOLD,
 )
+from apps.ai.common.utils import create_embeddings
 from apps.ai.models.chunk import Chunk
+from apps.owasp.models.project import Project
+from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
+from apps.slack.models.message import Message
 
 logger = logging.getLogger(__name__)
 
@@ -57,11 +65,12 @@ class Retriever:
 
         """
         try:
-            response = self.openai_client.embeddings.create(
-                input=[query],
+            return create_embeddings(
+                [query],
+                self.openai_client,
                 model=self.embedding_model,
-            )
-            return response.data[0].embedding
+                cache_timeout=settings.AI_QUERY_EMBEDDING_CACHE_TIME_SECONDS,
+            )[0]
         except openai.OpenAIError:
             logger.exception("OpenAI API error")
             raise
@@ -125,7 +134,11 @@ class Retriever:
                     "created_at": getattr(entity, "created_at", None),
                     "updated_at": getattr(entity, "updated_at", None),
                     "released_at": getattr(entity, "released_at", None),
-                    "health_score": getattr(entity, "health_score", None),
+                    "health_score": (
+                        entity.latest_health_score
+                        if hasattr(entity, "latest_health_score")
+                        else getattr(entity, "health_score", None)
+                    ),
                     "is_active": getattr(entity, "is_active", None),
                     "track_issues": getattr(entity, "track_issues", None),
                     "url": getattr(entity, "url", None),
@@ -187,6 +200,7 @@ class Retriever:
         limit: int = DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
         similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
         content_types: list[str] | None = None,
+        ef_search: int = DEFAULT_HNSW_EF_SEARCH,
     ) -> list[dict[str, Any]]:
         """Retrieve the most relevant chunks based on vector similarity.
 
@@ -195,6 +209,8 @@ class Retriever:
             limit: The maximum number of chunks to retrieve.
             similarity_threshold: The minimum similarity score (0-1).
             content_types: An optional list of content types to filter by.
+            ef_search: The HNSW index search candidates list size, higher values
+                trade latency for recall.
 
         Returns:
             A list of dictionaries, each containing chunk text and rich metadata.
@@ -203,9 +219,7 @@ class Retriever:
         query_embedding = self.get_query_embedding(query)
         if not content_types:
             content_types = self.extract_content_types_from_query(query)
-        queryset = Chunk.objects.annotate(
-            similarity=1 - CosineDistance("embedding", query_embedding)
-        ).filter(similarity__gte=similarity_threshold)
+        queryset = Chunk.objects.annotate(distance=CosineDistance("embedding", query_embedding))
         if content_types:
             content_type_query = Q()
             for name in content_types:
@@ -220,7 +234,15 @@ class Retriever:
                     content_type_query |= Q(context__entity_type__model=lower_name)
             queryset = queryset.filter(content_type_query)
 
-        chunks = queryset.select_related("context__entity_type").order_by("-similarity")[:limit]
+        chunks = self.search_chunks(
+            queryset.select_related("context__entity_type").order_by("distance"),
+            limit,
+            ef_search=ef_search,
+            is_filtered=bool(content_types),
+        )
+
+        chunks = [chunk for chunk in chunks if 1 - chunk.distance >= similarity_threshold]
+        self.prefetch_entities(chunks)
 
         results = []
         for chunk in chunks:
@@ -234,7 +256,7 @@ class Retriever:
             results.append(
                 {
                     "text": chunk.text,
-                    "similarity": float(chunk.similarity),
+                    "similarity": float(1 - chunk.distance),
                     "source_type": chunk.context.entity_type.model,
                     "source_name": source_name,
                     "source_id": chunk.context.entity_id,
@@ -244,6 +266,75 @@ class Retriever:
 
         return results
 
+    def prefetch_entities(self, chunks: list[Chunk]) -> None:
+        """Prefetch chunk context entities with a query per content type.
+
+        Relations and the project health score used by `get_additional_context` are
+        loaded along with the entities.
+
+        Args:
+            chunks: The chunks to prefetch entities for.
+
+        """
+        prefetch_related_objects(
+            chunks,
+            GenericPrefetch(
+                "context__entity",
+                [
+                    Message.objects.select_related(
+                        "author",
+                        "conversation",
+                        "parent_message",
+                    ),
+                    Project.objects.annotate(
+                        latest_health_score=Subquery(
+                            ProjectHealthMetrics.objects.filter(project=OuterRef("pk"))
+                            .order_by("-nest_created_at")
+                            .values("score")[:1]
+                        )
+                    ),
+                ],
+            ),
+        )
+
+    def search_chunks(
+        self,
+        queryset,
+        limit: int,
+        *,
+        ef_search: int = DEFAULT_HNSW_EF_SEARCH,
+        is_filtered: bool = False,
+    ) -> list[Chunk]:
+        """Get the nearest chunks using the embedding HNSW index.
+
+        The similarity threshold can't be applied in the query as the index is only
+        used for `ORDER BY distance LIMIT k` queries, so it's applied to the results.
+
+        Args:
+            queryset: The chunks ordered by distance to the query embedding.
+            limit: The maximum number of chunks to retrieve.
+            ef_search: The HNSW index search candidates list size.
+            is_filtered: Whether the chunks are filtered by content type.
+
+        Returns:
+            The nearest chunks ordered by distance.
+
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            # The index returns at most ef_search rows, so it can't be lower than limit.
+            cursor.execute(
+                "SELECT set_config('hnsw.ef_search', %s, true)",
+                [str(max(ef_search, limit))],
+            )
+            if is_filtered:
+                # Keep scanning the index until enough rows match the filter.
+                cursor.execute("SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true)")
+
+            chunks = list(queryset[:limit])
+
+        # Iterative scans may return slightly out of order results.
+        return sorted(chunks, key=lambda chunk: chunk.distance)
+
     def extract_content_types_from_query(self, query: str) -> list[str]:
         """Scan the query for keywords matching supported content types.
 
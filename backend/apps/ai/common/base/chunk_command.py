@@ -1,14 +1,20 @@
 """Base chunk command class for creating chunks."""
 
+import logging
+
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Max, Model
+from django.db.models import Model
+from openai import OpenAIError
 
+from apps.ai.common import embedding_cache
 from apps.ai.common.base.ai_command import BaseAICommand
-from apps.ai.common.utils import create_chunks_and_embeddings
+from apps.ai.common.utils import create_embeddings
 from apps.ai.models.chunk import Chunk
 from apps.ai.models.context import Context
 from apps.common.utils import is_valid_json
 
+logger = logging.getLogger(__name__)
+
 
 class BaseChunkCommand(BaseAICommand):
     """Base class for chunk creation commands."""
@@ -18,9 +24,15 @@ class BaseChunkCommand(BaseAICommand):
         return f"Create or update chunks for OWASP {self.entity_name} data"
 
     def process_chunks_batch(self, entities: list[Model]) -> int:
-        """Process a batch of entities to create or update chunks."""
-        processed = 0
-        batch_chunks_to_create = []
+        """Process a batch of entities to create or update chunks.
+
+        Entities whose context content hasn't changed since the last chunking are skipped.
+        Contexts that yield no chunks have their content hash recorded as well.
+        Otherwise only new chunk texts are embedded and only vanished ones are deleted.
+        New chunk texts of the whole batch are embedded together.
+        """
+        chunked_contexts = []
+        pending_chunk_texts: list[tuple[str, Context, list[str]]] = []
         content_type = ContentType.objects.get_for_model(self.model_class)
 
         for entity in entities:
@@ -33,52 +45,77 @@ class BaseChunkCommand(BaseAICommand):
                 )
                 continue
 
-            latest_chunk_timestamp = context.chunks.aggregate(
-                latest_created=Max("nest_created_at")
-            )["latest_created"]
-
-            if not latest_chunk_timestamp or context.nest_updated_at > latest_chunk_timestamp:
-                self.stdout.write(f"Context for {entity_key} requires chunk creation/update")
+            if context.has_up_to_date_chunks:
+                self.stdout.write(f"Chunks for {entity_key} are already up to date.")
+                continue
 
-                if latest_chunk_timestamp:
-                    count, _ = context.chunks.all().delete()
-                    self.stdout.write(f"Deleted {count} stale chunks for {entity_key}")
+            self.stdout.write(f"Context for {entity_key} requires chunk creation/update")
 
-                content, metadata_content = self.extract_content(entity)
+            content, metadata_content = self.extract_content(entity)
 
-                if is_valid_json(content):
-                    full_content = content
-                else:
-                    full_content = (
-                        f"{metadata_content}\n\n{content}" if metadata_content else content
+            if is_valid_json(content):
+                full_content = content
+            else:
+                full_content = f"{metadata_content}\n\n{content}" if metadata_content else content
+
+            # Contexts without chunks still go through the stale chunk cleanup below
+            # and get their content hash recorded so they aren't re-processed next run.
+            unique_chunk_texts: set[str] = set()
+            if not full_content.strip():
+                self.stdout.write(f"No content to chunk for {self.entity_name} {entity_key}")
+            elif not (unique_chunk_texts := set(Chunk.split_text(full_content))):
+                self.stdout.write(f"No chunks created for {self.entity_name} {entity_key}")
+
+            existing_chunk_ids = dict(context.chunks.values_list("text", "id"))
+            if stale_chunk_ids := [
+                chunk_id
+                for text, chunk_id in existing_chunk_ids.items()
+                if text not in unique_chunk_texts
+            ]:
+                count, _ = context.chunks.filter(id__in=stale_chunk_ids).delete()
+                self.stdout.write(f"Deleted {count} stale chunks for {entity_key}")
+
+            if new_chunk_texts := unique_chunk_texts - existing_chunk_ids.keys():
+                pending_chunk_texts.append((entity_key, context, sorted(new_chunk_texts)))
+            else:
+                chunked_contexts.append(context)
+                self.stdout.write(f"No new chunks for {entity_key}")
+
+        if pending_chunk_texts:
+            try:
+                embeddings = iter(
+                    create_embeddings(
+                        [text for _, _, texts in pending_chunk_texts for text in texts],
+                        self.openai_client,
                     )
-
-                if not full_content.strip():
-                    self.stdout.write(f"No content to chunk for {self.entity_name} {entity_key}")
-                    continue
-
-                if not (unique_chunk_texts := set(Chunk.split_text(full_content))):
-                    self.stdout.write(f"No chunks created for {self.entity_name} {entity_key}")
-                    continue
-
-                if chunks := create_chunks_and_embeddings(
-                    chunk_texts=list(unique_chunk_texts),
-                    context=context,
-                    openai_client=self.openai_client,
-                    save=False,
-                ):
-                    batch_chunks_to_create.extend(chunks)
-                    processed += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f"Created {len(chunks)} new chunks for {entity_key}")
+                )
+            except OpenAIError:
+                logger.exception("Failed to create embeddings")
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Failed to create embeddings for {len(pending_chunk_texts)} "
+                        f"{self.entity_name_plural}"
                     )
+                )
             else:
-                self.stdout.write(f"Chunks for {entity_key} are already up to date.")
+                batch_chunks_to_create: list[Chunk] = []
+                for entity_key, context, texts in pending_chunk_texts:
+                    batch_chunks_to_create.extend(
+                        Chunk(context_id=context.id, embedding=next(embeddings), text=text)
+                        for text in texts
+                    )
+                    chunked_contexts.append(context)
+                    self.stdout.write(
+                        self.style.SUCCESS(f"Created {len(texts)} new chunks for {entity_key}")
+                    )
+
+                Chunk.bulk_save(batch_chunks_to_create)
 
-        if batch_chunks_to_create:
-            Chunk.bulk_save(batch_chunks_to_create)
+        for context in chunked_contexts:
+            context.chunks_content_hash = context.content_hash
+            context.save(update_fields=["chunks_content_hash"])
 
-        return processed
+        return len(chunked_contexts)
 
     def handle(self, *args, **options):
         """Handle the chunk creation command."""
@@ -88,8 +125,10 @@ class BaseChunkCommand(BaseAICommand):
         queryset = self.get_queryset(options)
         batch_size = options["batch_size"]
 
+        embedding_cache.stats.reset()
         self.handle_batch_processing(
             queryset=queryset,
             batch_size=batch_size,
             process_batch_func=self.process_chunks_batch,
         )
+        self.stdout.write(f"Embedding cache: {embedding_cache.stats}")
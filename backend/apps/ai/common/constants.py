@@ -1,11 +1,16 @@
 """AI app constants."""
 
 DEFAULT_CHUNKS_RETRIEVAL_LIMIT = 32
-DEFAULT_LAST_REQUEST_OFFSET_SECONDS = 2
+DEFAULT_HNSW_EF_SEARCH = 100
 DEFAULT_MAX_ITERATIONS = 3
 DEFAULT_REASONING_MODEL = "gpt-4o"
 DEFAULT_SIMILARITY_THRESHOLD = 0.1
 DELIMITER = "\n\n"
-GITHUB_REQUEST_INTERVAL_SECONDS = 0.5
-MIN_REQUEST_INTERVAL_SECONDS = 1.2
+EMBEDDING_MAX_INPUTS_PER_REQUEST = 2048
+EMBEDDING_MAX_RETRIES = 5
+EMBEDDING_MAX_TOKENS_PER_REQUEST = 300_000
+EMBEDDING_RETRY_DELAY_SECONDS = 1
+GITHUB_REQUESTS_BURST = 10
+GITHUB_REQUESTS_PER_SECOND = 5
+GITHUB_REQUESTS_WORKERS = 8
 QUEUE_RESPONSE_TIME_MINUTES = 1
@@ -0,0 +1,113 @@
+"""AI embedding cache.
+
+Embeddings are stored in the dedicated `embeddings` cache so that clearing the default
+cache does not force them to be recomputed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+
+class EmbeddingCacheStats:
+    """Thread-safe embedding cache counters."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.counter: Counter = Counter()
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Return human readable representation."""
+        return (
+            f"{self.counter['hits']} hits, "
+            f"{self.counter['misses']} misses ({self.hit_rate:.1%} hit rate)"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the cache hit rate."""
+        total = self.counter["hits"] + self.counter["misses"]
+        return self.counter["hits"] / total if total else 0.0
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): The counter name.
+            value (int, optional): The increment value.
+
+        """
+        with self.lock:
+            self.counter[name] += value
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        with self.lock:
+            self.counter.clear()
+
+
+cache = ConnectionProxy(caches, "embeddings")
+stats = EmbeddingCacheStats()
+
+
+def get_cache_key(text: str, model: str) -> str:
+    """Get cache key for the text embedding.
+
+    Args:
+        text (str): The embedded text.
+        model (str): The embedding model.
+
+    Returns:
+        str: The cache key.
+
+    """
+    return (
+        f"{settings.AI_EMBEDDING_CACHE_PREFIX}-{model}-{hashlib.sha256(text.encode()).hexdigest()}"
+    )
+
+
+def get_embeddings(texts: list[str], model: str) -> dict[str, list[float]]:
+    """Get cached embeddings.
+
+    Args:
+        texts (list[str]): The texts to look up.
+        model (str): The embedding model.
+
+    Returns:
+        dict[str, list[float]]: The cached embeddings by text.
+
+    """
+    keys = {get_cache_key(text, model): text for text in set(texts)}
+    embeddings = {keys[key]: embedding for key, embedding in cache.get_many(keys).items()}
+
+    stats.increment("hits", len(embeddings))
+    stats.increment("misses", len(keys) - len(embeddings))
+
+    return embeddings
+
+
+def set_embeddings(
+    embeddings: dict[str, list[float]],
+    model: str,
+    timeout: int | None = None,
+) -> None:
+    """Cache embeddings.
+
+    Args:
+        embeddings (dict[str, list[float]]): The embeddings by text.
+        model (str): The embedding model.
+        timeout (int, optional): The cache timeout in seconds.
+            Defaults to settings.AI_EMBEDDING_CACHE_TIME_SECONDS.
+
+    """
+    cache.set_many(
+        {get_cache_key(text, model): list(embedding) for text, embedding in embeddings.items()},
+        timeout=timeout or settings.AI_EMBEDDING_CACHE_TIME_SECONDS,
+    )
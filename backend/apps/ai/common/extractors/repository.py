@@ -2,14 +2,41 @@
 
 import json
 import logging
-import time
-
-from apps.ai.common.constants import DELIMITER, GITHUB_REQUEST_INTERVAL_SECONDS
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.ai.common.constants import (
+    DELIMITER,
+    GITHUB_REQUESTS_BURST,
+    GITHUB_REQUESTS_PER_SECOND,
+    GITHUB_REQUESTS_WORKERS,
+)
+from apps.common.rate_limiter import TokenBucket
 from apps.common.utils import is_valid_json
 from apps.github.utils import get_repository_file_content
 
 logger = logging.getLogger(__name__)
 
+# Shared by all extractions to stay within GitHub limits.
+rate_limiter = TokenBucket(rate=GITHUB_REQUESTS_PER_SECOND, capacity=GITHUB_REQUESTS_BURST)
+
+
+def fetch_file_content(url: str) -> str | None:
+    """Fetch repository file content respecting the GitHub rate limit.
+
+    Args:
+        url (str): The file URL.
+
+    Returns:
+        str or None: The file content or None if fetching failed.
+
+    """
+    rate_limiter.acquire()
+    try:
+        return get_repository_file_content(url)
+    except (ValueError, TypeError, OSError):
+        logger.debug("Failed to fetch markdown file")
+        return None
+
 
 def extract_repository_content(repository) -> tuple[str, str]:
     """Extract structured content from repository data.
@@ -122,39 +149,33 @@ def extract_repository_content(repository) -> tuple[str, str]:
         owner = repository.owner.login if repository.owner else ""
     branch = repository.default_branch or "main"
 
-    tab_files = []
-    if owner and repository.key:
-        contents_url = (
-            f"https://api.github.com/repos/{owner}/{repository.key}/contents/?ref={branch}"
-        )
-        response = get_repository_file_content(contents_url)
-        if response and is_valid_json(response):
-            items = json.loads(response)
-            for item in items:
-                if isinstance(item, dict):
-                    name = item.get("name", "")
-                    if name.startswith("tab_") and name.endswith(".md"):
-                        tab_files.append(name)
-
-    all_markdown_files = markdown_files + tab_files
-
     markdown_content = {}
-    for file_path in all_markdown_files:
-        try:
-            if owner and repository.key:
-                raw_url = (
-                    f"https://raw.githubusercontent.com/{owner}/{repository.key}/"
-                    f"{branch}/{file_path}"
-                )
-                content = get_repository_file_content(raw_url)
-
+    if owner and repository.key:
+        raw_url = f"https://raw.githubusercontent.com/{owner}/{repository.key}/{branch}"
+        with ThreadPoolExecutor(max_workers=GITHUB_REQUESTS_WORKERS) as executor:
+            futures = {
+                file_path: executor.submit(fetch_file_content, f"{raw_url}/{file_path}")
+                for file_path in markdown_files
+            }
+
+            contents_url = (
+                f"https://api.github.com/repos/{owner}/{repository.key}/contents/?ref={branch}"
+            )
+            response = fetch_file_content(contents_url)
+            if response and is_valid_json(response):
+                items = json.loads(response)
+                for item in items:
+                    if isinstance(item, dict):
+                        name = item.get("name", "")
+                        if name.startswith("tab_") and name.endswith(".md"):
+                            futures[name] = executor.submit(
+                                fetch_file_content, f"{raw_url}/{name}"
+                            )
+
+            for file_path, future in futures.items():
+                content = future.result()
                 if content and content.strip():
                     markdown_content[file_path] = content
-                time.sleep(GITHUB_REQUEST_INTERVAL_SECONDS)
-
-        except (ValueError, TypeError, OSError):
-            logger.debug("Failed to fetch markdown file")
-            continue
 
     if markdown_content:
         repository_data["markdown_content"] = markdown_content
@@ -2,13 +2,16 @@
 
 import logging
 import time
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterator
 
-from openai import OpenAI, OpenAIError
+from openai import OpenAI, OpenAIError, RateLimitError
 
+from apps.ai.common import embedding_cache
 from apps.ai.common.constants import (
-    DEFAULT_LAST_REQUEST_OFFSET_SECONDS,
-    MIN_REQUEST_INTERVAL_SECONDS,
+    EMBEDDING_MAX_INPUTS_PER_REQUEST,
+    EMBEDDING_MAX_RETRIES,
+    EMBEDDING_MAX_TOKENS_PER_REQUEST,
+    EMBEDDING_RETRY_DELAY_SECONDS,
 )
 from apps.ai.models.chunk import Chunk
 from apps.ai.models.context import Context
@@ -43,19 +46,7 @@ def create_chunks_and_embeddings(
     from apps.ai.models.chunk import Chunk
 
     try:
-        last_request_time = datetime.now(UTC) - timedelta(
-            seconds=DEFAULT_LAST_REQUEST_OFFSET_SECONDS
-        )
-        time_since_last_request = datetime.now(UTC) - last_request_time
-
-        if time_since_last_request < timedelta(seconds=MIN_REQUEST_INTERVAL_SECONDS):
-            time.sleep(MIN_REQUEST_INTERVAL_SECONDS - time_since_last_request.total_seconds())
-
-        response = openai_client.embeddings.create(
-            input=chunk_texts,
-            model=model,
-        )
-        embeddings = [d.embedding for d in response.data]
+        embeddings = create_embeddings(chunk_texts, openai_client, model=model)
 
         chunks = []
         for text, embedding in zip(chunk_texts, embeddings, strict=True):
@@ -70,6 +61,86 @@ def create_chunks_and_embeddings(
         return chunks
 
 
+def create_embeddings(
+    texts: list[str],
+    openai_client,
+    model: str = "text-embedding-3-small",
+    *,
+    cache_timeout: int | None = None,
+) -> list[list[float]]:
+    """Create embeddings for texts using as few OpenAI requests as possible.
+
+    Cached embeddings are reused and only the missing ones are requested.
+    Rate limited requests are retried with exponential backoff.
+
+    Args:
+        texts (list[str]): List of texts to embed
+        openai_client: Initialized OpenAI client
+        model (str): Embedding model to use
+        cache_timeout (int, optional): Cache timeout in seconds for new embeddings
+
+    Returns:
+        list[list[float]]: Embeddings in the order of the given texts
+
+    Raises:
+        OpenAIError: If a request fails or keeps being rate limited
+
+    """
+    embeddings = embedding_cache.get_embeddings(texts, model)
+    missing_texts = list(dict.fromkeys(text for text in texts if text not in embeddings))
+
+    for batch in get_embedding_batches(missing_texts):
+        for attempt in range(EMBEDDING_MAX_RETRIES + 1):
+            try:
+                response = openai_client.embeddings.create(input=batch, model=model)
+                break
+            except RateLimitError:
+                if attempt == EMBEDDING_MAX_RETRIES:
+                    raise
+                delay = EMBEDDING_RETRY_DELAY_SECONDS * 2**attempt
+                logger.warning("Embeddings request rate limited, retrying in %s seconds", delay)
+                time.sleep(delay)
+
+        batch_embeddings = dict(
+            zip(batch, (d.embedding for d in response.data), strict=True),
+        )
+        embedding_cache.set_embeddings(batch_embeddings, model, timeout=cache_timeout)
+        embeddings.update(batch_embeddings)
+
+    return [embeddings[text] for text in texts]
+
+
+def get_embedding_batches(texts: list[str]) -> Iterator[list[str]]:
+    """Pack texts into batches that fit into a single embeddings request.
+
+    The UTF-8 byte length of a text is used as an upper bound of its token count.
+
+    Args:
+        texts (list[str]): List of texts to pack
+
+    Yields:
+        list[str]: Batch of texts
+
+    """
+    batch: list[str] = []
+    batch_tokens = 0
+    for text in texts:
+        text_tokens = len(text.encode())
+        if batch and (
+            len(batch) == EMBEDDING_MAX_INPUTS_PER_REQUEST
+            or batch_tokens + text_tokens > EMBEDDING_MAX_TOKENS_PER_REQUEST
+        ):
+            yield batch
+            batch = []
+            batch_tokens = 0
+
+        batch.append(text)
+        batch_tokens += text_tokens
+
+    if batch:
+        yield batch
+
+
 def extract_json_from_markdown(content: str) -> str:
     """Extract JSON content from markdown code blocks.
 
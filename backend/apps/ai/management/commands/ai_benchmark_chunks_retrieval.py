@@ -0,0 +1,158 @@
+"""A command to benchmark chunks retrieval latency and recall."""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+EMBEDDING_DIMENSIONS = 1536
+
+RANDOM_VECTOR_SQL = (
+    "(SELECT array_agg((random() * 2 - 1) * %s + 0 * {row}) "  # noqa: S608
+    f"FROM generate_series(1, {EMBEDDING_DIMENSIONS}))::vector"
+)
+
+
+class Command(BaseCommand):
+    """Benchmark approximate nearest neighbor chunks retrieval."""
+
+    help = "Benchmark HNSW index latency and recall on a synthetic embeddings corpus"
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--clusters",
+            type=int,
+            default=100,
+            help="Number of topic clusters in the synthetic corpus",
+        )
+        parser.add_argument(
+            "--ef-search",
+            type=int,
+            nargs="+",
+            default=[10, 20, 40, 100, 200],
+            help="HNSW ef_search values to benchmark",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=10,
+            help="Number of nearest chunks to retrieve",
+        )
+        parser.add_argument(
+            "--noise",
+            type=float,
+            default=0.5,
+            help="Spread of embeddings around their cluster centers",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=100,
+            help="Number of queries to run",
+        )
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=20000,
+            help="Number of embeddings in the synthetic corpus",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        limit = options["limit"]
+        queries_count = options["queries"]
+
+        # Temporary tables are dropped with the transaction and never touch ai_chunks.
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.stdout.write("Generating synthetic corpus...")
+            self.create_table(cursor, "benchmark_centers", options["clusters"])
+            self.create_table(cursor, "benchmark_chunks", options["size"], options["noise"])
+            self.create_table(cursor, "benchmark_queries", queries_count, options["noise"])
+
+            self.stdout.write("Building HNSW index...")
+            started_at = time.perf_counter()
+            cursor.execute(
+                "CREATE INDEX ON benchmark_chunks "
+                "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+            )
+            cursor.execute("ANALYZE benchmark_chunks")
+            self.stdout.write(f"Index built in {time.perf_counter() - started_at:.1f} s")
+
+            cursor.execute("SET LOCAL enable_indexscan = off")
+            exact_results, exact_latency = self.search(cursor, queries_count, limit)
+            cursor.execute("SET LOCAL enable_indexscan = on")
+            self.stdout.write(
+                f"Exact search: latency {exact_latency:.2f} ms, recall@{limit} 1.000"
+            )
+
+            for ef_search in options["ef_search"]:
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+                results, latency = self.search(cursor, queries_count, limit)
+                recall = sum(
+                    len(set(result) & set(exact_result)) / len(exact_result)
+                    for result, exact_result in zip(results, exact_results, strict=True)
+                    if exact_result
+                ) / max(queries_count, 1)
+                self.stdout.write(
+                    f"HNSW ef_search={ef_search}: latency {latency:.2f} ms, "
+                    f"recall@{limit} {recall:.3f}"
+                )
+
+    def create_table(self, cursor, table: str, size: int, noise: float | None = None) -> None:
+        """Create a temporary table of synthetic embeddings.
+
+        Cluster centers are random vectors, other embeddings are randomly spread around them.
+
+        Args:
+            cursor: The database cursor.
+            table (str): The table name.
+            size (int): The number of embeddings.
+            noise (float | None): The spread around cluster centers, None for centers.
+
+        """
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {table} "
+            f"(id integer PRIMARY KEY, embedding vector({EMBEDDING_DIMENSIONS})) ON COMMIT DROP"
+        )
+        if noise is None:
+            cursor.execute(
+                f"INSERT INTO {table} SELECT i, {RANDOM_VECTOR_SQL.format(row='i')} "  # noqa: S608
+                "FROM generate_series(1, %s) i",
+                [1, size],
+            )
+            return
+
+        cursor.execute(
+            f"INSERT INTO {table} "  # noqa: S608
+            f"SELECT i, c.embedding + {RANDOM_VECTOR_SQL.format(row='i')} "
+            "FROM generate_series(1, %s) i "
+            "JOIN benchmark_centers c "
+            "ON c.id = 1 + i %% (SELECT count(*) FROM benchmark_centers)",
+            [noise, size],
+        )
+
+    def search(self, cursor, queries_count: int, limit: int) -> tuple[list[list[int]], float]:
+        """Run nearest neighbor queries.
+
+        Args:
+            cursor: The database cursor.
+            queries_count (int): The number of queries.
+            limit (int): The number of nearest embeddings to retrieve.
+
+        Returns:
+            tuple[list[list[int]], float]: The nearest embedding IDs per query and
+                the mean query latency in milliseconds.
+
+        """
+        results = []
+        started_at = time.perf_counter()
+        for query_id in range(1, queries_count + 1):
+            cursor.execute(
+                "SELECT id FROM benchmark_chunks ORDER BY embedding <=> "
+                "(SELECT embedding FROM benchmark_queries WHERE id = %s) LIMIT %s",
+                [query_id, limit],
+            )
+            results.append([row[0] for row in cursor.fetchall()])
+
+        return results, (time.perf_counter() - started_at) * 1000 / max(queries_count, 1)
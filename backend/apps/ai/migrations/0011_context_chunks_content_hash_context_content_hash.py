@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai", "0010_alter_context_unique_together"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="context",
+            name="chunks_content_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=64, verbose_name="Chunks content hash"
+            ),
+        ),
+        migrations.AddField(
+            model_name="context",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=64, verbose_name="Content hash"
+            ),
+        ),
+    ]
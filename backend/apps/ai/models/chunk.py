@@ -2,7 +2,7 @@
 
 from django.db import models
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
 
 from apps.ai.models.context import Context
 from apps.common.models import BulkSaveModel, TimestampedModel
@@ -14,6 +14,15 @@ class Chunk(TimestampedModel):
 
     class Meta:
         db_table = "ai_chunks"
+        indexes = [
+            HnswIndex(
+                name="chunk_embedding_hnsw_idx",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
+        ]
         verbose_name = "Chunk"
         unique_together = ("context", "text")
 
@@ -1,5 +1,6 @@
 """AI app context model."""
 
+import hashlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -15,7 +16,13 @@ logger = logging.getLogger(__name__)
 class Context(TimestampedModel):
     """Context model for storing generated text related to OWASP entities."""
 
+    chunks_content_hash = models.CharField(
+        verbose_name="Chunks content hash", max_length=64, blank=True, default=""
+    )
     content = models.TextField(verbose_name="Generated Text")
+    content_hash = models.CharField(
+        verbose_name="Content hash", max_length=64, blank=True, default=""
+    )
     entity_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     entity_id = models.PositiveIntegerField()
     entity = GenericForeignKey("entity_type", "entity_id")
@@ -35,6 +42,16 @@ class Context(TimestampedModel):
         )
         return f"{self.entity_type.model} {entity}: {truncate(self.content, 50)}"
 
+    @property
+    def has_up_to_date_chunks(self) -> bool:
+        """Indicate whether chunks were created for the current content."""
+        return bool(self.content_hash) and self.chunks_content_hash == self.content_hash
+
+    @staticmethod
+    def get_content_hash(content: str) -> str:
+        """Return content SHA-256 hash."""
+        return hashlib.sha256(content.encode()).hexdigest()
+
     @staticmethod
     def update_data(
         content: str,
@@ -43,18 +60,26 @@ class Context(TimestampedModel):
         *,
         save: bool = True,
     ) -> "Context":
-        """Create or update context for a given entity."""
+        """Create or update context for a given entity.
+
+        The context is not saved if its content hasn't changed.
+        """
         entity_type = ContentType.objects.get_for_model(entity)
         entity_id = entity.pk
 
+        content_hash = Context.get_content_hash(content)
         try:
             context = Context.objects.get(
                 entity_type=entity_type, entity_id=entity_id, source=source
             )
         except Context.DoesNotExist:
             context = Context(entity_type=entity_type, entity_id=entity_id, source=source)
+        else:
+            if context.content_hash == content_hash:
+                return context
 
         context.content = content
+        context.content_hash = content_hash
 
         if save:
             context.save()
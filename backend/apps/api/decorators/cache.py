@@ -1,11 +1,16 @@
 """Decorator for API Cache."""
 
+import hashlib
+import zlib
+from collections.abc import Iterable
 from functools import wraps
 from http import HTTPStatus
 
 from django.conf import settings
-from django.core.cache import cache
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from apps.common.cache import get_or_set_tagged
 
 
 def generate_key(
@@ -16,15 +21,78 @@ def generate_key(
     return f"{prefix}:{request.get_full_path()}"
 
 
+def get_etag(content: bytes) -> str:
+    """Generate an ETag for response content."""
+    return f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+
+
+def serialize_response(response: HttpResponse) -> tuple | HttpResponse:
+    """Serialize a successful response into a compact cache entry.
+
+    Args:
+        response (HttpResponse): The response to serialize.
+
+    Returns:
+        tuple | HttpResponse: The (status, content type, content, ETag, is compressed)
+            cache entry or the original response if it shouldn't be cached.
+
+    """
+    if response.status_code != HTTPStatus.OK or response.streaming:
+        return response
+
+    content = response.content
+    etag = get_etag(content)
+    is_compressed = len(content) >= settings.API_CACHE_COMPRESSION_MIN_SIZE
+    if is_compressed:
+        content = zlib.compress(content)
+
+    return response.status_code, response["Content-Type"], content, etag, is_compressed
+
+
+def deserialize_response(request: HttpRequest, entry: tuple | HttpResponse) -> HttpResponse:
+    """Build a response from a cache entry.
+
+    Args:
+        request (HttpRequest): The request being answered.
+        entry (tuple | HttpResponse): The cache entry or a non-cacheable response.
+
+    Returns:
+        HttpResponse: The response, 304 if the client already has the content.
+
+    """
+    if isinstance(entry, HttpResponse):
+        return entry
+
+    status, content_type, content, etag, is_compressed = entry
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in etags or "*" in etags:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(
+            zlib.decompress(content) if is_compressed else content,
+            content_type=content_type,
+            status=status,
+        )
+
+    response["ETag"] = etag
+    return response
+
+
 def cache_response(
     ttl: int | None = None,
     prefix: str | None = None,
+    tags: Iterable[str] = (),
 ):
     """Cache API responses for GET and HEAD requests.
 
+    Expired responses are recomputed by a single request while the others are
+    served the stale response. Responses are cached as bytes along with their ETag
+    so that conditional requests are answered with 304 Not Modified.
+
     Args:
         ttl (int): The time-to-live for the cache entry in seconds.
         prefix (str): A prefix for the cache key.
+        tags (Iterable[str]): Cache tags of the entities the response depends on.
 
     """
     if ttl is None:
@@ -39,17 +107,19 @@ def cache_response(
             if request.method not in ("GET", "HEAD"):
                 return view_func(request, *args, **kwargs)
 
-            cache_key = generate_key(
-                request=request,
-                prefix=prefix,
+            return deserialize_response(
+                request,
+                get_or_set_tagged(
+                    generate_key(
+                        request=request,
+                        prefix=prefix,
+                    ),
+                    lambda: serialize_response(view_func(request, *args, **kwargs)),
+                    tags,
+                    timeout=ttl,
+                    is_cacheable=lambda entry: isinstance(entry, tuple),
+                ),
             )
-            if response := cache.get(cache_key):
-                return response
-
-            response = view_func(request, *args, **kwargs)
-            if response.status_code == HTTPStatus.OK:
-                cache.set(cache_key, response, timeout=ttl)
-            return response
 
         return _wrapper
 
@@ -14,6 +14,8 @@ from apps.api.decorators.cache import cache_response
 from apps.api.rest.v0.common import Leader, LocationFilter
 from apps.owasp.models.chapter import Chapter as ChapterModel
 
+CACHE_TAGS = ("owasp.chapter", "owasp.entitymember")
+
 router = RouterPaginated(tags=["Chapters"])
 
 
@@ -72,7 +74,7 @@ class ChapterFilter(LocationFilter):
     response=list[Chapter],
     summary="List chapters",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_chapters(
     request: HttpRequest,
     filters: ChapterFilter = Query(...),
@@ -105,7 +107,7 @@ def list_chapters(
     },
     summary="Get chapter",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_chapter(
     request: HttpRequest,
     chapter_id: str = Path(example="London"),
@@ -13,6 +13,8 @@ from ninja.responses import Response
 from apps.api.decorators.cache import cache_response
 from apps.owasp.models.committee import Committee as CommitteeModel
 
+CACHE_TAGS = ("owasp.committee",)
+
 router = RouterPaginated(tags=["Committees"])
 
 
@@ -53,7 +55,7 @@ class CommitteeError(Schema):
     response=list[Committee],
     summary="List committees",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_committees(
     request: HttpRequest,
     ordering: Literal["created_at", "-created_at", "updated_at", "-updated_at"] | None = Query(
@@ -75,7 +77,7 @@ def list_committees(
     },
     summary="Get committee",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_chapter(
     request: HttpRequest,
     committee_id: str = Path(example="project"),
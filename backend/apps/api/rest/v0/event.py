@@ -14,6 +14,8 @@ from apps.api.decorators.cache import cache_response
 from apps.api.rest.v0.common import LocationFilter
 from apps.owasp.models.event import Event as EventModel
 
+CACHE_TAGS = ("owasp.event",)
+
 router = RouterPaginated(tags=["Events"])
 
 
@@ -52,7 +54,7 @@ class EventError(Schema):
     summary="List events",
     response=list[Event],
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_events(
     request: HttpRequest,
     filters: LocationFilter = Query(...),
@@ -95,7 +97,7 @@ def list_events(
     },
     summary="Get event",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_event(
     request: HttpRequest,
     event_id: str = Path(..., example="owasp-global-appsec-usa-2025-washington-dc"),
@@ -0,0 +1,92 @@
+"""Common bulk export helpers for v0 API."""
+
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import batched
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from ninja import Field, Schema
+
+
+class ExportParams(Schema):
+    """Query parameters for bulk export endpoints."""
+
+    gzip: bool = Field(default=False, description="Whether to gzip the exported data")
+    updated_since: datetime | None = Field(
+        None,
+        description="Only export items updated in Nest since this time",
+        example="2025-01-01T00:00:00Z",
+    )
+
+
+def iter_ndjson(queryset: QuerySet, schema: type[Schema]) -> Iterator[bytes]:
+    """Serialize queryset items as NDJSON lines using a server-side cursor.
+
+    Args:
+        queryset (QuerySet): The items to serialize.
+        schema (type[Schema]): The schema to serialize items with.
+
+    Yields:
+        bytes: The serialized lines of a chunk of items.
+
+    """
+    chunk_size = settings.API_EXPORT_CHUNK_SIZE
+    for items in batched(queryset.iterator(chunk_size=chunk_size), chunk_size, strict=False):
+        yield "".join(f"{schema.from_orm(item).model_dump_json()}\n" for item in items).encode()
+
+
+def iter_gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress chunks into a gzip stream.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks to compress.
+
+    Yields:
+        bytes: The compressed data.
+
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+
+    yield compressor.flush()
+
+
+def export_response(
+    queryset: QuerySet,
+    schema: type[Schema],
+    name: str,
+    params: ExportParams,
+) -> StreamingHttpResponse:
+    """Stream queryset items as an NDJSON file.
+
+    Args:
+        queryset (QuerySet): The items to export.
+        schema (type[Schema]): The schema to serialize items with.
+        name (str): The export file name without extension.
+        params (ExportParams): The export parameters.
+
+    Returns:
+        StreamingHttpResponse: The streamed NDJSON, gzipped if requested.
+
+    """
+    if params.updated_since:
+        queryset = queryset.filter(nest_updated_at__gte=params.updated_since)
+
+    chunks = iter_ndjson(queryset.order_by("id"), schema)
+    filename = f"{name}.ndjson"
+    if params.gzip:
+        chunks = iter_gzip(chunks)
+        filename = f"{filename}.gz"
+
+    response = StreamingHttpResponse(
+        chunks,
+        content_type="application/gzip" if params.gzip else "application/x-ndjson",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    return response
@@ -4,16 +4,20 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Literal
 
-from django.http import HttpRequest
+from django.db.models import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
 from ninja import Field, FilterSchema, Path, Query, Schema
 from ninja.decorators import decorate_view
 from ninja.pagination import RouterPaginated
 from ninja.responses import Response
 
 from apps.api.decorators.cache import cache_response
+from apps.api.rest.v0.export import ExportParams, export_response
 from apps.github.models.generic_issue_model import GenericIssueModel
 from apps.github.models.issue import Issue as IssueModel
 
+CACHE_TAGS = ("github.issue", "github.organization", "github.repository")
+
 router = RouterPaginated(tags=["Issues"])
 
 
@@ -62,6 +66,30 @@ class IssueFilter(FilterSchema):
     )
 
 
+def get_issue_queryset(filters: IssueFilter) -> QuerySet[IssueModel]:
+    """Get issues matching the filters.
+
+    Args:
+        filters (IssueFilter): The issue filters.
+
+    Returns:
+        QuerySet[IssueModel]: The filtered issues.
+
+    """
+    issues = IssueModel.objects.select_related("repository", "repository__organization")
+
+    if filters.organization:
+        issues = issues.filter(repository__organization__login__iexact=filters.organization)
+
+    if filters.repository:
+        issues = issues.filter(repository__name__iexact=filters.repository)
+
+    if filters.state:
+        issues = issues.filter(state=filters.state)
+
+    return issues
+
+
 @router.get(
     "/",
     description="Retrieve a paginated list of GitHub issues.",
@@ -69,7 +97,7 @@ class IssueFilter(FilterSchema):
     response=list[Issue],
     summary="List issues",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_issues(
     request: HttpRequest,
     filters: IssueFilter = Query(...),
@@ -79,17 +107,22 @@ def list_issues(
     ),
 ) -> list[Issue]:
     """Get all issues."""
-    issues = IssueModel.objects.select_related("repository", "repository__organization")
+    return get_issue_queryset(filters).order_by(ordering or "-created_at", "-updated_at")
 
-    if filters.organization:
-        issues = issues.filter(repository__organization__login__iexact=filters.organization)
-
-    if filters.repository:
-        issues = issues.filter(repository__name__iexact=filters.repository)
-    if filters.state:
-        issues = issues.filter(state=filters.state)
 
-    return issues.order_by(ordering or "-created_at", "-updated_at")
+@router.get(
+    "/export",
+    description="Stream all GitHub issues as NDJSON, one issue per line.",
+    operation_id="export_issues",
+    summary="Export issues",
+)
+def export_issues(
+    request: HttpRequest,
+    filters: IssueFilter = Query(...),
+    params: ExportParams = Query(...),
+) -> StreamingHttpResponse:
+    """Export issues."""
+    return export_response(get_issue_queryset(filters), IssueDetail, "issues", params)
 
 
 @router.get(
@@ -102,7 +135,7 @@ def list_issues(
     },
     summary="Get issue",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_issue(
     request: HttpRequest,
     organization_id: str = Path(example="OWASP"),
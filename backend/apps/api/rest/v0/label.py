@@ -10,6 +10,8 @@ from ninja.pagination import RouterPaginated
 from apps.api.decorators.cache import cache_response
 from apps.github.models.label import Label as LabelModel
 
+CACHE_TAGS = ("github.label",)
+
 router = RouterPaginated(tags=["Labels"])
 
 
@@ -47,7 +49,7 @@ class LabelFilter(FilterSchema):
     response=list[Label],
     summary="List labels",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_label(
     request: HttpRequest,
     filters: LabelFilter = Query(...),
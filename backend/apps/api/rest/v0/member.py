@@ -4,15 +4,18 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Literal
 
-from django.http import HttpRequest
+from django.http import HttpRequest, StreamingHttpResponse
 from ninja import Field, FilterSchema, Path, Query, Schema
 from ninja.decorators import decorate_view
 from ninja.pagination import RouterPaginated
 from ninja.responses import Response
 
 from apps.api.decorators.cache import cache_response
+from apps.api.rest.v0.export import ExportParams, export_response
 from apps.github.models.user import User as UserModel
 
+CACHE_TAGS = ("github.user",)
+
 router = RouterPaginated(tags=["Community"])
 
 
@@ -67,7 +70,7 @@ class MemberFilter(FilterSchema):
     response=list[Member],
     summary="List members",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_members(
     request: HttpRequest,
     filters: MemberFilter = Query(...),
@@ -80,6 +83,23 @@ def list_members(
     return filters.filter(UserModel.objects.order_by(ordering or "-created_at"))
 
 
+@router.get(
+    "/export",
+    description="Stream all OWASP community members as NDJSON, one member per line.",
+    operation_id="export_members",
+    summary="Export members",
+)
+def export_members(
+    request: HttpRequest,
+    filters: MemberFilter = Query(...),
+    params: ExportParams = Query(...),
+) -> StreamingHttpResponse:
+    """Export members."""
+    return export_response(
+        filters.filter(UserModel.objects.all()), MemberDetail, "members", params
+    )
+
+
 @router.get(
     "/{str:member_id}",
     description="Retrieve member details.",
@@ -90,7 +110,7 @@ def list_members(
     },
     summary="Get member",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_member(
     request: HttpRequest,
     member_id: str = Path(example="OWASP"),
@@ -14,6 +14,8 @@ from apps.api.decorators.cache import cache_response
 from apps.github.models.generic_issue_model import GenericIssueModel
 from apps.github.models.milestone import Milestone as MilestoneModel
 
+CACHE_TAGS = ("github.milestone", "github.organization", "github.repository")
+
 router = RouterPaginated(tags=["Milestones"])
 
 
@@ -73,7 +75,7 @@ class MilestoneFilter(FilterSchema):
     response=list[Milestone],
     summary="List milestones",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_milestones(
     request: HttpRequest,
     filters: MilestoneFilter = Query(...),
@@ -106,7 +108,7 @@ def list_milestones(
     },
     summary="Get milestone",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_milestone(
     request: HttpRequest,
     organization_id: str = Path(example="OWASP"),
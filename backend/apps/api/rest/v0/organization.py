@@ -13,6 +13,8 @@ from ninja.responses import Response
 from apps.api.decorators.cache import cache_response
 from apps.github.models.organization import Organization as OrganizationModel
 
+CACHE_TAGS = ("github.organization",)
+
 router = RouterPaginated(tags=["Community"])
 
 
@@ -59,7 +61,7 @@ class OrganizationFilter(FilterSchema):
     response=list[Organization],
     summary="List organizations",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_organization(
     request: HttpRequest,
     filters: OrganizationFilter = Query(...),
@@ -86,7 +88,7 @@ def list_organization(
     },
     summary="Get organization",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_organization(
     request: HttpRequest,
     organization_id: str = Path(example="OWASP"),
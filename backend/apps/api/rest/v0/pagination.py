@@ -1,35 +1,133 @@
 """Common pagination classes for v0 API."""
 
+import base64
+import binascii
+import json
+from functools import reduce
+from http import HTTPStatus
+from operator import or_
 from typing import Any
 
+from django.db.models import Q
 from django.http import Http404
 from ninja import Field, Schema
+from ninja.errors import HttpError
 from ninja.pagination import PaginationBase
 
 
+def decode_cursor(cursor: str) -> list:
+    """Decode an opaque cursor into the ordering values of the last seen item."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        message = "Invalid cursor."
+        raise HttpError(HTTPStatus.BAD_REQUEST, message) from e
+
+    if not isinstance(values, list):
+        message = "Invalid cursor."
+        raise HttpError(HTTPStatus.BAD_REQUEST, message)
+
+    return values
+
+
+def encode_cursor(values: list) -> str:
+    """Encode the ordering values of the last seen item into an opaque cursor.
+
+    Values are stringified at full precision, e.g. datetimes keep their microseconds.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps(values, default=str, separators=(",", ":")).encode()
+    ).decode()
+
+
+def get_ordering(queryset) -> list[str]:
+    """Get the queryset ordering fields with the primary key as a tiebreaker."""
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)  # noqa: SLF001
+    if not all(isinstance(field, str) for field in ordering):
+        message = "Cursor pagination is not supported for this ordering."
+        raise HttpError(HTTPStatus.BAD_REQUEST, message)
+
+    if not ordering or ordering[-1].lstrip("-") not in ("id", "pk"):
+        ordering.append(f"{'-' if ordering and ordering[-1].startswith('-') else ''}id")
+
+    return ordering
+
+
+def get_ordering_value(item, field: str):
+    """Get the ordering field value of an item."""
+    return reduce(getattr, field.lstrip("-").split("__"), item)
+
+
+def get_after_filter(ordering: list[str], values: list) -> Q:
+    """Build a filter matching items that come after the cursor values.
+
+    NULL values sort last in ascending and first in descending order, as in PostgreSQL.
+    """
+    conditions = []
+    equal = Q()
+    for field, value in zip(ordering, values, strict=True):
+        name = field.lstrip("-")
+        if value is None:
+            after = Q(**{f"{name}__isnull": False}) if field.startswith("-") else Q(pk__in=[])
+        elif field.startswith("-"):
+            after = Q(**{f"{name}__lt": value})
+        else:
+            after = Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+
+        conditions.append(equal & after)
+        equal &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+    return reduce(or_, conditions)
+
+
 class CustomPagination(PaginationBase):
-    """Custom pagination with standardized output schema."""
+    """Custom pagination with standardized output schema.
+
+    Page number pagination is used by default. Passing a `cursor` (empty for the first
+    page) switches to keyset pagination, which skips counting and offsetting rows.
+    """
 
     items_attribute: str = "items"
 
     class Input(Schema):
         """Input parameters for pagination."""
 
+        cursor: str | None = Field(
+            None,
+            description=(
+                "Cursor for keyset pagination, use an empty value for the first page "
+                "and next_cursor for the following ones"
+            ),
+        )
         page: int = Field(1, ge=1, description="Page number")
         page_size: int = Field(100, ge=1, le=100, description="Number of items per page")
 
     class Output(Schema):
         """Standardized output schema for paginated responses."""
 
-        current_page: int = Field(description="Current page number")
+        current_page: int | None = Field(
+            description="Current page number (not set for cursor pagination)"
+        )
         has_next: bool = Field(description="Whether there is a next page")
-        has_previous: bool = Field(description="Whether there is a previous page")
+        has_previous: bool | None = Field(
+            description="Whether there is a previous page (not set for cursor pagination)"
+        )
         items: list[Any] = Field(description="List of items")
-        total_count: int = Field(description="Total number of items")
-        total_pages: int = Field(description="Total number of pages")
+        next_cursor: str | None = Field(
+            None, description="Cursor of the next page (cursor pagination only)"
+        )
+        total_count: int | None = Field(
+            description="Total number of items (not set for cursor pagination)"
+        )
+        total_pages: int | None = Field(
+            description="Total number of pages (not set for cursor pagination)"
+        )
 
     def paginate_queryset(self, queryset, pagination: Input, **params):
         """Paginate the queryset and return standardized output."""
+        if pagination.cursor is not None:
+            return self.paginate_queryset_by_cursor(queryset, pagination)
+
         page = pagination.page
         page_size = pagination.page_size
 
@@ -56,3 +154,35 @@ class CustomPagination(PaginationBase):
             "total_count": total_count,
             "total_pages": total_pages,
         }
+
+    def paginate_queryset_by_cursor(self, queryset, pagination: Input):
+        """Paginate the queryset using the ordering values of the last seen item."""
+        ordering = get_ordering(queryset)
+        queryset = queryset.order_by(*ordering)
+
+        if pagination.cursor:
+            values = decode_cursor(pagination.cursor)
+            if len(values) != len(ordering):
+                message = "Invalid cursor."
+                raise HttpError(HTTPStatus.BAD_REQUEST, message)
+
+            queryset = queryset.filter(get_after_filter(ordering, values))
+
+        # Fetch one extra item to find out whether there is a next page.
+        items = list(queryset[: pagination.page_size + 1])
+        has_next = len(items) > pagination.page_size
+        items = items[: pagination.page_size]
+
+        return {
+            "current_page": None,
+            "has_next": has_next,
+            "has_previous": None,
+            "items": items,
+            "next_cursor": encode_cursor(
+                [get_ordering_value(items[-1], field) for field in ordering]
+            )
+            if has_next
+            else None,
+            "total_count": None,
+            "total_pages": None,
+        }
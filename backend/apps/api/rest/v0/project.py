@@ -15,6 +15,8 @@ from apps.api.rest.v0.common import Leader
 from apps.owasp.models.enums.project import ProjectLevel
 from apps.owasp.models.project import Project as ProjectModel
 
+CACHE_TAGS = ("owasp.entitymember", "owasp.project")
+
 router = RouterPaginated(tags=["Projects"])
 
 
@@ -74,7 +76,7 @@ class ProjectFilter(FilterSchema):
     response=list[Project],
     summary="List projects",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_projects(
     request: HttpRequest,
     filters: ProjectFilter = Query(...),
@@ -101,7 +103,7 @@ def list_projects(
     },
     summary="Get project",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_project(
     request: HttpRequest,
     project_id: str = Path(example="Nest"),
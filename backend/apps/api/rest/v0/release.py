@@ -4,15 +4,19 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Literal
 
-from django.http import HttpRequest
+from django.db.models import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
 from ninja import Field, FilterSchema, Path, Query, Schema
 from ninja.decorators import decorate_view
 from ninja.pagination import RouterPaginated
 from ninja.responses import Response
 
 from apps.api.decorators.cache import cache_response
+from apps.api.rest.v0.export import ExportParams, export_response
 from apps.github.models.release import Release as ReleaseModel
 
+CACHE_TAGS = ("github.organization", "github.release", "github.repository")
+
 router = RouterPaginated(tags=["Releases"])
 
 
@@ -57,6 +61,35 @@ class ReleaseFilter(FilterSchema):
     tag_name: str | None = Field(None, description="Tag name of the release", example="0.2.10")
 
 
+def get_release_queryset(filters: ReleaseFilter) -> QuerySet[ReleaseModel]:
+    """Get published releases matching the filters.
+
+    Args:
+        filters (ReleaseFilter): The release filters.
+
+    Returns:
+        QuerySet[ReleaseModel]: The filtered releases.
+
+    """
+    releases = ReleaseModel.objects.exclude(
+        published_at__isnull=True,
+    ).select_related(
+        "repository",
+        "repository__organization",
+    )
+
+    if filters.organization:
+        releases = releases.filter(repository__organization__login__iexact=filters.organization)
+
+    if filters.repository:
+        releases = releases.filter(repository__name__iexact=filters.repository)
+
+    if filters.tag_name:
+        releases = releases.filter(tag_name=filters.tag_name)
+
+    return releases
+
+
 @router.get(
     "/",
     description="Retrieve a paginated list of GitHub releases.",
@@ -64,7 +97,7 @@ class ReleaseFilter(FilterSchema):
     summary="List releases",
     response=list[Release],
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_release(
     request: HttpRequest,
     filters: ReleaseFilter = Query(...),
@@ -74,23 +107,22 @@ def list_release(
     ),
 ) -> list[Release]:
     """Get all releases."""
-    releases = ReleaseModel.objects.exclude(
-        published_at__isnull=True,
-    ).select_related(
-        "repository",
-        "repository__organization",
-    )
-
-    if filters.organization:
-        releases = releases.filter(repository__organization__login__iexact=filters.organization)
+    return get_release_queryset(filters).order_by(ordering or "-published_at", "-created_at")
 
-    if filters.repository:
-        releases = releases.filter(repository__name__iexact=filters.repository)
-
-    if filters.tag_name:
-        releases = releases.filter(tag_name=filters.tag_name)
 
-    return releases.order_by(ordering or "-published_at", "-created_at")
+@router.get(
+    "/export",
+    description="Stream all GitHub releases as NDJSON, one release per line.",
+    operation_id="export_releases",
+    summary="Export releases",
+)
+def export_releases(
+    request: HttpRequest,
+    filters: ReleaseFilter = Query(...),
+    params: ExportParams = Query(...),
+) -> StreamingHttpResponse:
+    """Export releases."""
+    return export_response(get_release_queryset(filters), ReleaseDetail, "releases", params)
 
 
 @router.get(
@@ -103,7 +135,7 @@ def list_release(
     },
     summary="Get release",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_release(
     request: HttpRequest,
     organization_id: str = Path(example="OWASP"),
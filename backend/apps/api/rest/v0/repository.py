@@ -13,6 +13,8 @@ from ninja.responses import Response
 from apps.api.decorators.cache import cache_response
 from apps.github.models.repository import Repository as RepositoryModel
 
+CACHE_TAGS = ("github.organization", "github.repository")
+
 router = RouterPaginated(tags=["Repositories"])
 
 
@@ -62,7 +64,7 @@ class RepositoryFilter(FilterSchema):
     summary="List repositories",
     response=list[Repository],
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_repository(
     request: HttpRequest,
     filters: RepositoryFilter = Query(...),
@@ -90,7 +92,7 @@ def list_repository(
     },
     summary="Get repository",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_repository(
     request: HttpRequest,
     organization_id: str = Path(example="OWASP"),
@@ -25,6 +25,17 @@ from apps.owasp.models.snapshot import Snapshot as SnapshotModel
 
 ORDERING_FIELD_DESCRIPTION = "Ordering field"
 
+CACHE_TAGS = (
+    "github.issue",
+    "github.organization",
+    "github.release",
+    "github.repository",
+    "github.user",
+    "owasp.chapter",
+    "owasp.project",
+    "owasp.snapshot",
+)
+
 router = RouterPaginated(tags=["Community"])
 
 
@@ -108,7 +119,7 @@ class SnapshotError(Schema):
     response=list[Snapshot],
     summary="List snapshots",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshots(
     request: HttpRequest,
     ordering: Literal[
@@ -135,7 +146,7 @@ def list_snapshots(
     },
     summary="Get snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_snapshot(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -156,7 +167,7 @@ def get_snapshot(
     response=list[Chapter],
     summary="List new chapters in snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshot_chapters(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -181,7 +192,7 @@ def list_snapshot_chapters(
     response=list[SnapshotIssue],
     summary="List new issues in snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshot_issues(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -208,7 +219,7 @@ def list_snapshot_issues(
     response=list[Member],
     summary="List new members in snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshot_members(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -233,7 +244,7 @@ def list_snapshot_members(
     response=list[Project],
     summary="List new projects in snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshot_projects(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -258,7 +269,7 @@ def list_snapshot_projects(
     response=list[SnapshotRelease],
     summary="List new releases in snapshot",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_snapshot_releases(
     request: HttpRequest,
     snapshot_id: str = Path(example="2025-02"),
@@ -12,6 +12,8 @@ from ninja.responses import Response
 from apps.api.decorators.cache import cache_response
 from apps.owasp.models.sponsor import Sponsor as SponsorModel
 
+CACHE_TAGS = ("owasp.sponsor",)
+
 router = RouterPaginated(tags=["Sponsors"])
 
 
@@ -70,7 +72,7 @@ class SponsorFilter(FilterSchema):
     response=list[Sponsor],
     summary="List sponsors",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def list_sponsors(
     request: HttpRequest,
     filters: SponsorFilter = Query(...),
@@ -93,7 +95,7 @@ def list_sponsors(
     },
     summary="Get sponsor",
 )
-@decorate_view(cache_response())
+@decorate_view(cache_response(tags=CACHE_TAGS))
 def get_sponsor(
     request: HttpRequest,
     sponsor_id: str = Path(..., example="adobe"),
@@ -7,3 +7,9 @@ class CommonConfig(AppConfig):
     """Common app config."""
 
     name = "apps.common"
+
+    def ready(self):
+        """Ready."""
+        from apps.common.cache import connect_receivers
+
+        connect_receivers()
@@ -0,0 +1,405 @@
+"""Common app tagged cache.
+
+Cached entries store the versions of the tags they depend on, e.g. `owasp.project`
+for any project or `owasp.project:42` for a specific one. Invalidating a tag drops
+its version so every entry that depends on it becomes a miss without scanning keys.
+
+Invalidation receivers are connected for the models the REST API cache tags and the
+GraphQL types refer to only, other models changes can't affect cached values.
+
+Entries may outlive their TTL by a stale period: while one worker holding the key
+lock recomputes the value, concurrent requests keep being served the stale one.
+"""
+
+from __future__ import annotations
+
+import math
+import pkgutil
+import random
+import time
+from importlib import import_module
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+
+from apps.common.models import post_bulk_save
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Deletes the lock only if it still holds the token, atomically.
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def get_model_tag(model) -> str:
+    """Get cache tag for a model.
+
+    Args:
+        model (type[Model]): The model class.
+
+    Returns:
+        str: The model cache tag.
+
+    """
+    return model._meta.label_lower  # noqa: SLF001
+
+
+def get_instance_tag(instance: models.Model) -> str:
+    """Get cache tag for a model instance.
+
+    Args:
+        instance (Model): The model instance.
+
+    Returns:
+        str: The instance cache tag.
+
+    """
+    return f"{get_model_tag(type(instance))}:{instance.pk}"
+
+
+def get_result_tags(result) -> set[str]:
+    """Get cache tags for a resolved value.
+
+    Args:
+        result: A model instance, a queryset or a list of model instances.
+
+    Returns:
+        set[str]: The cache tags the value depends on.
+
+    """
+    if isinstance(result, models.Model):
+        # Bulk saves invalidate the model tag only.
+        return {get_model_tag(type(result)), get_instance_tag(result)}
+
+    if isinstance(result, models.QuerySet):
+        return {get_model_tag(result.model)}
+
+    if isinstance(result, list | tuple):
+        return {get_model_tag(type(item)) for item in result if isinstance(item, models.Model)}
+
+    return set()
+
+
+def get_tag_key(tag: str) -> str:
+    """Get cache key of a tag version.
+
+    Args:
+        tag (str): The cache tag.
+
+    Returns:
+        str: The tag version cache key.
+
+    """
+    return f"{settings.CACHE_TAG_PREFIX}-{tag}"
+
+
+def get_tag_versions(tags: Iterable[str]) -> dict[str, str]:
+    """Get current tag versions creating the missing ones.
+
+    Args:
+        tags (Iterable[str]): The cache tags.
+
+    Returns:
+        dict[str, str]: Versions by tag.
+
+    """
+    tags_by_key = {get_tag_key(tag): tag for tag in tags}
+    versions = cache.get_many(tags_by_key)
+    if missing_versions := {key: uuid4().hex for key in tags_by_key if key not in versions}:
+        cache.set_many(missing_versions, timeout=settings.CACHE_TAG_TIME_SECONDS)
+        versions.update(missing_versions)
+
+    return {tags_by_key[key]: version for key, version in versions.items()}
+
+
+def get_entry(key: str) -> tuple | None:
+    """Get cached entry unless any of its tags has been invalidated.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        tuple | None: The cached value, its soft expiration timestamp and computation time.
+
+    """
+    if (entry := cache.get(key)) is None:
+        return None
+
+    versions, value, expires_at, delta = entry
+    if versions and cache.get_many([get_tag_key(tag) for tag in versions]) != {
+        get_tag_key(tag): version for tag, version in versions.items()
+    }:
+        return None
+
+    return value, expires_at, delta
+
+
+def get_tagged(key: str, default=None):
+    """Get cached value unless any of its tags has been invalidated.
+
+    Args:
+        key (str): The cache key.
+        default: The value to return on a miss.
+
+    Returns:
+        The cached value or default.
+
+    """
+    if (entry := get_entry(key)) is None:
+        return default
+
+    return entry[0]
+
+
+def set_tagged(
+    key: str,
+    value,
+    tags: Iterable[str] = (),
+    timeout: float | None = DEFAULT_TIMEOUT,
+    *,
+    delta: float = 0,
+    stale_timeout: float = 0,
+) -> None:
+    """Cache value along with the current versions of its tags.
+
+    Args:
+        key (str): The cache key.
+        value: The value to cache.
+        tags (Iterable[str], optional): The cache tags the value depends on.
+        timeout (float | None, optional): The cache timeout in seconds.
+        delta (float, optional): The value computation time in seconds.
+        stale_timeout (float, optional): The time in seconds a stale value is kept
+            after the timeout.
+
+    """
+    expires_at = None
+    if timeout is not None and timeout is not DEFAULT_TIMEOUT:
+        expires_at = time.time() + timeout
+        timeout += stale_timeout
+
+    cache.set(key, (get_tag_versions(tags), value, expires_at, delta), timeout=timeout)
+
+
+def is_expired(expires_at: float | None, delta: float) -> bool:
+    """Check whether a cached value should be recomputed.
+
+    The expiration is brought forward randomly in proportion to the value computation
+    time so that hot keys are usually refreshed before they actually expire.
+
+    Args:
+        expires_at (float | None): The value soft expiration timestamp.
+        delta (float): The value computation time in seconds.
+
+    Returns:
+        bool: True if the value should be recomputed.
+
+    """
+    if expires_at is None:
+        return False
+
+    return (
+        time.time() - delta * settings.CACHE_EARLY_REFRESH_BETA * math.log(1 - random.random())  # noqa: S311
+        >= expires_at
+    )
+
+
+def get_lock_key(key: str) -> str:
+    """Get cache key of a recomputation lock.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        str: The lock cache key.
+
+    """
+    return f"{settings.CACHE_LOCK_PREFIX}-{key}"
+
+
+def release_lock(lock_key: str, lock_token: str) -> None:
+    """Release a recomputation lock if it's still held with the token.
+
+    Args:
+        lock_key (str): The lock cache key.
+        lock_token (str): The token the lock was acquired with.
+
+    """
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, RedisCache):
+        get_redis_connection(DEFAULT_CACHE_ALIAS).eval(
+            RELEASE_LOCK_SCRIPT,
+            1,
+            backend.client.make_key(lock_key),
+            backend.client.encode(lock_token),
+        )
+    elif cache.get(lock_key) == lock_token:
+        cache.delete(lock_key)
+
+
+def wait_for_entry(key: str) -> tuple | None:
+    """Wait for another worker to cache an entry.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        tuple | None: The cached entry or None if it didn't appear in time.
+
+    """
+    lock_key = get_lock_key(key)
+    deadline = time.monotonic() + settings.CACHE_LOCK_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(settings.CACHE_LOCK_POLL_INTERVAL_SECONDS)
+        if (entry := get_entry(key)) is not None:
+            return entry
+
+        if cache.get(lock_key) is None:
+            break
+
+    return None
+
+
+def get_or_set_tagged(
+    key: str,
+    default: Callable,
+    tags: Iterable[str] | Callable = (),
+    timeout: float = DEFAULT_TIMEOUT,
+    *,
+    is_cacheable: Callable | None = None,
+    stale_timeout: float | None = None,
+):
+    """Get cached value or compute it once across concurrent workers.
+
+    A missing value is computed by the worker that acquires the key lock while the
+    others wait for it. A stale value is refreshed by the lock owner while the others
+    keep serving the stale one.
+
+    Args:
+        key (str): The cache key.
+        default (Callable): The function computing the value.
+        tags (Iterable[str] | Callable, optional): The cache tags the value depends on
+            or a function returning them for the computed value.
+        timeout (float, optional): The cache timeout in seconds.
+        is_cacheable (Callable | None, optional): A function checking whether
+            the computed value should be cached.
+        stale_timeout (float | None, optional): The time in seconds a stale value
+            is served after the timeout.
+
+    Returns:
+        The cached or computed value.
+
+    """
+    if stale_timeout is None:
+        stale_timeout = settings.CACHE_STALE_TIME_SECONDS
+
+    entry = get_entry(key)
+    if entry is not None and not is_expired(*entry[1:]):
+        return entry[0]
+
+    lock_key = get_lock_key(key)
+    # The token prevents releasing a lock that expired and was taken over by another worker.
+    lock_token = uuid4().hex
+    is_locked = cache.add(lock_key, lock_token, timeout=settings.CACHE_LOCK_TIME_SECONDS)
+    if not is_locked:
+        if entry is not None:
+            return entry[0]
+
+        if (entry := wait_for_entry(key)) is not None:
+            return entry[0]
+
+    try:
+        started_at = time.monotonic()
+        value = default()
+        if is_cacheable is None or is_cacheable(value):
+            set_tagged(
+                key,
+                value,
+                tags(value) if callable(tags) else tags,
+                timeout=timeout,
+                delta=time.monotonic() - started_at,
+                stale_timeout=stale_timeout,
+            )
+    finally:
+        if is_locked:
+            release_lock(lock_key, lock_token)
+
+    return value
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """Invalidate every cached value depending on any of the tags.
+
+    Args:
+        tags (Iterable[str]): The cache tags.
+
+    """
+    if keys := [get_tag_key(tag) for tag in tags]:
+        cache.delete_many(keys)
+
+
+def get_tagged_models() -> set[type[models.Model]]:
+    """Get models cached values may depend on.
+
+    Returns:
+        set[type[Model]]: The models of the REST API cache tags and the GraphQL types.
+
+    """
+    from apps.api.rest import v0
+    from settings.graphql import schema
+
+    labels = {
+        tag
+        for module in pkgutil.iter_modules(v0.__path__)
+        for tag in getattr(import_module(f"{v0.__name__}.{module.name}"), "CACHE_TAGS", ())
+    }
+    tagged_models = {apps.get_model(label) for label in labels}
+
+    for graphql_type in schema.schema_converter.type_map.values():
+        definition = getattr(graphql_type.definition, "origin", None)
+        if django_definition := getattr(definition, "__strawberry_django_definition__", None):
+            tagged_models.add(django_definition.model)
+
+    return tagged_models
+
+
+def connect_receivers() -> None:
+    """Connect cache invalidation receivers to the tagged models signals."""
+    for model in get_tagged_models():
+        post_bulk_save.connect(invalidate_bulk_saved_tags, sender=model)
+        post_delete.connect(invalidate_instance_tags, sender=model)
+        post_save.connect(invalidate_instance_tags, sender=model)
+        for field in model._meta.many_to_many:  # noqa: SLF001
+            m2m_changed.connect(invalidate_m2m_changed_tags, sender=field.remote_field.through)
+
+
+def invalidate_instance_tags(sender, instance, **_kwargs) -> None:
+    """Invalidate model and instance tags of a changed instance."""
+    if not isinstance(instance, models.Model):
+        return
+
+    invalidate_tags((get_model_tag(sender), get_instance_tag(instance)))
+
+
+def invalidate_m2m_changed_tags(instance, action, **_kwargs) -> None:
+    """Invalidate model and instance tags of an instance with changed relations."""
+    # The sender is the intermediate model, the instance is either side of the relation.
+    if action.startswith("post_"):
+        invalidate_instance_tags(type(instance), instance)
+
+
+def invalidate_bulk_saved_tags(sender, **_kwargs) -> None:
+    """Invalidate model tag of bulk saved instances."""
+    invalidate_tags((get_model_tag(sender),))
@@ -5,12 +5,15 @@ import json
 from functools import lru_cache
 
 from django.conf import settings
-from django.core.cache import cache
+from django.db.models import QuerySet
 from strawberry.extensions import SchemaExtension
 from strawberry.permission import PermissionExtension
 from strawberry.schema import Schema
 from strawberry.utils.str_converters import to_camel_case
 
+from apps.common.cache import get_or_set_tagged, get_result_tags
+from apps.common.loaders import BatchLoader, batch_loader
+
 
 @lru_cache(maxsize=1)
 def get_protected_fields(schema: Schema) -> tuple[str, ...]:
@@ -60,8 +63,35 @@ class CacheExtension(SchemaExtension):
         ):
             return _next(root, info, *args, **kwargs)
 
-        return cache.get_or_set(
+        return get_or_set_tagged(
             self.generate_key(info.field_name, kwargs),
             lambda: _next(root, info, *args, **kwargs),
-            settings.GRAPHQL_RESOLVER_CACHE_TIME_SECONDS,
+            get_result_tags,
+            timeout=settings.GRAPHQL_RESOLVER_CACHE_TIME_SECONDS,
         )
+
+
+class BatchLoaderExtension(SchemaExtension):
+    """Batch nested resolvers over the model instances of resolved lists.
+
+    Must be listed after CacheExtension so that cached lists are registered too.
+    """
+
+    def on_execute(self):
+        """Create a batch loader for the request execution."""
+        token = batch_loader.set(BatchLoader())
+        try:
+            yield
+        finally:
+            batch_loader.reset(token)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        """Register resolved model instance lists as batches."""
+        result = _next(root, info, *args, **kwargs)
+        if isinstance(result, QuerySet):
+            result = list(result)
+
+        if isinstance(result, list | tuple) and (loader := batch_loader.get()):
+            loader.register(result)
+
+        return result
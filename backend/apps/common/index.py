@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from functools import lru_cache
+from itertools import batched
 from pathlib import Path
 
 from algoliasearch.http.exceptions import AlgoliaException
@@ -12,6 +15,8 @@ from algoliasearch.search.config import SearchConfig
 from algoliasearch_django import AlgoliaIndex
 from algoliasearch_django.decorators import register as algolia_register
 from django.conf import settings
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
 
 from apps.common.constants import NL
 
@@ -32,6 +37,10 @@ EXCLUDED_LOCAL_INDEX_NAMES = (
     "projects_updated_at_desc",
 )
 LOCAL_INDEX_LIMIT = 1000
+BATCH_SIZE = 1000
+
+# Record payload hashes must survive default cache clearing.
+cache = ConnectionProxy(caches, "indexing")
 
 
 class IndexRegistry:
@@ -285,9 +294,133 @@ class IndexBase(AlgoliaIndex):
         """Get the queryset for the index.
 
         Returns
-            QuerySet: The queryset of entities to index.
+            Iterator: The entities to index with their index fields prefetched.
 
         """
         qs = self.get_entities()
 
-        return qs[:LOCAL_INDEX_LIMIT] if settings.IS_LOCAL_ENVIRONMENT else qs
+        return self.iter_instances(qs[:LOCAL_INDEX_LIMIT] if settings.IS_LOCAL_ENVIRONMENT else qs)
+
+    def iter_instances(self, queryset):
+        """Iterate over the queryset in batches with prefetched index fields.
+
+        Args:
+            queryset (QuerySet): The queryset of entities to index.
+
+        Yields:
+            Model: The entity.
+
+        """
+        for instances in batched(
+            queryset.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE, strict=False
+        ):
+            self.prefetch_index_fields(instances)
+            yield from instances
+
+    def prefetch_index_fields(self, instances) -> None:
+        """Precompute index fields for a batch of entities.
+
+        Override to compute per entity queries based fields in bulk.
+
+        Args:
+            instances (tuple): The entities batch.
+
+        """
+
+    def get_record_hash_cache_key(self, object_id) -> str:
+        """Get cache key for the record payload hash.
+
+        Args:
+            object_id: The record object ID.
+
+        Returns:
+            str: The cache key.
+
+        """
+        return f"{settings.ALGOLIA_RECORD_HASH_CACHE_PREFIX}-{self.index_name}-{object_id}"
+
+    def push_records(self, records: list[dict]) -> int:
+        """Push records which payload changed since the last push.
+
+        Args:
+            records (list[dict]): The index records.
+
+        Returns:
+            int: The number of pushed records.
+
+        """
+        hashes = {
+            self.get_record_hash_cache_key(record["objectID"]): hashlib.sha256(
+                json.dumps(record, default=str, sort_keys=True).encode()
+            ).hexdigest()
+            for record in records
+        }
+        cached_hashes = cache.get_many(hashes)
+        changed_hashes = {
+            key: value for key, value in hashes.items() if cached_hashes.get(key) != value
+        }
+        if not changed_hashes:
+            return 0
+
+        IndexBase.get_client().partial_update_objects(
+            index_name=self.index_name,
+            objects=[
+                record
+                for record in records
+                if self.get_record_hash_cache_key(record["objectID"]) in changed_hashes
+            ],
+            create_if_not_exists=True,
+            wait_for_tasks=True,
+        )
+        cache.set_many(changed_hashes, timeout=None)
+
+        return len(changed_hashes)
+
+    def sync_records(self, object_ids=None) -> tuple[int, int]:
+        """Push changed records to the index.
+
+        Records are built in batches and only the ones which payload hash differs
+        from the last pushed one are sent. Tracked objects which are no longer
+        indexable are deleted from the index.
+
+        Args:
+            object_ids (set, optional): IDs of changed objects. All records are
+                checked if None.
+
+        Returns:
+            tuple[int, int]: The number of updated and deleted records.
+
+        """
+        instances = (
+            self.get_queryset()
+            if object_ids is None
+            else self.iter_instances(self.get_entities().filter(pk__in=object_ids))
+        )
+
+        indexed_ids = set()
+        records = []
+        updated_count = 0
+        for instance in instances:
+            if not self._should_index(instance):
+                continue
+
+            indexed_ids.add(instance.pk)
+            records.append(self.get_raw_record(instance))
+            if len(records) == BATCH_SIZE:
+                updated_count += self.push_records(records)
+                records.clear()
+
+        if records:
+            updated_count += self.push_records(records)
+
+        if not object_ids or not (deleted_ids := set(object_ids) - indexed_ids):
+            return updated_count, 0
+
+        IndexBase.get_client().delete_objects(
+            index_name=self.index_name,
+            object_ids=[str(object_id) for object_id in sorted(deleted_ids)],
+            wait_for_tasks=True,
+        )
+        cache.delete_many([self.get_record_hash_cache_key(object_id) for object_id in deleted_ids])
+
+        return updated_count, len(deleted_ids)
@@ -0,0 +1,200 @@
+"""Common GraphQL batch loaders.
+
+Strawberry's DataLoader requires async resolvers while the schema is served by the sync
+GraphQL view. Batching is done the same way here synchronously: each list of model
+instances resolved during a request is registered as a batch, and the first nested
+resolver that needs a relation loads it for the whole batch with a single query.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from django.db import models
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+batch_loader: ContextVar[BatchLoader | None] = ContextVar("batch_loader", default=None)
+
+
+class BatchLoader:
+    """Per request registry of instance batches and their loaded values."""
+
+    def __init__(self) -> None:
+        """Initialize batch loader."""
+        self.batches: dict[int, list[models.Model]] = {}
+        self.values: dict[tuple, dict] = {}
+
+    def get_batch(self, instance: models.Model) -> list[models.Model]:
+        """Get the batch an instance was resolved with.
+
+        Args:
+            instance (Model): The model instance.
+
+        Returns:
+            list[Model]: The instance siblings including the instance itself.
+
+        """
+        return self.batches.setdefault(id(instance), [instance])
+
+    def load(self, instance: models.Model, load_batch: Callable, *args, default=None):
+        """Load a value for an instance, loading it for the whole batch once.
+
+        Args:
+            instance (Model): The model instance.
+            load_batch (Callable): A function returning values by primary key
+                for a list of instances.
+            *args: Additional load_batch arguments.
+            default: The value to return for instances missing from the result.
+
+        Returns:
+            The loaded value.
+
+        """
+        batch = self.get_batch(instance)
+        key = (load_batch, args, id(batch))
+        if key not in self.values:
+            self.values[key] = load_batch(batch, *args)
+
+        return self.values[key].get(instance.pk, default)
+
+    def register(self, instances: Iterable) -> None:
+        """Register resolved model instances as batches by model.
+
+        Args:
+            instances (Iterable): The resolved values.
+
+        """
+        batches = defaultdict(list)
+        for instance in instances:
+            if isinstance(instance, models.Model) and instance.pk is not None:
+                batches[instance.__class__._meta.concrete_model].append(instance)  # noqa: SLF001
+
+        for batch in batches.values():
+            for instance in batch:
+                self.batches.setdefault(id(instance), batch)
+
+
+def load(instance: models.Model, load_batch: Callable, *args, default=None):
+    """Load a value for an instance batching it with its siblings.
+
+    Outside of a GraphQL request the value is loaded for the instance alone.
+
+    Args:
+        instance (Model): The model instance.
+        load_batch (Callable): A function returning values by primary key
+            for a list of instances.
+        *args: Additional load_batch arguments.
+        default: The value to return for instances missing from the result.
+
+    Returns:
+        The loaded value.
+
+    """
+    return (batch_loader.get() or BatchLoader()).load(instance, load_batch, *args, default=default)
+
+
+def prefetch_related(instance: models.Model, *lookups) -> models.Model:
+    """Prefetch related objects for an instance and its siblings.
+
+    Outside of a GraphQL request nothing is prefetched and relations are loaded lazily.
+
+    Args:
+        instance (Model): The model instance.
+        *lookups: The prefetch_related lookups.
+
+    Returns:
+        Model: The instance.
+
+    """
+    if loader := batch_loader.get():
+        loader.load(instance, prefetch_related_batch, *lookups)
+
+    return instance
+
+
+def prefetch_related_batch(instances: list[models.Model], *lookups) -> dict:
+    """Prefetch related objects for a batch of instances."""
+    models.prefetch_related_objects(instances, *lookups)
+
+    return {}
+
+
+def group_by(queryset: models.QuerySet, key: str) -> dict[int, list]:
+    """Group items by a lookup value with a single query.
+
+    Args:
+        queryset (QuerySet): The items to group.
+        key (str): The lookup to group items by, e.g. `repository_id`.
+
+    Returns:
+        dict[int, list]: Items by lookup value.
+
+    """
+    return group_by_batch_key(queryset.annotate(batch_key=F(key)))
+
+
+def group_by_batch_key(items: Iterable) -> dict[int, list]:
+    """Group items annotated with a batch key."""
+    groups = defaultdict(list)
+    for item in items:
+        groups[item.batch_key].append(item)
+
+    return groups
+
+
+def get_top_by(
+    queryset: models.QuerySet,
+    key: str,
+    ordering: Iterable[str],
+    limit: int,
+) -> dict[int, list]:
+    """Get the first items per lookup value with a single query.
+
+    Args:
+        queryset (QuerySet): The items to group.
+        key (str): The lookup to group items by, e.g. `repository_id`.
+        ordering (Iterable[str]): The ordering of items within a group.
+        limit (int): The number of items per group.
+
+    Returns:
+        dict[int, list]: Items by lookup value.
+
+    """
+    ordering = list(ordering)
+    return group_by_batch_key(
+        queryset.annotate(
+            batch_key=F(key),
+            batch_row_number=Window(
+                expression=RowNumber(),
+                partition_by=F("batch_key"),
+                order_by=[
+                    F(field[1:]).desc() if field.startswith("-") else F(field).asc()
+                    for field in ordering
+                ],
+            ),
+        )
+        .filter(batch_row_number__lte=limit)
+        .order_by(*ordering)
+    )
+
+
+def count_by(queryset: models.QuerySet, key: str) -> dict[int, int]:
+    """Count items per lookup value with a single query.
+
+    Args:
+        queryset (QuerySet): The items to count.
+        key (str): The lookup to count items by, e.g. `repository_id`.
+
+    Returns:
+        dict[int, int]: Items count by lookup value.
+
+    """
+    return dict(
+        queryset.values(key).annotate(batch_count=Count("pk")).values_list(key, "batch_count")
+    )
@@ -0,0 +1,52 @@
+"""A command to push changed OWASP Nest records to Algolia indices."""
+
+from algoliasearch_django import algolia_engine
+from django.core.management.base import BaseCommand
+
+from apps.core.utils.index import dirty_records
+
+
+class Command(BaseCommand):
+    help = "Push changed OWASP Nest records to Algolia indices."
+
+    def add_arguments(self, parser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
+
+        """
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Check all records instead of the ones changed since the last run",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        """Push changed records to Algolia indices.
+
+        Args:
+            *_args: Positional arguments (not used).
+            **options: Command-line options.
+
+        """
+        print("\nThe following indices records were updated:")
+        for model in algolia_engine.get_registered_models():
+            if options["all"]:
+                object_ids = None
+            elif not (object_ids := dirty_records.pop(model)):
+                continue
+
+            index = algolia_engine.get_adapter(model)
+            try:
+                updated_count, deleted_count = index.sync_records(object_ids)
+            except Exception:
+                if object_ids:
+                    dirty_records.add(model, object_ids)
+                    dirty_records.flush()
+                raise
+
+            print(
+                f"{7 * ' '} * {index.index_name} --> "
+                f"{updated_count} updated, {deleted_count} deleted"
+            )
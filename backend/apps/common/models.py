@@ -3,9 +3,13 @@
 # ruff: noqa: SLF001 https://docs.astral.sh/ruff/rules/private-member-access/
 
 from django.db import models
+from django.dispatch import Signal
 
 BATCH_SIZE = 1000
 
+# Sent after BulkSaveModel.bulk_save with the saved `objects`.
+post_bulk_save = Signal()
+
 
 class BulkSaveModel(models.Model):
     """Base model for bulk save action."""
@@ -31,8 +35,50 @@ class BulkSaveModel(models.Model):
             fields=fields or [field.name for field in model._meta.fields if not field.primary_key],
             batch_size=BATCH_SIZE,
         )
+        post_bulk_save.send(sender=model, objects=list(objects))
         objects.clear()
 
+    @staticmethod
+    def bulk_save_m2m(field, relations) -> None:
+        """Bulk save many-to-many relations.
+
+        Only stale through model rows are deleted and only missing ones are created,
+        so unchanged relations cost no writes.
+
+        Args:
+            field (ManyToManyDescriptor): The many-to-many field (e.g. `Issue.labels`).
+            relations (dict): Mapping of source object IDs to sets of target object IDs.
+
+        """
+        if not relations:
+            return
+
+        through = field.through
+        source_id = f"{field.field.m2m_field_name()}_id"
+        target_id = f"{field.field.m2m_reverse_field_name()}_id"
+
+        existing = {
+            (source, target): pk
+            for pk, source, target in through.objects.filter(
+                **{f"{source_id}__in": relations}
+            ).values_list("pk", source_id, target_id)
+        }
+        desired = {(source, target) for source, targets in relations.items() for target in targets}
+
+        if stale := [pk for pair, pk in existing.items() if pair not in desired]:
+            through.objects.filter(pk__in=stale).delete()
+
+        through.objects.bulk_create(
+            (
+                through(**{source_id: source, target_id: target})
+                for source, target in desired
+                if (source, target) not in existing
+            ),
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        relations.clear()
+
 
 class TimestampedModel(models.Model):
     """Base model with auto created_at and updated_at fields."""
@@ -0,0 +1,58 @@
+"""Common app rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `capacity` requests and `rate` requests per second
+    on average.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (int, optional): The maximum number of tokens.
+
+        """
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        while True:
+            with self.lock:
+                self.refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                delay = (1 - self.tokens) / self.rate
+
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Withhold tokens so that the next one is available in `seconds` at the earliest.
+
+        Args:
+            seconds (float): The number of seconds to pause for.
+
+        """
+        with self.lock:
+            self.refill()
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def refill(self) -> None:
+        """Add the tokens accumulated since the last update, the lock must be held."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
@@ -7,3 +7,7 @@ class CoreConfig(AppConfig):
     """Core app config."""
 
     name = "apps.core"
+
+    def ready(self):
+        """Ready."""
+        import apps.core.utils.index  # noqa: F401
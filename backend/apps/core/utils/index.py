@@ -2,20 +2,133 @@
 
 import contextlib
 import logging
+import threading
+from collections import defaultdict
 
-from algoliasearch_django import register, unregister
+from algoliasearch_django import algolia_engine, register, unregister
 from algoliasearch_django.registration import RegistrationError
 from django.apps import apps
+from django.conf import settings
 from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django_redis import get_redis_connection
 
+from apps.common.models import post_bulk_save
 from apps.common.utils import convert_to_camel_case
 from apps.core.constants import CACHE_PREFIX
 
 logger = logging.getLogger(__name__)
 
 
+class DirtyRecords:
+    """Thread-safe tracker of indexable objects changed while indexing is disabled.
+
+    The IDs are buffered in memory and added to per model Redis sets on flush, so the
+    delta indexer can push only the changed records later. The sets live in the
+    `indexing` Redis database, which is not affected by clearing the default cache.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.ids: defaultdict[type, set] = defaultdict(set)
+        self.lock = threading.Lock()
+        self.models: set[type] = set()
+
+    @staticmethod
+    def get_key(model) -> str:
+        """Get Redis key for the model dirty records IDs set.
+
+        Args:
+            model (Model): The Django model class.
+
+        Returns:
+            str: The Redis key.
+
+        """
+        return (
+            f"{settings.ALGOLIA_DIRTY_RECORDS_CACHE_PREFIX}-"
+            f"{model._meta.label_lower}"  # noqa: SLF001
+        )
+
+    def add(self, model, ids) -> None:
+        """Add changed objects IDs.
+
+        Args:
+            model (Model): The Django model class.
+            ids (Iterable): The changed objects IDs.
+
+        """
+        with self.lock:
+            self.ids[model].update(ids)
+
+    def flush(self) -> None:
+        """Add the buffered IDs to the Redis sets."""
+        with self.lock:
+            ids, self.ids = self.ids, defaultdict(set)
+
+        if not any(ids.values()):
+            return
+
+        pipeline = get_redis_connection("indexing").pipeline()
+        for model, model_ids in ids.items():
+            if model_ids:
+                pipeline.sadd(self.get_key(model), *model_ids)
+        pipeline.execute()
+
+    def is_tracked(self, model) -> bool:
+        """Check whether the model changes should be tracked.
+
+        Args:
+            model (Model): The Django model class.
+
+        Returns:
+            bool: True if the model is indexed, False otherwise.
+
+        """
+        return model in self.models or algolia_engine.is_registered(model)
+
+    def pop(self, model) -> set:
+        """Get and clear the model dirty records IDs.
+
+        Args:
+            model (Model): The Django model class.
+
+        Returns:
+            set: The changed objects IDs.
+
+        """
+        key = self.get_key(model)
+        # The transaction guarantees IDs added concurrently are either returned or kept.
+        pipeline = get_redis_connection("indexing").pipeline()
+        pipeline.smembers(key)
+        pipeline.delete(key)
+        ids, _ = pipeline.execute()
+
+        return {int(object_id) for object_id in ids}
+
+
+dirty_records = DirtyRecords()
+
+
+@receiver(post_bulk_save)
+def track_bulk_saved_records(sender, objects, **_kwargs) -> None:
+    """Track bulk saved indexable objects (bulk saves bypass auto indexing)."""
+    if dirty_records.is_tracked(sender):
+        dirty_records.add(sender, (o.pk for o in objects if o.pk))
+        dirty_records.flush()
+
+
+def track_changed_record(sender, instance, **_kwargs) -> None:
+    """Track an indexable object saved or deleted while indexing is disabled."""
+    dirty_records.add(sender, (instance.pk,))
+
+
 class DisableIndexing:
-    """Context manager to temporarily disable Algolia indexing."""
+    """Context manager to temporarily disable Algolia indexing.
+
+    Objects saved or deleted while indexing is disabled are tracked in `dirty_records`.
+    """
 
     def __init__(self, app_names: tuple[str, ...] | None = None):
         """Initialize the context manager.
@@ -29,6 +142,17 @@ class DisableIndexing:
 
     def __enter__(self):
         """Disable indexing when entering the context."""
+        self.models = [
+            model
+            for app_name in self.app_names
+            for model in apps.get_app_config(app_name).get_models()
+            if algolia_engine.is_registered(model)
+        ]
+        dirty_records.models.update(self.models)
+        for model in self.models:
+            post_delete.connect(track_changed_record, sender=model)
+            post_save.connect(track_changed_record, sender=model)
+
         self.unregister_indexes()
         return self
 
@@ -36,6 +160,12 @@ class DisableIndexing:
         """Re-enable indexing when exiting the context."""
         self.register_indexes()
 
+        for model in self.models:
+            post_delete.disconnect(track_changed_record, sender=model)
+            post_save.disconnect(track_changed_record, sender=model)
+        dirty_records.models.difference_update(self.models)
+        dirty_records.flush()
+
     def register_indexes(self) -> None:
         """Register indexes."""
         for app_name in self.app_names:
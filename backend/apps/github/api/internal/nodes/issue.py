@@ -3,9 +3,47 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import group_by, load, prefetch_related
 from apps.github.api.internal.nodes.pull_request import PullRequestNode
 from apps.github.api.internal.nodes.user import UserNode
 from apps.github.models.issue import Issue
+from apps.github.models.pull_request import PullRequest
+from apps.mentorship.models.issue_user_interest import IssueUserInterest
+
+
+def load_interested_users(issues: list[Issue]) -> dict[int, list]:
+    """Load users interested in issues."""
+    return {
+        issue_id: [interest.user for interest in interests]
+        for issue_id, interests in group_by(
+            IssueUserInterest.objects.filter(issue_id__in=[issue.id for issue in issues])
+            .select_related("user")
+            .order_by("user__login"),
+            "issue_id",
+        ).items()
+    }
+
+
+def load_merged_issue_ids(issues: list[Issue]) -> dict[int, bool]:
+    """Load whether issues have at least one merged pull request."""
+    return dict.fromkeys(
+        Issue.objects.filter(
+            id__in=[issue.id for issue in issues],
+            pull_requests__merged_at__isnull=False,
+            pull_requests__state="closed",
+        ).values_list("id", flat=True),
+        True,
+    )
+
+
+def load_pull_requests(issues: list[Issue]) -> dict[int, list]:
+    """Load pull requests linked to issues."""
+    return group_by(
+        PullRequest.objects.filter(
+            related_issues__in=[issue.id for issue in issues]
+        ).select_related("author", "repository"),
+        "related_issues",
+    )
 
 
 @strawberry_django.type(
@@ -25,11 +63,12 @@ class IssueNode(strawberry.relay.Node):
     @strawberry.field
     def author(self) -> UserNode | None:
         """Resolve author."""
-        return self.author
+        return prefetch_related(self, "author").author
 
     @strawberry.field
     def organization_name(self) -> str | None:
         """Resolve organization name."""
+        prefetch_related(self, "repository__organization")
         return (
             self.repository.organization.login
             if self.repository and self.repository.organization
@@ -39,34 +78,30 @@ class IssueNode(strawberry.relay.Node):
     @strawberry.field
     def repository_name(self) -> str | None:
         """Resolve the repository name."""
+        prefetch_related(self, "repository")
         return self.repository.name if self.repository else None
 
     @strawberry.field
     def assignees(self) -> list[UserNode]:
         """Resolve assignees list."""
-        return list(self.assignees.all())
+        return list(prefetch_related(self, "assignees").assignees.all())
 
     @strawberry.field
     def labels(self) -> list[str]:
         """Resolve label names for the issue."""
-        return list(self.labels.values_list("name", flat=True))
+        return [label.name for label in prefetch_related(self, "labels").labels.all()]
 
     @strawberry.field
     def is_merged(self) -> bool:
         """Return True if this issue has at least one merged pull request."""
-        return self.pull_requests.filter(state="closed", merged_at__isnull=False).exists()
+        return load(self, load_merged_issue_ids, default=False)
 
     @strawberry.field
     def interested_users(self) -> list[UserNode]:
         """Return all users who have expressed interest in this issue."""
-        return [
-            interest.user
-            for interest in self.participant_interests.select_related("user").order_by(
-                "user__login"
-            )
-        ]
+        return load(self, load_interested_users, default=[])
 
     @strawberry.field
     def pull_requests(self) -> list[PullRequestNode]:
         """Return all pull requests linked to this issue."""
-        return list(self.pull_requests.select_related("author", "repository").all())
+        return load(self, load_pull_requests, default=[])
@@ -3,6 +3,7 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import prefetch_related
 from apps.github.api.internal.nodes.user import UserNode
 from apps.github.models.milestone import Milestone
 
@@ -25,11 +26,12 @@ class MilestoneNode(strawberry.relay.Node):
     @strawberry.field
     def author(self) -> UserNode | None:
         """Resolve author."""
-        return self.author
+        return prefetch_related(self, "author").author
 
     @strawberry.field
     def organization_name(self) -> str | None:
         """Resolve organization name."""
+        prefetch_related(self, "repository__organization")
         return (
             self.repository.organization.login
             if self.repository and self.repository.organization
@@ -47,4 +49,5 @@ class MilestoneNode(strawberry.relay.Node):
     @strawberry.field
     def repository_name(self) -> str | None:
         """Resolve repository name."""
+        prefetch_related(self, "repository")
         return self.repository.name if self.repository else None
@@ -4,6 +4,7 @@ import strawberry
 import strawberry_django
 from django.db import models
 
+from apps.common.loaders import load
 from apps.github.models.organization import Organization
 from apps.github.models.repository import Repository
 from apps.github.models.repository_contributor import RepositoryContributor
@@ -20,6 +21,41 @@ class OrganizationStatsNode:
     total_stars: int
 
 
+def load_stats(organizations: list[Organization]) -> dict[int, OrganizationStatsNode]:
+    """Load stats of organizations."""
+    organization_ids = [organization.id for organization in organizations]
+    repository_stats = {
+        stats["organization_id"]: stats
+        for stats in Repository.objects.filter(organization_id__in=organization_ids)
+        .values("organization_id")
+        .annotate(
+            total_repositories=models.Count("id"),
+            total_stars=models.Sum("stars_count"),
+            total_forks=models.Sum("forks_count"),
+            total_issues=models.Sum("open_issues_count"),
+        )
+    }
+    unique_contributors = dict(
+        RepositoryContributor.objects.filter(repository__organization_id__in=organization_ids)
+        .values("repository__organization_id")
+        .annotate(total_contributors=models.Count("user", distinct=True))
+        .values_list("repository__organization_id", "total_contributors")
+    )
+
+    organization_stats = {}
+    for organization_id in organization_ids:
+        stats = repository_stats.get(organization_id, {})
+        organization_stats[organization_id] = OrganizationStatsNode(
+            total_repositories=stats.get("total_repositories") or 0,
+            total_contributors=unique_contributors.get(organization_id, 0),
+            total_stars=stats.get("total_stars") or 0,
+            total_forks=stats.get("total_forks") or 0,
+            total_issues=stats.get("total_issues") or 0,
+        )
+
+    return organization_stats
+
+
 @strawberry_django.type(
     Organization,
     fields=[
@@ -42,33 +78,7 @@ class OrganizationNode(strawberry.relay.Node):
     @strawberry.field
     def stats(self) -> OrganizationStatsNode:
         """Resolve organization stats."""
-        repositories = Repository.objects.filter(organization=self)
-
-        total_repositories = repositories.count()
-        aggregated_stats = repositories.aggregate(
-            total_stars=models.Sum("stars_count"),
-            total_forks=models.Sum("forks_count"),
-            total_issues=models.Sum("open_issues_count"),
-        )
-
-        total_stars = aggregated_stats.get("total_stars") or 0
-        total_forks = aggregated_stats.get("total_forks") or 0
-        total_issues = aggregated_stats.get("total_issues") or 0
-
-        unique_contributors = (
-            RepositoryContributor.objects.filter(repository__in=repositories)
-            .values("user")
-            .distinct()
-            .count()
-        )
-
-        return OrganizationStatsNode(
-            total_repositories=total_repositories,
-            total_contributors=unique_contributors,
-            total_stars=total_stars,
-            total_forks=total_forks,
-            total_issues=total_issues,
-        )
+        return load(self, load_stats)
 
     @strawberry.field
     def url(self) -> str:
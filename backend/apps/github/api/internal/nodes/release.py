@@ -3,11 +3,23 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import load, prefetch_related
 from apps.github.api.internal.nodes.user import UserNode
 from apps.github.models.release import Release
+from apps.github.models.repository import Repository
 from apps.owasp.constants import OWASP_ORGANIZATION_NAME
 
 
+def load_projects(releases: list[Release]) -> dict:
+    """Load projects of release repositories."""
+    projects = Repository.get_projects({release.repository_id for release in releases})
+    return {
+        release.id: projects[release.repository_id]
+        for release in releases
+        if release.repository_id in projects
+    }
+
+
 @strawberry_django.type(
     Release,
     fields=[
@@ -23,11 +35,12 @@ class ReleaseNode(strawberry.relay.Node):
     @strawberry.field
     def author(self) -> UserNode | None:
         """Resolve author."""
-        return self.author
+        return prefetch_related(self, "author").author
 
     @strawberry.field
     def organization_name(self) -> str | None:
         """Resolve organization name."""
+        prefetch_related(self, "repository__organization")
         return (
             self.repository.organization.login
             if self.repository and self.repository.organization
@@ -37,15 +50,13 @@ class ReleaseNode(strawberry.relay.Node):
     @strawberry.field
     def project_name(self) -> str | None:
         """Resolve project name."""
-        return (
-            self.repository.project.name.lstrip(OWASP_ORGANIZATION_NAME)
-            if self.repository and self.repository.project
-            else None
-        )
+        project = load(self, load_projects)
+        return project.name.lstrip(OWASP_ORGANIZATION_NAME) if project else None
 
     @strawberry.field
     def repository_name(self) -> str | None:
         """Resolve repository name."""
+        prefetch_related(self, "repository")
         return self.repository.name if self.repository else None
 
     @strawberry.field
@@ -5,11 +5,15 @@ from typing import TYPE_CHECKING, Annotated
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import get_top_by, load, prefetch_related
 from apps.github.api.internal.nodes.issue import IssueNode
 from apps.github.api.internal.nodes.milestone import MilestoneNode
 from apps.github.api.internal.nodes.organization import OrganizationNode
 from apps.github.api.internal.nodes.release import ReleaseNode
 from apps.github.api.internal.nodes.repository_contributor import RepositoryContributorNode
+from apps.github.models.issue import Issue
+from apps.github.models.milestone import Milestone
+from apps.github.models.release import Release
 from apps.github.models.repository import Repository
 
 if TYPE_CHECKING:
@@ -19,6 +23,55 @@ RECENT_ISSUES_LIMIT = 5
 RECENT_RELEASES_LIMIT = 5
 
 
+def load_latest_releases(repositories: list[Repository]) -> dict:
+    """Load latest releases of repositories."""
+    return Repository.get_latest_releases([repository.id for repository in repositories])
+
+
+def load_projects(repositories: list[Repository]) -> dict:
+    """Load projects of repositories."""
+    return Repository.get_projects([repository.id for repository in repositories])
+
+
+def load_recent_issues(repositories: list[Repository]) -> dict[int, list]:
+    """Load recent issues of repositories."""
+    return get_top_by(
+        Issue.objects.filter(
+            repository_id__in=[repository.id for repository in repositories]
+        ).select_related("author"),
+        "repository_id",
+        ["-created_at"],
+        RECENT_ISSUES_LIMIT,
+    )
+
+
+def load_recent_milestones(repositories: list[Repository], limit: int) -> dict[int, list]:
+    """Load recent milestones of repositories."""
+    return get_top_by(
+        Milestone.objects.filter(
+            repository_id__in=[repository.id for repository in repositories]
+        ).select_related("repository"),
+        "repository_id",
+        ["-created_at"],
+        limit,
+    )
+
+
+def load_recent_releases(repositories: list[Repository]) -> dict[int, list]:
+    """Load recent published releases of repositories."""
+    return get_top_by(
+        Release.objects.filter(
+            is_draft=False,
+            is_pre_release=False,
+            published_at__isnull=False,
+            repository_id__in=[repository.id for repository in repositories],
+        ),
+        "repository_id",
+        ["-published_at"],
+        RECENT_RELEASES_LIMIT,
+    )
+
+
 @strawberry_django.type(
     Repository,
     fields=[
@@ -45,7 +98,7 @@ class RepositoryNode(strawberry.relay.Node):
     def issues(self) -> list[IssueNode]:
         """Resolve recent issues."""
         # TODO(arkid15r): rename this to recent_issues.
-        return self.issues.select_related("author").order_by("-created_at")[:RECENT_ISSUES_LIMIT]
+        return load(self, load_recent_issues, default=[])
 
     @strawberry.field
     def languages(self) -> list[str]:
@@ -55,12 +108,12 @@ class RepositoryNode(strawberry.relay.Node):
     @strawberry.field
     def latest_release(self) -> str:
         """Resolve latest release."""
-        return self.latest_release
+        return load(self, load_latest_releases)
 
     @strawberry.field
     def organization(self) -> OrganizationNode | None:
         """Resolve organization."""
-        return self.organization
+        return prefetch_related(self, "organization").organization
 
     @strawberry.field
     def owner_key(self) -> str:
@@ -72,18 +125,18 @@ class RepositoryNode(strawberry.relay.Node):
         self,
     ) -> Annotated["ProjectNode", strawberry.lazy("apps.owasp.api.internal.nodes.project")] | None:
         """Resolve project."""
-        return self.project
+        return load(self, load_projects)
 
     @strawberry.field
     def recent_milestones(self, limit: int = 5) -> list[MilestoneNode]:
         """Resolve recent milestones."""
-        return self.recent_milestones.select_related("repository").order_by("-created_at")[:limit]
+        return load(self, load_recent_milestones, limit, default=[])
 
     @strawberry.field
     def releases(self) -> list[ReleaseNode]:
         """Resolve recent releases."""
         # TODO(arkid15r): rename this to recent_releases.
-        return self.published_releases.order_by("-published_at")[:RECENT_RELEASES_LIMIT]
+        return load(self, load_recent_releases, default=[])
 
     @strawberry.field
     def top_contributors(self) -> list[RepositoryContributorNode]:
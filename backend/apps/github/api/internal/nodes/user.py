@@ -3,8 +3,43 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import count_by, group_by, load, prefetch_related
+from apps.github.models.issue import Issue
+from apps.github.models.release import Release
 from apps.github.models.user import User
 from apps.nest.api.internal.nodes.badge import BadgeNode
+from apps.nest.models.user_badge import UserBadge
+
+
+def load_badge_counts(users: list[User]) -> dict[int, int]:
+    """Load active badge counts of users."""
+    return count_by(
+        UserBadge.objects.filter(is_active=True, user_id__in=[user.id for user in users]),
+        "user_id",
+    )
+
+
+def load_badges(users: list[User]) -> dict[int, list]:
+    """Load active badges of users."""
+    return {
+        user_id: [user_badge.badge for user_badge in user_badges]
+        for user_id, user_badges in group_by(
+            UserBadge.objects.filter(is_active=True, user_id__in=[user.id for user in users])
+            .select_related("badge")
+            .order_by("badge__weight", "badge__name"),
+            "user_id",
+        ).items()
+    }
+
+
+def load_issues_counts(users: list[User]) -> dict[int, int]:
+    """Load created issues counts of users."""
+    return count_by(Issue.objects.filter(author_id__in=[user.id for user in users]), "author_id")
+
+
+def load_releases_counts(users: list[User]) -> dict[int, int]:
+    """Load created releases counts of users."""
+    return count_by(Release.objects.filter(author_id__in=[user.id for user in users]), "author_id")
 
 
 @strawberry_django.type(
@@ -31,24 +66,12 @@ class UserNode:
     @strawberry.field
     def badge_count(self) -> int:
         """Resolve badge count."""
-        return self.user_badges.filter(is_active=True).count()
+        return load(self, load_badge_counts, default=0)
 
     @strawberry.field
     def badges(self) -> list[BadgeNode]:
         """Return user badges."""
-        user_badges = (
-            self.user_badges.filter(
-                is_active=True,
-            )
-            .select_related(
-                "badge",
-            )
-            .order_by(
-                "badge__weight",
-                "badge__name",
-            )
-        )
-        return [user_badge.badge for user_badge in user_badges]
+        return load(self, load_badges, default=[])
 
     @strawberry.field
     def created_at(self) -> float:
@@ -58,6 +81,7 @@ class UserNode:
     @strawberry.field
     def first_owasp_contribution_at(self) -> float | None:
         """Resolve first OWASP contribution date."""
+        prefetch_related(self, "owasp_profile")
         if hasattr(self, "owasp_profile") and self.owasp_profile.first_contribution_at:
             return self.owasp_profile.first_contribution_at.timestamp()
         return None
@@ -65,6 +89,7 @@ class UserNode:
     @strawberry.field
     def is_owasp_board_member(self) -> bool:
         """Resolve if member is currently on OWASP Board of Directors."""
+        prefetch_related(self, "owasp_profile")
         if hasattr(self, "owasp_profile"):
             return self.owasp_profile.is_owasp_board_member
         return False
@@ -72,6 +97,7 @@ class UserNode:
     @strawberry.field
     def is_former_owasp_staff(self) -> bool:
         """Resolve if member is a former OWASP staff member."""
+        prefetch_related(self, "owasp_profile")
         if hasattr(self, "owasp_profile"):
             return self.owasp_profile.is_former_owasp_staff
         return False
@@ -79,6 +105,7 @@ class UserNode:
     @strawberry.field
     def is_gsoc_mentor(self) -> bool:
         """Resolve if member is a Google Summer of Code mentor."""
+        prefetch_related(self, "owasp_profile")
         if hasattr(self, "owasp_profile"):
             return self.owasp_profile.is_gsoc_mentor
         return False
@@ -86,11 +113,12 @@ class UserNode:
     @strawberry.field
     def issues_count(self) -> int:
         """Resolve issues count."""
-        return self.idx_issues_count
+        return load(self, load_issues_counts, default=0)
 
     @strawberry.field
     def linkedin_page_id(self) -> str:
         """Resolve LinkedIn page ID."""
+        prefetch_related(self, "owasp_profile")
         if hasattr(self, "owasp_profile") and self.owasp_profile.linkedin_page_id:
             return self.owasp_profile.linkedin_page_id
         return ""
@@ -98,7 +126,7 @@ class UserNode:
     @strawberry.field
     def releases_count(self) -> int:
         """Resolve releases count."""
-        return self.idx_releases_count
+        return load(self, load_releases_counts, default=0)
 
     @strawberry.field
     def updated_at(self) -> float:
@@ -7,3 +7,7 @@ class GithubConfig(AppConfig):
     """Github app config."""
 
     name = "apps.github"
+
+    def ready(self):
+        """Ready."""
+        import apps.github.signals  # noqa: F401
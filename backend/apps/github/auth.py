@@ -1,5 +1,6 @@
 """GitHub App authentication module."""
 
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -8,6 +9,7 @@ from django.conf import settings
 from github import Auth, Github
 from github.GithubException import BadCredentialsException
 
+from apps.github import http_cache
 from apps.github.constants import GITHUB_ITEMS_PER_PAGE
 
 logger = logging.getLogger(__name__)
@@ -62,7 +64,7 @@ class GitHubAppAuth:
 
         if self._is_app_configured():
             logger.warning("Using GitHub App authentication")
-            return Github(
+            client = Github(
                 auth=Auth.AppInstallationAuth(
                     app_auth=Auth.AppAuth(
                         app_id=self.app_id,
@@ -72,10 +74,16 @@ class GitHubAppAuth:
                 ),
                 per_page=per_page,
             )
+            http_cache.install(client, f"app:{self.app_id}:{self.app_installation_id}")
+            return client
 
         if self.pat_token:
             logger.warning("Using GitHub PAT token")
-            return Github(self.pat_token, per_page=per_page)
+            client = Github(self.pat_token, per_page=per_page)
+            http_cache.install(
+                client, f"pat:{hashlib.sha256(self.pat_token.encode()).hexdigest()}"
+            )
+            return client
 
         raise BadCredentialsException(401, "Invalid GitHub credentials", None)
 
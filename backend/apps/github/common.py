@@ -12,7 +12,9 @@ from github.GithubException import UnknownObjectException
 if TYPE_CHECKING:
     from github import Github
 
+from apps.github.constants import GITHUB_ITEMS_PER_PAGE
 from apps.github.models.comment import Comment
+from apps.github.models.common import use_identity_map
 from apps.github.models.issue import Issue
 from apps.github.models.label import Label
 from apps.github.models.milestone import Milestone
@@ -27,11 +29,16 @@ from apps.github.utils import check_owasp_site_repository
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@use_identity_map()
 def sync_repository(
     gh_repository, organization=None, user=None
 ) -> tuple[Organization, Repository]:
     """Sync GitHub repository data.
 
+    Users, labels, milestones and contributors are resolved through an identity map,
+    so each of them is loaded and saved at most once per sync. Assignees and labels
+    relations are saved in bulk for each page of milestones, issues and pull requests.
+
     Args:
         gh_repository (github.Repository.Repository): The GitHub repository object.
         organization (Organization, optional): The organization instance.
@@ -82,6 +89,7 @@ def sync_repository(
             else timezone.now() - td(days=30)
         )
 
+        milestone_labels: dict[int, set[int]] = {}
         for gh_milestone in gh_repository.get_milestones(**kwargs):
             if gh_milestone.updated_at < until:
                 break
@@ -93,13 +101,17 @@ def sync_repository(
             )
 
             # Labels.
-            milestone.labels.clear()
+            milestone_labels[milestone.id] = set()
             for gh_milestone_label in gh_milestone.get_labels():
                 try:
-                    milestone.labels.add(Label.update_data(gh_milestone_label))
+                    milestone_labels[milestone.id].add(Label.update_data(gh_milestone_label).id)
                 except UnknownObjectException:
                     logger.exception("Couldn't get GitHub milestone label %s", milestone.url)
 
+            if len(milestone_labels) >= GITHUB_ITEMS_PER_PAGE:
+                Milestone.bulk_save_m2m(Milestone.labels, milestone_labels)
+        Milestone.bulk_save_m2m(Milestone.labels, milestone_labels)
+
         # GitHub repository issues.
         project_track_issues = repository.project.track_issues if repository.project else True
         month_ago = timezone.now() - td(days=30)
@@ -115,6 +127,8 @@ def sync_repository(
                 if (latest_updated_issue := repository.latest_updated_issue)
                 else month_ago
             )
+            issue_assignees: dict[int, set[int]] = {}
+            issue_labels: dict[int, set[int]] = {}
             for gh_issue in gh_repository.get_issues(**kwargs):
                 if gh_issue.pull_request:  # Skip pull requests.
                     continue
@@ -140,18 +154,25 @@ def sync_repository(
                 )
 
                 # Assignees.
-                issue.assignees.clear()
-                for gh_issue_assignee in gh_issue.assignees:
-                    if issue_assignee := User.update_data(gh_issue_assignee):
-                        issue.assignees.add(issue_assignee)
+                issue_assignees[issue.id] = {
+                    issue_assignee.id
+                    for gh_issue_assignee in gh_issue.assignees
+                    if (issue_assignee := User.update_data(gh_issue_assignee))
+                }
 
                 # Labels.
-                issue.labels.clear()
+                issue_labels[issue.id] = set()
                 for gh_issue_label in gh_issue.labels:
                     try:
-                        issue.labels.add(Label.update_data(gh_issue_label))
+                        issue_labels[issue.id].add(Label.update_data(gh_issue_label).id)
                     except UnknownObjectException:
                         logger.exception("Couldn't get GitHub issue label %s", issue.url)
+
+                if len(issue_assignees) >= GITHUB_ITEMS_PER_PAGE:
+                    Issue.bulk_save_m2m(Issue.assignees, issue_assignees)
+                    Issue.bulk_save_m2m(Issue.labels, issue_labels)
+            Issue.bulk_save_m2m(Issue.assignees, issue_assignees)
+            Issue.bulk_save_m2m(Issue.labels, issue_labels)
         else:
             logger.info("Skipping issues sync for %s", repository.name)
 
@@ -166,6 +187,8 @@ def sync_repository(
             if (latest_updated_pull_request := repository.latest_updated_pull_request)
             else month_ago
         )
+        pull_request_assignees: dict[int, set[int]] = {}
+        pull_request_labels: dict[int, set[int]] = {}
         for gh_pull_request in gh_repository.get_pulls(**kwargs):
             if gh_pull_request.updated_at < until:
                 break
@@ -188,19 +211,28 @@ def sync_repository(
             )
 
             # Assignees.
-            pull_request.assignees.clear()
-            for gh_pull_request_assignee in gh_pull_request.assignees:
-                if pull_request_assignee := User.update_data(gh_pull_request_assignee):
-                    pull_request.assignees.add(pull_request_assignee)
+            pull_request_assignees[pull_request.id] = {
+                pull_request_assignee.id
+                for gh_pull_request_assignee in gh_pull_request.assignees
+                if (pull_request_assignee := User.update_data(gh_pull_request_assignee))
+            }
 
             # Labels.
-            pull_request.labels.clear()
+            pull_request_labels[pull_request.id] = set()
             for gh_pull_request_label in gh_pull_request.labels:
                 try:
-                    pull_request.labels.add(Label.update_data(gh_pull_request_label))
+                    pull_request_labels[pull_request.id].add(
+                        Label.update_data(gh_pull_request_label).id
+                    )
                 except UnknownObjectException:
                     logger.exception("Couldn't get GitHub pull request label %s", pull_request.url)
 
+            if len(pull_request_assignees) >= GITHUB_ITEMS_PER_PAGE:
+                PullRequest.bulk_save_m2m(PullRequest.assignees, pull_request_assignees)
+                PullRequest.bulk_save_m2m(PullRequest.labels, pull_request_labels)
+        PullRequest.bulk_save_m2m(PullRequest.assignees, pull_request_assignees)
+        PullRequest.bulk_save_m2m(PullRequest.labels, pull_request_labels)
+
     # GitHub repository releases.
     releases = []
     if not is_owasp_site_repository:
@@ -219,17 +251,27 @@ def sync_repository(
     Release.bulk_save(releases)
 
     # GitHub repository contributors.
-    RepositoryContributor.bulk_save(
-        [
-            RepositoryContributor.update_data(
-                gh_contributor,
-                repository=repository,
-                user=user,
-            )
-            for gh_contributor in gh_repository.get_contributors()
-            if (user := User.update_data(gh_contributor))
-        ]
-    )
+    gh_contributors = list(gh_repository.get_contributors())
+    with use_identity_map() as identity_map:
+        identity_map.prefetch(
+            User,
+            node_ids=[User.get_node_id(gh_contributor) for gh_contributor in gh_contributors],
+        )
+        if repository.id:
+            identity_map.prefetch(RepositoryContributor, repository=repository)
+
+        RepositoryContributor.bulk_save(
+            [
+                RepositoryContributor.update_data(
+                    gh_contributor,
+                    repository=repository,
+                    user=user,
+                    save=False,
+                )
+                for gh_contributor in gh_contributors
+                if (user := User.update_data(gh_contributor))
+            ]
+        )
 
     return organization, repository
 
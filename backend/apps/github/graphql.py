@@ -0,0 +1,604 @@
+"""GitHub GraphQL API fetch layer."""
+
+from __future__ import annotations
+
+from base64 import b64encode
+from datetime import datetime
+from types import SimpleNamespace
+
+from github.GithubException import GithubException, UnknownObjectException
+
+from apps.github.constants import GITHUB_ITEMS_PER_PAGE
+
+FUNDING_YML_PATH = ".github/FUNDING.yml"
+GITHUB_NESTED_ITEMS_PER_PAGE = 20
+
+LOCK_REASONS = {
+    "OFF_TOPIC": "off-topic",
+    "RESOLVED": "resolved",
+    "SPAM": "spam",
+    "TOO_HEATED": "too heated",
+}
+
+USER_FRAGMENT = """
+fragment UserFields on User {
+  avatarUrl
+  bio
+  company
+  createdAt
+  databaseId
+  email
+  id
+  isHireable
+  location
+  login
+  name
+  twitterUsername
+  updatedAt
+  followers { totalCount }
+  following { totalCount }
+  gists(privacy: PUBLIC) { totalCount }
+  repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+}
+"""
+
+ACTOR_FRAGMENT = """
+fragment ActorFields on Actor {
+  __typename
+  avatarUrl
+  login
+  ... on Bot { createdAt databaseId id updatedAt }
+  ... on Mannequin { createdAt databaseId id updatedAt }
+  ... on Organization { createdAt databaseId id name updatedAt }
+  ... on User { ...UserFields }
+}
+"""
+
+LABEL_FRAGMENT = """
+fragment LabelFields on Label {
+  color
+  description
+  id
+  name
+}
+"""
+
+MILESTONE_FRAGMENT = """
+fragment MilestoneFields on Milestone {
+  closedAt
+  createdAt
+  description
+  dueOn
+  id
+  number
+  state
+  title
+  updatedAt
+  url
+  creator { ...ActorFields }
+  closedIssues: issues(states: CLOSED) { totalCount }
+  closedPullRequests: pullRequests(states: [CLOSED, MERGED]) { totalCount }
+  openIssues: issues(states: OPEN) { totalCount }
+  openPullRequests: pullRequests(states: OPEN) { totalCount }
+}
+"""
+
+ISSUE_FRAGMENT = f"""
+fragment IssueFields on Issue {{
+  activeLockReason
+  body
+  closedAt
+  createdAt
+  databaseId
+  id
+  locked
+  number
+  state
+  stateReason
+  title
+  updatedAt
+  url
+  author {{ ...ActorFields }}
+  assignees(first: {GITHUB_NESTED_ITEMS_PER_PAGE}) {{ nodes {{ ...UserFields }} }}
+  comments {{ totalCount }}
+  labels(first: {GITHUB_NESTED_ITEMS_PER_PAGE}) {{ nodes {{ ...LabelFields }} }}
+  milestone {{ ...MilestoneFields }}
+}}
+"""
+
+PULL_REQUEST_FRAGMENT = f"""
+fragment PullRequestFields on PullRequest {{
+  body
+  closedAt
+  createdAt
+  databaseId
+  id
+  mergedAt
+  number
+  state
+  title
+  updatedAt
+  url
+  author {{ ...ActorFields }}
+  assignees(first: {GITHUB_NESTED_ITEMS_PER_PAGE}) {{ nodes {{ ...UserFields }} }}
+  labels(first: {GITHUB_NESTED_ITEMS_PER_PAGE}) {{ nodes {{ ...LabelFields }} }}
+  milestone {{ ...MilestoneFields }}
+}}
+"""
+
+RELEASE_FRAGMENT = """
+fragment ReleaseFields on Release {
+  createdAt
+  databaseId
+  description
+  id
+  isDraft
+  isPrerelease
+  name
+  publishedAt
+  tagName
+  author { ...UserFields }
+}
+"""
+
+REPOSITORY_QUERY = f"""
+query($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{
+    createdAt
+    description
+    diskUsage
+    forkCount
+    hasIssuesEnabled
+    hasProjectsEnabled
+    hasWikiEnabled
+    homepageUrl
+    id
+    isArchived
+    isFork
+    isTemplate
+    name
+    pushedAt
+    stargazerCount
+    updatedAt
+    defaultBranchRef {{
+      name
+      target {{ ... on Commit {{ history {{ totalCount }} }} }}
+    }}
+    fundingFile: object(expression: "HEAD:{FUNDING_YML_PATH}") {{ ... on Blob {{ text }} }}
+    languages(first: 100) {{ edges {{ size node {{ name }} }} }}
+    licenseInfo {{ spdxId }}
+    openIssues: issues(states: OPEN) {{ totalCount }}
+    openPullRequests: pullRequests(states: OPEN) {{ totalCount }}
+    repositoryTopics(first: 100) {{ nodes {{ topic {{ name }} }} }}
+    watchers {{ totalCount }}
+  }}
+}}
+"""
+
+CONNECTION_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    {connection}(first: $first, after: $after, orderBy: {order_by}) {{
+      pageInfo {{ endCursor hasNextPage }}
+      nodes {{ ...{fragment_name} }}
+    }}
+  }}
+}}
+"""
+
+ISSUES_QUERY = (
+    CONNECTION_QUERY.format(
+        connection="issues",
+        fragment_name="IssueFields",
+        order_by="{field: UPDATED_AT, direction: DESC}",
+    )
+    + ACTOR_FRAGMENT
+    + ISSUE_FRAGMENT
+    + LABEL_FRAGMENT
+    + MILESTONE_FRAGMENT
+    + USER_FRAGMENT
+)
+
+MILESTONES_QUERY = (
+    CONNECTION_QUERY.format(
+        connection="milestones",
+        fragment_name="MilestoneFields",
+        order_by="{field: UPDATED_AT, direction: DESC}",
+    )
+    + ACTOR_FRAGMENT
+    + MILESTONE_FRAGMENT
+    + USER_FRAGMENT
+)
+
+PULL_REQUESTS_QUERY = (
+    CONNECTION_QUERY.format(
+        connection="pullRequests",
+        fragment_name="PullRequestFields",
+        order_by="{field: UPDATED_AT, direction: DESC}",
+    )
+    + ACTOR_FRAGMENT
+    + LABEL_FRAGMENT
+    + MILESTONE_FRAGMENT
+    + PULL_REQUEST_FRAGMENT
+    + USER_FRAGMENT
+)
+
+RELEASES_QUERY = (
+    CONNECTION_QUERY.format(
+        connection="releases",
+        fragment_name="ReleaseFields",
+        order_by="{field: CREATED_AT, direction: DESC}",
+    )
+    + RELEASE_FRAGMENT
+    + USER_FRAGMENT
+)
+
+MILESTONE_LABELS_QUERY = f"""
+query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    milestone(number: $number) {{
+      issues(first: $first, after: $after) {{
+        pageInfo {{ endCursor hasNextPage }}
+        nodes {{ labels(first: {GITHUB_NESTED_ITEMS_PER_PAGE}) {{ nodes {{ ...LabelFields }} }} }}
+      }}
+    }}
+  }}
+}}
+{LABEL_FRAGMENT}
+"""
+
+
+def parse_datetime(value: str | None) -> datetime | None:
+    """Parse GitHub GraphQL API datetime.
+
+    Args:
+        value (str, optional): The ISO 8601 datetime string.
+
+    Returns:
+        datetime or None: The timezone aware datetime.
+
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+def get_total_count(data: dict, *fields: str) -> int:
+    """Sum `totalCount` values of the connection fields.
+
+    Args:
+        data (dict): The GraphQL object data.
+        *fields (str): The connection field names.
+
+    Returns:
+        int: The total count.
+
+    """
+    return sum((data.get(field) or {}).get("totalCount", 0) for field in fields)
+
+
+def to_label(data: dict) -> SimpleNamespace:
+    """Convert GraphQL label data to a github.Label.Label compatible object.
+
+    Args:
+        data (dict): The GraphQL label data.
+
+    Returns:
+        SimpleNamespace: The label object.
+
+    """
+    return SimpleNamespace(
+        color=data["color"],
+        description=data["description"],
+        name=data["name"],
+        raw_data={"node_id": data["id"]},
+    )
+
+
+def to_user(data: dict | None) -> SimpleNamespace | None:
+    """Convert GraphQL actor data to a github.NamedUser.NamedUser compatible object.
+
+    Args:
+        data (dict, optional): The GraphQL actor data.
+
+    Returns:
+        SimpleNamespace or None: The user object or None for deleted (ghost) users.
+
+    """
+    if not data or not data.get("id"):
+        return None
+
+    typename = data.get("__typename", "User")
+    return SimpleNamespace(
+        avatar_url=data["avatarUrl"],
+        bio=data.get("bio"),
+        collaborators=None,
+        company=data.get("company"),
+        created_at=parse_datetime(data["createdAt"]),
+        email=data.get("email"),
+        followers=get_total_count(data, "followers") if "followers" in data else None,
+        following=get_total_count(data, "following") if "following" in data else None,
+        hireable=data.get("isHireable"),
+        id=data.get("databaseId"),
+        location=data.get("location"),
+        login=data["login"],
+        name=data.get("name"),
+        public_gists=get_total_count(data, "gists") if "gists" in data else None,
+        public_repos=(get_total_count(data, "repositories") if "repositories" in data else None),
+        raw_data={"node_id": data["id"]},
+        twitter_username=data.get("twitterUsername"),
+        type=typename,
+        updated_at=parse_datetime(data["updatedAt"]),
+    )
+
+
+class GraphQLCommits:
+    """Repository commits with lazily checked `totalCount`.
+
+    Mirrors PyGithub's PaginatedList that raises on `totalCount` access rather than
+    on `get_commits()` call for empty repositories.
+    """
+
+    def __init__(self, history: dict | None) -> None:
+        """Initialize commits.
+
+        Args:
+            history (dict | None): The default branch history data, None if empty.
+
+        """
+        self.history = history
+
+    @property
+    def totalCount(self) -> int:  # noqa: N802
+        """Get total number of commits.
+
+        Returns:
+            int: The number of commits.
+
+        Raises:
+            GithubException: If the repository is empty.
+
+        """
+        if self.history is None:
+            raise GithubException(
+                409,
+                {"message": "Git Repository is empty.", "status": "409"},
+                None,
+            )
+
+        return self.history["totalCount"]
+
+
+class GraphQLRepository:
+    """GitHub repository backed by GitHub GraphQL API data.
+
+    Provides the subset of github.Repository.Repository interface used by
+    `apps.github.common.sync_repository` so that the existing model mappers can
+    be fed with GraphQL data. Repository metadata is fetched with a single query and
+    milestones, issues, pull requests and releases are fetched lazily page by page.
+    Anything that is not available via GraphQL API (e.g. contributors) falls back
+    to the wrapped REST API object.
+    """
+
+    def __init__(self, gh_repository, requester) -> None:
+        """Initialize the repository and fetch its metadata.
+
+        Args:
+            gh_repository (github.Repository.Repository): The REST API repository object.
+            requester (github.Requester.Requester): The authenticated GitHub requester.
+
+        """
+        self._gh_repository = gh_repository
+        self._requester = requester
+        self.owner_login, self.name = gh_repository.full_name.split("/", 1)
+
+        data = self._query(REPOSITORY_QUERY)["repository"]
+        self._data = data
+
+        self.archived = data["isArchived"]
+        self.created_at = parse_datetime(data["createdAt"])
+        self.default_branch = (data["defaultBranchRef"] or {}).get("name")
+        self.description = data["description"]
+        self.fork = data["isFork"]
+        self.forks_count = data["forkCount"]
+        self.has_downloads = None
+        self.has_issues = data["hasIssuesEnabled"]
+        self.has_pages = None
+        self.has_projects = data["hasProjectsEnabled"]
+        self.has_wiki = data["hasWikiEnabled"]
+        self.homepage = data["homepageUrl"]
+        self.is_template = data["isTemplate"]
+        self.license = (
+            SimpleNamespace(spdx_id=data["licenseInfo"]["spdxId"]) if data["licenseInfo"] else None
+        )
+        self.name = data["name"]
+        self.open_issues_count = get_total_count(data, "openIssues", "openPullRequests")
+        self.pushed_at = parse_datetime(data["pushedAt"])
+        self.raw_data = {"node_id": data["id"]}
+        self.size = data["diskUsage"]
+        self.stargazers_count = data["stargazerCount"]
+        self.subscribers_count = get_total_count(data, "watchers")
+        self.topics = [node["topic"]["name"] for node in data["repositoryTopics"]["nodes"]]
+        self.updated_at = parse_datetime(data["updatedAt"])
+        self.watchers_count = data["stargazerCount"]
+
+    def __getattr__(self, name: str):
+        """Fall back to the REST API repository object."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self._gh_repository, name)
+
+    def _paginate(self, query: str, path: tuple[str, ...], **variables):
+        """Iterate over GraphQL connection nodes fetching pages on demand.
+
+        Args:
+            query (str): The GraphQL connection query.
+            path (tuple): The path to the connection in the query result.
+            **variables: Additional query variables.
+
+        Yields:
+            dict: The connection node data.
+
+        """
+        after = None
+        while True:
+            connection = self._query(
+                query,
+                after=after,
+                first=GITHUB_ITEMS_PER_PAGE,
+                **variables,
+            )
+            for key in path:
+                connection = connection.get(key) or {}
+
+            yield from connection.get("nodes", ())
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            after = page_info["endCursor"]
+
+    def _query(self, query: str, **variables) -> dict:
+        """Run a GraphQL query against the repository.
+
+        Args:
+            query (str): The GraphQL query.
+            **variables: Additional query variables.
+
+        Returns:
+            dict: The query result data.
+
+        """
+        _, response = self._requester.graphql_query(
+            query,
+            {"name": self.name, "owner": self.owner_login, **variables},
+        )
+        return response["data"]
+
+    def _to_milestone(self, data: dict | None) -> SimpleNamespace | None:
+        if not data:
+            return None
+
+        return SimpleNamespace(
+            closed_at=parse_datetime(data["closedAt"]),
+            closed_issues=get_total_count(data, "closedIssues", "closedPullRequests"),
+            created_at=parse_datetime(data["createdAt"]),
+            creator=to_user(data["creator"]),
+            description=data["description"],
+            due_on=parse_datetime(data["dueOn"]),
+            get_labels=lambda: self._get_milestone_labels(data["number"]),
+            html_url=data["url"],
+            number=data["number"],
+            open_issues=get_total_count(data, "openIssues", "openPullRequests"),
+            raw_data={"node_id": data["id"]},
+            state=data["state"].lower(),
+            title=data["title"],
+            updated_at=parse_datetime(data["updatedAt"]),
+        )
+
+    def _get_milestone_labels(self, number: int) -> list[SimpleNamespace]:
+        labels = {}
+        for node in self._paginate(
+            MILESTONE_LABELS_QUERY,
+            ("repository", "milestone", "issues"),
+            number=number,
+        ):
+            for label in node["labels"]["nodes"]:
+                labels[label["id"]] = to_label(label)
+
+        return list(labels.values())
+
+    def get_commits(self):
+        """Get repository commits (only `totalCount` is supported)."""
+        target = (self._data["defaultBranchRef"] or {}).get("target") or {}
+        return GraphQLCommits(target.get("history"))
+
+    def get_contents(self, path: str, *args, **kwargs):
+        """Get repository file contents.
+
+        Args:
+            path (str): The file path.
+            *args: Additional positional arguments for REST API fallback.
+            **kwargs: Additional keyword arguments for REST API fallback.
+
+        Returns:
+            The file contents object.
+
+        """
+        if path != FUNDING_YML_PATH:
+            return self._gh_repository.get_contents(path, *args, **kwargs)
+
+        if not (funding_file := self._data["fundingFile"]) or funding_file.get("text") is None:
+            raise UnknownObjectException(404, {"message": "Not Found"}, None)
+
+        return SimpleNamespace(content=b64encode(funding_file["text"].encode()).decode())
+
+    def get_issues(self, **_kwargs):
+        """Get repository issues ordered by update time (pull requests excluded)."""
+        for data in self._paginate(ISSUES_QUERY, ("repository", "issues")):
+            yield SimpleNamespace(
+                active_lock_reason=LOCK_REASONS.get(data["activeLockReason"]),
+                assignees=[to_user(node) for node in data["assignees"]["nodes"]],
+                body=data["body"],
+                closed_at=parse_datetime(data["closedAt"]),
+                comments=get_total_count(data, "comments"),
+                created_at=parse_datetime(data["createdAt"]),
+                html_url=data["url"],
+                id=data["databaseId"],
+                labels=[to_label(node) for node in data["labels"]["nodes"]],
+                locked=data["locked"],
+                milestone=self._to_milestone(data["milestone"]),
+                number=data["number"],
+                pull_request=None,
+                raw_data={"node_id": data["id"]},
+                state=data["state"].lower(),
+                state_reason=(data["stateReason"] or "").lower() or None,
+                title=data["title"],
+                updated_at=parse_datetime(data["updatedAt"]),
+                user=to_user(data["author"]),
+            )
+
+    def get_languages(self) -> dict[str, int]:
+        """Get repository languages with their sizes in bytes."""
+        return {edge["node"]["name"]: edge["size"] for edge in self._data["languages"]["edges"]}
+
+    def get_milestones(self, **_kwargs):
+        """Get repository milestones ordered by update time."""
+        for data in self._paginate(MILESTONES_QUERY, ("repository", "milestones")):
+            yield self._to_milestone(data)
+
+    def get_pulls(self, **_kwargs):
+        """Get repository pull requests ordered by update time."""
+        for data in self._paginate(PULL_REQUESTS_QUERY, ("repository", "pullRequests")):
+            yield SimpleNamespace(
+                assignees=[to_user(node) for node in data["assignees"]["nodes"]],
+                body=data["body"],
+                closed_at=parse_datetime(data["closedAt"]),
+                created_at=parse_datetime(data["createdAt"]),
+                html_url=data["url"],
+                id=data["databaseId"],
+                labels=[to_label(node) for node in data["labels"]["nodes"]],
+                merged_at=parse_datetime(data["mergedAt"]),
+                milestone=self._to_milestone(data["milestone"]),
+                number=data["number"],
+                raw_data={"node_id": data["id"]},
+                state="open" if data["state"] == "OPEN" else "closed",
+                title=data["title"],
+                updated_at=parse_datetime(data["updatedAt"]),
+                user=to_user(data["author"]),
+            )
+
+    def get_releases(self):
+        """Get repository releases ordered by creation time."""
+        for data in self._paginate(RELEASES_QUERY, ("repository", "releases")):
+            yield SimpleNamespace(
+                author=to_user(data["author"]),
+                body=data["description"],
+                created_at=parse_datetime(data["createdAt"]),
+                draft=data["isDraft"],
+                id=data["databaseId"],
+                prerelease=data["isPrerelease"],
+                published_at=parse_datetime(data["publishedAt"]),
+                raw_data={"node_id": data["id"]},
+                tag_name=data["tagName"],
+                title=data["name"],
+            )
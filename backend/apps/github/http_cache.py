@@ -0,0 +1,293 @@
+"""GitHub conditional requests (ETag / Last-Modified) HTTP cache."""
+
+# ruff: noqa: SLF001 https://docs.astral.sh/ruff/rules/private-member-access/
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from functools import partial
+from typing import TYPE_CHECKING
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from github.Requester import HTTPSRequestsConnectionClass, Requester
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    from github import Github
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+POOL_SIZE = 20
+# Headers describing the original transfer rather than the cached content.
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class HttpCacheStats:
+    """Thread-safe HTTP cache counters."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.counter: Counter = Counter()
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Return human readable representation."""
+        return (
+            f"{self.counter['hits']} hits, "
+            f"{self.counter['misses']} misses, "
+            f"{self.counter['not_modified']} not modified (304)"
+        )
+
+    def increment(self, name: str) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): The counter name.
+
+        """
+        with self.lock:
+            self.counter[name] += 1
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        with self.lock:
+            self.counter.clear()
+
+
+stats = HttpCacheStats()
+
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """Transport adapter caching GET responses and revalidating them conditionally.
+
+    Responses with ETag or Last-Modified headers are stored in the Django cache.
+    Fresh entries (per Cache-Control max-age) are served without a request, stale
+    ones are revalidated with If-None-Match/If-Modified-Since headers. GitHub does
+    not count 304 responses against the rate limit.
+
+    Cache entries are scoped to the authentication identity so that responses visible
+    to one set of credentials are never served to another one.
+    """
+
+    def __init__(self, *args, identity: str = "", **kwargs) -> None:
+        """Initialize the adapter.
+
+        Args:
+            *args: Positional arguments for the parent adapter.
+            identity (str, optional): The authentication identity of the requests.
+            **kwargs: Keyword arguments for the parent adapter.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.identity = identity
+
+    def send(self, request, **kwargs):
+        """Send the request using the cached response when possible.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            **kwargs: Additional keyword arguments for the parent adapter.
+
+        Returns:
+            requests.Response: The response.
+
+        """
+        if request.method != "GET" or kwargs.get("stream"):
+            return super().send(request, **kwargs)
+
+        key = get_cache_key(request, identity=self.identity)
+        if (entry := cache.get(key)) is None:
+            stats.increment("misses")
+        else:
+            if entry["expires_at"] > time.time():
+                stats.increment("hits")
+                return build_response(request, entry)
+
+            if entry["etag"]:
+                request.headers.setdefault("If-None-Match", entry["etag"])
+            if entry["last_modified"]:
+                request.headers.setdefault("If-Modified-Since", entry["last_modified"])
+
+        response = super().send(request, **kwargs)
+
+        if entry is not None and response.status_code == requests.codes.not_modified:
+            stats.increment("not_modified")
+            entry["expires_at"] = get_expires_at(response.headers)
+            entry["headers"].update(get_cached_headers(response.headers))
+            cache.set(key, entry, timeout=settings.GITHUB_HTTP_CACHE_TIME_SECONDS)
+            return build_response(request, entry, response=response)
+
+        if response.status_code == requests.codes.ok and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            cache.set(
+                key,
+                {
+                    "content": response.content,
+                    "etag": response.headers.get("ETag"),
+                    "expires_at": get_expires_at(response.headers),
+                    "headers": get_cached_headers(response.headers),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+                timeout=settings.GITHUB_HTTP_CACHE_TIME_SECONDS,
+            )
+
+        return response
+
+
+class CachedHTTPSConnection(HTTPSRequestsConnectionClass):
+    """PyGithub HTTPS connection using the shared cached session."""
+
+    def __init__(self, *args, identity: str = "", **kwargs) -> None:
+        """Initialize the connection.
+
+        Args:
+            *args: Positional arguments for the parent connection class.
+            identity (str, optional): The authentication identity of the connection.
+            **kwargs: Keyword arguments for the parent connection class.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.session = get_session(identity=identity, max_retries=self.retry)
+
+    def close(self) -> None:
+        """Keep the shared session open for the next connections."""
+
+
+def build_response(request, entry: dict, response=None) -> requests.Response:
+    """Build a response from the cache entry.
+
+    Args:
+        request (requests.PreparedRequest): The request.
+        entry (dict): The cache entry.
+        response (requests.Response, optional): The 304 response to update.
+
+    Returns:
+        requests.Response: The response with cached content.
+
+    """
+    headers = CaseInsensitiveDict(entry["headers"])
+    if response is None:
+        response = requests.Response()
+        response.reason = "OK"
+        response.request = request
+        response.url = request.url
+    else:
+        # Keep the latest response headers (e.g. rate limit ones).
+        headers.update(get_cached_headers(response.headers))
+        response.reason = "OK"
+
+    response._content = entry["content"]
+    response.encoding = get_encoding_from_headers(headers)
+    response.headers = headers
+    response.status_code = requests.codes.ok
+
+    return response
+
+
+def get_cache_key(request, identity: str = "") -> str:
+    """Get cache key for the request.
+
+    Args:
+        request (requests.PreparedRequest): The request.
+        identity (str, optional): The authentication identity of the request.
+
+    Returns:
+        str: The cache key.
+
+    """
+    accept = request.headers.get("Accept", "")
+    # Requests without a known identity are scoped to their credentials.
+    identity = identity or request.headers.get("Authorization", "")
+    return (
+        f"{settings.GITHUB_HTTP_CACHE_PREFIX}-"
+        f"{hashlib.sha256(f'{identity}:{request.url}:{accept}'.encode()).hexdigest()}"
+    )
+
+
+def get_cached_headers(headers) -> dict:
+    """Get response headers worth caching.
+
+    Args:
+        headers (requests.structures.CaseInsensitiveDict): The response headers.
+
+    Returns:
+        dict: The headers.
+
+    """
+    return {key: value for key, value in headers.items() if key.lower() not in SKIPPED_HEADERS}
+
+
+def get_expires_at(headers) -> float:
+    """Get the response freshness expiration timestamp.
+
+    Args:
+        headers (requests.structures.CaseInsensitiveDict): The response headers.
+
+    Returns:
+        float: The timestamp until the response can be used without revalidation.
+
+    """
+    cache_control = headers.get("Cache-Control", "")
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+
+    match = MAX_AGE_RE.search(cache_control)
+    return time.time() + int(match.group(1)) if match else 0
+
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(identity: str = "", max_retries=0) -> requests.Session:
+    """Get the shared HTTP session with conditional requests cache.
+
+    Args:
+        identity (str, optional): The authentication identity of the session requests.
+        max_retries (int or urllib3.util.Retry, optional): The retry configuration
+            used when the session is created.
+
+    Returns:
+        requests.Session: The session.
+
+    """
+    with _sessions_lock:
+        if (session := _sessions.get(identity)) is None:
+            session = _sessions[identity] = requests.Session()
+            # Disable .netrc credentials lookup for PyGithub requests.
+            session.auth = Requester.noopAuth
+            adapter = ConditionalCacheAdapter(
+                identity=identity,
+                max_retries=max_retries,
+                pool_connections=POOL_SIZE,
+                pool_maxsize=POOL_SIZE,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+        return session
+
+
+def install(client: Github, identity: str) -> None:
+    """Make the GitHub client send requests through the shared cached session.
+
+    Args:
+        client (Github): The GitHub client.
+        identity (str): The client authentication identity, e.g. the GitHub App
+            installation or a PAT token hash.
+
+    """
+    client.requester._Requester__connectionClass = partial(  # type: ignore[attr-defined]
+        CachedHTTPSConnection, identity=identity
+    )
@@ -1,9 +1,17 @@
 """GitHub user Algolia index configuration."""
 
-from django.db.models import Q, QuerySet
+from collections import defaultdict
+
+from django.db.models import Count, F, Q, QuerySet, Window
+from django.db.models.functions import RowNumber
 
 from apps.common.index import IndexBase, register
+from apps.github.models.issue import Issue
+from apps.github.models.mixins.user import TOP_REPOSITORY_CONTRIBUTORS_LIMIT
+from apps.github.models.repository import Repository
+from apps.github.models.repository_contributor import RepositoryContributor
 from apps.github.models.user import User
+from apps.nest.models.user_badge import UserBadge
 
 
 @register(User)
@@ -78,6 +86,61 @@ class UserIndex(IndexBase):
             QuerySet: A queryset of User objects to be indexed.
 
         """
-        return User.objects.exclude(
-            Q(is_bot=True) | Q(login__in=User.get_non_indexable_logins()),
+        return User.objects.indexable()
+
+    def prefetch_index_fields(self, instances) -> None:
+        """Precompute per user queries based index fields in bulk.
+
+        Args:
+            instances (tuple[User]): The users batch.
+
+        """
+        user_ids = {user.id for user in instances}
+
+        badge_counts = dict(
+            UserBadge.objects.filter(is_active=True, user_id__in=user_ids)
+            .values("user_id")
+            .annotate(count=Count("id"))
+            .values_list("user_id", "count")
         )
+        issues_counts = dict(
+            Issue.objects.filter(author_id__in=user_ids)
+            .values("author_id")
+            .annotate(count=Count("id"))
+            .values_list("author_id", "count")
+        )
+
+        contributions = defaultdict(list)
+        for rc in (
+            RepositoryContributor.objects.filter(user_id__in=user_ids)
+            .exclude(
+                Q(repository__is_fork=True)
+                | Q(repository__organization__is_owasp_related_organization=False)
+                | Q(user__login__in=User.get_non_indexable_logins())
+            )
+            .annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=F("user_id"),
+                    order_by=F("contributions_count").desc(),
+                )
+            )
+            .filter(row_number__lte=TOP_REPOSITORY_CONTRIBUTORS_LIMIT)
+            .order_by("user_id", "-contributions_count")
+            .select_related("repository__owner")
+        ):
+            contributions[rc.user_id].append(rc)
+
+        latest_releases = Repository.get_latest_releases(
+            {rc.repository_id for rcs in contributions.values() for rc in rcs}
+        )
+
+        for user in instances:
+            for rc in contributions[user.id]:
+                rc.repository.latest_release = latest_releases.get(rc.repository_id)
+
+            user.idx_badge_count = badge_counts.get(user.id, 0)
+            user.idx_contributions = [
+                user.get_idx_contribution(rc) for rc in contributions[user.id]
+            ]
+            user.idx_issues_count = issues_counts.get(user.id, 0)
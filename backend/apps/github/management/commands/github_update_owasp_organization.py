@@ -1,13 +1,21 @@
 """A command to update OWASP entities from GitHub data."""
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from django.core.management.base import BaseCommand
+from django.db import IntegrityError, connection
 
 from apps.core.utils import index
+from apps.github import http_cache
 from apps.github.auth import get_github_client
 from apps.github.common import sync_repository
+from apps.github.graphql import GraphQLRepository
+from apps.github.models.organization import Organization
 from apps.github.models.repository import Repository
+from apps.github.utils import use_file_content_cache
 from apps.owasp.constants import OWASP_ORGANIZATION_NAME
 from apps.owasp.models.chapter import Chapter
 from apps.owasp.models.committee import Committee
@@ -15,6 +23,49 @@ from apps.owasp.models.project import Project
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Remaining requests below which workers pause until the rate limit resets.
+RATE_LIMIT_THRESHOLD = 100
+SYNC_REPOSITORY_ATTEMPTS = 3
+
+
+class RateLimitBudget:
+    """GitHub rate limit budget shared by concurrent workers."""
+
+    def __init__(self, threshold: int = RATE_LIMIT_THRESHOLD) -> None:
+        """Initialize the rate limit budget.
+
+        Args:
+            threshold (int): Remaining requests below which workers wait for a reset.
+
+        """
+        self.lock = threading.Lock()
+        self.remaining: int | None = None
+        self.reset_time = 0
+        self.threshold = threshold
+
+    def update(self, gh) -> None:
+        """Update the budget from the latest GitHub response headers.
+
+        Args:
+            gh (github.Github): The GitHub client used by a worker.
+
+        """
+        remaining, _ = gh.rate_limiting
+        with self.lock:
+            self.remaining = remaining
+            self.reset_time = gh.rate_limiting_resettime
+
+    def wait(self) -> None:
+        """Block until the shared budget allows more requests."""
+        with self.lock:
+            if self.remaining is None or self.remaining >= self.threshold:
+                return
+
+            if (delay := self.reset_time - time.time()) > 0:
+                logger.warning("GitHub rate limit is almost exhausted, waiting %ds", delay)
+                time.sleep(delay)
+            self.remaining = None
+
 
 class Command(BaseCommand):
     """Fetch OWASP GitHub repository and update relevant entities."""
@@ -35,6 +86,18 @@ class Command(BaseCommand):
             type=str,
             help="The OWASP organization's repository name (e.g. Nest, www-project-nest')",
         )
+        parser.add_argument(
+            "--workers",
+            default=1,
+            required=False,
+            type=int,
+            help="The number of repositories to sync concurrently",
+        )
+        parser.add_argument(
+            "--use-graphql",
+            action="store_true",
+            help="Fetch repository data using GitHub GraphQL API",
+        )
 
     def handle(self, *_args, **options) -> None:
         """Handle the command execution.
@@ -44,19 +107,15 @@ class Command(BaseCommand):
             **options: Arbitrary keyword arguments containing command options.
 
         """
+        http_cache.stats.reset()
         with index.disable_indexing():
             gh = get_github_client()
             gh_owasp_organization = gh.get_organization(OWASP_ORGANIZATION_NAME)
 
-            owasp_organization = None
-            owasp_user = None
-
-            chapters = []
-            committees = []
-            projects = []
-
             offset = options["offset"]
             repository = options["repository"]
+            use_graphql = options.get("use_graphql", False)
+            workers = max(options.get("workers") or 1, 1)
 
             if repository:
                 gh_repositories = [gh_owasp_organization.get_repo(repository)]
@@ -69,43 +128,29 @@ class Command(BaseCommand):
                 )
                 gh_repositories_count = gh_repositories.totalCount  # type: ignore[attr-defined]
 
-            for idx, gh_repository in enumerate(gh_repositories[offset:]):
-                prefix = f"{idx + offset + 1} of {gh_repositories_count}"
-                entity_key = gh_repository.name.lower()
-                repository_url = f"https://github.com/OWASP/{entity_key}"
-                print(f"{prefix:<12} {repository_url}")
-
-                try:
-                    owasp_organization, owasp_repository = sync_repository(
-                        gh_repository,
-                        organization=owasp_organization,
-                        user=owasp_user,
-                    )
-
-                    # OWASP chapters.
-                    if entity_key.startswith("www-chapter-"):
-                        chapters.append(
-                            Chapter.update_data(gh_repository, owasp_repository, save=False)
-                        )
-
-                    # OWASP projects.
-                    elif entity_key.startswith("www-project-"):
-                        projects.append(
-                            Project.update_data(gh_repository, owasp_repository, save=False)
-                        )
-
-                    # OWASP committees.
-                    elif entity_key.startswith("www-committee-"):
-                        committees.append(
-                            Committee.update_data(gh_repository, owasp_repository, save=False)
-                        )
-                except Exception:
-                    logger.exception("Error syncing repository %s", repository_url)
-                    continue
+            entities: dict[type, list] = {Chapter: [], Committee: [], Project: []}
+            if workers > 1:
+                self.sync_repositories_concurrently(
+                    gh_owasp_organization,
+                    gh_repositories[offset:],
+                    gh_repositories_count,
+                    entities,
+                    offset=offset,
+                    use_graphql=use_graphql,
+                    workers=workers,
+                )
+            else:
+                self.sync_repositories(
+                    gh_repositories[offset:],
+                    gh_repositories_count,
+                    entities,
+                    graphql_requester=gh.requester if use_graphql else None,
+                    offset=offset,
+                )
 
-            Chapter.bulk_save(chapters)
-            Committee.bulk_save(committees)
-            Project.bulk_save(projects)
+            Chapter.bulk_save(entities[Chapter])
+            Committee.bulk_save(entities[Committee])
+            Project.bulk_save(entities[Project])
 
             if not repository:  # The entire organization is being synced.
                 # Check repository counts.
@@ -124,8 +169,176 @@ class Command(BaseCommand):
                 )
 
             gh.close()
+            print(f"GitHub HTTP cache: {http_cache.stats}")
 
             # Add OWASP repository to repositories list.
             for project in Project.objects.all():
                 if project.owasp_repository:
                     project.repositories.add(project.owasp_repository)
+
+    def sync_repositories(
+        self,
+        gh_repositories,
+        gh_repositories_count: int,
+        entities: dict[type, list],
+        *,
+        graphql_requester=None,
+        offset: int = 0,
+    ) -> None:
+        """Sync repositories one by one.
+
+        Args:
+            gh_repositories (list): The GitHub repositories to sync.
+            gh_repositories_count (int): The total number of repositories.
+            entities (dict): OWASP entities to bulk save, grouped by model.
+            graphql_requester (github.Requester.Requester, optional): The requester
+                to fetch repository data with via GitHub GraphQL API.
+            offset (int, optional): The number of skipped repositories.
+
+        """
+        owasp_organization = None
+        for idx, gh_repository in enumerate(gh_repositories):
+            prefix = f"{idx + offset + 1} of {gh_repositories_count}"
+            repository_url = f"https://github.com/OWASP/{gh_repository.name.lower()}"
+            print(f"{prefix:<12} {repository_url}")
+
+            try:
+                owasp_organization, entity_model, entity = self.sync_entity(
+                    gh_repository,
+                    graphql_requester=graphql_requester,
+                    organization=owasp_organization,
+                )
+            except Exception:
+                logger.exception("Error syncing repository %s", repository_url)
+                continue
+
+            if entity_model is not None:
+                entities[entity_model].append(entity)
+
+    def sync_repositories_concurrently(
+        self,
+        gh_owasp_organization,
+        gh_repositories,
+        gh_repositories_count: int,
+        entities: dict[type, list],
+        *,
+        offset: int = 0,
+        use_graphql: bool = False,
+        workers: int,
+    ) -> None:
+        """Sync repositories using a pool of worker threads.
+
+        Each worker thread uses its own GitHub client and database connection
+        while all of them share a single rate limit budget.
+
+        Args:
+            gh_owasp_organization (github.Organization.Organization): The OWASP organization.
+            gh_repositories (list): The GitHub repositories to sync.
+            gh_repositories_count (int): The total number of repositories.
+            entities (dict): OWASP entities to bulk save, grouped by model.
+            offset (int, optional): The number of skipped repositories.
+            use_graphql (bool, optional): Whether to fetch data via GitHub GraphQL API.
+            workers (int): The number of worker threads.
+
+        """
+        # Resolve the shared organization upfront so that workers don't race to create it.
+        owasp_organization = Organization.update_data(gh_owasp_organization)
+
+        clients = []
+        clients_lock = threading.Lock()
+        local = threading.local()
+        rate_limit_budget = RateLimitBudget()
+
+        def sync(repository_name: str):
+            if (gh := getattr(local, "gh", None)) is None:
+                gh = local.gh = get_github_client()
+                with clients_lock:
+                    clients.append(gh)
+
+            try:
+                rate_limit_budget.wait()
+                gh_repository = gh.get_repo(f"{OWASP_ORGANIZATION_NAME}/{repository_name}")
+                kwargs = {
+                    "graphql_requester": gh.requester if use_graphql else None,
+                    "organization": owasp_organization,
+                }
+                for _ in range(SYNC_REPOSITORY_ATTEMPTS - 1):
+                    try:
+                        return self.sync_entity(gh_repository, **kwargs)
+                    except IntegrityError:
+                        # Another worker has just created a shared row (e.g. a user).
+                        logger.warning("Retrying repository %s sync", repository_name)
+                return self.sync_entity(gh_repository, **kwargs)
+            finally:
+                rate_limit_budget.update(gh)
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(sync, gh_repository.name): gh_repository.name.lower()
+                for gh_repository in gh_repositories
+            }
+            for idx, future in enumerate(as_completed(futures)):
+                prefix = f"{idx + offset + 1} of {gh_repositories_count}"
+                repository_url = f"https://github.com/OWASP/{futures[future]}"
+                print(f"{prefix:<12} {repository_url}")
+
+                try:
+                    _, entity_model, entity = future.result()
+                except Exception:
+                    logger.exception("Error syncing repository %s", repository_url)
+                    continue
+
+                if entity_model is not None:
+                    entities[entity_model].append(entity)
+
+        for gh in clients:
+            gh.close()
+
+    @use_file_content_cache()
+    def sync_entity(self, gh_repository, graphql_requester=None, organization=None) -> tuple:
+        """Sync repository and build its OWASP entity.
+
+        Entity markdown files (e.g. index.md, leaders.md) are fetched at most once.
+
+        Args:
+            gh_repository (github.Repository.Repository): The GitHub repository.
+            graphql_requester (github.Requester.Requester, optional): The requester
+                to fetch repository data with via GitHub GraphQL API.
+            organization (Organization, optional): The organization instance.
+
+        Returns:
+            tuple: The organization, the OWASP entity model and its unsaved instance
+                (or None for both if the repository is not an OWASP entity one).
+
+        """
+        if graphql_requester is not None:
+            gh_repository = GraphQLRepository(gh_repository, graphql_requester)
+
+        entity_key = gh_repository.name.lower()
+        organization, owasp_repository = sync_repository(
+            gh_repository,
+            organization=organization,
+        )
+
+        entity_model = None
+        # OWASP chapters.
+        if entity_key.startswith("www-chapter-"):
+            entity_model = Chapter
+
+        # OWASP projects.
+        elif entity_key.startswith("www-project-"):
+            entity_model = Project
+
+        # OWASP committees.
+        elif entity_key.startswith("www-committee-"):
+            entity_model = Committee
+
+        if entity_model is None:
+            return organization, None, None
+
+        return (
+            organization,
+            entity_model,
+            entity_model.update_data(gh_repository, owasp_repository, save=False),
+        )
@@ -1,8 +1,20 @@
 """Github app common models."""
 
+# ruff: noqa: SLF001 https://docs.astral.sh/ruff/rules/private-member-access/
+
+from __future__ import annotations
+
+import contextlib
+from collections import defaultdict
+from contextvars import ContextVar
+
 from django.db import models
 from github.GithubException import UnknownObjectException
 
+from apps.common.models import BATCH_SIZE, post_bulk_save
+
+_identity_map: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
 
 class GenericUserModel(models.Model):
     """Generic user model."""
@@ -84,7 +96,169 @@ class NodeModel(models.Model):
     @staticmethod
     def get_node_id(node):
         """Extract node_id."""
+        if node is None:  # E.g. a deleted (ghost) user.
+            return None
+
         try:
             return node.raw_data["node_id"]
         except UnknownObjectException:
             pass
+
+
+class IdentityMap:
+    """Per-sync identity map of GitHub entities.
+
+    Each entity is loaded from the database at most once. Writes are deferred and
+    flushed in batches using upserts. New entities are flushed right away as they
+    need a primary key to be referenced by other entities.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the identity map."""
+        self.objects: dict[type, dict] = defaultdict(dict)
+        self.pending: dict[type, dict] = defaultdict(dict)
+
+    @staticmethod
+    def current() -> IdentityMap | None:
+        """Get the active identity map."""
+        return _identity_map.get()
+
+    @staticmethod
+    def get_identity_fields(model) -> tuple[str, ...]:
+        """Get fields that identify a model instance."""
+        return getattr(model, "identity_fields", ("node_id",))
+
+    def get_key(self, model, values) -> tuple:
+        """Get identity key for the field values (a dict or a model instance).
+
+        Args:
+            model (type[Model]): The model class.
+            values (dict | Model): The lookup values or the model instance.
+
+        Returns:
+            tuple: The identity key.
+
+        """
+        if isinstance(values, dict):
+            return tuple(
+                getattr(values[field], "pk", values[field])
+                for field in self.get_identity_fields(model)
+            )
+
+        return tuple(
+            getattr(values, model._meta.get_field(field).attname)
+            for field in self.get_identity_fields(model)
+        )
+
+    def get(self, model, **lookup):
+        """Get a model instance by its identity fields.
+
+        Args:
+            model (type[Model]): The model class.
+            **lookup: The identity field values.
+
+        Returns:
+            Model | None: The instance or None if it doesn't exist.
+
+        """
+        objects = self.objects[model]
+        if (key := self.get_key(model, lookup)) not in objects:
+            objects[key] = model.objects.filter(**lookup).first()
+
+        return objects[key]
+
+    def prefetch(self, model, *, node_ids=None, **filters) -> None:
+        """Load model instances in a single query.
+
+        Args:
+            model (type[Model]): The model class.
+            node_ids (Iterable[str], optional): Node IDs to load.
+            **filters: Lookup filters for the instances to load.
+
+        """
+        objects = self.objects[model]
+        if node_ids is not None:
+            if not (
+                node_ids := {
+                    node_id for node_id in node_ids if node_id and (node_id,) not in objects
+                }
+            ):
+                return
+            # Remember missing nodes so that they aren't looked up again.
+            objects.update(dict.fromkeys((node_id,) for node_id in node_ids))
+            filters["node_id__in"] = node_ids
+
+        for instance in model.objects.filter(**filters):
+            if objects.get(key := self.get_key(model, instance)) is None:
+                objects[key] = instance
+
+    def save(self, instance) -> None:
+        """Schedule a model instance save.
+
+        Args:
+            instance (Model): The model instance.
+
+        """
+        model = type(instance)
+        key = self.get_key(model, instance)
+        self.objects[model][key] = instance
+        self.pending[model][key] = instance
+
+        if instance.pk is None:
+            self.flush(model)
+
+    def flush(self, model=None) -> None:
+        """Upsert pending instances.
+
+        Args:
+            model (type[Model], optional): The model to flush (all models by default).
+
+        """
+        for pending_model in [model] if model else list(self.pending):
+            if not (pending := self.pending.pop(pending_model, None)):
+                continue
+
+            identity_fields = self.get_identity_fields(pending_model)
+            try:
+                pending_model.objects.bulk_create(
+                    pending.values(),
+                    batch_size=BATCH_SIZE,
+                    unique_fields=identity_fields,
+                    update_conflicts=True,
+                    update_fields=[
+                        field.name
+                        for field in pending_model._meta.concrete_fields
+                        if not field.primary_key
+                        and field.name not in identity_fields
+                        and not getattr(field, "auto_now_add", False)
+                    ],
+                )
+            except Exception:
+                # Don't hand out instances that were never saved.
+                for key in pending:
+                    self.objects[pending_model].pop(key, None)
+                raise
+
+            # Upserts bypass model signals, so let bulk save receivers track the changes.
+            post_bulk_save.send(sender=pending_model, objects=list(pending.values()))
+
+
+@contextlib.contextmanager
+def use_identity_map():
+    """Activate an identity map unless one is already active.
+
+    Yields:
+        IdentityMap: The active identity map.
+
+    """
+    if (identity_map := IdentityMap.current()) is not None:
+        yield identity_map
+        return
+
+    identity_map = IdentityMap()
+    token = _identity_map.set(identity_map)
+    try:
+        yield identity_map
+        identity_map.flush()
+    finally:
+        _identity_map.reset(token)
@@ -3,7 +3,7 @@
 from django.db import models
 
 from apps.common.models import BulkSaveModel, TimestampedModel
-from apps.github.models.common import NodeModel
+from apps.github.models.common import IdentityMap, NodeModel
 
 
 class Label(BulkSaveModel, NodeModel, TimestampedModel):
@@ -65,13 +65,31 @@ class Label(BulkSaveModel, NodeModel, TimestampedModel):
 
         """
         label_node_id = Label.get_node_id(gh_label)
-        try:
-            label = Label.objects.get(node_id=label_node_id)
-        except Label.DoesNotExist:
-            label = Label(node_id=label_node_id)
+        if (identity_map := IdentityMap.current()) is None:
+            try:
+                label = Label.objects.get(node_id=label_node_id)
+            except Label.DoesNotExist:
+                label = Label(node_id=label_node_id)
+        else:
+            label = identity_map.get(Label, node_id=label_node_id)
+            if label is None:
+                label = Label(node_id=label_node_id)
+            # Skip labels that haven't changed since they were saved.
+            elif all(
+                value is None or getattr(label, field) == value
+                for field, value in (
+                    ("color", gh_label.color),
+                    ("description", gh_label.description),
+                    ("name", gh_label.name),
+                )
+            ):
+                return label
 
         label.from_github(gh_label)
         if save:
-            label.save()
+            if identity_map is None:
+                label.save()
+            else:
+                identity_map.save(label)
 
         return label
@@ -0,0 +1,32 @@
+"""GitHub app user managers."""
+
+from django.db import models
+from django.db.models import Q
+
+
+class UserQuerySet(models.QuerySet):
+    """User queryset."""
+
+    def indexable(self) -> "UserQuerySet":
+        """Return indexable users only.
+
+        Mirrors `UserIndexMixin.is_indexable` so it can be applied in SQL.
+        """
+        return self.exclude(
+            Q(is_bot=True)
+            | Q(login__endswith="Bot")
+            | Q(login__endswith="-bot")
+            | Q(login__in=self.model.get_non_indexable_logins())
+        )
+
+
+class UserManager(models.Manager):
+    """User manager."""
+
+    def get_queryset(self) -> UserQuerySet:
+        """Get queryset."""
+        return UserQuerySet(self.model, using=self._db)
+
+    def indexable(self) -> UserQuerySet:
+        """Return indexable users only."""
+        return self.get_queryset().indexable()
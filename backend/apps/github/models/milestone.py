@@ -3,6 +3,7 @@
 from django.db import models
 
 from apps.common.models import BulkSaveModel
+from apps.github.models.common import IdentityMap
 from apps.github.models.generic_issue_model import GenericIssueModel
 from apps.github.models.managers.milestone import ClosedMilestoneManager, OpenMilestoneManager
 
@@ -95,13 +96,28 @@ class Milestone(GenericIssueModel):
 
         """
         milestone_node_id = Milestone.get_node_id(gh_milestone)
-        try:
-            milestone = Milestone.objects.get(node_id=milestone_node_id)
-        except Milestone.DoesNotExist:
-            milestone = Milestone(node_id=milestone_node_id)
+        if (identity_map := IdentityMap.current()) is None:
+            try:
+                milestone = Milestone.objects.get(node_id=milestone_node_id)
+            except Milestone.DoesNotExist:
+                milestone = Milestone(node_id=milestone_node_id)
+        else:
+            milestone = identity_map.get(Milestone, node_id=milestone_node_id)
+            if milestone is None:
+                milestone = Milestone(node_id=milestone_node_id)
+            # Skip milestones that haven't changed since they were saved.
+            elif (
+                milestone.updated_at == gh_milestone.updated_at
+                and milestone.author_id == getattr(author, "pk", None)
+                and milestone.repository_id == getattr(repository, "pk", None)
+            ):
+                return milestone
 
         milestone.from_github(gh_milestone, author, repository)
         if save:
-            milestone.save()
+            if identity_map is None:
+                milestone.save()
+            else:
+                identity_map.save(milestone)
 
         return milestone
@@ -1,6 +1,7 @@
 """GitHub user model mixins for index-related functionality."""
 
 from django.db.models import Q
+from django.utils.functional import cached_property
 
 ISSUES_LIMIT = 6
 RELEASES_LIMIT = 6
@@ -24,7 +25,7 @@ class UserIndexMixin:
         """Return avatar URL for indexing."""
         return self.avatar_url
 
-    @property
+    @cached_property
     def idx_badge_count(self) -> int:
         """Return badge count for indexing."""
         return self.user_badges.filter(is_active=True).count()
@@ -89,26 +90,13 @@ class UserIndexMixin:
         """Return title for indexing."""
         return self.title
 
-    @property
+    @cached_property
     def idx_contributions(self):
         """Return contributions for indexing."""
         from apps.github.models.repository_contributor import RepositoryContributor
 
         return [
-            {
-                "contributions_count": rc.contributions_count,
-                "repository_contributors_count": rc.repository.contributors_count,
-                "repository_description": rc.repository.description,
-                "repository_forks_count": rc.repository.forks_count,
-                "repository_key": rc.repository.key.lower(),
-                "repository_name": rc.repository.name,
-                "repository_latest_release": str(rc.repository.latest_release.summary)
-                if rc.repository.latest_release
-                else "",
-                "repository_license": rc.repository.license,
-                "repository_owner_key": rc.repository.owner.login.lower(),
-                "repository_stars_count": rc.repository.stars_count,
-            }
+            self.get_idx_contribution(rc)
             for rc in RepositoryContributor.objects.filter(
                 user=self,
             )
@@ -121,6 +109,32 @@ class UserIndexMixin:
             .select_related("repository")[:TOP_REPOSITORY_CONTRIBUTORS_LIMIT]
         ]
 
+    @staticmethod
+    def get_idx_contribution(rc) -> dict:
+        """Return repository contribution data for indexing.
+
+        Args:
+            rc (RepositoryContributor): The repository contributor instance.
+
+        Returns:
+            dict: The contribution data.
+
+        """
+        return {
+            "contributions_count": rc.contributions_count,
+            "repository_contributors_count": rc.repository.contributors_count,
+            "repository_description": rc.repository.description,
+            "repository_forks_count": rc.repository.forks_count,
+            "repository_key": rc.repository.key.lower(),
+            "repository_name": rc.repository.name,
+            "repository_latest_release": str(rc.repository.latest_release.summary)
+            if rc.repository.latest_release
+            else "",
+            "repository_license": rc.repository.license,
+            "repository_owner_key": rc.repository.owner.login.lower(),
+            "repository_stars_count": rc.repository.stars_count,
+        }
+
     @property
     def idx_contributions_count(self) -> int:
         """Return contributions count for indexing."""
@@ -147,7 +161,7 @@ class UserIndexMixin:
             ).order_by("-created_at")[:ISSUES_LIMIT]
         ]
 
-    @property
+    @cached_property
     def idx_issues_count(self) -> int:
         """Return issues count for indexing."""
         return self.issues.count()
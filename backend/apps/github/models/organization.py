@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from django.apps import apps
@@ -79,7 +78,6 @@ class Organization(
             if value is not None:
                 setattr(self, model_field, value)
 
-    @lru_cache
     @staticmethod
     def get_logins():
         """Retrieve all organization logins."""
@@ -6,6 +6,7 @@ from base64 import b64decode
 
 import yaml
 from django.db import models
+from django.utils.functional import cached_property
 from github.GithubException import GithubException
 
 from apps.common.models import TimestampedModel
@@ -13,6 +14,7 @@ from apps.github.constants import OWASP_LOGIN
 from apps.github.models.common import NodeModel
 from apps.github.models.milestone import Milestone
 from apps.github.models.mixins import RepositoryIndexMixin
+from apps.github.models.release import Release
 from apps.github.utils import (
     check_funding_policy_compliance,
     check_owasp_site_repository,
@@ -123,7 +125,7 @@ class Repository(NodeModel, RepositoryIndexMixin, TimestampedModel):
         """
         return self.pull_requests.order_by("-created_at").first()
 
-    @property
+    @cached_property
     def latest_release(self):
         """Get the latest release for the repository.
 
@@ -306,6 +308,50 @@ class Repository(NodeModel, RepositoryIndexMixin, TimestampedModel):
         self.organization = organization
         self.owner = user
 
+    @staticmethod
+    def get_latest_releases(repository_ids) -> dict:
+        """Get the latest published release for each of the repositories.
+
+        Args:
+            repository_ids (Iterable[int]): The repository IDs.
+
+        Returns:
+            dict: Latest release by repository ID.
+
+        """
+        return {
+            release.repository_id: release
+            for release in Release.objects.filter(
+                is_draft=False,
+                is_pre_release=False,
+                published_at__isnull=False,
+                repository_id__in=repository_ids,
+            )
+            .order_by("repository_id", "-published_at")
+            .distinct("repository_id")
+        }
+
+    @staticmethod
+    def get_projects(repository_ids) -> dict:
+        """Get the project of each of the repositories.
+
+        Args:
+            repository_ids (Iterable[int]): The repository IDs.
+
+        Returns:
+            dict: Project by repository ID.
+
+        """
+        from apps.owasp.models.project import Project
+
+        return {
+            project.repository_id: project
+            for project in Project.objects.filter(repositories__in=repository_ids)
+            .annotate(repository_id=models.F("repositories"))
+            .order_by("repository_id", "id")
+            .distinct("repository_id")
+        }
+
     @staticmethod
     def update_data(
         gh_repository,
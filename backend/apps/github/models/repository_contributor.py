@@ -7,6 +7,7 @@ from django.db.models import Sum
 from django.template.defaultfilters import pluralize
 
 from apps.common.models import BulkSaveModel, TimestampedModel
+from apps.github.models.common import IdentityMap
 from apps.github.models.managers.repository_contributor import RepositoryContributorManager
 
 # Matches a full name starting with at least two Unicode letters (no digits or underscores),
@@ -20,6 +21,8 @@ class RepositoryContributor(BulkSaveModel, TimestampedModel):
 
     objects = RepositoryContributorManager()
 
+    identity_fields = ("repository", "user")
+
     class Meta:
         db_table = "github_repository_contributors"
         indexes = [
@@ -98,12 +101,22 @@ class RepositoryContributor(BulkSaveModel, TimestampedModel):
             RepositoryContributor: The updated or created repository contributor instance.
 
         """
-        try:
-            repository_contributor = RepositoryContributor.objects.get(
+        if (identity_map := IdentityMap.current()) is None:
+            try:
+                repository_contributor = RepositoryContributor.objects.get(
+                    repository=repository,
+                    user=user,
+                )
+            except RepositoryContributor.DoesNotExist:
+                repository_contributor = None
+        else:
+            repository_contributor = identity_map.get(
+                RepositoryContributor,
                 repository=repository,
                 user=user,
             )
-        except RepositoryContributor.DoesNotExist:
+
+        if repository_contributor is None:
             repository_contributor = RepositoryContributor(
                 repository=repository,
                 user=user,
@@ -111,7 +124,10 @@ class RepositoryContributor(BulkSaveModel, TimestampedModel):
         repository_contributor.from_github(gh_contributor)
 
         if save:
-            repository_contributor.save()
+            if identity_map is None:
+                repository_contributor.save()
+            else:
+                identity_map.save(repository_contributor)
 
         return repository_contributor
 
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import models
 
 from apps.common.models import BulkSaveModel, TimestampedModel
@@ -14,7 +17,8 @@ from apps.github.constants import (
     GITHUB_GHOST_USER_LOGIN,
     OWASP_FOUNDATION_LOGIN,
 )
-from apps.github.models.common import GenericUserModel, NodeModel
+from apps.github.models.common import GenericUserModel, IdentityMap, NodeModel
+from apps.github.models.managers.user import UserManager
 from apps.github.models.mixins.user import UserIndexMixin
 from apps.github.models.organization import Organization
 
@@ -24,6 +28,9 @@ if TYPE_CHECKING:
     from apps.owasp.models.chapter import Chapter
     from apps.owasp.models.project import Project
 
+# In-process copy of the non-indexable logins keyed by their cache version.
+non_indexable_logins_by_version: dict[str | None, frozenset] = {}
+
 
 class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
     """User model."""
@@ -36,6 +43,8 @@ class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
         ]
         verbose_name_plural = "Users"
 
+    objects = UserManager()
+
     bio = models.TextField(verbose_name="Bio", max_length=1000, blank=True, default="")
     is_bot = models.BooleanField(verbose_name="Is bot", default=False)
     is_hireable = models.BooleanField(verbose_name="Is hireable", default=False)
@@ -169,19 +178,46 @@ class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
         BulkSaveModel.bulk_save(User, users, fields=fields)
 
     @staticmethod
-    def get_non_indexable_logins() -> set:
+    def clear_non_indexable_logins_cache() -> None:
+        """Clear non-indexable logins cache.
+
+        Bumping the version invalidates the in-process copies in every process.
+        """
+        cache.delete(settings.GITHUB_NON_INDEXABLE_LOGINS_CACHE_KEY)
+        cache.set(
+            settings.GITHUB_NON_INDEXABLE_LOGINS_VERSION_CACHE_KEY, uuid4().hex, timeout=None
+        )
+
+    @staticmethod
+    def get_non_indexable_logins() -> frozenset:
         """Get logins that should not be indexed.
 
+        The set is kept in process and reloaded only when its cache version changes.
+
         Returns
-            set: A set of non-indexable logins.
+            frozenset: A set of non-indexable logins.
 
         """
-        return {
-            GITHUB_ACTIONS_USER_LOGIN,
-            GITHUB_GHOST_USER_LOGIN,
-            OWASP_FOUNDATION_LOGIN,
-            *Organization.get_logins(),
-        }
+        version = cache.get(settings.GITHUB_NON_INDEXABLE_LOGINS_VERSION_CACHE_KEY)
+        if (logins := non_indexable_logins_by_version.get(version)) is not None:
+            return logins
+
+        logins = cache.get_or_set(
+            settings.GITHUB_NON_INDEXABLE_LOGINS_CACHE_KEY,
+            lambda: frozenset(
+                (
+                    GITHUB_ACTIONS_USER_LOGIN,
+                    GITHUB_GHOST_USER_LOGIN,
+                    OWASP_FOUNDATION_LOGIN,
+                    *Organization.get_logins(),
+                )
+            ),
+            timeout=settings.GITHUB_NON_INDEXABLE_LOGINS_CACHE_TIME_SECONDS,
+        )
+        non_indexable_logins_by_version.clear()
+        non_indexable_logins_by_version[version] = logins
+
+        return logins
 
     @staticmethod
     def update_data(gh_user, *, save: bool = True, **kwargs) -> User | None:
@@ -200,10 +236,18 @@ class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
         if not user_node_id:
             return None
 
-        try:
-            user = User.objects.get(node_id=user_node_id)
-        except User.DoesNotExist:
-            user = User(node_id=user_node_id)
+        if (identity_map := IdentityMap.current()) is None:
+            try:
+                user = User.objects.get(node_id=user_node_id)
+            except User.DoesNotExist:
+                user = User(node_id=user_node_id)
+        else:
+            user = identity_map.get(User, node_id=user_node_id)
+            if user is None:
+                user = User(node_id=user_node_id)
+            # Skip users that haven't changed since they were saved.
+            elif not kwargs and user.updated_at == gh_user.updated_at:
+                return user
 
         user.from_github(gh_user)
 
@@ -211,6 +255,9 @@ class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
             setattr(user, name, value)
 
         if save:
-            user.save()
+            if identity_map is None:
+                user.save()
+            else:
+                identity_map.save(user)
 
         return user
@@ -0,0 +1,22 @@
+"""Signal handlers for Organization changes to clear non-indexable logins cache."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.models import post_bulk_save
+from apps.github.models.organization import Organization
+from apps.github.models.user import User
+
+
+class OrganizationChangeHandler:
+    """Handles Organization changes to clear non-indexable logins cache."""
+
+    @receiver(post_bulk_save, sender=Organization)
+    @receiver(post_delete, sender=Organization)
+    @receiver(post_save, sender=Organization)
+    def organization_change_clear_non_indexable_logins_cache(sender, **kwargs):  # noqa: N805
+        """Signal handler to clear non-indexable logins cache.
+
+        The sender and kwargs arguments are provided by the signal.
+        """
+        User.clear_non_indexable_logins_cache()
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+from contextvars import ContextVar
 from urllib.parse import urlparse
 
-import requests
 from requests.exceptions import RequestException
 
 from apps.github.constants import GITHUB_REPOSITORY_RE
+from apps.github.http_cache import get_session
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_file_content_cache: ContextVar[dict[str, str] | None] = ContextVar(
+    "file_content_cache", default=None
+)
+
 
 def check_owasp_site_repository(key: str) -> bool:
     """Check if the repository is an OWASP site repository.
@@ -60,6 +66,9 @@ def check_funding_policy_compliance(platform: str, target: str | None) -> bool:
 def get_repository_file_content(url: str, *, timeout: float | None = 30) -> str:
     """Get the content of a file from a repository.
 
+    The file is revalidated with a conditional request if it has been fetched before
+    and is fetched at most once within `use_file_content_cache` context.
+
     Args:
         url (str): The URL of the file.
         timeout (float, optional): The request timeout in seconds.
@@ -68,12 +77,21 @@ def get_repository_file_content(url: str, *, timeout: float | None = 30) -> str:
         str: The content of the file, or empty string if the request fails.
 
     """
+    file_content_cache = _file_content_cache.get()
+    if file_content_cache is not None and url in file_content_cache:
+        return file_content_cache[url]
+
     try:
-        return requests.get(url, timeout=timeout).text
+        content = get_session().get(url, timeout=timeout).text
     except RequestException as e:
         logger.exception("Failed to fetch file", extra={"URL": url, "error": str(e)})
         return ""
 
+    if file_content_cache is not None:
+        file_content_cache[url] = content
+
+    return content
+
 
 def get_repository_path(url: str) -> str | None:
     """Parse a repository URL to extract the owner and repository name.
@@ -115,3 +133,25 @@ def normalize_url(url: str, *, check_path: bool = False) -> str | None:
     )
 
     return normalized_url.split("#")[0].strip().rstrip("/")
+
+
+@contextlib.contextmanager
+def use_file_content_cache():
+    """Memoize repository file content fetched within the context.
+
+    Nested contexts share the outermost cache.
+
+    Yields:
+        dict: The file content by URL.
+
+    """
+    if (file_content_cache := _file_content_cache.get()) is not None:
+        yield file_content_cache
+        return
+
+    file_content_cache = {}
+    token = _file_content_cache.set(file_content_cache)
+    try:
+        yield file_content_cache
+    finally:
+        _file_content_cache.reset(token)
@@ -2,6 +2,8 @@
 
 import strawberry
 
+from apps.common.loaders import prefetch_related
+
 
 @strawberry.type
 class MentorNode:
@@ -12,14 +14,17 @@ class MentorNode:
     @strawberry.field
     def avatar_url(self) -> str:
         """Get the GitHub avatar URL of the mentor."""
+        prefetch_related(self, "github_user")
         return self.github_user.avatar_url if self.github_user else ""
 
     @strawberry.field
     def name(self) -> str:
         """Get the GitHub name of the mentor."""
+        prefetch_related(self, "github_user")
         return self.github_user.name if self.github_user else ""
 
     @strawberry.field
     def login(self) -> str:
         """Get the GitHub login of the mentor."""
+        prefetch_related(self, "github_user")
         return self.github_user.login if self.github_user else ""
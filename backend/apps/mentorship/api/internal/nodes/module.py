@@ -4,6 +4,7 @@ from datetime import datetime
 
 import strawberry
 
+from apps.common.loaders import prefetch_related
 from apps.github.api.internal.nodes.issue import IssueNode
 from apps.github.api.internal.nodes.user import UserNode
 from apps.github.models import Label
@@ -37,7 +38,7 @@ class ModuleNode:
     @strawberry.field
     def mentors(self) -> list[MentorNode]:
         """Get the list of mentors for this module."""
-        return self.mentors.all()
+        return prefetch_related(self, "mentors__github_user").mentors.all()
 
     @strawberry.field
     def mentees(self) -> list[UserNode]:
@@ -70,6 +71,7 @@ class ModuleNode:
     @strawberry.field
     def project_name(self) -> str | None:
         """Get the project name for this module."""
+        prefetch_related(self, "project")
         return self.project.name if self.project else None
 
     @strawberry.field
@@ -4,6 +4,7 @@ from datetime import datetime
 
 import strawberry
 
+from apps.common.loaders import prefetch_related
 from apps.mentorship.api.internal.nodes.enum import (
     ExperienceLevelEnum,
     ProgramStatusEnum,
@@ -31,7 +32,7 @@ class ProgramNode:
     @strawberry.field
     def admins(self) -> list[MentorNode] | None:
         """Get the list of program administrators."""
-        return self.admins.all()
+        return prefetch_related(self, "admins__github_user").admins.all()
 
 
 @strawberry.type
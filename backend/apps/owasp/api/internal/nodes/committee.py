@@ -3,6 +3,7 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import prefetch_related
 from apps.owasp.api.internal.nodes.common import GenericEntityNode
 from apps.owasp.models.committee import Committee
 
@@ -14,7 +15,7 @@ class CommitteeNode(GenericEntityNode):
     @strawberry.field
     def contributors_count(self) -> int:
         """Resolve contributors count."""
-        return self.owasp_repository.contributors_count
+        return prefetch_related(self, "owasp_repository").owasp_repository.contributors_count
 
     @strawberry.field
     def created_at(self) -> float:
@@ -24,12 +25,12 @@ class CommitteeNode(GenericEntityNode):
     @strawberry.field
     def forks_count(self) -> int:
         """Resolve forks count."""
-        return self.owasp_repository.forks_count
+        return prefetch_related(self, "owasp_repository").owasp_repository.forks_count
 
     @strawberry.field
     def issues_count(self) -> int:
         """Resolve issues count."""
-        return self.owasp_repository.open_issues_count
+        return prefetch_related(self, "owasp_repository").owasp_repository.open_issues_count
 
     @strawberry.field
     def repositories_count(self) -> int:
@@ -39,4 +40,4 @@ class CommitteeNode(GenericEntityNode):
     @strawberry.field
     def stars_count(self) -> int:
         """Resolve stars count."""
-        return self.owasp_repository.stars_count
+        return prefetch_related(self, "owasp_repository").owasp_repository.stars_count
@@ -3,6 +3,7 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import prefetch_related
 from apps.github.api.internal.nodes.user import UserNode
 from apps.owasp.models.member_snapshot import MemberSnapshot
 
@@ -31,7 +32,7 @@ class MemberSnapshotNode(strawberry.relay.Node):
     @strawberry.field
     def github_user(self) -> UserNode:
         """Resolve GitHub user."""
-        return self.github_user
+        return prefetch_related(self, "github_user").github_user
 
     @strawberry.field
     def issues_count(self) -> int:
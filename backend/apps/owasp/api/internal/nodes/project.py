@@ -3,12 +3,18 @@
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import count_by, get_top_by, group_by, load
 from apps.core.utils.index import deep_camelize
 from apps.github.api.internal.nodes.issue import IssueNode
 from apps.github.api.internal.nodes.milestone import MilestoneNode
 from apps.github.api.internal.nodes.pull_request import PullRequestNode
 from apps.github.api.internal.nodes.release import ReleaseNode
 from apps.github.api.internal.nodes.repository import RepositoryNode
+from apps.github.models.issue import Issue
+from apps.github.models.milestone import Milestone
+from apps.github.models.pull_request import PullRequest
+from apps.github.models.release import Release
+from apps.github.models.repository import Repository
 from apps.owasp.api.internal.nodes.common import GenericEntityNode
 from apps.owasp.api.internal.nodes.project_health_metrics import (
     ProjectHealthMetricsNode,
@@ -21,6 +27,106 @@ RECENT_RELEASES_LIMIT = 5
 RECENT_PULL_REQUESTS_LIMIT = 5
 
 
+def load_health_metrics(projects: list[Project], limit: int) -> dict[int, list]:
+    """Load health metrics of projects."""
+    return get_top_by(
+        ProjectHealthMetrics.objects.filter(project_id__in=[project.id for project in projects]),
+        "project_id",
+        ["nest_created_at"],
+        limit,
+    )
+
+
+def load_issues_counts(projects: list[Project]) -> dict[int, int]:
+    """Load open issues counts of projects."""
+    return count_by(
+        Issue.open_issues.filter(repository__project__in=[project.id for project in projects]),
+        "repository__project",
+    )
+
+
+def load_latest_health_metrics(projects: list[Project]) -> dict:
+    """Load latest health metrics of projects."""
+    return {
+        metrics.project_id: metrics
+        for metrics in ProjectHealthMetrics.get_latest_health_metrics().filter(
+            project_id__in=[project.id for project in projects]
+        )
+    }
+
+
+def load_recent_issues(projects: list[Project]) -> dict[int, list]:
+    """Load recent issues of projects."""
+    return get_top_by(
+        Issue.objects.filter(
+            repository__project__in=[project.id for project in projects]
+        ).select_related("author", "repository"),
+        "repository__project",
+        ["-created_at"],
+        RECENT_ISSUES_LIMIT,
+    )
+
+
+def load_recent_milestones(projects: list[Project], limit: int) -> dict[int, list]:
+    """Load recent milestones of projects."""
+    return get_top_by(
+        Milestone.objects.filter(
+            repository__project__in=[project.id for project in projects]
+        ).select_related("author", "repository"),
+        "repository__project",
+        ["-created_at"],
+        limit,
+    )
+
+
+def load_recent_pull_requests(projects: list[Project]) -> dict[int, list]:
+    """Load recent pull requests of projects."""
+    return get_top_by(
+        PullRequest.objects.filter(
+            repository__project__in=[project.id for project in projects]
+        ).select_related("author", "repository"),
+        "repository__project",
+        ["-created_at"],
+        RECENT_PULL_REQUESTS_LIMIT,
+    )
+
+
+def load_recent_releases(projects: list[Project]) -> dict[int, list]:
+    """Load recent published releases of projects."""
+    return get_top_by(
+        Release.objects.filter(
+            is_draft=False,
+            published_at__isnull=False,
+            repository__project__in=[project.id for project in projects],
+        ).select_related("repository"),
+        "repository__project",
+        ["-published_at"],
+        RECENT_RELEASES_LIMIT,
+    )
+
+
+def load_repositories(projects: list[Project]) -> dict[int, list]:
+    """Load repositories of projects."""
+    return group_by(
+        Repository.objects.filter(
+            organization__isnull=False,
+            project__in=[project.id for project in projects],
+        ).order_by(
+            "-pushed_at",
+            "-updated_at",
+        ),
+        "project",
+    )
+
+
+def load_repositories_counts(projects: list[Project]) -> dict[int, int]:
+    """Load repositories counts of projects."""
+    return count_by(
+        Repository.objects.filter(project__in=[project.id for project in projects]),
+        "project",
+    )
+
+
 @strawberry_django.type(
     Project,
     fields=[
@@ -49,27 +155,17 @@ class ProjectNode(GenericEntityNode):
     @strawberry.field
     def health_metrics_list(self, limit: int = 30) -> list[ProjectHealthMetricsNode]:
         """Resolve project health metrics."""
-        return ProjectHealthMetrics.objects.filter(
-            project=self,
-        ).order_by(
-            "nest_created_at",
-        )[:limit]
+        return load(self, load_health_metrics, limit, default=[])
 
     @strawberry.field
     def health_metrics_latest(self) -> ProjectHealthMetricsNode | None:
         """Resolve latest project health metrics."""
-        return (
-            ProjectHealthMetrics.get_latest_health_metrics()
-            .filter(
-                project=self,
-            )
-            .first()
-        )
+        return load(self, load_latest_health_metrics)
 
     @strawberry.field
     def issues_count(self) -> int:
         """Resolve issues count."""
-        return self.idx_issues_count
+        return load(self, load_issues_counts, default=0)
 
     @strawberry.field
     def key(self) -> str:
@@ -84,39 +180,32 @@ class ProjectNode(GenericEntityNode):
     @strawberry.field
     def recent_issues(self) -> list[IssueNode]:
         """Resolve recent issues."""
-        return self.issues.select_related("author").order_by("-created_at")[:RECENT_ISSUES_LIMIT]
+        return load(self, load_recent_issues, default=[])
 
     @strawberry.field
     def recent_milestones(self, limit: int = 5) -> list[MilestoneNode]:
         """Resolve recent milestones."""
-        return self.recent_milestones.select_related("author").order_by("-created_at")[:limit]
+        return load(self, load_recent_milestones, limit, default=[])
 
     @strawberry.field
     def recent_pull_requests(self) -> list[PullRequestNode]:
         """Resolve recent pull requests."""
-        return self.pull_requests.select_related("author").order_by("-created_at")[
-            :RECENT_PULL_REQUESTS_LIMIT
-        ]
+        return load(self, load_recent_pull_requests, default=[])
 
     @strawberry.field
     def recent_releases(self) -> list[ReleaseNode]:
         """Resolve recent releases."""
-        return self.published_releases.order_by("-published_at")[:RECENT_RELEASES_LIMIT]
+        return load(self, load_recent_releases, default=[])
 
     @strawberry.field
     def repositories(self) -> list[RepositoryNode]:
         """Resolve repositories."""
-        return self.repositories.filter(
-            organization__isnull=False,
-        ).order_by(
-            "-pushed_at",
-            "-updated_at",
-        )
+        return load(self, load_repositories, default=[])
 
     @strawberry.field
     def repositories_count(self) -> int:
         """Resolve repositories count."""
-        return self.idx_repositories_count
+        return load(self, load_repositories_counts, default=0)
 
     @strawberry.field
     def topics(self) -> list[str]:
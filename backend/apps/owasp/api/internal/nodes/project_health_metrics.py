@@ -5,6 +5,7 @@ from datetime import datetime
 import strawberry
 import strawberry_django
 
+from apps.common.loaders import prefetch_related
 from apps.owasp.api.internal.filters.project_health_metrics import ProjectHealthMetricsFilter
 from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
 
@@ -79,12 +80,12 @@ class ProjectHealthMetricsNode(strawberry.relay.Node):
     @strawberry.field
     def project_key(self) -> str:
         """Resolve project key."""
-        return self.project.nest_key
+        return prefetch_related(self, "project").project.nest_key
 
     @strawberry.field
     def project_name(self) -> str:
         """Resolve project name."""
-        return self.project.name
+        return prefetch_related(self, "project").project.name
 
     @strawberry.field
     def owasp_page_last_update_days(self) -> int:
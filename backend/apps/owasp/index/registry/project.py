@@ -1,7 +1,20 @@
 """OWASP app project index."""
 
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Count, Sum
+from django.db.models.functions import Lower
+
 from apps.common.index import IndexBase, register
+from apps.github.models.issue import Issue
+from apps.github.models.repository import Repository
+from apps.github.models.repository_contributor import RepositoryContributor
+from apps.owasp.models.mixins.project import REPOSITORIES_LIMIT
 from apps.owasp.models.project import Project
+from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
+
+TOP_CONTRIBUTORS_LIMIT = 15
 
 
 @register(Project)
@@ -109,7 +122,77 @@ class ProjectIndex(IndexBase):
             Project.objects.prefetch_related(
                 "organizations",
                 "repositories",
+                "repositories__owner",
             )
             .filter(organizations__isnull=False)
             .distinct()
         )
+
+    def prefetch_index_fields(self, instances) -> None:
+        """Precompute per project queries based index fields in bulk.
+
+        Args:
+            instances (tuple[Project]): The projects batch.
+
+        """
+        project_repositories = {
+            project.id: sorted(
+                project.repositories.all(), key=lambda r: r.stars_count, reverse=True
+            )
+            for project in instances
+        }
+        repository_ids = {r.id for rs in project_repositories.values() for r in rs}
+
+        open_issues_counts = dict(
+            Issue.open_issues.filter(repository_id__in=repository_ids)
+            .values("repository_id")
+            .annotate(count=Count("id"))
+            .values_list("repository_id", "count")
+        )
+
+        latest_releases = Repository.get_latest_releases(
+            {r.id for rs in project_repositories.values() for r in rs[:REPOSITORIES_LIMIT]}
+        )
+
+        top_contributors: defaultdict[str, list[dict]] = defaultdict(list)
+        for tc in (
+            RepositoryContributor.objects.by_humans()
+            .to_community_repositories()
+            .annotate(project_key=Lower("repository__project__key"))
+            .filter(project_key__in={f"www-project-{p.key}".lower() for p in instances})
+            .filter(repository__project__isnull=False)
+            .values("project_key", "user__avatar_url", "user__login", "user__name")
+            .annotate(total_contributions=Sum("contributions_count"))
+            .order_by("project_key", "-total_contributions")
+        ):
+            if len(top_contributors[tc["project_key"]]) < TOP_CONTRIBUTORS_LIMIT:
+                top_contributors[tc["project_key"]].append(
+                    {
+                        "avatar_url": tc["user__avatar_url"],
+                        "contributions_count": tc["total_contributions"],
+                        "login": tc["user__login"],
+                        "name": tc["user__name"],
+                    }
+                )
+
+        # TODO(arkid15r): Enable real health score in production when ready.
+        if not settings.IS_PRODUCTION_ENVIRONMENT:
+            health_scores = dict(
+                ProjectHealthMetrics.objects.filter(project_id__in=project_repositories)
+                .order_by("project_id", "-nest_created_at")
+                .distinct("project_id")
+                .values_list("project_id", "score")
+            )
+            for project in instances:
+                project.idx_health_score = health_scores.get(project.id)
+
+        for project in instances:
+            repositories = project_repositories[project.id]
+            for repository in repositories[:REPOSITORIES_LIMIT]:
+                repository.latest_release = latest_releases.get(repository.id)
+
+            project.idx_issues_count = sum(open_issues_counts.get(r.id, 0) for r in repositories)
+            project.idx_repositories = [
+                project.get_idx_repository(r) for r in repositories[:REPOSITORIES_LIMIT]
+            ]
+            project.idx_top_contributors = top_contributors[f"www-project-{project.key}".lower()]
@@ -5,7 +5,7 @@ import time
 
 from django.core.management.base import BaseCommand
 
-from apps.github.utils import normalize_url
+from apps.github.utils import normalize_url, use_file_content_cache
 from apps.owasp.models.committee import Committee
 from apps.owasp.scraper import OwaspScraper
 
@@ -24,6 +24,7 @@ class Command(BaseCommand):
         """
         parser.add_argument("--offset", default=0, required=False, type=int)
 
+    @use_file_content_cache()
     def handle(self, *args, **options) -> None:
         """Handle the command execution."""
         active_committees = Committee.active_committees.order_by("-created_at")
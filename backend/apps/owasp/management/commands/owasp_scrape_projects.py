@@ -8,7 +8,7 @@ from github.GithubException import UnknownObjectException
 
 from apps.github.auth import get_github_client
 from apps.github.constants import GITHUB_USER_RE
-from apps.github.utils import normalize_url
+from apps.github.utils import normalize_url, use_file_content_cache
 from apps.owasp.models.project import Project
 from apps.owasp.scraper import OwaspScraper
 
@@ -27,6 +27,7 @@ class Command(BaseCommand):
         """
         parser.add_argument("--offset", default=0, required=False, type=int)
 
+    @use_file_content_cache()
     def handle(self, *args, **options) -> None:
         """Handle the command execution.
 
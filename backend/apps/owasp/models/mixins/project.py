@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from django.conf import settings
+from django.utils.functional import cached_property
 
 from apps.common.utils import join_values
 from apps.github.models.repository_contributor import RepositoryContributor
@@ -37,7 +38,7 @@ class ProjectIndexMixin(RepositoryBasedEntityModelMixin):
         """Return forks count for indexing."""
         return self.forks_count
 
-    @property
+    @cached_property
     def idx_health_score(self) -> float | None:
         """Return health score for indexing."""
         # TODO(arkid15r): Enable real health score in production when ready.
@@ -48,7 +49,7 @@ class ProjectIndexMixin(RepositoryBasedEntityModelMixin):
         """Return active status for indexing."""
         return self.is_active
 
-    @property
+    @cached_property
     def idx_issues_count(self) -> int:
         """Return issues count for indexing."""
         return self.open_issues.count()
@@ -83,24 +84,37 @@ class ProjectIndexMixin(RepositoryBasedEntityModelMixin):
         """Return organizations for indexing."""
         return join_values(fields=[o.name for o in self.organizations.all()])
 
-    @property
+    @cached_property
     def idx_repositories(self) -> list[dict]:
         """Return repositories for indexing."""
         return [
-            {
-                "contributors_count": r.contributors_count,
-                "description": r.description,
-                "forks_count": r.forks_count,
-                "key": r.key.lower(),
-                "latest_release": str(r.latest_release.summary) if r.latest_release else "",
-                "license": r.license,
-                "name": r.name,
-                "owner_key": r.owner.login.lower(),
-                "stars_count": r.stars_count,
-            }
+            self.get_idx_repository(r)
             for r in self.repositories.order_by("-stars_count")[:REPOSITORIES_LIMIT]
         ]
 
+    @staticmethod
+    def get_idx_repository(r) -> dict:
+        """Return repository data for indexing.
+
+        Args:
+            r (Repository): The repository instance.
+
+        Returns:
+            dict: The repository data.
+
+        """
+        return {
+            "contributors_count": r.contributors_count,
+            "description": r.description,
+            "forks_count": r.forks_count,
+            "key": r.key.lower(),
+            "latest_release": str(r.latest_release.summary) if r.latest_release else "",
+            "license": r.license,
+            "name": r.name,
+            "owner_key": r.owner.login.lower(),
+            "stars_count": r.stars_count,
+        }
+
     @property
     def idx_repositories_count(self) -> int:
         """Return repositories count for indexing."""
@@ -111,7 +125,7 @@ class ProjectIndexMixin(RepositoryBasedEntityModelMixin):
         """Return stars count for indexing."""
         return self.stars_count
 
-    @property
+    @cached_property
     def idx_top_contributors(self) -> list:
         """Return top contributors for indexing."""
         return RepositoryContributor.get_top_contributors(project=self.key)
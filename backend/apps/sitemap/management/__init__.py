@@ -0,0 +1 @@
+"""Sitemap app management."""
@@ -0,0 +1,33 @@
+"""A command to pre-generate OWASP Nest sitemaps."""
+
+from django.core.management.base import BaseCommand
+
+from apps.sitemap.urls import sitemaps
+from apps.sitemap.utils import (
+    cache_sitemap,
+    get_section_path,
+    get_sitemap,
+    iter_sitemap_index,
+    iter_urlset,
+)
+
+SITEMAP_INDEX_PATH = "/sitemap.xml"
+
+
+class Command(BaseCommand):
+    help = "Pre-generate OWASP Nest sitemaps and store them in the cache."
+
+    def handle(self, *_args, **_options) -> None:
+        """Generate sitemap index and every page of every sitemap section."""
+        for _ in cache_sitemap(iter_sitemap_index(sitemaps), SITEMAP_INDEX_PATH):
+            pass
+
+        for section, section_sitemap in sitemaps.items():
+            sitemap = get_sitemap(section_sitemap)
+            paginator = sitemap.paginator
+            path = get_section_path(section)
+            for page in paginator.page_range:
+                for _ in cache_sitemap(iter_urlset({sitemap: paginator}, page), path, page):
+                    pass
+
+            print(f"{section}: {paginator.num_pages} page(s), {paginator.count} URL(s)")
@@ -11,6 +11,7 @@ from .views import (
     RepositorySitemap,
     SnapshotSitemap,
     StaticSitemap,
+    cached_sitemap_index_view,
     cached_sitemap_view,
 )
 
@@ -28,7 +29,7 @@ sitemaps = {
 urlpatterns = [
     path(
         "sitemap.xml",
-        cached_sitemap_view(sitemaps=sitemaps),
+        cached_sitemap_index_view(sitemaps=sitemaps),
     ),
     path(
         "sitemap/chapters.xml",
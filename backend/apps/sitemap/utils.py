@@ -0,0 +1,155 @@
+"""Sitemap app utils."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import escape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.contrib.sitemaps import Sitemap
+
+SITEMAP_CHUNK_SIZE = 1000
+SITEMAP_CONTENT_TYPE = "application/xml"
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def get_cache_key(path: str, page: int = 1) -> str:
+    """Get sitemap cache key.
+
+    Args:
+        path (str): The sitemap URL path.
+        page (int, optional): The sitemap page number.
+
+    Returns:
+        str: The cache key.
+
+    """
+    return f"{settings.SITEMAP_CACHE_PREFIX}-{path}-{page}"
+
+
+def get_sitemap(sitemap) -> Sitemap:
+    """Get sitemap instance.
+
+    Args:
+        sitemap (Sitemap | type[Sitemap]): The sitemap instance or class.
+
+    Returns:
+        Sitemap: The sitemap instance.
+
+    """
+    return sitemap() if callable(sitemap) else sitemap
+
+
+def get_section_path(section: str) -> str:
+    """Get sitemap section URL path.
+
+    Args:
+        section (str): The sitemap section name.
+
+    Returns:
+        str: The section URL path.
+
+    """
+    return f"/sitemap/{section}.xml"
+
+
+def cache_sitemap(chunks: Iterator[str], path: str, page: int = 1) -> Iterator[str]:
+    """Yield sitemap chunks and cache the whole sitemap once all of them are generated.
+
+    Args:
+        chunks (Iterator[str]): The sitemap chunks.
+        path (str): The sitemap URL path.
+        page (int, optional): The sitemap page number.
+
+    Yields:
+        str: The sitemap chunk.
+
+    """
+    content = []
+    for chunk in chunks:
+        content.append(chunk)
+        yield chunk
+
+    cache.set(
+        get_cache_key(path, page),
+        "".join(content).encode(),
+        timeout=settings.SITEMAP_CACHE_TIME_SECONDS,
+    )
+
+
+def iter_sitemap_index(sitemaps: dict) -> Iterator[str]:
+    """Generate sitemap index XML referencing every page of every section.
+
+    Args:
+        sitemaps (dict): The sitemaps by section name.
+
+    Yields:
+        str: The sitemap index XML chunk.
+
+    """
+    yield f'<?xml version="1.0" encoding="utf-8"?>\n<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n'
+
+    for section, sitemap in sitemaps.items():
+        location = f"{settings.SITE_URL}{get_section_path(section)}"
+        for page in get_sitemap(sitemap).paginator.page_range:
+            page_location = location if page == 1 else f"{location}?p={page}"
+            yield f"  <sitemap>\n    <loc>{escape(page_location)}</loc>\n  </sitemap>\n"
+
+    yield "</sitemapindex>\n"
+
+
+def iter_urlset(paginators: dict, page: int = 1) -> Iterator[str]:
+    """Generate sitemap XML for a page of the sitemaps.
+
+    Args:
+        paginators (dict): The sitemap paginators by sitemap instance.
+        page (int, optional): The sitemap page number.
+
+    Yields:
+        str: The sitemap XML chunk.
+
+    """
+    yield f'<?xml version="1.0" encoding="utf-8"?>\n<urlset xmlns="{SITEMAP_NAMESPACE}">\n'
+
+    urls = []
+    for sitemap, paginator in paginators.items():
+        items = paginator.page(page).object_list
+        if hasattr(items, "iterator"):
+            items = items.iterator(chunk_size=SITEMAP_CHUNK_SIZE)
+
+        for item in items:
+            urls.append(render_url(sitemap, item))
+            if len(urls) == SITEMAP_CHUNK_SIZE:
+                yield "".join(urls)
+                urls.clear()
+
+    yield "".join(urls)
+    yield "</urlset>\n"
+
+
+def render_url(sitemap: Sitemap, item) -> str:
+    """Render sitemap URL entry.
+
+    Args:
+        sitemap (Sitemap): The sitemap instance.
+        item: The sitemap item.
+
+    Returns:
+        str: The URL entry XML.
+
+    """
+    url = [f"  <url>\n    <loc>{escape(settings.SITE_URL + sitemap.location(item))}</loc>\n"]
+    if lastmod := sitemap.lastmod(item):
+        url.append(f"    <lastmod>{lastmod.isoformat()}</lastmod>\n")
+    if changefreq := sitemap.changefreq(item):
+        url.append(f"    <changefreq>{changefreq}</changefreq>\n")
+    if priority := sitemap.priority(item):
+        url.append(f"    <priority>{priority}</priority>\n")
+    url.append("  </url>\n")
+
+    return "".join(url)
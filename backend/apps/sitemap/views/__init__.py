@@ -1,8 +1,17 @@
 """Sitemap views."""
 
-from django.contrib.sitemaps.views import sitemap
-from django.http import HttpRequest
-from django.views.decorators.cache import cache_page
+from django.core.cache import cache
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
+
+from apps.sitemap.utils import (
+    SITEMAP_CONTENT_TYPE,
+    cache_sitemap,
+    get_cache_key,
+    get_sitemap,
+    iter_sitemap_index,
+    iter_urlset,
+)
 
 from .chapter import ChapterSitemap
 from .committee import CommitteeSitemap
@@ -14,11 +23,45 @@ from .snapshot import SnapshotSitemap
 from .static import StaticSitemap
 
 
-def cached_sitemap_view(sitemaps, **kwargs):
-    """Cache sitemap view for performance optimization."""
+def cached_sitemap_index_view(sitemaps):
+    """Serve pre-generated sitemap index or stream and cache it."""
 
-    @cache_page(86400)  # Cache for 24 hours.
     def _view(request: HttpRequest):
-        return sitemap(request, sitemaps=sitemaps, **kwargs)
+        if content := cache.get(get_cache_key(request.path)):
+            return HttpResponse(content, content_type=SITEMAP_CONTENT_TYPE)
+
+        return StreamingHttpResponse(
+            cache_sitemap(iter_sitemap_index(sitemaps), request.path),
+            content_type=SITEMAP_CONTENT_TYPE,
+        )
+
+    return _view
+
+
+def cached_sitemap_view(sitemaps):
+    """Serve pre-generated sitemap page or stream and cache it."""
+
+    def _view(request: HttpRequest):
+        try:
+            page = int(request.GET.get("p", 1))
+        except ValueError as e:
+            raise Http404 from e
+
+        if content := cache.get(get_cache_key(request.path, page)):
+            return HttpResponse(content, content_type=SITEMAP_CONTENT_TYPE)
+
+        paginators = {}
+        for sitemap in map(get_sitemap, sitemaps.values()):
+            paginator = sitemap.paginator
+            try:
+                paginator.validate_number(page)
+            except InvalidPage as e:
+                raise Http404 from e
+            paginators[sitemap] = paginator
+
+        return StreamingHttpResponse(
+            cache_sitemap(iter_urlset(paginators, page), request.path, page),
+            content_type=SITEMAP_CONTENT_TYPE,
+        )
 
     return _view
@@ -1,5 +1,7 @@
 """Member sitemap."""
 
+from django.db.models import QuerySet
+
 from apps.github.models.user import User
 from apps.sitemap.views.base import BaseSitemap
 
@@ -10,20 +12,22 @@ class MemberSitemap(BaseSitemap):
     change_frequency = "daily"
     prefix = "/members"
 
-    def items(self) -> list[User]:
+    def items(self) -> QuerySet[User]:
         """Return members for sitemap generation.
 
         Returns:
-            list: List of indexable User objects ordered by update/creation date
+            QuerySet: Indexable User objects ordered by update/creation date
 
         """
-        return [
-            u
-            for u in User.objects.filter(
-                is_bot=False,
-            ).order_by(
+        return (
+            User.objects.indexable()
+            .only(
+                "created_at",
+                "login",
+                "updated_at",
+            )
+            .order_by(
                 "-updated_at",
                 "-created_at",
             )
-            if u.is_indexable
-        ]
+        )
@@ -12,6 +12,7 @@ from apps.common.utils import convert_to_snake_case
 from apps.slack.apps import SlackConfig
 from apps.slack.blocks import DIVIDER, SECTION_BREAK, markdown
 from apps.slack.constants import FEEDBACK_SHARING_INVITE, NEST_BOT_NAME
+from apps.slack.services.handlers import enqueue_command
 from apps.slack.utils import get_text
 
 logger = logging.getLogger(__name__)
@@ -121,6 +122,9 @@ class CommandBase:
     def handler(self, ack, command, client):
         """Handle the Slack command.
 
+        The command is acknowledged right away and processed in the background
+        unless the Slack queue is disabled.
+
         Args:
             ack (function): Acknowledge the Slack command request.
             command (dict): The Slack command payload.
@@ -132,6 +136,20 @@ class CommandBase:
         if not settings.SLACK_COMMANDS_ENABLED:
             return
 
+        if settings.SLACK_QUEUE_ENABLED:
+            enqueue_command(self, command)
+            return
+
+        self.process_command(command, client)
+
+    def process_command(self, command, client):
+        """Process the Slack command posting the result as a direct message.
+
+        Args:
+            command (dict): The Slack command payload.
+            client (slack_sdk.WebClient): The Slack WebClient instance for API calls.
+
+        """
         try:
             if blocks := self.render_blocks(command):
                 client.chat_postMessage(
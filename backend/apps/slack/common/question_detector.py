@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import time
+from collections import Counter
 
 import openai
 from django.core.exceptions import ObjectDoesNotExist
@@ -13,6 +16,7 @@ from apps.ai.common.constants import (
     DEFAULT_SIMILARITY_THRESHOLD,
 )
 from apps.core.models.prompt import Prompt
+from apps.slack.constants import OWASP_KEYWORDS, QUESTION_WORDS
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,15 @@ class QuestionDetector:
     TEMPERATURE = 0.1
     CHAT_MODEL = "gpt-4o-mini"
     CHUNKS_RETRIEVAL_LIMIT = 10
+    MIN_WORDS_COUNT = 2
+
+    KEYWORDS_PATTERN = re.compile(
+        r"\b(?:"
+        + "|".join(re.escape(keyword) for keyword in sorted(OWASP_KEYWORDS, key=len, reverse=True))
+        + r")\b"
+    )
+    SLACK_MARKUP_PATTERN = re.compile(r"<[^>]*>|:[\w+-]+:")
+    WORD_PATTERN = re.compile(r"[\w']+")
 
     def __init__(self):
         """Initialize the question detector.
@@ -37,6 +50,7 @@ class QuestionDetector:
             raise ValueError(error_msg)
 
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
+        self.prefilter_stats: Counter[bool] = Counter()
         self.retriever = Retriever()
 
     def is_owasp_question(self, text: str) -> bool:
@@ -52,6 +66,10 @@ class QuestionDetector:
         if not text or not text.strip():
             return False
 
+        if not self.is_question_candidate(text):
+            return False
+
+        started_at = time.perf_counter()
         context_chunks = self.retriever.retrieve(
             query=text,
             limit=self.CHUNKS_RETRIEVAL_LIMIT,
@@ -59,6 +77,10 @@ class QuestionDetector:
         )
 
         openai_result = self.is_owasp_question_with_openai(text, context_chunks)
+        logger.info(
+            "Question detection took %.0f ms",
+            (time.perf_counter() - started_at) * 1000,
+        )
 
         if openai_result is None:
             logger.warning(
@@ -68,6 +90,41 @@ class QuestionDetector:
 
         return openai_result
 
+    def is_question_candidate(self, text: str) -> bool:
+        """Check if the text may be an OWASP-related question without external calls.
+
+        Messages with too few words once Slack links, mentions and emojis are removed,
+        and messages that neither look like a question nor mention an OWASP keyword are
+        rejected before the retrieval and OpenAI detection stage.
+
+        Args:
+            text: The input text to check.
+
+        Returns:
+            bool: True if the text should be checked by the detection stage.
+
+        """
+        started_at = time.perf_counter()
+
+        text = self.SLACK_MARKUP_PATTERN.sub(" ", text.lower())
+        words = self.WORD_PATTERN.findall(text)
+        is_candidate = len(words) >= self.MIN_WORDS_COUNT and (
+            "?" in text
+            or words[0].replace("'", "") in QUESTION_WORDS
+            or self.KEYWORDS_PATTERN.search(" ".join(words)) is not None
+        )
+
+        self.prefilter_stats[is_candidate] += 1
+        logger.info(
+            "Question pre-filter %s message in %.3f ms, pass-through rate %.2f of %d",
+            "passed" if is_candidate else "rejected",
+            (time.perf_counter() - started_at) * 1000,
+            self.prefilter_stats[True] / self.prefilter_stats.total(),
+            self.prefilter_stats.total(),
+        )
+
+        return is_candidate
+
     def is_owasp_question_with_openai(self, text: str, context_chunks: list[dict]) -> bool | None:
         """Determine if the text is an OWASP-related question using retrieved context chunks.
 
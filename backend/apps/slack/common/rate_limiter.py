@@ -0,0 +1,75 @@
+"""Slack Web API rate limiter."""
+
+from __future__ import annotations
+
+import threading
+
+from apps.common.rate_limiter import TokenBucket
+from apps.slack.constants import (
+    SLACK_API_DEFAULT_TIER,
+    SLACK_API_METHOD_TIERS,
+    SLACK_API_TIER_RATE_LIMITS,
+)
+
+
+class RateLimiter:
+    """Thread-safe per-method Slack Web API rate limiter.
+
+    Each method has its own token bucket refilled according to the method rate limit
+    tier, so concurrent workers share a method budget without blocking calls of other
+    methods.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the rate limiter."""
+        self.buckets: dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_rate(method: str) -> float:
+        """Get the allowed number of calls of a method per second.
+
+        Args:
+            method (str): The Slack WebClient method name, e.g. `conversations_history`.
+
+        Returns:
+            float: The rate in calls per second.
+
+        """
+        tier = SLACK_API_METHOD_TIERS.get(method, SLACK_API_DEFAULT_TIER)
+        return SLACK_API_TIER_RATE_LIMITS[tier] / 60
+
+    def get_bucket(self, method: str) -> TokenBucket:
+        """Get the token bucket of a method.
+
+        Args:
+            method (str): The Slack WebClient method name.
+
+        Returns:
+            TokenBucket: The method token bucket.
+
+        """
+        with self.lock:
+            if method not in self.buckets:
+                self.buckets[method] = TokenBucket(rate=self.get_rate(method))
+
+            return self.buckets[method]
+
+    def pause(self, method: str, seconds: float) -> None:
+        """Postpone the next call of a method, e.g. after a rate limited response.
+
+        Args:
+            method (str): The Slack WebClient method name.
+            seconds (float): The number of seconds to postpone the call for.
+
+        """
+        self.get_bucket(method).pause(seconds)
+
+    def wait(self, method: str) -> None:
+        """Block until a call of a method is allowed.
+
+        Args:
+            method (str): The Slack WebClient method name.
+
+        """
+        self.get_bucket(method).acquire()
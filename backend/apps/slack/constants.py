@@ -82,6 +82,49 @@ OWASP_KEYWORDS = {
 
 OWASP_WORKSPACE_ID = "T04T40NHX"
 
+QUESTION_WORDS = {
+    "any",
+    "anyone",
+    "are",
+    "can",
+    "could",
+    "did",
+    "do",
+    "does",
+    "explain",
+    "help",
+    "how",
+    "is",
+    "recommend",
+    "should",
+    "tell",
+    "what",
+    "whats",
+    "when",
+    "where",
+    "which",
+    "who",
+    "why",
+    "will",
+    "would",
+}
+
+# Slack Web API rate limit tiers in requests per minute, see https://api.slack.com/apis/rate-limits
+SLACK_API_DEFAULT_TIER = 3
+SLACK_API_METHOD_TIERS = {
+    "bots_info": 3,
+    "conversations_history": 3,
+    "conversations_replies": 3,
+    "search_messages": 2,
+    "users_info": 4,
+}
+SLACK_API_TIER_RATE_LIMITS = {
+    1: 1,
+    2: 20,
+    3: 50,
+    4: 100,
+}
+
 VIEW_PROJECTS_ACTION = "view_projects_action"
 VIEW_PROJECTS_ACTION_NEXT = "view_projects_action_next"
 VIEW_PROJECTS_ACTION_PREV = "view_projects_action_prev"
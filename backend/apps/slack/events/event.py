@@ -15,6 +15,7 @@ from apps.common.utils import convert_to_snake_case
 from apps.slack.apps import SlackConfig
 from apps.slack.blocks import DIVIDER, SECTION_BREAK, markdown
 from apps.slack.constants import FEEDBACK_SHARING_INVITE, NEST_BOT_NAME
+from apps.slack.services.handlers import enqueue_event, is_duplicate_event
 from apps.slack.utils import get_text
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class EventBase:
     """Base class for Slack events."""
 
     event_type: str | None = None
+    is_debounced: bool = False
     matchers: list[Callable[[Any], bool]] | None = None
 
     @staticmethod
@@ -144,13 +146,18 @@ class EventBase:
         """
         return event.get("user", event.get("user_id"))
 
-    def handler(self, event, client, ack):
+    def handler(self, event, client, ack, body=None, request=None):
         """Handle the Slack event.
 
+        The event is acknowledged right away and processed in the background
+        unless the Slack queue is disabled.
+
         Args:
             event (dict): The Slack event payload.
             client (WebClient): The Slack WebClient instance.
             ack (Callable): Function to acknowledge the event.
+            body (dict | None): The Slack request body.
+            request (BoltRequest | None): The Slack request.
 
         """
         ack()
@@ -158,6 +165,39 @@ class EventBase:
         if not settings.SLACK_EVENTS_ENABLED:
             return
 
+        retry_num = request.headers.get("x-slack-retry-num", [None])[0] if request else None
+        if body and is_duplicate_event(body, retry_num):
+            return
+
+        if settings.SLACK_QUEUE_ENABLED:
+            enqueue_event(self, event)
+            return
+
+        self.process_event(event, client)
+
+    def get_debounce_key(self, event) -> str | None:
+        """Get the key debounced events are collapsed by.
+
+        Only the latest of the events collected during a debounce window with the same key
+        is processed.
+
+        Args:
+            event (dict): The Slack event payload.
+
+        Returns:
+            str | None: The collapse key or None to always process the event.
+
+        """
+        return None
+
+    def process_event(self, event, client):
+        """Process the Slack event handling errors.
+
+        Args:
+            event (dict): The Slack event payload.
+            client (WebClient): The Slack WebClient instance.
+
+        """
         try:
             self.handle_event(event, client)
         except SlackApiError as e:
@@ -18,11 +18,22 @@ class MessagePosted(EventBase):
     """Handles new messages posted in channels."""
 
     event_type = "message"
+    is_debounced = True
 
     def __init__(self):
         """Initialize MessagePosted event handler."""
         self.question_detector = QuestionDetector()
 
+    def get_debounce_key(self, event) -> str | None:
+        """Collapse thread replies per thread and top-level messages per user."""
+        if event.get("subtype") or event.get("bot_id"):
+            return None
+
+        if thread_ts := event.get("thread_ts"):
+            return f"thread:{thread_ts}"
+
+        return f"user:{event.get('user')}"
+
     def handle_event(self, event, client):
         """Handle an incoming message event."""
         if event.get("subtype") or event.get("bot_id"):
@@ -2,16 +2,19 @@
 
 import logging
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.template.defaultfilters import pluralize
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from apps.github.models.user import User
 from apps.owasp.models.member_profile import MemberProfile
+from apps.slack.common.rate_limiter import RateLimiter
 from apps.slack.models import Conversation, Member, Message, Workspace
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,12 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Populate messages for all Slack conversations"
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the command."""
+        super().__init__(*args, **kwargs)
+        self.members_lock = threading.Lock()
+        self.rate_limiter = RateLimiter()
+
     def add_arguments(self, parser):
         """Define command line arguments."""
         parser.add_argument(
@@ -32,7 +41,7 @@ class Command(BaseCommand):
             "--delay",
             type=float,
             default=4,
-            help="Delay between API requests in seconds",
+            help="Delay before retrying rate-limited requests without Retry-After in seconds",
         )
         parser.add_argument(
             "--channel-id",
@@ -65,6 +74,12 @@ class Command(BaseCommand):
             type=str,
             help="End date for message range (YYYY-MM-DD, defaults to today)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of conversations to sync concurrently",
+        )
 
     def handle(self, *args, **options):
         batch_size = options["batch_size"]
@@ -75,6 +90,7 @@ class Command(BaseCommand):
         github_user_id = options["github_user_id"]
         start_at = options["start_at"]
         end_at = options["end_at"]
+        workers = options["workers"]
 
         # Resolve Slack user ID if GitHub user ID is provided
         if github_user_id:
@@ -113,15 +129,21 @@ class Command(BaseCommand):
                 else Conversation.objects.filter(sync_messages=True, workspace=workspace)
             )
 
-            for conversation in conversations:
-                self._fetch_conversation(
-                    batch_size=batch_size,
-                    client=client,
-                    conversation=conversation,
-                    delay=delay,
-                    include_replies=True,
-                    max_retries=max_retries,
-                )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._fetch_conversation,
+                        batch_size=batch_size,
+                        client=client,
+                        conversation=conversation,
+                        delay=delay,
+                        include_replies=True,
+                        max_retries=max_retries,
+                    )
+                    for conversation in conversations
+                ]
+                for future in futures:
+                    future.result()
 
         self.stdout.write(self.style.SUCCESS("\nFinished processing all workspaces"))
 
@@ -230,11 +252,14 @@ class Command(BaseCommand):
             # Search for messages using search.messages API
             query = f"from:<@{user_id}>"
             page = 1
-            retry_count = 0
 
             while True:
                 try:
-                    response = client.search_messages(
+                    response = self._call_slack_api(
+                        client,
+                        "search_messages",
+                        delay=delay,
+                        max_retries=max_retries,
                         query=query,
                         count=100,
                         sort="timestamp",
@@ -242,8 +267,6 @@ class Command(BaseCommand):
                         page=page,
                     )
 
-                    self._handle_slack_response(response, "search_messages")
-
                     messages_data = response.get("messages", {}).get("matches", [])
                     if not messages_data:
                         self.stdout.write(f"No more messages found for page {page}")
@@ -326,24 +349,8 @@ class Command(BaseCommand):
                         break
 
                     page += 1
-                    time.sleep(delay)
 
                 except SlackApiError as e:
-                    if e.response["error"] == "ratelimited":
-                        if retry_count >= max_retries:
-                            self.stdout.write(
-                                self.style.ERROR(f"Max retries ({max_retries}) exceeded")
-                            )
-                            break
-
-                        retry_after = int(e.response.headers.get("Retry-After", delay))
-                        retry_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(f"Rate limited. Retrying after {retry_after}s")
-                        )
-                        time.sleep(retry_after)
-                        continue
-
                     self.stdout.write(
                         self.style.ERROR(f"Error searching messages: {e.response['error']}")
                     )
@@ -353,6 +360,47 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"\nFinished! Total messages synced: {total_messages}")
         )
 
+    def _call_slack_api(
+        self,
+        client: WebClient,
+        method: str,
+        delay: float,
+        max_retries: int,
+        **kwargs,
+    ):
+        """Call a Slack API method within its rate limit, retrying rate-limited calls.
+
+        Only the rate-limited method is paused, calls of other methods and workers
+        waiting for them are not blocked.
+        """
+        retry_count = 0
+        while True:
+            self.rate_limiter.wait(method)
+            try:
+                response = getattr(client, method)(**kwargs)
+            except SlackApiError as e:
+                if e.response["error"] != "ratelimited":
+                    raise
+
+                if retry_count >= max_retries:
+                    self.stdout.write(
+                        self.style.ERROR(f"Max retries ({max_retries}) exceeded for {method}")
+                    )
+                    raise
+
+                retry_after = int(e.response.headers.get("Retry-After", delay * (retry_count + 1)))
+                retry_count += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Rate limited on {method}. Retrying after {retry_after} seconds"
+                    )
+                )
+                self.rate_limiter.pause(method, retry_after)
+                continue
+
+            self._handle_slack_response(response, method)
+            return response
+
     def _fetch_conversation(
         self,
         client: WebClient,
@@ -363,7 +411,7 @@ class Command(BaseCommand):
         *,
         include_replies: bool = True,
     ):
-        """Fetch messages for a single conversation from its beginning."""
+        """Fetch new messages for a single conversation since its latest synced message."""
         self.stdout.write(f"\nProcessing channel: {conversation.name}")
 
         try:
@@ -385,6 +433,9 @@ class Command(BaseCommand):
                     f"Failed to fetch messages for {conversation.name}: {e.response['error']}"
                 )
             )
+        finally:
+            # Conversations are fetched by worker threads, each with its own connection.
+            connection.close()
 
     def _fetch_messages(
         self,
@@ -396,72 +447,93 @@ class Command(BaseCommand):
         *,
         include_replies: bool = True,
     ) -> None:
-        """Fetch all parent messages (non-thread) for a conversation."""
+        """Fetch parent messages (non-thread) posted after the latest synced one.
+
+        History pages come newest first, so the conversation's latest synced message
+        timestamp is advanced only once the whole walk has succeeded.
+        """
         cursor = None
-        has_more = True
-        while has_more:
+        oldest = latest_ts = conversation.latest_synced_message_ts or "0"
+        while True:
             try:
-                retry_count = 0
-                response = client.conversations_history(
+                response = self._call_slack_api(
+                    client,
+                    "conversations_history",
+                    delay=delay,
+                    max_retries=max_retries,
                     channel=conversation.slack_channel_id,
                     cursor=cursor,
                     limit=batch_size,
-                    oldest=conversation.latest_message.ts if conversation.latest_message else "0",
+                    oldest=oldest,
                 )
-
-                self._handle_slack_response(response, "conversations_history")
-
-                messages = [
-                    message
-                    for message_data in response.get("messages", [])
-                    if (
-                        message := self._create_message(
-                            client=client,
-                            conversation=conversation,
-                            delay=delay,
-                            max_retries=max_retries,
-                            message_data=message_data,
-                        )
-                    )
-                ]
-                cursor = response.get("response_metadata", {}).get("next_cursor")
-                has_more = bool(cursor)
             except SlackApiError as e:
-                if e.response["error"] == "ratelimited":
-                    if retry_count >= max_retries:
-                        self.stdout.write(
-                            self.style.ERROR(f"Max retries ({max_retries}) exceeded for history")
-                        )
-                        break
-
-                    retry_after = int(
-                        e.response.headers.get("Retry-After", delay * (retry_count + 1))
-                    )
-                    retry_count += 1
-                    self.stdout.write(
-                        self.style.WARNING(f"Rate limited. Retrying after {retry_after} seconds")
-                    )
-                    time.sleep(retry_after)
-                    continue
-
                 self.stdout.write(
                     self.style.ERROR(f"Error fetching messages: {e.response['error']}")
                 )
-                break
-
-            Message.bulk_save(messages.copy())
-            if include_replies and messages:
-                print("Fetching message replies...")
-                for message in messages:
-                    if not message.has_replies:
-                        continue
+                return
 
-                    self._fetch_replies(
+            messages_data = response.get("messages", [])
+            latest_ts = max(
+                (latest_ts, *(message_data.get("ts", "0") for message_data in messages_data))
+            )
+            messages = [
+                message
+                for message_data in messages_data
+                if (
+                    message := self._create_message(
                         client=client,
-                        message=message,
+                        conversation=conversation,
                         delay=delay,
                         max_retries=max_retries,
+                        message_data=message_data,
                     )
+                )
+            ]
+
+            Message.bulk_save(messages.copy())
+            if include_replies and messages:
+                self._fetch_threads(
+                    client=client,
+                    messages=messages,
+                    delay=delay,
+                    max_retries=max_retries,
+                )
+
+            if not (cursor := response.get("response_metadata", {}).get("next_cursor")):
+                break
+
+        if latest_ts > oldest:
+            conversation.latest_synced_message_ts = latest_ts
+            conversation.save(update_fields=["latest_synced_message_ts"])
+
+    def _fetch_threads(
+        self,
+        client: WebClient,
+        messages: list[Message],
+        delay: float,
+        max_retries: int,
+    ):
+        """Fetch new thread replies for parent messages.
+
+        Threads whose latest reply is already synced are skipped.
+        """
+        if not (parent_messages := [message for message in messages if message.has_replies]):
+            return
+
+        self.stdout.write("Fetching message replies...")
+        latest_reply_ts = Message.get_latest_reply_ts(parent_messages)
+        for message in parent_messages:
+            oldest = latest_reply_ts.get(message.id, "0")
+            if (latest_reply := message.raw_data.get("latest_reply")) and oldest >= latest_reply:
+                continue
+
+            self._fetch_replies(
+                client=client,
+                message=message,
+                delay=delay,
+                max_retries=max_retries,
+                oldest=oldest,
+            )
 
     def _fetch_replies(
         self,
@@ -469,71 +541,49 @@ class Command(BaseCommand):
         message: Message,
         delay: float,
         max_retries: int,
+        *,
+        oldest: str = "0",
     ):
-        """Fetch all thread replies for parent messages."""
+        """Fetch thread replies posted after the latest synced one."""
         replies = []
         try:
             cursor = None
-            has_more = True
-            while has_more:
-                retry_count = 0
-                try:
-                    params = {
-                        "channel": message.conversation.slack_channel_id,
-                        "cursor": cursor,
-                        "inclusive": False,
-                        "limit": 1000,
-                        "oldest": (
-                            latest_reply.ts if (latest_reply := message.latest_reply) else "0"
-                        ),
-                        "ts": message.slack_message_id,
-                    }
-                    response = client.conversations_replies(**params)
-                    self._handle_slack_response(response, "conversations_replies")
-
-                    messages = response.get("messages", [])
-                    if not messages:
-                        break
-
-                    replies += [
-                        reply
-                        for reply_data in messages
-                        if (
-                            reply := self._create_message(
-                                client=client,
-                                conversation=message.conversation,
-                                delay=delay,
-                                max_retries=max_retries,
-                                message_data=reply_data,
-                                parent_message=message,
-                            )
-                        )
-                    ]
+            while True:
+                response = self._call_slack_api(
+                    client,
+                    "conversations_replies",
+                    delay=delay,
+                    max_retries=max_retries,
+                    channel=message.conversation.slack_channel_id,
+                    cursor=cursor,
+                    inclusive=False,
+                    limit=1000,
+                    oldest=oldest,
+                    ts=message.slack_message_id,
+                )
 
-                    cursor = response.get("response_metadata", {}).get("next_cursor")
-                    has_more = bool(cursor)
-                except SlackApiError as e:
-                    if e.response["error"] == "ratelimited":
-                        if retry_count >= max_retries:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f"Max retries ({max_retries}) exceeded for thread"
-                                )
-                            )
-                            break
+                if not (messages := response.get("messages", [])):
+                    break
 
-                        retry_after = int(
-                            e.response.headers.get("Retry-After", delay * (retry_count + 1))
-                        )
-                        retry_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Rate limited. Retrying after {retry_after} seconds"
-                            )
+                replies += [
+                    reply
+                    for reply_data in messages
+                    # The thread parent message is returned along with replies.
+                    if reply_data.get("ts") != message.slack_message_id
+                    and (
+                        reply := self._create_message(
+                            client=client,
+                            conversation=message.conversation,
+                            delay=delay,
+                            max_retries=max_retries,
+                            message_data=reply_data,
+                            parent_message=message,
                         )
-                        time.sleep(retry_after)
-                        continue
-                    raise
+                    )
+                ]
+
+                if not (cursor := response.get("response_metadata", {}).get("next_cursor")):
+                    break
         except SlackApiError as e:
             self.stdout.write(
                 self.style.ERROR(
@@ -543,7 +593,7 @@ class Command(BaseCommand):
             )
 
         if replies_count := len(replies):
-            print(
+            self.stdout.write(
                 f"Saving {replies_count} repl{pluralize(replies_count, 'y,ies')} for {message.url}"
             )
             Message.bulk_save(replies)
@@ -560,58 +610,15 @@ class Command(BaseCommand):
     ) -> Message | None:
         """Create Message instance using from_slack pattern."""
         author = None
-        slack_user_id = message_data.get("user") or message_data.get("bot_id")
-        if slack_user_id:
-            try:
-                author = Member.objects.get(
-                    slack_user_id=slack_user_id,
-                    workspace=conversation.workspace,
-                )
-            except Member.DoesNotExist:
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        # User.
-                        if message_data.get("user"):
-                            user_info = client.users_info(user=slack_user_id)
-                            self._handle_slack_response(user_info, "users_info")
-
-                            author = Member.update_data(
-                                user_info["user"], conversation.workspace, save=True
-                            )
-                            self.stdout.write(
-                                self.style.SUCCESS(f"Created a new member: {slack_user_id}")
-                            )
-                        # Bot.
-                        else:
-                            bot_info = client.bots_info(bot=slack_user_id)
-                            self._handle_slack_response(bot_info, "bots_info")
-                            bot_data = {
-                                "id": slack_user_id,
-                                "is_bot": True,
-                                "name": bot_info["bot"].get("name"),
-                                "real_name": bot_info["bot"].get("name"),
-                            }
-                            author = Member.update_data(
-                                bot_data, conversation.workspace, save=True
-                            )
-                            self.stdout.write(
-                                self.style.SUCCESS(f"Created bot member: {slack_user_id}")
-                            )
-                        break
-                    except SlackApiError as e:
-                        if e.response.get("error") == "ratelimited":
-                            retry_after = int(e.response.headers.get("Retry-After", delay))
-                            retry_count += 1
-                            self.stdout.write(self.style.WARNING("Rate limited on member info"))
-                            time.sleep(retry_after)
-                        else:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f"Failed to fetch member data for {slack_user_id}"
-                                )
-                            )
-                            break
+        if slack_user_id := message_data.get("user") or message_data.get("bot_id"):
+            author = self._get_member(
+                client=client,
+                delay=delay,
+                is_bot=not message_data.get("user"),
+                max_retries=max_retries,
+                slack_user_id=slack_user_id,
+                workspace=conversation.workspace,
+            )
 
         return Message.update_data(
             data=message_data,
@@ -621,6 +628,65 @@ class Command(BaseCommand):
             save=False,
         )
 
+    def _get_member(
+        self,
+        client: WebClient,
+        slack_user_id: str,
+        workspace: Workspace,
+        delay: float,
+        max_retries: int,
+        *,
+        is_bot: bool,
+    ) -> Member | None:
+        """Get a message author, creating it from Slack data if needed."""
+        try:
+            return Member.objects.get(slack_user_id=slack_user_id, workspace=workspace)
+        except Member.DoesNotExist:
+            pass
+
+        try:
+            if is_bot:
+                bot_info = self._call_slack_api(
+                    client,
+                    "bots_info",
+                    delay=delay,
+                    max_retries=max_retries,
+                    bot=slack_user_id,
+                )
+                member_data = {
+                    "id": slack_user_id,
+                    "is_bot": True,
+                    "name": bot_info["bot"].get("name"),
+                    "real_name": bot_info["bot"].get("name"),
+                }
+            else:
+                user_info = self._call_slack_api(
+                    client,
+                    "users_info",
+                    delay=delay,
+                    max_retries=max_retries,
+                    user=slack_user_id,
+                )
+                member_data = user_info["user"]
+        except SlackApiError:
+            self.stdout.write(self.style.ERROR(f"Failed to fetch member data for {slack_user_id}"))
+            return None
+
+        # Workers may run into the same new member concurrently, the lock only guards
+        # the database write so that other workers keep calling the Slack API.
+        with self.members_lock:
+            try:
+                return Member.objects.get(slack_user_id=slack_user_id, workspace=workspace)
+            except Member.DoesNotExist:
+                member = Member.update_data(member_data, workspace, save=True)
+
+        if is_bot:
+            self.stdout.write(self.style.SUCCESS(f"Created bot member: {slack_user_id}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Created a new member: {slack_user_id}"))
+
+        return member
+
     def _handle_slack_response(self, response, api_method):
         """Handle Slack API response and raise exception if needed."""
         if not response["ok"]:
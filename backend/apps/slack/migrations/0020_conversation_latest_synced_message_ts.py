@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack", "0019_conversation_is_nest_bot_assistant_enabled"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversation",
+            name="latest_synced_message_ts",
+            field=models.CharField(
+                blank=True,
+                default="",
+                max_length=50,
+                verbose_name="Latest synced message timestamp",
+            ),
+        ),
+    ]
@@ -41,6 +41,9 @@ class Conversation(TimestampedModel):
     workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE, related_name="channels")
 
     # Additional attributes.
+    latest_synced_message_ts = models.CharField(
+        verbose_name="Latest synced message timestamp", max_length=50, blank=True, default=""
+    )
     sync_messages = models.BooleanField(verbose_name="Sync messages", default=False)
 
     def __str__(self):
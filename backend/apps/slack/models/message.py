@@ -122,6 +122,24 @@ class Message(TimestampedModel):
         """Bulk save messages."""
         BulkSaveModel.bulk_save(Message, messages, fields=fields)
 
+    @staticmethod
+    def get_latest_reply_ts(messages: list["Message"]) -> dict[int, str]:
+        """Get the timestamp of the latest synced reply of each thread.
+
+        Args:
+          messages (list[Message]): The thread parent messages.
+
+        Returns:
+          dict[int, str]: Latest reply timestamp by parent message ID.
+
+        """
+        return dict(
+            Message.objects.filter(parent_message__in=messages)
+            .values("parent_message_id")
+            .annotate(latest_reply_ts=models.Max("slack_message_id"))
+            .values_list("parent_message_id", "latest_reply_ts")
+        )
+
     @staticmethod
     def update_data(
         data: dict,
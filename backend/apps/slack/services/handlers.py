@@ -0,0 +1,190 @@
+"""Slack events and commands background processing.
+
+Slack handlers acknowledge requests right away and enqueue the actual work on the "ai"
+queue so that detection, retrieval and OpenAI calls never run in the web process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import timedelta
+
+import django_rq
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.utils.module_loading import import_string
+from django_rq import job
+
+from apps.slack.apps import SlackConfig
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAME = "ai"
+SLACK_EVENT_CACHE_KEY_PREFIX = "slack:event"
+SLACK_EVENTS_DEBOUNCE_KEY_PREFIX = "slack:events"
+
+
+def get_handler_path(handler) -> str:
+    """Get the import path of a Slack handler class.
+
+    Args:
+        handler: The Slack event or command handler instance.
+
+    Returns:
+        str: The handler class import path.
+
+    """
+    return f"{type(handler).__module__}.{type(handler).__qualname__}"
+
+
+def get_handler(handler_path: str):
+    """Get a Slack handler instance.
+
+    Args:
+        handler_path (str): The handler class import path.
+
+    Returns:
+        The Slack event or command handler instance.
+
+    """
+    return import_string(handler_path)()
+
+
+def is_duplicate_event(body: dict, retry_num: str | None = None) -> bool:
+    """Check whether a Slack event was already received.
+
+    Slack retries events it considers undelivered with the same event ID and
+    an `X-Slack-Retry-Num` header.
+
+    Args:
+        body (dict): The Slack request body.
+        retry_num (str | None): The `X-Slack-Retry-Num` header value.
+
+    Returns:
+        bool: True if the event was already received, False otherwise.
+
+    """
+    if not (event_id := body.get("event_id")):
+        return False
+
+    if django_cache.add(
+        f"{SLACK_EVENT_CACHE_KEY_PREFIX}:{event_id}",
+        retry_num or "0",
+        timeout=settings.SLACK_EVENTS_DEDUPLICATION_TIMEOUT,
+    ):
+        return False
+
+    logger.info("Ignored Slack event %s retry %s", event_id, retry_num)
+    return True
+
+
+def enqueue_command(handler, command: dict) -> None:
+    """Enqueue Slack command processing.
+
+    Args:
+        handler (CommandBase): The Slack command handler.
+        command (dict): The Slack command payload.
+
+    """
+    django_rq.get_queue(QUEUE_NAME).enqueue(
+        process_command,
+        get_handler_path(handler),
+        command,
+    )
+
+
+def enqueue_event(handler, event: dict) -> None:
+    """Enqueue Slack event processing.
+
+    Events of debounced handlers are collected per channel and processed by a single
+    job scheduled once per debounce window.
+
+    Args:
+        handler (EventBase): The Slack event handler.
+        event (dict): The Slack event payload.
+
+    """
+    handler_path = get_handler_path(handler)
+    queue = django_rq.get_queue(QUEUE_NAME)
+
+    if not (handler.is_debounced and (channel_id := event.get("channel"))):
+        queue.enqueue(process_event, handler_path, event)
+        return
+
+    debounce_seconds = settings.SLACK_EVENTS_DEBOUNCE_SECONDS
+    key = f"{SLACK_EVENTS_DEBOUNCE_KEY_PREFIX}:{handler.event_type}:{channel_id}"
+
+    queue.connection.rpush(key, json.dumps(event))
+    if queue.connection.set(f"{key}:scheduled", 1, nx=True, ex=debounce_seconds * 10):
+        queue.enqueue_in(
+            timedelta(seconds=debounce_seconds),
+            process_debounced_events,
+            handler_path,
+            key,
+        )
+
+
+@job(QUEUE_NAME)
+def process_command(handler_path: str, command: dict) -> None:
+    """Process a Slack command in the background.
+
+    Args:
+        handler_path (str): The command handler class import path.
+        command (dict): The Slack command payload.
+
+    """
+    if not SlackConfig.app:
+        logger.warning("Slack app is not configured")
+        return
+
+    get_handler(handler_path).process_command(command, SlackConfig.app.client)
+
+
+@job(QUEUE_NAME)
+def process_event(handler_path: str, event: dict) -> None:
+    """Process a Slack event in the background.
+
+    Args:
+        handler_path (str): The event handler class import path.
+        event (dict): The Slack event payload.
+
+    """
+    if not SlackConfig.app:
+        logger.warning("Slack app is not configured")
+        return
+
+    get_handler(handler_path).process_event(event, SlackConfig.app.client)
+
+
+@job(QUEUE_NAME)
+def process_debounced_events(handler_path: str, key: str) -> None:
+    """Process Slack events collected for a channel during a debounce window.
+
+    Events with the same handler debounce key are collapsed into the latest one.
+
+    Args:
+        handler_path (str): The event handler class import path.
+        key (str): The channel events list key.
+
+    """
+    pipeline = django_rq.get_connection(QUEUE_NAME).pipeline()
+    pipeline.lrange(key, 0, -1)
+    pipeline.delete(key, f"{key}:scheduled")
+    events, _ = pipeline.execute()
+
+    if not SlackConfig.app:
+        logger.warning("Slack app is not configured")
+        return
+
+    handler = get_handler(handler_path)
+    latest_events: dict[str, dict] = {}
+    for index, event_data in enumerate(events):
+        event = json.loads(event_data)
+        debounce_key = handler.get_debounce_key(event) or f"event:{index}"
+        # Re-insert to keep the events in the order their latest versions were posted.
+        latest_events.pop(debounce_key, None)
+        latest_events[debounce_key] = event
+
+    for event in latest_events.values():
+        handler.process_event(event, SlackConfig.app.client)
@@ -127,13 +127,35 @@ class Base(Configuration):
         "INDEX_PREFIX": ENVIRONMENT.lower(),
     }
 
+    AI_EMBEDDING_CACHE_PREFIX = "ai-embedding"
+    AI_EMBEDDING_CACHE_TIME_SECONDS = 2592000  # 30 days.
+    AI_QUERY_EMBEDDING_CACHE_TIME_SECONDS = 86400  # 24 hours.
+    ALGOLIA_DIRTY_RECORDS_CACHE_PREFIX = "algolia-dirty-records"
+    ALGOLIA_RECORD_HASH_CACHE_PREFIX = "algolia-record-hash"
+    API_EXPORT_CHUNK_SIZE = 1000
     API_PAGE_SIZE = 100
+    API_CACHE_COMPRESSION_MIN_SIZE = 1024
     API_CACHE_PREFIX = "api-response"
     API_CACHE_TIME_SECONDS = 86400  # 24 hours.
+    CACHE_EARLY_REFRESH_BETA = 1.0
+    CACHE_LOCK_POLL_INTERVAL_SECONDS = 0.05
+    CACHE_LOCK_PREFIX = "cache-lock"
+    CACHE_LOCK_TIME_SECONDS = 60
+    CACHE_LOCK_WAIT_SECONDS = 5
+    CACHE_STALE_TIME_SECONDS = 3600  # 1 hour.
+    CACHE_TAG_PREFIX = "cache-tag"
+    CACHE_TAG_TIME_SECONDS = 604800  # 7 days.
+    GITHUB_HTTP_CACHE_PREFIX = "github-http"
+    GITHUB_HTTP_CACHE_TIME_SECONDS = 604800  # 7 days.
+    GITHUB_NON_INDEXABLE_LOGINS_CACHE_KEY = "github-non-indexable-logins"
+    GITHUB_NON_INDEXABLE_LOGINS_CACHE_TIME_SECONDS = 86400  # 24 hours.
+    GITHUB_NON_INDEXABLE_LOGINS_VERSION_CACHE_KEY = "github-non-indexable-logins-version"
     GRAPHQL_RESOLVER_CACHE_PREFIX = "graphql-resolver"
     GRAPHQL_RESOLVER_CACHE_TIME_SECONDS = 86400  # 24 hours.
     NINJA_PAGINATION_CLASS = "apps.api.rest.v0.pagination.CustomPagination"
     NINJA_PAGINATION_PER_PAGE = API_PAGE_SIZE
+    SITEMAP_CACHE_PREFIX = "sitemap"
+    SITEMAP_CACHE_TIME_SECONDS = 172800  # 48 hours.
 
     REDIS_HOST = values.SecretValue(environ_name="REDIS_HOST")
     REDIS_PASSWORD = values.SecretValue(environ_name="REDIS_PASSWORD")
@@ -145,7 +167,25 @@ class Base(Configuration):
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
             },
             "TIMEOUT": 300,
-        }
+        },
+        # Embeddings are expensive to recompute and must survive default cache clearing.
+        "embeddings": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/2",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+            "TIMEOUT": AI_EMBEDDING_CACHE_TIME_SECONDS,
+        },
+        # Changed records pending indexing must survive default cache clearing.
+        "indexing": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/3",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+            "TIMEOUT": None,
+        },
     }
 
     RQ_QUEUES = {
@@ -222,5 +262,8 @@ class Base(Configuration):
 
     SLACK_BOT_TOKEN = values.SecretValue()
     SLACK_COMMANDS_ENABLED = True
+    SLACK_EVENTS_DEBOUNCE_SECONDS = 5
+    SLACK_EVENTS_DEDUPLICATION_TIMEOUT = 3600
     SLACK_EVENTS_ENABLED = True
+    SLACK_QUEUE_ENABLED = True
     SLACK_SIGNING_SECRET = values.SecretValue()
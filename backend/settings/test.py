@@ -11,6 +11,16 @@ class Test(Base):
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "test-cache",
         },
+        "embeddings": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-embeddings-cache",
+        },
+        "indexing": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-indexing-cache",
+        },
     }
 
     IS_TEST_ENVIRONMENT = True
+
+    SLACK_QUEUE_ENABLED = False
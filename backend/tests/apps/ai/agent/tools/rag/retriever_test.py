@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import openai
 import pytest
+from django.core.cache import caches
 
 from apps.ai.agent.tools.rag.retriever import Retriever
 
@@ -12,6 +13,27 @@ from apps.ai.agent.tools.rag.retriever import Retriever
 class TestRetriever:
     """Test cases for the Retriever class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        caches["embeddings"].clear()
+        yield
+        caches["embeddings"].clear()
+
+    @pytest.fixture(autouse=True)
+    def mock_connection(self):
+        with (
+            patch("apps.ai.agent.tools.rag.retriever.connection") as mock_connection,
+            patch("apps.ai.agent.tools.rag.retriever.transaction"),
+        ):
+            yield mock_connection
+
+    @pytest.fixture(autouse=True)
+    def mock_prefetch_related_objects(self):
+        with patch(
+            "apps.ai.agent.tools.rag.retriever.prefetch_related_objects"
+        ) as mock_prefetch_related_objects:
+            yield mock_prefetch_related_objects
+
     def test_init_success(self):
         """Test successful initialization with API key."""
         with (
@@ -67,6 +89,24 @@ class TestRetriever:
                 input=["test query"], model="text-embedding-3-small"
             )
 
+    def test_get_query_embedding_cached(self):
+        """Test repeated query embedding is served from the cache."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI") as mock_openai,
+        ):
+            mock_client = MagicMock()
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
+            mock_client.embeddings.create.return_value = mock_response
+            mock_openai.return_value = mock_client
+
+            retriever = Retriever()
+
+            assert retriever.get_query_embedding("test query") == [0.1, 0.2, 0.3]
+            assert retriever.get_query_embedding("test query") == [0.1, 0.2, 0.3]
+            mock_client.embeddings.create.assert_called_once()
+
     def test_get_query_embedding_openai_error(self):
         """Test query embedding with OpenAI API error."""
         with (
@@ -459,14 +499,12 @@ class TestRetriever:
 
             mock_annotated = MagicMock()
             mock_filtered = MagicMock()
-            mock_final = MagicMock()
 
             mock_chunk.objects.annotate.return_value = mock_annotated
             mock_annotated.filter.return_value = mock_filtered
-            mock_filtered.filter.return_value = mock_final
-            mock_final.select_related.return_value = mock_final
-            mock_final.order_by.return_value = mock_final
-            mock_final.__getitem__ = MagicMock(return_value=[])
+            mock_filtered.select_related.return_value = mock_filtered
+            mock_filtered.order_by.return_value = mock_filtered
+            mock_filtered.__getitem__ = MagicMock(return_value=[])
 
             retriever = Retriever()
             result = retriever.retrieve("test query", content_types=["owasp.chapter"])
@@ -474,7 +512,7 @@ class TestRetriever:
             assert result == []
             mock_chunk.objects.annotate.assert_called_once()
             mock_annotated.filter.assert_called_once()
-            mock_filtered.filter.assert_called_once()
+            mock_filtered.order_by.assert_called_once_with("distance")
 
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
     def test_retrieve_successful_with_chunks(self, mock_chunk):
@@ -505,17 +543,15 @@ class TestRetriever:
             mock_chunk_instance = MagicMock()
             mock_chunk_instance.id = 1
             mock_chunk_instance.text = "Test chunk text"
-            mock_chunk_instance.similarity = 0.85
+            mock_chunk_instance.distance = 0.15
             mock_chunk_instance.context = mock_context
 
             mock_annotated = MagicMock()
-            mock_filtered = MagicMock()
 
             mock_chunk.objects.annotate.return_value = mock_annotated
-            mock_annotated.filter.return_value = mock_filtered
-            mock_filtered.select_related.return_value = mock_filtered
-            mock_filtered.order_by.return_value = mock_filtered
-            mock_filtered.__getitem__ = MagicMock(return_value=[mock_chunk_instance])
+            mock_annotated.select_related.return_value = mock_annotated
+            mock_annotated.order_by.return_value = mock_annotated
+            mock_annotated.__getitem__ = MagicMock(return_value=[mock_chunk_instance])
 
             retriever = Retriever()
             result = retriever.retrieve("test query")
@@ -525,8 +561,102 @@ class TestRetriever:
             assert result[0]["source_type"] == "chapter"
             assert result[0]["source_name"] == "Test Chapter"
             assert result[0]["source_id"] == "123"
+            assert result[0]["similarity"] == pytest.approx(0.85)
             assert "additional_context" in result[0]
 
+    @patch("apps.ai.agent.tools.rag.retriever.Chunk")
+    def test_retrieve_applies_similarity_threshold(
+        self, mock_chunk, mock_connection, mock_prefetch_related_objects
+    ):
+        """Test that nearest chunks are fetched by distance and the threshold applied after."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI") as mock_openai,
+        ):
+            mock_client = MagicMock()
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
+            mock_client.embeddings.create.return_value = mock_response
+            mock_openai.return_value = mock_client
+
+            near_chunk = MagicMock(distance=0.2, text="Near chunk")
+            far_chunk = MagicMock(distance=0.9, text="Far chunk")
+
+            mock_annotated = MagicMock()
+            mock_chunk.objects.annotate.return_value = mock_annotated
+            mock_annotated.select_related.return_value = mock_annotated
+            mock_annotated.order_by.return_value = mock_annotated
+            mock_annotated.__getitem__ = MagicMock(return_value=[far_chunk, near_chunk])
+
+            retriever = Retriever()
+            result = retriever.retrieve(
+                "test query", limit=5, similarity_threshold=0.5, ef_search=20
+            )
+
+            assert [chunk["text"] for chunk in result] == ["Near chunk"]
+            mock_prefetch_related_objects.assert_called_once()
+            assert mock_prefetch_related_objects.call_args.args[0] == [near_chunk]
+            mock_annotated.filter.assert_not_called()
+            mock_annotated.order_by.assert_called_once_with("distance")
+            mock_annotated.__getitem__.assert_called_once_with(slice(None, 5))
+            cursor = mock_connection.cursor.return_value.__enter__.return_value
+            cursor.execute.assert_called_once_with(
+                "SELECT set_config('hnsw.ef_search', %s, true)", ["20"]
+            )
+
+    def test_prefetch_entities(self, mock_prefetch_related_objects):
+        """Test that chunk entities are prefetched with a query per content type."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            chunks = [MagicMock(), MagicMock()]
+
+            Retriever().prefetch_entities(chunks)
+
+            mock_prefetch_related_objects.assert_called_once()
+            args = mock_prefetch_related_objects.call_args.args
+            assert args[0] == chunks
+            assert args[1].prefetch_through == "context__entity"
+            assert {queryset.model.__name__ for queryset in args[1].querysets} == {
+                "Message",
+                "Project",
+            }
+
+    def test_get_additional_context_project_latest_health_score(self):
+        """Test that the prefetched project health score is used."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            content_object = MagicMock()
+            content_object.__class__.__name__ = "Project"
+            content_object.latest_health_score = 72.0
+
+            result = Retriever().get_additional_context(content_object)
+
+            assert result["health_score"] == pytest.approx(72.0)
+
+    def test_search_chunks_filtered(self, mock_connection):
+        """Test that filtered searches use iterative index scans and enough candidates."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            chunks = [MagicMock(distance=0.3), MagicMock(distance=0.1)]
+            queryset = MagicMock()
+            queryset.__getitem__ = MagicMock(return_value=chunks)
+
+            result = Retriever().search_chunks(queryset, 64, ef_search=40, is_filtered=True)
+
+            assert result == [chunks[1], chunks[0]]
+            cursor = mock_connection.cursor.return_value.__enter__.return_value
+            assert cursor.execute.call_args_list[0].args == (
+                "SELECT set_config('hnsw.ef_search', %s, true)",
+                ["64"],
+            )
+            assert "hnsw.iterative_scan" in cursor.execute.call_args_list[1].args[0]
+
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
     def test_retrieve_with_content_types_filter(self, mock_chunk):
         """Test retrieve method with content types filter."""
@@ -542,14 +672,12 @@ class TestRetriever:
 
             mock_annotated = MagicMock()
             mock_filtered = MagicMock()
-            mock_final = MagicMock()
 
             mock_chunk.objects.annotate.return_value = mock_annotated
             mock_annotated.filter.return_value = mock_filtered
-            mock_filtered.filter.return_value = mock_final
-            mock_final.select_related.return_value = mock_final
-            mock_final.order_by.return_value = mock_final
-            mock_final.__getitem__ = MagicMock(return_value=[])
+            mock_filtered.select_related.return_value = mock_filtered
+            mock_filtered.order_by.return_value = mock_filtered
+            mock_filtered.__getitem__ = MagicMock(return_value=[])
 
             retriever = Retriever()
             result = retriever.retrieve("test query", content_types=["chapter"])
@@ -557,7 +685,7 @@ class TestRetriever:
             assert result == []
             mock_chunk.objects.annotate.assert_called_once()
             mock_annotated.filter.assert_called_once()
-            mock_filtered.filter.assert_called_once()
+            mock_filtered.order_by.assert_called_once_with("distance")
 
     @patch("apps.ai.agent.tools.rag.retriever.logger")
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
@@ -575,16 +703,15 @@ class TestRetriever:
 
             mock_chunk_instance = MagicMock()
             mock_chunk_instance.id = 1
+            mock_chunk_instance.distance = 0.15
             mock_chunk_instance.context = None
 
             mock_annotated = MagicMock()
-            mock_filtered = MagicMock()
 
             mock_chunk.objects.annotate.return_value = mock_annotated
-            mock_annotated.filter.return_value = mock_filtered
-            mock_filtered.select_related.return_value = mock_filtered
-            mock_filtered.order_by.return_value = mock_filtered
-            mock_filtered.__getitem__ = MagicMock(return_value=[mock_chunk_instance])
+            mock_annotated.select_related.return_value = mock_annotated
+            mock_annotated.order_by.return_value = mock_annotated
+            mock_annotated.__getitem__ = MagicMock(return_value=[mock_chunk_instance])
 
             retriever = Retriever()
             result = retriever.retrieve("test query")
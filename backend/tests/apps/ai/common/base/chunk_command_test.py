@@ -3,12 +3,12 @@
 from typing import Any
 from unittest.mock import Mock, call, patch
 
+import openai
 import pytest
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
 
 from apps.ai.common.base.chunk_command import BaseChunkCommand
-from apps.ai.models.chunk import Chunk
 from apps.ai.models.context import Context
 
 
@@ -54,9 +54,9 @@ def mock_context():
     context.id = 1
     context.content_type_id = 1
     context.object_id = 1
-    context.chunks.aggregate.return_value = {"latest_created": None}
-    context.chunks.all.return_value.delete.return_value = (0, {})
-    context.nest_updated_at = Mock()
+    context.chunks.values_list.return_value = []
+    context.chunks.filter.return_value.delete.return_value = (0, {})
+    context.has_up_to_date_chunks = False
     return context
 
 
@@ -68,19 +68,6 @@ def mock_content_type():
     return content_type
 
 
-@pytest.fixture
-def mock_chunks():
-    """Return a list of mock chunk instances."""
-    chunks = []
-    for i in range(3):
-        chunk = Mock(spec=Chunk)
-        chunk.id = i + 1
-        chunk.text = f"Chunk text {i + 1}"
-        chunk.context_id = 1
-        chunks.append(chunk)
-    return chunks
-
-
 class TestBaseChunkCommand:
     """Test suite for the BaseChunkCommand class."""
 
@@ -140,6 +127,9 @@ class TestBaseChunkCommand:
         """Test process_chunks_batch when extracted content is empty."""
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.content_hash = "empty-hash"
+        mock_context.chunks.values_list.return_value = [("old chunk", 1)]
+        mock_context.chunks.filter.return_value.delete.return_value = (1, {})
 
         with (
             patch.object(command, "extract_content", return_value=("", "")),
@@ -147,7 +137,10 @@ class TestBaseChunkCommand:
         ):
             result = command.process_chunks_batch([mock_entity])
 
-            assert result == 0
+            assert result == 1
+            mock_context.chunks.filter.assert_called_once_with(id__in=[1])
+            assert mock_context.chunks_content_hash == "empty-hash"
+            mock_context.save.assert_called_once_with(update_fields=["chunks_content_hash"])
             # Check that it wrote the initial message and the empty content message
             expected_calls = [
                 call("Context for test-key-123 requires chunk creation/update"),
@@ -171,30 +164,35 @@ class TestBaseChunkCommand:
         """Test process_chunks_batch when no chunks are created from text."""
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.content_hash = "hash"
         mock_split_text.return_value = []
 
-        with patch.object(command.stdout, "write") as mock_write:
+        with (
+            patch("apps.ai.common.base.chunk_command.create_embeddings") as mock_create_embeddings,
+            patch.object(command.stdout, "write") as mock_write,
+        ):
             result = command.process_chunks_batch([mock_entity])
 
-            assert result == 0
+            assert result == 1
             # Check that both messages were written
             expected_calls = [
                 call("Context for test-key-123 requires chunk creation/update"),
                 call("No chunks created for test_entity test-key-123"),
             ]
             mock_write.assert_has_calls(expected_calls)
-            call_args = mock_write.call_args[0][0]
-            assert "No chunks created for test_entity test-key-123" in call_args
+            mock_create_embeddings.assert_not_called()
+            assert mock_context.chunks_content_hash == "hash"
+            mock_context.save.assert_called_once_with(update_fields=["chunks_content_hash"])
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_success(
         self,
         mock_bulk_save,
-        mock_create_chunks,
+        mock_create_embeddings,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -202,31 +200,29 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
-        mock_chunks,
     ):
         """Test successful chunk processing."""
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
         mock_split_text.return_value = ["chunk1", "chunk2", "chunk3"]
-        mock_create_chunks.return_value = mock_chunks
+        mock_create_embeddings.return_value = [[0.1], [0.2], [0.3]]
         command.openai_client = Mock()
 
-        with (
-            patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter,
-            patch.object(command.stdout, "write") as mock_write,
-        ):
-            mock_qs = Mock()
-            mock_qs.values_list.return_value = []
-            mock_chunk_filter.return_value = mock_qs
+        with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
 
             assert result == 1
-            _, kwargs = mock_create_chunks.call_args
-            assert set(kwargs["chunk_texts"]) == {"chunk1", "chunk2", "chunk3"}
-            assert kwargs["context"] == mock_context
-            assert kwargs["openai_client"] == command.openai_client
-            assert kwargs["save"] is False
-            mock_bulk_save.assert_called_once_with(mock_chunks)
+            mock_create_embeddings.assert_called_once_with(
+                ["chunk1", "chunk2", "chunk3"], command.openai_client
+            )
+            mock_bulk_save.assert_called_once()
+            chunks = mock_bulk_save.call_args[0][0]
+            assert [(chunk.text, chunk.embedding) for chunk in chunks] == [
+                ("chunk1", [0.1]),
+                ("chunk2", [0.2]),
+                ("chunk3", [0.3]),
+            ]
+            assert all(chunk.context_id == mock_context.id for chunk in chunks)
             mock_write.assert_has_calls(
                 [
                     call("Context for test-key-123 requires chunk creation/update"),
@@ -237,19 +233,18 @@ class TestBaseChunkCommand:
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_multiple_entities(
         self,
         mock_bulk_save,
-        mock_create_chunks,
+        mock_create_embeddings,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
         command,
         mock_context,
         mock_content_type,
-        mock_chunks,
     ):
         """Test processing multiple entities in a batch."""
         entities = []
@@ -263,20 +258,16 @@ class TestBaseChunkCommand:
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
         mock_split_text.return_value = ["chunk1", "chunk2"]
-        mock_create_chunks.return_value = mock_chunks[:2]
+        mock_create_embeddings.return_value = [[0.1], [0.2]] * 3
         command.openai_client = Mock()
 
-        with (
-            patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter,
-            patch.object(command.stdout, "write"),
-        ):
-            mock_qs = Mock()
-            mock_qs.values_list.return_value = []
-            mock_chunk_filter.return_value = mock_qs
+        with patch.object(command.stdout, "write"):
             result = command.process_chunks_batch(entities)
 
             assert result == 3
-            assert mock_create_chunks.call_count == 3
+            mock_create_embeddings.assert_called_once_with(
+                ["chunk1", "chunk2"] * 3, command.openai_client
+            )
             mock_bulk_save.assert_called_once()
             bulk_save_args = mock_bulk_save.call_args[0][0]
             assert len(bulk_save_args) == 6
@@ -284,10 +275,10 @@ class TestBaseChunkCommand:
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
     def test_process_chunks_batch_create_chunks_fails(
         self,
-        mock_create_chunks,
+        mock_create_embeddings,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -296,17 +287,20 @@ class TestBaseChunkCommand:
         mock_context,
         mock_content_type,
     ):
-        """Test process_chunks_batch when create_chunks_and_embeddings fails."""
+        """Test process_chunks_batch when create_embeddings fails."""
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
         mock_split_text.return_value = ["chunk1", "chunk2"]
-        mock_create_chunks.return_value = None
+        mock_create_embeddings.side_effect = openai.OpenAIError("API connection failed")
         command.openai_client = Mock()
 
-        result = command.process_chunks_batch([mock_entity])
+        with patch("apps.ai.models.chunk.Chunk.bulk_save") as mock_bulk_save:
+            result = command.process_chunks_batch([mock_entity])
 
         assert result == 0
-        mock_create_chunks.assert_called_once()
+        mock_create_embeddings.assert_called_once()
+        mock_bulk_save.assert_not_called()
+        mock_context.save.assert_not_called()
 
     def test_process_chunks_batch_content_combination(
         self, command, mock_entity, mock_context, mock_content_type
@@ -320,15 +314,13 @@ class TestBaseChunkCommand:
                 "apps.ai.common.base.chunk_command.Context.objects.filter"
             ) as mock_context_filter,
             patch("apps.ai.models.chunk.Chunk.split_text") as mock_split_text,
-            patch(
-                "apps.ai.common.base.chunk_command.create_chunks_and_embeddings"
-            ) as mock_create_chunks,
+            patch("apps.ai.common.base.chunk_command.create_embeddings") as mock_create_embeddings,
             patch("apps.ai.models.chunk.Chunk.bulk_save"),
         ):
             mock_get_content_type.return_value = mock_content_type
             mock_context_filter.return_value.first.return_value = mock_context
             mock_split_text.return_value = ["chunk1"]
-            mock_create_chunks.return_value = [Mock()]
+            mock_create_embeddings.return_value = [[0.1]]
             command.openai_client = Mock()
 
             with patch.object(
@@ -336,22 +328,14 @@ class TestBaseChunkCommand:
                 "extract_content",
                 return_value=("prose", "metadata"),
             ):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
+                command.process_chunks_batch([mock_entity])
 
                 expected_content = "metadata\n\nprose"
                 mock_split_text.assert_called_once_with(expected_content)
 
             mock_split_text.reset_mock()
             with patch.object(command, "extract_content", return_value=("prose", "")):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
+                command.process_chunks_batch([mock_entity])
 
                 mock_split_text.assert_called_with("prose")
 
@@ -405,15 +389,13 @@ class TestBaseChunkCommand:
                 "apps.ai.common.base.chunk_command.Context.objects.filter"
             ) as mock_context_filter,
             patch("apps.ai.models.chunk.Chunk.split_text") as mock_split_text,
-            patch(
-                "apps.ai.common.base.chunk_command.create_chunks_and_embeddings"
-            ) as mock_create_chunks,
+            patch("apps.ai.common.base.chunk_command.create_embeddings") as mock_create_embeddings,
             patch("apps.ai.models.chunk.Chunk.bulk_save") as mock_bulk_save,
         ):
             mock_get_content_type.return_value = mock_content_type
             mock_context_filter.return_value.first.return_value = mock_context
             mock_split_text.return_value = ["chunk1"]
-            mock_create_chunks.return_value = [Mock()]
+            mock_create_embeddings.return_value = [[0.1]]
             command.openai_client = Mock()
 
             with patch.object(
@@ -421,11 +403,7 @@ class TestBaseChunkCommand:
                 "extract_content",
                 return_value=("", "metadata"),
             ):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
+                command.process_chunks_batch([mock_entity])
 
                 mock_split_text.assert_called_once_with("metadata\n\n")
                 mock_bulk_save.assert_called_once()
@@ -433,12 +411,12 @@ class TestBaseChunkCommand:
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_with_duplicates(
         self,
         mock_bulk_save,
-        mock_create_chunks,
+        mock_create_embeddings,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -446,13 +424,12 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
-        mock_chunks,
     ):
         """Test that duplicate chunk texts are filtered out before processing."""
         mock_get_content_type.return_value = mock_content_type
         mock_context_filter.return_value.first.return_value = mock_context
         mock_split_text.return_value = ["chunk1", "chunk2", "chunk1", "chunk3", "chunk2"]
-        mock_create_chunks.return_value = mock_chunks
+        mock_create_embeddings.return_value = [[0.1], [0.2], [0.3]]
         command.openai_client = Mock()
 
         with patch.object(command.stdout, "write"):
@@ -460,12 +437,11 @@ class TestBaseChunkCommand:
 
             assert result == 1
             mock_split_text.assert_called_once()
-            _, kwargs = mock_create_chunks.call_args
-            assert set(kwargs["chunk_texts"]) == {"chunk1", "chunk2", "chunk3"}
-            assert kwargs["context"] == mock_context
-            assert kwargs["openai_client"] == command.openai_client
-            assert kwargs["save"] is False
-            mock_bulk_save.assert_called_once_with(mock_chunks)
+            mock_create_embeddings.assert_called_once_with(
+                ["chunk1", "chunk2", "chunk3"], command.openai_client
+            )
+            mock_bulk_save.assert_called_once()
+            assert len(mock_bulk_save.call_args[0][0]) == 3
 
     def test_process_chunks_batch_whitespace_only_content(
         self, command, mock_entity, mock_context, mock_content_type
@@ -488,9 +464,110 @@ class TestBaseChunkCommand:
             ):
                 result = command.process_chunks_batch([mock_entity])
 
-                assert result == 0
+                assert result == 1
+                mock_context.save.assert_called_once_with(update_fields=["chunks_content_hash"])
                 expected_calls = [
                     call("Context for test-key-123 requires chunk creation/update"),
                     call("No content to chunk for test_entity test-key-123"),
                 ]
                 mock_write.assert_has_calls(expected_calls)
+
+    def test_process_chunks_batch_up_to_date_chunks(
+        self, command, mock_entity, mock_context, mock_content_type
+    ):
+        """Test process_chunks_batch skips contexts with unchanged content."""
+        mock_context.has_up_to_date_chunks = True
+
+        with (
+            patch(
+                "apps.ai.common.base.chunk_command.ContentType.objects.get_for_model",
+                return_value=mock_content_type,
+            ),
+            patch(
+                "apps.ai.common.base.chunk_command.Context.objects.filter"
+            ) as mock_context_filter,
+            patch("apps.ai.common.base.chunk_command.create_embeddings") as mock_create_embeddings,
+            patch.object(command, "extract_content") as mock_extract_content,
+            patch.object(command.stdout, "write") as mock_write,
+        ):
+            mock_context_filter.return_value.first.return_value = mock_context
+
+            result = command.process_chunks_batch([mock_entity])
+
+            assert result == 0
+            mock_extract_content.assert_not_called()
+            mock_create_embeddings.assert_not_called()
+            mock_context.save.assert_not_called()
+            mock_write.assert_called_with("Chunks for test-key-123 are already up to date.")
+
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.models.chunk.Chunk.split_text")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
+    def test_process_chunks_batch_incremental_update(
+        self,
+        mock_bulk_save,
+        mock_create_embeddings,
+        mock_split_text,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_entity,
+        mock_context,
+        mock_content_type,
+    ):
+        """Test that only new chunk texts are embedded and vanished ones are deleted."""
+        mock_get_content_type.return_value = mock_content_type
+        mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.content_hash = "new-hash"
+        mock_context.chunks.values_list.return_value = [("chunk1", 1), ("stale", 2)]
+        mock_context.chunks.filter.return_value.delete.return_value = (1, {})
+        mock_split_text.return_value = ["chunk1", "chunk2"]
+        mock_create_embeddings.return_value = [[0.2]]
+        command.openai_client = Mock()
+
+        with patch.object(command.stdout, "write") as mock_write:
+            result = command.process_chunks_batch([mock_entity])
+
+            assert result == 1
+            mock_context.chunks.filter.assert_called_once_with(id__in=[2])
+            mock_create_embeddings.assert_called_once_with(["chunk2"], command.openai_client)
+            mock_bulk_save.assert_called_once()
+            assert [chunk.text for chunk in mock_bulk_save.call_args[0][0]] == ["chunk2"]
+            assert mock_context.chunks_content_hash == "new-hash"
+            mock_context.save.assert_called_once_with(update_fields=["chunks_content_hash"])
+            mock_write.assert_any_call("Deleted 1 stale chunks for test-key-123")
+
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.models.chunk.Chunk.split_text")
+    @patch("apps.ai.common.base.chunk_command.create_embeddings")
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
+    def test_process_chunks_batch_no_new_chunks(
+        self,
+        mock_bulk_save,
+        mock_create_embeddings,
+        mock_split_text,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_entity,
+        mock_context,
+        mock_content_type,
+    ):
+        """Test that no embeddings are requested when all chunk texts already exist."""
+        mock_get_content_type.return_value = mock_content_type
+        mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.chunks.values_list.return_value = [("chunk1", 1), ("chunk2", 2)]
+        mock_split_text.return_value = ["chunk1", "chunk2"]
+
+        with patch.object(command.stdout, "write") as mock_write:
+            result = command.process_chunks_batch([mock_entity])
+
+            assert result == 1
+            mock_create_embeddings.assert_not_called()
+            mock_bulk_save.assert_not_called()
+            mock_context.chunks.filter.assert_not_called()
+            mock_context.save.assert_called_once_with(update_fields=["chunks_content_hash"])
+            mock_write.assert_any_call("No new chunks for test-key-123")
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+from django.test import override_settings
+
+from apps.ai.common import embedding_cache
+from apps.ai.common.embedding_cache import EmbeddingCacheStats
+
+MODEL = "text-embedding-3-small"
+
+
+class TestEmbeddingCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        caches["embeddings"].clear()
+        yield
+        caches["embeddings"].clear()
+
+    @pytest.fixture(autouse=True)
+    def stats(self):
+        stats = EmbeddingCacheStats()
+        with patch("apps.ai.common.embedding_cache.stats", stats):
+            yield stats
+
+    def test_get_cache_key(self):
+        key = embedding_cache.get_cache_key("text", MODEL)
+
+        assert key.startswith(f"ai-embedding-{MODEL}-")
+        assert key == embedding_cache.get_cache_key("text", MODEL)
+        assert key != embedding_cache.get_cache_key("text", "text-embedding-3-large")
+        assert key != embedding_cache.get_cache_key("other text", MODEL)
+
+    def test_get_and_set_embeddings(self, stats):
+        embedding_cache.set_embeddings({"a": [0.1], "b": [0.2]}, MODEL)
+
+        assert embedding_cache.get_embeddings(["a", "b", "c"], MODEL) == {
+            "a": [0.1],
+            "b": [0.2],
+        }
+        assert embedding_cache.get_embeddings(["a"], "text-embedding-3-large") == {}
+        assert stats.counter == {"hits": 2, "misses": 2}
+        assert stats.hit_rate == 0.5
+        assert str(stats) == "2 hits, 2 misses (50.0% hit rate)"
+
+    def test_set_embeddings_timeout(self):
+        with (
+            override_settings(AI_EMBEDDING_CACHE_TIME_SECONDS=100),
+            patch("apps.ai.common.embedding_cache.cache") as mock_cache,
+        ):
+            embedding_cache.set_embeddings({"a": [0.1]}, MODEL)
+            embedding_cache.set_embeddings({"a": [0.1]}, MODEL, timeout=10)
+
+        assert [c.kwargs["timeout"] for c in mock_cache.set_many.call_args_list] == [100, 10]
+
+    def test_stats_reset(self, stats):
+        stats.increment("hits", 3)
+        stats.reset()
+
+        assert stats.hit_rate == 0.0
+        assert str(stats) == "0 hits, 0 misses (0.0% hit rate)"
@@ -591,3 +591,33 @@ class TestRepositoryMarkdownContentExtractor:
         mock_logger.debug.assert_called_once()
         debug_call_args = mock_logger.debug.call_args[0][0]
         assert "Failed to fetch markdown file" in debug_call_args
+
+    @patch("apps.ai.common.extractors.repository.rate_limiter")
+    @patch("apps.ai.common.extractors.repository.get_repository_file_content")
+    def test_extract_repository_markdown_content_tab_files(self, mock_get_content, mock_limiter):
+        """Test that tab files from the contents listing are fetched."""
+        organization = MagicMock()
+        organization.login = "test-org"
+
+        repository = create_mock_repository(
+            name="test-repo",
+            key="test-repo",
+            description="Test repository",
+            default_branch="main",
+            organization=organization,
+        )
+
+        def side_effect(url):
+            if "/contents/" in url:
+                return json.dumps([{"name": "tab_about.md"}, {"name": "index.md"}])
+            if url.endswith("tab_about.md"):
+                return "# About"
+            return ""
+
+        mock_get_content.side_effect = side_effect
+
+        json_content, _ = extract_repository_content(repository)
+
+        data = json.loads(json_content)
+        assert data["markdown_content"] == {"tab_about.md": "# About"}
+        assert mock_limiter.acquire.call_count == mock_get_content.call_count == 6
@@ -1,10 +1,14 @@
-from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, call, patch
 
+import httpx
 import openai
+import pytest
+from django.core.cache import caches
 
 from apps.ai.common.utils import (
     create_chunks_and_embeddings,
+    create_embeddings,
+    get_embedding_batches,
     regenerate_chunks_for_context,
 )
 
@@ -14,19 +18,18 @@ class MockEmbeddingData:
         self.embedding = embedding
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches["embeddings"].clear()
+    yield
+    caches["embeddings"].clear()
+
+
 class TestUtils:
     @patch("apps.ai.common.utils.Chunk.update_data")
     @patch("apps.ai.common.utils.time.sleep")
-    @patch("apps.ai.common.utils.datetime")
-    def test_create_chunks_and_embeddings_success(
-        self, mock_datetime, mock_sleep, mock_update_data
-    ):
+    def test_create_chunks_and_embeddings_success(self, mock_sleep, mock_update_data):
         """Tests the successful path where the OpenAI API returns embeddings."""
-        base_time = datetime.now(UTC)
-        mock_datetime.now.return_value = base_time
-        mock_datetime.UTC = UTC
-        mock_datetime.timedelta = timedelta
-
         mock_openai_client = MagicMock()
         mock_api_response = MagicMock()
         mock_api_response.data = [
@@ -115,132 +118,128 @@ class TestUtils:
         assert result == []
 
     @patch("apps.ai.common.utils.Chunk.update_data")
-    @patch("apps.ai.common.utils.time.sleep")
-    @patch("apps.ai.common.utils.datetime")
-    def test_create_chunks_and_embeddings_sleep_called(
-        self, mock_datetime, mock_sleep, mock_update_data
-    ):
-        """Tests that sleep is called when needed."""
-        base_time = datetime.now(UTC)
-        mock_datetime.now.return_value = base_time
-        mock_datetime.UTC = UTC
-        mock_datetime.timedelta = timedelta
-
+    def test_create_chunks_and_embeddings_filter_none_chunks(self, mock_update_data):
+        """Tests that None chunks are filtered out from results."""
         mock_openai_client = MagicMock()
         mock_api_response = MagicMock()
-        mock_api_response.data = [MockEmbeddingData([0.1, 0.2])]
+        mock_api_response.data = [
+            MockEmbeddingData([0.1, 0.2]),
+            MockEmbeddingData([0.3, 0.4]),
+        ]
         mock_openai_client.embeddings.create.return_value = mock_api_response
 
         mock_chunk_instance = MagicMock()
-        mock_update_data.return_value = mock_chunk_instance
+        mock_update_data.side_effect = [mock_chunk_instance, None]
 
-        mock_content_object = MagicMock()
+        mock_context_obj = MagicMock()
 
         result = create_chunks_and_embeddings(
-            ["test chunk"],
-            mock_content_object,
+            ["first chunk", "second chunk"],
+            mock_context_obj,
             mock_openai_client,
         )
 
-        mock_sleep.assert_not_called()
-        assert result == [mock_chunk_instance]
+        assert len(result) == 1
+        assert result[0] == mock_chunk_instance
 
-    @patch("apps.ai.common.utils.Chunk.update_data")
-    @patch("apps.ai.common.utils.time.sleep")
-    @patch("apps.ai.common.utils.datetime")
-    def test_create_chunks_and_embeddings_no_sleep_with_current_settings(
-        self, mock_datetime, mock_sleep, mock_update_data
-    ):
-        """Tests that sleep is not called with current offset settings."""
-        base_time = datetime.now(UTC)
-        mock_datetime.now.return_value = base_time
-        mock_datetime.UTC = UTC
-        mock_datetime.timedelta = timedelta
 
-        mock_openai_client = MagicMock()
-        mock_api_response = MagicMock()
-        mock_api_response.data = [MockEmbeddingData([0.1, 0.2])]
-        mock_openai_client.embeddings.create.return_value = mock_api_response
+class TestCreateEmbeddings:
+    """Test cases for create_embeddings and get_embedding_batches functions."""
 
-        mock_chunk_instance = MagicMock()
-        mock_update_data.return_value = mock_chunk_instance
-        mock_context_obj = MagicMock()
+    def test_get_embedding_batches_max_inputs(self):
+        """Tests that batches don't exceed the maximum number of inputs."""
+        with patch("apps.ai.common.utils.EMBEDDING_MAX_INPUTS_PER_REQUEST", 2):
+            batches = list(get_embedding_batches(["a", "b", "c", "d", "e"]))
 
-        result = create_chunks_and_embeddings(
-            ["test chunk"],
-            mock_context_obj,
-            mock_openai_client,
-        )
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
 
-        mock_sleep.assert_not_called()
-        mock_update_data.assert_called_once_with(
-            text="test chunk", embedding=[0.1, 0.2], context=mock_context_obj, save=True
-        )
-        assert result == [mock_chunk_instance]
+    def test_get_embedding_batches_max_tokens(self):
+        """Tests that batches don't exceed the maximum number of tokens."""
+        with patch("apps.ai.common.utils.EMBEDDING_MAX_TOKENS_PER_REQUEST", 5):
+            batches = list(get_embedding_batches(["aa", "bbb", "cc", "dddddd"]))
 
-    @patch("apps.ai.common.utils.Chunk.update_data")
-    @patch("apps.ai.common.utils.time.sleep")
-    @patch("apps.ai.common.utils.datetime")
-    def test_create_chunks_and_embeddings_sleep_when_rate_limited(
-        self, mock_datetime, mock_sleep, mock_update_data
-    ):
-        """Tests that sleep is called when rate limiting is needed."""
-        base_time = datetime.now(UTC)
+        assert batches == [["aa", "bbb"], ["cc"], ["dddddd"]]
 
-        mock_datetime.now.side_effect = [
-            base_time,
-            base_time,
-        ]
-        mock_datetime.UTC = UTC
-        mock_datetime.timedelta = timedelta
+    def test_get_embedding_batches_empty(self):
+        """Tests that no batches are produced for no texts."""
+        assert list(get_embedding_batches([])) == []
 
+    def test_create_embeddings_multiple_requests(self):
+        """Tests that embeddings of all batches are returned in order."""
         mock_openai_client = MagicMock()
-        mock_api_response = MagicMock()
-        mock_api_response.data = [MockEmbeddingData([0.1, 0.2])]
-        mock_openai_client.embeddings.create.return_value = mock_api_response
+        mock_openai_client.embeddings.create.side_effect = [
+            MagicMock(data=[MockEmbeddingData([0.1]), MockEmbeddingData([0.2])]),
+            MagicMock(data=[MockEmbeddingData([0.3])]),
+        ]
 
-        mock_chunk_instance = MagicMock()
-        mock_update_data.return_value = mock_chunk_instance
+        with patch("apps.ai.common.utils.EMBEDDING_MAX_INPUTS_PER_REQUEST", 2):
+            result = create_embeddings(["a", "b", "c"], mock_openai_client)
 
-        with (
-            patch("apps.ai.common.utils.DEFAULT_LAST_REQUEST_OFFSET_SECONDS", 5),
-            patch("apps.ai.common.utils.MIN_REQUEST_INTERVAL_SECONDS", 10),
-        ):
-            mock_context_obj = MagicMock()
+        assert result == [[0.1], [0.2], [0.3]]
+        mock_openai_client.embeddings.create.assert_has_calls(
+            [
+                call(input=["a", "b"], model="text-embedding-3-small"),
+                call(input=["c"], model="text-embedding-3-small"),
+            ]
+        )
+
+    def test_create_embeddings_cached(self):
+        """Tests that only texts missing from the cache are requested."""
+        mock_openai_client = MagicMock()
+        mock_openai_client.embeddings.create.side_effect = [
+            MagicMock(data=[MockEmbeddingData([0.1]), MockEmbeddingData([0.2])]),
+            MagicMock(data=[MockEmbeddingData([0.3])]),
+        ]
 
-            result = create_chunks_and_embeddings(
-                ["test chunk"],
-                mock_context_obj,
-                mock_openai_client,
-            )
+        assert create_embeddings(["a", "b", "a"], mock_openai_client) == [[0.1], [0.2], [0.1]]
+        assert create_embeddings(["b", "c"], mock_openai_client) == [[0.2], [0.3]]
 
-        mock_sleep.assert_called_once()
-        assert result == [mock_chunk_instance]
+        mock_openai_client.embeddings.create.assert_has_calls(
+            [
+                call(input=["a", "b"], model="text-embedding-3-small"),
+                call(input=["c"], model="text-embedding-3-small"),
+            ]
+        )
 
-    @patch("apps.ai.common.utils.Chunk.update_data")
-    def test_create_chunks_and_embeddings_filter_none_chunks(self, mock_update_data):
-        """Tests that None chunks are filtered out from results."""
+    @patch("apps.ai.common.utils.time.sleep")
+    def test_create_embeddings_rate_limited(self, mock_sleep):
+        """Tests that rate limited requests are retried with exponential backoff."""
+        rate_limit_error = openai.RateLimitError(
+            "Rate limit exceeded",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api")),
+            body=None,
+        )
         mock_openai_client = MagicMock()
-        mock_api_response = MagicMock()
-        mock_api_response.data = [
-            MockEmbeddingData([0.1, 0.2]),
-            MockEmbeddingData([0.3, 0.4]),
+        mock_openai_client.embeddings.create.side_effect = [
+            rate_limit_error,
+            rate_limit_error,
+            MagicMock(data=[MockEmbeddingData([0.1])]),
         ]
-        mock_openai_client.embeddings.create.return_value = mock_api_response
 
-        mock_chunk_instance = MagicMock()
-        mock_update_data.side_effect = [mock_chunk_instance, None]
+        result = create_embeddings(["a"], mock_openai_client)
 
-        mock_context_obj = MagicMock()
+        assert result == [[0.1]]
+        assert mock_openai_client.embeddings.create.call_count == 3
+        mock_sleep.assert_has_calls([call(1), call(2)])
 
-        result = create_chunks_and_embeddings(
-            ["first chunk", "second chunk"],
-            mock_context_obj,
-            mock_openai_client,
+    @patch("apps.ai.common.utils.time.sleep")
+    def test_create_embeddings_rate_limit_retries_exhausted(self, mock_sleep):
+        """Tests that the error is raised when retries are exhausted."""
+        mock_openai_client = MagicMock()
+        mock_openai_client.embeddings.create.side_effect = openai.RateLimitError(
+            "Rate limit exceeded",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api")),
+            body=None,
         )
 
-        assert len(result) == 1
-        assert result[0] == mock_chunk_instance
+        with (
+            patch("apps.ai.common.utils.EMBEDDING_MAX_RETRIES", 2),
+            pytest.raises(openai.RateLimitError),
+        ):
+            create_embeddings(["a"], mock_openai_client)
+
+        assert mock_openai_client.embeddings.create.call_count == 3
+        assert mock_sleep.call_count == 2
 
 
 class TestRegenerateChunksForContext:
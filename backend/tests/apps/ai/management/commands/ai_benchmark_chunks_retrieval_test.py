@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management.base import BaseCommand
+
+from apps.ai.management.commands.ai_benchmark_chunks_retrieval import Command
+
+
+@pytest.fixture
+def command():
+    return Command()
+
+
+@pytest.fixture
+def mock_cursor():
+    with (
+        patch(
+            "apps.ai.management.commands.ai_benchmark_chunks_retrieval.connection"
+        ) as mock_connection,
+        patch("apps.ai.management.commands.ai_benchmark_chunks_retrieval.transaction"),
+    ):
+        yield mock_connection.cursor.return_value.__enter__.return_value
+
+
+class TestAiBenchmarkChunksRetrievalCommand:
+    def test_command_inheritance(self, command):
+        assert isinstance(command, BaseCommand)
+
+    def test_add_arguments(self, command):
+        parser = MagicMock()
+
+        command.add_arguments(parser)
+
+        assert [call.args[0] for call in parser.add_argument.call_args_list] == [
+            "--clusters",
+            "--ef-search",
+            "--limit",
+            "--noise",
+            "--queries",
+            "--size",
+        ]
+
+    def test_search(self, command, mock_cursor):
+        mock_cursor.fetchall.side_effect = [[(1,), (2,)], [(3,), (4,)]]
+
+        results, latency = command.search(mock_cursor, 2, 2)
+
+        assert results == [[1, 2], [3, 4]]
+        assert latency >= 0
+        assert mock_cursor.execute.call_count == 2
+
+    def test_handle(self, command, mock_cursor):
+        command.stdout = MagicMock()
+        exact_results = [[[1, 2], [3, 4]], 1.0]
+        hnsw_results = [[[1, 5], [3, 4]], 0.5]
+
+        with patch.object(command, "search", side_effect=[exact_results, hnsw_results]):
+            command.handle(clusters=2, ef_search=[10], limit=2, noise=0.5, queries=2, size=10)
+
+        output = [call.args[0] for call in command.stdout.write.call_args_list]
+        assert "Exact search: latency 1.00 ms, recall@2 1.000" in output
+        assert "HNSW ef_search=10: latency 0.50 ms, recall@2 0.750" in output
+        mock_cursor.execute.assert_any_call(
+            "SELECT set_config('hnsw.ef_search', %s, true)", ["10"]
+        )
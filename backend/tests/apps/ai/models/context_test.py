@@ -165,6 +165,26 @@ class TestContextModel:
             assert result == mock_context
             assert mock_context.content == content
 
+    @patch("apps.ai.models.context.Context.objects.get")
+    def test_update_data_unchanged_content(self, mock_get):
+        mock_context = create_model_mock(Context)
+        mock_context.content_hash = Context.get_content_hash("Test")
+        mock_get.return_value = mock_context
+
+        mock_content_object = Mock()
+        mock_content_object.pk = 1
+
+        with patch("apps.ai.models.context.ContentType.objects.get_for_model"):
+            result = Context.update_data("Test", mock_content_object, source="src", save=True)
+
+            assert result == mock_context
+            mock_context.save.assert_not_called()
+
+    def test_get_content_hash(self):
+        assert Context.get_content_hash("Test") == Context.get_content_hash("Test")
+        assert Context.get_content_hash("Test") != Context.get_content_hash("Other")
+        assert len(Context.get_content_hash("Test")) == 64
+
     def test_str_method_with_name_attribute(self):
         """Test __str__ method when entity has name attribute."""
         content_object = Mock()
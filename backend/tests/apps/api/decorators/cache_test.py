@@ -1,13 +1,23 @@
 """Test cases for the API cache decorator."""
 
+import zlib
 from http import HTTPStatus
 from unittest.mock import MagicMock, patch
 from urllib.parse import urlparse
 
 import pytest
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse
 
-from apps.api.decorators.cache import cache_response, generate_key
+from apps.api.decorators.cache import (
+    cache_response,
+    deserialize_response,
+    generate_key,
+    get_etag,
+    serialize_response,
+)
+from apps.common.cache import get_tagged, invalidate_tags
 
 
 @pytest.mark.parametrize(
@@ -41,38 +51,88 @@ class TestCacheResponse:
         request.GET = {}
         return request
 
-    @patch("apps.api.decorators.cache.cache")
-    def test_get_request_caches_response(self, mock_cache, mock_request):
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Clear cache before and after each test."""
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_get_request_caches_response(self, mock_request):
         """Test that a GET request caches the response."""
-        mock_cache.get.return_value = None
         view_func = MagicMock(return_value=HttpResponse(status=HTTPStatus.OK))
         decorated_view = cache_response(ttl=60)(view_func)
 
         response = decorated_view(mock_request)
 
         assert response.status_code == HTTPStatus.OK
-        mock_cache.get.assert_called_once()
-        mock_cache.set.assert_called_once()
+        assert get_tagged(generate_key(mock_request, settings.API_CACHE_PREFIX)) is not None
         view_func.assert_called_once_with(mock_request)
 
-    @patch("apps.api.decorators.cache.cache")
-    def test_get_request_returns_cached_response(self, mock_cache, mock_request):
+    def test_get_request_returns_cached_response(self, mock_request):
         """Test that a GET request returns a cached response if available."""
-        cached_response = HttpResponse(status=HTTPStatus.OK, content=b"cached")
-        mock_cache.get.return_value = cached_response
-        view_func = MagicMock()
+        view_func = MagicMock(return_value=HttpResponse(status=HTTPStatus.OK, content=b"cached"))
+        decorated_view = cache_response(ttl=60)(view_func)
+
+        decorated_view(mock_request)
+        response = decorated_view(mock_request)
+
+        assert response.content == b"cached"
+        view_func.assert_called_once_with(mock_request)
+
+    def test_get_request_sets_etag(self, mock_request):
+        """Test that cached responses carry the ETag of their content."""
+        view_func = MagicMock(return_value=HttpResponse(status=HTTPStatus.OK, content=b"data"))
+        decorated_view = cache_response(ttl=60)(view_func)
+
+        response = decorated_view(mock_request)
+
+        assert response["ETag"] == get_etag(b"data")
+
+    def test_get_request_matching_etag_not_modified(self, mock_request):
+        """Test that a request with a matching If-None-Match header gets a 304."""
+        view_func = MagicMock(return_value=HttpResponse(status=HTTPStatus.OK, content=b"data"))
         decorated_view = cache_response(ttl=60)(view_func)
+        mock_request.META["HTTP_IF_NONE_MATCH"] = get_etag(b"data")
 
         response = decorated_view(mock_request)
 
-        assert response == cached_response
-        mock_cache.get.assert_called_once()
-        mock_cache.set.assert_not_called()
-        view_func.assert_not_called()
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response["ETag"] == get_etag(b"data")
+        assert not response.content
+
+    def test_get_request_passes_tags(self, mock_request):
+        """Test that cache tags are passed to the tagged cache."""
+        view_func = MagicMock()
+        decorated_view = cache_response(ttl=60, tags=("owasp.project",))(view_func)
+
+        with (
+            patch("apps.api.decorators.cache.get_or_set_tagged") as mock_get_or_set_tagged,
+            patch("apps.api.decorators.cache.deserialize_response") as mock_deserialize,
+        ):
+            response = decorated_view(mock_request)
+
+        assert response == mock_deserialize.return_value
+        mock_deserialize.assert_called_once_with(mock_request, mock_get_or_set_tagged.return_value)
+        args, kwargs = mock_get_or_set_tagged.call_args
+        assert args[0] == generate_key(mock_request, settings.API_CACHE_PREFIX)
+        assert args[2] == ("owasp.project",)
+        assert kwargs["timeout"] == 60
+
+    def test_tag_invalidation_refreshes_response(self, mock_request):
+        """Test that invalidating a tag makes the next request recompute the response."""
+        view_func = MagicMock(return_value=HttpResponse(status=HTTPStatus.OK))
+        decorated_view = cache_response(ttl=60, tags=("owasp.project",))(view_func)
+
+        decorated_view(mock_request)
+        invalidate_tags(("owasp.project",))
+        decorated_view(mock_request)
+
+        assert view_func.call_count == 2
 
     @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
-    @patch("apps.api.decorators.cache.cache")
-    def test_non_get_head_requests_not_cached(self, mock_cache, method, mock_request):
+    @patch("apps.api.decorators.cache.get_or_set_tagged")
+    def test_non_get_head_requests_not_cached(self, mock_get_or_set_tagged, method, mock_request):
         """Test that non-GET/HEAD requests are not cached."""
         mock_request.method = method
         view_func = MagicMock(return_value=HttpResponse())
@@ -80,8 +140,7 @@ class TestCacheResponse:
 
         decorated_view(mock_request)
 
-        mock_cache.get.assert_not_called()
-        mock_cache.set.assert_not_called()
+        mock_get_or_set_tagged.assert_not_called()
         view_func.assert_called_once_with(mock_request)
 
     @pytest.mark.parametrize(
@@ -94,15 +153,78 @@ class TestCacheResponse:
             HTTPStatus.INTERNAL_SERVER_ERROR,
         ],
     )
-    @patch("apps.api.decorators.cache.cache")
-    def test_non_200_responses_not_cached(self, mock_cache, status_code, mock_request):
+    def test_non_200_responses_not_cached(self, status_code, mock_request):
         """Test that responses with non-200 status codes are not cached."""
-        mock_cache.get.return_value = None
         view_func = MagicMock(return_value=HttpResponse(status=status_code))
         decorated_view = cache_response(ttl=60)(view_func)
 
+        decorated_view(mock_request)
         decorated_view(mock_request)
 
-        mock_cache.get.assert_called_once()
-        mock_cache.set.assert_not_called()
-        view_func.assert_called_once_with(mock_request)
+        assert get_tagged(generate_key(mock_request, settings.API_CACHE_PREFIX)) is None
+        assert view_func.call_count == 2
+
+
+class TestSerializeResponse:
+    """Test cases for the response cache entry serialization."""
+
+    def test_serialize_response(self):
+        """Test that a small response is serialized without compression."""
+        response = HttpResponse(b'{"a": 1}', content_type="application/json")
+
+        assert serialize_response(response) == (
+            HTTPStatus.OK,
+            "application/json",
+            b'{"a": 1}',
+            get_etag(b'{"a": 1}'),
+            False,
+        )
+
+    def test_serialize_response_compressed(self):
+        """Test that a large response is compressed."""
+        content = b"x" * settings.API_CACHE_COMPRESSION_MIN_SIZE
+
+        status, _, compressed_content, etag, is_compressed = serialize_response(
+            HttpResponse(content)
+        )
+
+        assert status == HTTPStatus.OK
+        assert is_compressed
+        assert len(compressed_content) < len(content)
+        assert etag == get_etag(content)
+
+    def test_serialize_non_200_response(self):
+        """Test that non-200 responses are returned as is."""
+        response = HttpResponse(status=HTTPStatus.NOT_FOUND)
+
+        assert serialize_response(response) is response
+
+    def test_deserialize_response(self):
+        """Test that a compressed entry is restored."""
+        request = HttpRequest()
+        content = b"x" * 2048
+        entry = (HTTPStatus.OK, "application/json", zlib.compress(content), "etag", True)
+
+        response = deserialize_response(request, entry)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == content
+        assert response["Content-Type"] == "application/json"
+        assert response["ETag"] == "etag"
+
+    @pytest.mark.parametrize("if_none_match", ['"etag"', '"other", "etag"', "*"])
+    def test_deserialize_response_not_modified(self, if_none_match):
+        """Test that matching ETags produce a 304 response."""
+        request = HttpRequest()
+        request.META["HTTP_IF_NONE_MATCH"] = if_none_match
+        entry = (HTTPStatus.OK, "application/json", b"data", '"etag"', False)
+
+        response = deserialize_response(request, entry)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_deserialize_response_passes_responses_through(self):
+        """Test that non-cacheable responses are returned as is."""
+        response = HttpResponse(status=HTTPStatus.NOT_FOUND)
+
+        assert deserialize_response(HttpRequest(), response) is response
@@ -0,0 +1,83 @@
+import gzip
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.api.rest.v0.export import ExportParams, export_response, iter_gzip, iter_ndjson
+from apps.api.rest.v0.member import MemberDetail
+
+MEMBER_DATA = {
+    "avatar_url": "https://github.com/images/johndoe.png",
+    "bio": "Developer advocate",
+    "company": "GitHub",
+    "created_at": datetime(2024, 12, 30, tzinfo=UTC),
+    "followers_count": 10,
+    "following_count": 5,
+    "location": "San Francisco",
+    "login": "johndoe",
+    "name": "John Doe",
+    "public_repositories_count": 3,
+    "title": "Senior Engineer",
+    "twitter_username": "johndoe",
+    "updated_at": datetime(2024, 12, 30, tzinfo=UTC),
+    "url": "https://github.com/johndoe",
+}
+
+
+def make_member(login):
+    member = MagicMock()
+    member.configure_mock(**{**MEMBER_DATA, "login": login})
+    return member
+
+
+@pytest.fixture
+def mock_queryset():
+    queryset = MagicMock()
+    queryset.filter.return_value = queryset
+    queryset.order_by.return_value = queryset
+    queryset.iterator.return_value = iter([make_member(f"user{i}") for i in range(3)])
+    return queryset
+
+
+def test_iter_ndjson(mock_queryset, settings):
+    settings.API_EXPORT_CHUNK_SIZE = 2
+
+    chunks = list(iter_ndjson(mock_queryset, MemberDetail))
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["login"] for line in lines] == ["user0", "user1", "user2"]
+    mock_queryset.iterator.assert_called_once_with(chunk_size=2)
+
+
+def test_iter_gzip():
+    assert gzip.decompress(b"".join(iter_gzip([b"a\n", b"", b"b\n"]))) == b"a\nb\n"
+
+
+def test_export_response(mock_queryset):
+    response = export_response(mock_queryset, MemberDetail, "members", ExportParams())
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert response["Content-Disposition"] == 'attachment; filename="members.ndjson"'
+    assert len(b"".join(response.streaming_content).splitlines()) == 3
+    mock_queryset.filter.assert_not_called()
+    mock_queryset.order_by.assert_called_once_with("id")
+
+
+def test_export_response_gzip_updated_since(mock_queryset):
+    updated_since = datetime(2025, 1, 1, tzinfo=UTC)
+
+    response = export_response(
+        mock_queryset,
+        MemberDetail,
+        "members",
+        ExportParams(gzip=True, updated_since=updated_since),
+    )
+
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == 'attachment; filename="members.ndjson.gz"'
+    content = gzip.decompress(b"".join(response.streaming_content))
+    assert len(content.splitlines()) == 3
+    mock_queryset.filter.assert_called_once_with(nest_updated_at__gte=updated_since)
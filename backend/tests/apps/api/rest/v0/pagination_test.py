@@ -0,0 +1,149 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from django.db.models import Q
+from django.http import Http404
+from ninja.errors import HttpError
+
+from apps.api.rest.v0.pagination import (
+    CustomPagination,
+    decode_cursor,
+    encode_cursor,
+    get_after_filter,
+    get_ordering,
+)
+
+
+def make_queryset(items, order_by=("-created_at",)):
+    queryset = MagicMock()
+    queryset.query.order_by = order_by
+    queryset.count.return_value = len(items)
+    queryset.__getitem__.side_effect = lambda key: items[key]
+    queryset.order_by.return_value = queryset
+    queryset.filter.return_value = queryset
+    return queryset
+
+
+class TestCursor:
+    def test_encode_decode_cursor(self):
+        created_at = datetime(2025, 1, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+        values = decode_cursor(encode_cursor([created_at, None, 42]))
+
+        assert values == [str(created_at), None, 42]
+        assert datetime.fromisoformat(values[0]) == created_at
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30=", "!!!"])
+    def test_decode_invalid_cursor(self, cursor):
+        with pytest.raises(HttpError) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestGetOrdering:
+    @pytest.mark.parametrize(
+        ("order_by", "expected"),
+        [
+            (("-created_at",), ["-created_at", "-id"]),
+            (("created_at", "-updated_at"), ["created_at", "-updated_at", "-id"]),
+            (("name",), ["name", "id"]),
+            (("-created_at", "id"), ["-created_at", "id"]),
+        ],
+    )
+    def test_get_ordering(self, order_by, expected):
+        assert get_ordering(make_queryset([], order_by)) == expected
+
+    def test_get_ordering_model_default(self):
+        queryset = make_queryset([], ())
+        queryset.model._meta.ordering = ["name"]
+
+        assert get_ordering(queryset) == ["name", "id"]
+
+    def test_get_ordering_expression(self):
+        with pytest.raises(HttpError):
+            get_ordering(make_queryset([], (MagicMock(),)))
+
+
+class TestGetAfterFilter:
+    def test_descending(self):
+        assert get_after_filter(["-created_at", "-id"], ["2025-01-01", 5]) == Q(
+            created_at__lt="2025-01-01"
+        ) | (Q(created_at="2025-01-01") & Q(id__lt=5))
+
+    def test_ascending(self):
+        assert get_after_filter(["name", "id"], ["OWASP", 5]) == (
+            Q(name__gt="OWASP") | Q(name__isnull=True)
+        ) | (Q(name="OWASP") & (Q(id__gt=5) | Q(id__isnull=True)))
+
+    def test_null_values(self):
+        assert get_after_filter(["-published_at", "-id"], [None, 5]) == Q(
+            published_at__isnull=False
+        ) | (Q(published_at__isnull=True) & Q(id__lt=5))
+
+
+class TestCustomPagination:
+    @pytest.fixture
+    def pagination(self):
+        return CustomPagination()
+
+    def test_page_pagination(self, pagination):
+        items = [MagicMock() for _ in range(5)]
+
+        result = pagination.paginate_queryset(
+            make_queryset(items), CustomPagination.Input(page=2, page_size=2)
+        )
+
+        assert result == {
+            "current_page": 2,
+            "has_next": True,
+            "has_previous": True,
+            "items": items[2:4],
+            "total_count": 5,
+            "total_pages": 3,
+        }
+
+    def test_page_pagination_page_not_found(self, pagination):
+        with pytest.raises(Http404):
+            pagination.paginate_queryset(
+                make_queryset([]), CustomPagination.Input(page=2, page_size=2)
+            )
+
+    def test_cursor_pagination_first_page(self, pagination):
+        items = [MagicMock(created_at=f"2025-01-0{i}", id=i) for i in range(3, 0, -1)]
+        queryset = make_queryset(items)
+
+        result = pagination.paginate_queryset(
+            queryset, CustomPagination.Input(cursor="", page_size=2)
+        )
+
+        assert result["items"] == items[:2]
+        assert result["has_next"]
+        assert result["total_count"] is None
+        assert decode_cursor(result["next_cursor"]) == ["2025-01-02", 2]
+        queryset.count.assert_not_called()
+        queryset.filter.assert_not_called()
+        queryset.order_by.assert_called_once_with("-created_at", "-id")
+
+    def test_cursor_pagination_next_page(self, pagination):
+        items = [MagicMock(created_at="2025-01-01", id=1)]
+        queryset = make_queryset(items)
+
+        result = pagination.paginate_queryset(
+            queryset,
+            CustomPagination.Input(cursor=encode_cursor(["2025-01-02", 2]), page_size=2),
+        )
+
+        assert result["items"] == items
+        assert not result["has_next"]
+        assert result["next_cursor"] is None
+        queryset.filter.assert_called_once_with(
+            get_after_filter(["-created_at", "-id"], ["2025-01-02", 2])
+        )
+
+    def test_cursor_pagination_cursor_mismatch(self, pagination):
+        with pytest.raises(HttpError):
+            pagination.paginate_queryset(
+                make_queryset([]), CustomPagination.Input(cursor=encode_cursor([1]))
+            )
@@ -0,0 +1,340 @@
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django_redis.cache import RedisCache
+
+from apps.ai.models.chunk import Chunk
+from apps.common.cache import (
+    RELEASE_LOCK_SCRIPT,
+    get_entry,
+    get_instance_tag,
+    get_lock_key,
+    get_model_tag,
+    get_or_set_tagged,
+    get_result_tags,
+    get_tag_key,
+    get_tag_versions,
+    get_tagged,
+    get_tagged_models,
+    invalidate_bulk_saved_tags,
+    invalidate_instance_tags,
+    invalidate_m2m_changed_tags,
+    invalidate_tags,
+    is_expired,
+    release_lock,
+    set_tagged,
+    wait_for_entry,
+)
+from apps.common.models import post_bulk_save
+from apps.github.models.issue import Issue
+from apps.github.models.label import Label
+from apps.owasp.models.project import Project
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestTags:
+    def test_get_model_tag(self):
+        assert get_model_tag(Project) == "owasp.project"
+
+    def test_get_instance_tag(self):
+        assert get_instance_tag(Project(id=42)) == "owasp.project:42"
+
+    def test_get_tag_key(self):
+        assert get_tag_key("owasp.project") == "cache-tag-owasp.project"
+
+    @pytest.mark.parametrize(
+        ("result", "expected_tags"),
+        [
+            (None, set()),
+            ({"key": "value"}, set()),
+            ([], set()),
+            ([Project(id=1), Issue(id=2), "text"], {"owasp.project", "github.issue"}),
+        ],
+    )
+    def test_get_result_tags(self, result, expected_tags):
+        assert get_result_tags(result) == expected_tags
+
+    def test_get_result_tags_instance(self):
+        assert get_result_tags(Project(id=1)) == {"owasp.project", "owasp.project:1"}
+
+    def test_get_result_tags_queryset(self):
+        assert get_result_tags(Project.objects.all()) == {"owasp.project"}
+
+    def test_get_tag_versions(self):
+        versions = get_tag_versions(("owasp.project", "github.issue"))
+
+        assert set(versions) == {"owasp.project", "github.issue"}
+        assert get_tag_versions(("owasp.project",)) == {"owasp.project": versions["owasp.project"]}
+
+
+class TestTagged:
+    def test_get_tagged_miss(self):
+        assert get_tagged("key") is None
+        assert get_tagged("key", "default") == "default"
+
+    def test_set_tagged_without_tags(self):
+        set_tagged("key", "value")
+
+        assert get_tagged("key") == "value"
+
+    def test_set_tagged_with_tags(self):
+        set_tagged("key", "value", ("owasp.project", "owasp.project:1"))
+
+        assert get_tagged("key") == "value"
+
+    def test_invalidate_tags(self):
+        set_tagged("project", "project", ("owasp.project:1",))
+        set_tagged("issue", "issue", ("github.issue",))
+
+        invalidate_tags(("owasp.project:1",))
+
+        assert get_tagged("project") is None
+        assert get_tagged("issue") == "issue"
+
+    def test_invalidate_tags_empty(self):
+        set_tagged("key", "value", ("owasp.project",))
+
+        invalidate_tags(())
+
+        assert get_tagged("key") == "value"
+
+    def test_set_tagged_expiration(self):
+        with patch("apps.common.cache.time.time", return_value=1000):
+            set_tagged("key", "value", timeout=60, delta=0.5, stale_timeout=30)
+
+            assert get_entry("key") == ("value", 1060, 0.5)
+
+    def test_set_tagged_without_timeout(self):
+        set_tagged("key", "value", timeout=None)
+
+        assert get_entry("key") == ("value", None, 0)
+
+
+class TestIsExpired:
+    def test_never_expires(self):
+        assert not is_expired(None, 10)
+
+    @pytest.mark.parametrize(
+        ("expires_at", "delta", "random_value", "expected"),
+        [
+            (1100, 0, 0.5, False),
+            (1000, 0, 0.5, True),
+            (900, 0, 0.5, True),
+            (1100, 1, 0.5, False),
+            (1100, 1000, 0.5, True),
+        ],
+    )
+    def test_is_expired(self, expires_at, delta, random_value, expected):
+        with (
+            patch("apps.common.cache.time.time", return_value=1000),
+            patch("apps.common.cache.random.random", return_value=random_value),
+        ):
+            assert is_expired(expires_at, delta) is expected
+
+
+class TestGetOrSetTagged:
+    def test_miss_computes_and_caches(self):
+        default = MagicMock(return_value="value")
+
+        assert get_or_set_tagged("key", default, ("owasp.project",), timeout=60) == "value"
+        assert get_or_set_tagged("key", default, ("owasp.project",), timeout=60) == "value"
+
+        default.assert_called_once()
+        assert cache.get(get_lock_key("key")) is None
+
+    def test_callable_tags(self):
+        tags = MagicMock(return_value={"owasp.project:1"})
+
+        get_or_set_tagged("key", lambda: "value", tags, timeout=60)
+        invalidate_tags(("owasp.project:1",))
+
+        tags.assert_called_once_with("value")
+        assert get_tagged("key") is None
+
+    def test_not_cacheable(self):
+        get_or_set_tagged("key", lambda: "value", timeout=60, is_cacheable=lambda _: False)
+
+        assert get_tagged("key") is None
+
+    def test_stale_value_is_refreshed(self):
+        set_tagged("key", "stale", timeout=-1, stale_timeout=60)
+
+        assert get_or_set_tagged("key", lambda: "fresh", timeout=60) == "fresh"
+        assert get_tagged("key") == "fresh"
+
+    def test_stale_value_is_served_while_locked(self):
+        set_tagged("key", "stale", timeout=-1, stale_timeout=60)
+        cache.add(get_lock_key("key"), 1)
+        default = MagicMock()
+
+        assert get_or_set_tagged("key", default, timeout=60) == "stale"
+        default.assert_not_called()
+
+    def test_miss_waits_for_lock_owner(self):
+        cache.add(get_lock_key("key"), 1)
+        default = MagicMock()
+
+        with patch(
+            "apps.common.cache.wait_for_entry", return_value=("value", None, 0)
+        ) as mock_wait_for_entry:
+            assert get_or_set_tagged("key", default, timeout=60) == "value"
+
+        mock_wait_for_entry.assert_called_once_with("key")
+        default.assert_not_called()
+
+    def test_miss_computes_when_wait_times_out(self):
+        cache.add(get_lock_key("key"), 1)
+
+        with patch("apps.common.cache.wait_for_entry", return_value=None):
+            assert get_or_set_tagged("key", lambda: "value", timeout=60) == "value"
+
+        assert cache.get(get_lock_key("key")) == 1
+
+    def test_lock_is_released_on_error(self):
+        def default():
+            message = "computation failed"
+            raise ValueError(message)
+
+        with pytest.raises(ValueError, match="computation failed"):
+            get_or_set_tagged("key", default, timeout=60)
+
+        assert cache.get(get_lock_key("key")) is None
+
+    def test_expired_lock_of_another_worker_is_kept(self):
+        def default():
+            cache.set(get_lock_key("key"), "other-token")
+            return "value"
+
+        assert get_or_set_tagged("key", default, timeout=60) == "value"
+        assert cache.get(get_lock_key("key")) == "other-token"
+
+
+class TestReleaseLock:
+    def test_locmem_fallback(self):
+        cache.set("lock", "token")
+        release_lock("lock", "other-token")
+        assert cache.get("lock") == "token"
+
+        release_lock("lock", "token")
+        assert cache.get("lock") is None
+
+    def test_redis_compare_and_delete(self):
+        backend = MagicMock(spec=RedisCache)
+        backend.client.make_key.return_value = ":1:lock"
+        backend.client.encode.return_value = b"encoded-token"
+
+        with (
+            patch("apps.common.cache.caches", {"default": backend}),
+            patch("apps.common.cache.get_redis_connection") as mock_get_redis_connection,
+            patch("apps.common.cache.cache") as mock_cache,
+        ):
+            release_lock("lock", "token")
+
+        backend.client.make_key.assert_called_once_with("lock")
+        backend.client.encode.assert_called_once_with("token")
+        mock_get_redis_connection.return_value.eval.assert_called_once_with(
+            RELEASE_LOCK_SCRIPT, 1, ":1:lock", b"encoded-token"
+        )
+        mock_cache.get.assert_not_called()
+        mock_cache.delete.assert_not_called()
+
+
+class TestWaitForEntry:
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        with patch("apps.common.cache.time.sleep"):
+            yield
+
+    def test_returns_cached_entry(self):
+        cache.add(get_lock_key("key"), 1)
+        set_tagged("key", "value", timeout=None)
+
+        assert wait_for_entry("key") == ("value", None, 0)
+
+    def test_stops_when_lock_is_released(self):
+        assert wait_for_entry("key") is None
+
+    def test_times_out(self, settings):
+        settings.CACHE_LOCK_WAIT_SECONDS = 0
+        cache.add(get_lock_key("key"), 1)
+
+        assert wait_for_entry("key") is None
+
+
+class TestReceivers:
+    def test_invalidate_instance_tags(self):
+        set_tagged("list", "list", ("owasp.project",))
+        set_tagged("details", "details", ("owasp.project:1",))
+        set_tagged("other", "other", ("owasp.project:2",))
+
+        invalidate_instance_tags(sender=Project, instance=Project(id=1))
+
+        assert get_tagged("list") is None
+        assert get_tagged("details") is None
+        assert get_tagged("other") == "other"
+
+    @pytest.mark.parametrize(
+        ("action", "is_invalidated"),
+        [
+            ("pre_add", False),
+            ("post_add", True),
+            ("post_clear", True),
+            ("post_remove", True),
+        ],
+    )
+    def test_invalidate_m2m_changed_tags(self, action, is_invalidated):
+        set_tagged("details", "details", ("github.issue:1",))
+
+        invalidate_m2m_changed_tags(sender=MagicMock(), instance=Issue(id=1), action=action)
+
+        assert (get_tagged("details") is None) is is_invalidated
+
+    def test_invalidate_bulk_saved_tags(self):
+        set_tagged("list", "list", ("owasp.project",))
+        set_tagged("details", "details", ("owasp.project:1",))
+        set_tagged("other", "other", ("owasp.project:2",))
+
+        with patch("apps.common.cache.invalidate_tags") as mock_invalidate_tags:
+            invalidate_bulk_saved_tags(sender=Project, objects=[Project(id=1), Project()])
+
+        mock_invalidate_tags.assert_called_once_with(("owasp.project",))
+
+    def test_invalidate_instance_tags_without_instance(self):
+        set_tagged("list", "list", ("github.organization",))
+
+        invalidate_instance_tags(sender=Project, instance=None)
+
+        assert get_tagged("list") == "list"
+
+    def test_get_tagged_models(self):
+        tagged_models = get_tagged_models()
+
+        assert Issue in tagged_models
+        assert Project in tagged_models
+        assert Label in tagged_models
+        assert Chunk not in tagged_models
+
+    def test_untagged_model_signals_are_ignored(self):
+        with patch("apps.common.cache.invalidate_tags") as mock_invalidate_tags:
+            post_save.send(sender=Chunk, instance=Chunk(id=1))
+            post_bulk_save.send(sender=MagicMock, objects=[MagicMock(pk=1)])
+
+        mock_invalidate_tags.assert_not_called()
+
+    def test_tagged_model_signals_invalidate_tags(self):
+        with patch("apps.common.cache.invalidate_tags") as mock_invalidate_tags:
+            post_save.send(sender=Label, instance=Label(id=1))
+            post_bulk_save.send(sender=Label, objects=[Label(id=1)])
+
+        assert mock_invalidate_tags.call_args_list == [
+            call(("github.label", "github.label:1")),
+            call(("github.label",)),
+        ]
@@ -1,11 +1,17 @@
-"""Tests for CacheExtension."""
+"""Tests for GraphQL schema extensions."""
 
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
 from strawberry.permission import PermissionExtension
 
-from apps.common.extensions import CacheExtension, get_protected_fields
+from apps.common.cache import get_result_tags, get_tagged, set_tagged
+from apps.common.extensions import BatchLoaderExtension, CacheExtension, get_protected_fields
+from apps.common.loaders import batch_loader
+from apps.github.models.issue import Issue
 
 
 class TestGenerateKey:
@@ -87,6 +93,13 @@ class TestGetProtectedFields:
 class TestResolve:
     """Test cases for the resolve method."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Clear cache before and after each test."""
+        cache.clear()
+        yield
+        cache.clear()
+
     @pytest.fixture(autouse=True)
     def mock_protected_fields(self):
         """Patch get_protected_fields for all tests."""
@@ -140,24 +153,88 @@ class TestResolve:
         mock_next.assert_called_once()
         assert result == mock_next.return_value
 
-    @patch("apps.common.extensions.cache")
-    def test_returns_cached_result_on_hit(self, mock_cache, extension, mock_info, mock_next):
+    def test_returns_cached_result_on_hit(self, extension, mock_info, mock_next):
         """Test that cached result is returned on cache hit."""
         cached_result = {"name": "Cached OWASP"}
-        mock_cache.get_or_set.return_value = cached_result
+        set_tagged(extension.generate_key("chapter", {"key": "germany"}), cached_result)
 
         result = extension.resolve(mock_next, None, mock_info, key="germany")
 
         assert result == cached_result
-        mock_cache.get_or_set.assert_called_once()
         mock_next.assert_not_called()
 
-    @patch("apps.common.extensions.cache")
-    def test_caches_result_on_miss(self, mock_cache, extension, mock_info, mock_next):
+    def test_caches_result_on_miss(self, extension, mock_info, mock_next):
         """Test that result is cached on cache miss."""
-        mock_cache.get_or_set.side_effect = lambda _key, default, _timeout: default()
+        result = extension.resolve(mock_next, None, mock_info, key="germany")
+
+        assert result == mock_next.return_value
+        mock_next.assert_called_once()
+        assert (
+            get_tagged(extension.generate_key("chapter", {"key": "germany"}))
+            == mock_next.return_value
+        )
+
+    def test_caches_none_result(self, extension, mock_info, mock_next):
+        """Test that a cached None result is returned as a hit."""
+        set_tagged(extension.generate_key("chapter", {"key": "germany"}), None)
 
+        result = extension.resolve(mock_next, None, mock_info, key="germany")
+
+        assert result is None
+        mock_next.assert_not_called()
+
+    @patch("apps.common.extensions.get_or_set_tagged")
+    def test_passes_result_tags(self, mock_get_or_set_tagged, extension, mock_info, mock_next):
+        """Test that cache tags are derived from the resolved value."""
         extension.resolve(mock_next, None, mock_info, key="germany")
 
-        mock_next.assert_called_once()
-        mock_cache.get_or_set.assert_called_once()
+        args, kwargs = mock_get_or_set_tagged.call_args
+        assert args[0] == extension.generate_key("chapter", {"key": "germany"})
+        assert args[2] is get_result_tags
+        assert kwargs["timeout"] == settings.GRAPHQL_RESOLVER_CACHE_TIME_SECONDS
+
+
+class TestBatchLoaderExtension:
+    """Test cases for the BatchLoaderExtension."""
+
+    @pytest.fixture
+    def extension(self):
+        """Return a BatchLoaderExtension instance."""
+        extension = BatchLoaderExtension()
+        extension.execution_context = MagicMock()
+        return extension
+
+    def test_on_execute_sets_loader(self, extension):
+        """Test that a batch loader is active during the execution only."""
+        execution = extension.on_execute()
+
+        next(execution)
+        loader = batch_loader.get()
+        assert loader is not None
+
+        with pytest.raises(StopIteration):
+            next(execution)
+        assert batch_loader.get() is None
+
+    def test_resolve_registers_lists(self, extension):
+        """Test that resolved model instance lists are registered as batches."""
+        issues = [Issue(id=1), Issue(id=2)]
+        queryset = MagicMock(spec=QuerySet)
+        queryset.__iter__.return_value = iter(issues)
+        execution = extension.on_execute()
+        next(execution)
+
+        try:
+            result = extension.resolve(MagicMock(return_value=queryset), None, MagicMock())
+            loader = batch_loader.get()
+        finally:
+            execution.close()
+
+        assert result == issues
+        assert loader.get_batch(issues[1]) == issues
+
+    def test_resolve_without_loader(self, extension):
+        """Test that results are returned as is outside of an execution."""
+        issues = [Issue(id=1)]
+
+        assert extension.resolve(MagicMock(return_value=issues), None, MagicMock()) is issues
@@ -4,12 +4,15 @@ import pytest
 from algoliasearch.http.exceptions import AlgoliaException
 from algoliasearch_django import AlgoliaIndex
 from django.conf import settings
+from django.core.cache import caches
 from django.test import override_settings
 
 from apps.common.index import (
+    BATCH_SIZE,
     EXCLUDED_LOCAL_INDEX_NAMES,
     IndexBase,
     IndexRegistry,
+    cache,
     is_indexable,
     register,
 )
@@ -205,3 +208,99 @@ class TestIndexBase:
 
         assert result1 == result2 == TOTAL_COUNT
         self.mock_client.search_single_index.assert_called_once()
+
+
+class TestIndexBaseSyncRecords:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        cache.clear()
+        with patch("apps.common.index.IndexBase.get_client") as mock_get_client:
+            self.mock_client = mock_get_client.return_value
+            yield
+        cache.clear()
+
+    @pytest.fixture
+    def index(self):
+        index = IndexBase.__new__(IndexBase)
+        index.index_name = "test_index"
+        index.get_raw_record = lambda instance: {"objectID": instance.pk, "name": instance.name}
+        index._should_index = lambda instance: instance.is_indexable
+        return index
+
+    @staticmethod
+    def get_instances(*names):
+        instances = []
+        for pk, name in enumerate(names, start=1):
+            instance = MagicMock(pk=pk, is_indexable=True)
+            instance.name = name
+            instances.append(instance)
+        return instances
+
+    def test_iter_instances(self, index):
+        instances = self.get_instances(*(str(i) for i in range(BATCH_SIZE + 1)))
+        queryset = MagicMock()
+        queryset.iterator.return_value = iter(instances)
+        index.prefetch_index_fields = MagicMock()
+
+        assert list(index.iter_instances(queryset)) == instances
+        queryset.iterator.assert_called_once_with(chunk_size=BATCH_SIZE)
+        assert [len(c.args[0]) for c in index.prefetch_index_fields.call_args_list] == [
+            BATCH_SIZE,
+            1,
+        ]
+
+    def test_sync_records_all(self, index):
+        instances = self.get_instances("a", "b")
+        index.get_queryset = lambda: iter(instances)
+
+        assert index.sync_records() == (2, 0)
+        self.mock_client.partial_update_objects.assert_called_once_with(
+            index_name="test_index",
+            objects=[{"objectID": 1, "name": "a"}, {"objectID": 2, "name": "b"}],
+            create_if_not_exists=True,
+            wait_for_tasks=True,
+        )
+
+        self.mock_client.reset_mock()
+        instances[1].name = "c"
+
+        assert index.sync_records() == (1, 0)
+        self.mock_client.partial_update_objects.assert_called_once_with(
+            index_name="test_index",
+            objects=[{"objectID": 2, "name": "c"}],
+            create_if_not_exists=True,
+            wait_for_tasks=True,
+        )
+
+        self.mock_client.reset_mock()
+
+        assert index.sync_records() == (0, 0)
+        self.mock_client.partial_update_objects.assert_not_called()
+        self.mock_client.delete_objects.assert_not_called()
+
+    def test_sync_records_stores_hashes_in_indexing_cache(self, index):
+        index.get_queryset = lambda: iter(self.get_instances("a"))
+
+        index.sync_records()
+
+        key = index.get_record_hash_cache_key(1)
+        assert caches["indexing"].get(key)
+        assert caches["default"].get(key) is None
+
+    def test_sync_records_object_ids(self, index):
+        indexable, not_indexable = self.get_instances("a", "b")
+        not_indexable.is_indexable = False
+        index.get_entities = MagicMock()
+        index.get_entities.return_value.filter.return_value.iterator.return_value = [
+            indexable,
+            not_indexable,
+        ]
+
+        assert index.sync_records({1, 2, 3}) == (1, 2)
+        index.get_entities.return_value.filter.assert_called_once_with(pk__in={1, 2, 3})
+        self.mock_client.partial_update_objects.assert_called_once()
+        self.mock_client.delete_objects.assert_called_once_with(
+            index_name="test_index",
+            object_ids=["2", "3"],
+            wait_for_tasks=True,
+        )
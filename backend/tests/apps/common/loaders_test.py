@@ -0,0 +1,138 @@
+"""Tests for GraphQL batch loaders."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+from apps.common.loaders import (
+    BatchLoader,
+    batch_loader,
+    count_by,
+    group_by_batch_key,
+    load,
+    prefetch_related,
+)
+from apps.github.models.issue import Issue
+from apps.github.models.release import Release
+
+
+class TestBatchLoader:
+    """Test cases for the BatchLoader class."""
+
+    def test_register_groups_instances_by_model(self):
+        """Test that resolved instances are grouped into batches by model."""
+        issues = [Issue(id=1), Issue(id=2)]
+        release = Release(id=1)
+        loader = BatchLoader()
+
+        loader.register([*issues, release, Issue(), "not-a-model"])
+
+        assert loader.get_batch(issues[0]) == issues
+        assert loader.get_batch(issues[1]) is loader.get_batch(issues[0])
+        assert loader.get_batch(release) == [release]
+
+    def test_register_keeps_first_batch(self):
+        """Test that an instance keeps the batch it was first resolved with."""
+        issues = [Issue(id=1), Issue(id=2)]
+        loader = BatchLoader()
+
+        loader.register(issues)
+        loader.register(issues[:1])
+
+        assert loader.get_batch(issues[0]) == issues
+
+    def test_load_calls_load_batch_once_per_batch(self):
+        """Test that values are loaded once for the whole batch."""
+        issues = [Issue(id=1), Issue(id=2), Issue(id=3)]
+        load_batch = Mock(return_value={1: "a", 2: "b"})
+        loader = BatchLoader()
+        loader.register(issues)
+
+        result = [loader.load(issue, load_batch, default="-") for issue in issues]
+
+        assert result == ["a", "b", "-"]
+        load_batch.assert_called_once_with(issues)
+
+    def test_load_distinguishes_arguments(self):
+        """Test that values are loaded separately for different arguments."""
+        issue = Issue(id=1)
+        load_batch = Mock(side_effect=lambda _, limit: {1: limit})
+        loader = BatchLoader()
+
+        assert loader.load(issue, load_batch, 3) == 3
+        assert loader.load(issue, load_batch, 5) == 5
+        assert loader.load(issue, load_batch, 3) == 3
+        assert load_batch.call_count == 2
+
+
+class TestLoad:
+    """Test cases for the load function."""
+
+    def test_without_active_loader(self):
+        """Test that values are loaded for the instance alone outside of a request."""
+        issue = Issue(id=1)
+        load_batch = Mock(return_value={1: "a"})
+
+        assert load(issue, load_batch) == "a"
+        load_batch.assert_called_once_with([issue])
+
+    def test_with_active_loader(self):
+        """Test that values are loaded for sibling instances within a request."""
+        issues = [Issue(id=1), Issue(id=2)]
+        load_batch = Mock(return_value={1: "a", 2: "b"})
+        loader = BatchLoader()
+        loader.register(issues)
+
+        token = batch_loader.set(loader)
+        try:
+            result = [load(issue, load_batch) for issue in issues]
+        finally:
+            batch_loader.reset(token)
+
+        assert result == ["a", "b"]
+        load_batch.assert_called_once_with(issues)
+
+
+class TestPrefetchRelated:
+    """Test cases for the prefetch_related function."""
+
+    @patch("apps.common.loaders.models.prefetch_related_objects")
+    def test_without_active_loader(self, mock_prefetch_related_objects):
+        """Test that nothing is prefetched outside of a request."""
+        issue = Issue(id=1)
+
+        assert prefetch_related(issue, "author") is issue
+        mock_prefetch_related_objects.assert_not_called()
+
+    @patch("apps.common.loaders.models.prefetch_related_objects")
+    def test_with_active_loader(self, mock_prefetch_related_objects):
+        """Test that relations are prefetched once for sibling instances."""
+        issues = [Issue(id=1), Issue(id=2)]
+        loader = BatchLoader()
+        loader.register(issues)
+
+        token = batch_loader.set(loader)
+        try:
+            for issue in issues:
+                prefetch_related(issue, "author")
+                prefetch_related(issue, "repository__organization")
+        finally:
+            batch_loader.reset(token)
+
+        assert mock_prefetch_related_objects.call_count == 2
+        mock_prefetch_related_objects.assert_any_call(issues, "author")
+        mock_prefetch_related_objects.assert_any_call(issues, "repository__organization")
+
+
+def test_group_by_batch_key():
+    """Test that items are grouped by their batch key preserving order."""
+    items = [Mock(batch_key=1), Mock(batch_key=2), Mock(batch_key=1)]
+
+    assert group_by_batch_key(items) == {1: [items[0], items[2]], 2: [items[1]]}
+
+
+def test_count_by():
+    """Test that items are counted per lookup value."""
+    queryset = MagicMock()
+    queryset.values.return_value.annotate.return_value.values_list.return_value = [(1, 3)]
+
+    assert count_by(queryset, "repository_id") == {1: 3}
+    queryset.values.assert_called_once_with("repository_id")
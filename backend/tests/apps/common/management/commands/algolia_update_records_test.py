@@ -0,0 +1,70 @@
+"""Test cases for the algolia_update_records command."""
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from algoliasearch.http.exceptions import AlgoliaException
+from django.core.management import call_command
+
+
+class TestUpdateRecordsCommand:
+    """Test cases for the algolia_update_records command."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        """Set up test environment."""
+        self.model = MagicMock()
+        self.index = MagicMock()
+        self.index.index_name = "test_issues"
+        self.index.sync_records.return_value = (2, 1)
+        with (
+            patch(
+                "apps.common.management.commands.algolia_update_records.algolia_engine"
+            ) as mock_algolia_engine,
+            patch(
+                "apps.common.management.commands.algolia_update_records.dirty_records"
+            ) as self.mock_dirty_records,
+        ):
+            mock_algolia_engine.get_registered_models.return_value = [self.model]
+            mock_algolia_engine.get_adapter.return_value = self.index
+            yield
+
+    def test_handle_dirty_records(self):
+        """Test pushing records changed since the last run."""
+        self.mock_dirty_records.pop.return_value = {1, 2, 3}
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            call_command("algolia_update_records")
+
+        self.mock_dirty_records.pop.assert_called_once_with(self.model)
+        self.index.sync_records.assert_called_once_with({1, 2, 3})
+        assert "test_issues --> 2 updated, 1 deleted" in fake_out.getvalue()
+
+    def test_handle_no_dirty_records(self):
+        """Test skipping indices without changed records."""
+        self.mock_dirty_records.pop.return_value = set()
+
+        with patch("sys.stdout", new=StringIO()):
+            call_command("algolia_update_records")
+
+        self.index.sync_records.assert_not_called()
+
+    def test_handle_all(self):
+        """Test checking all records."""
+        with patch("sys.stdout", new=StringIO()):
+            call_command("algolia_update_records", "--all")
+
+        self.mock_dirty_records.pop.assert_not_called()
+        self.index.sync_records.assert_called_once_with(None)
+
+    def test_handle_exception(self):
+        """Test changed records are kept when pushing fails."""
+        self.mock_dirty_records.pop.return_value = {1}
+        self.index.sync_records.side_effect = AlgoliaException("Error")
+
+        with patch("sys.stdout", new=StringIO()), pytest.raises(AlgoliaException):
+            call_command("algolia_update_records")
+
+        self.mock_dirty_records.add.assert_called_once_with(self.model, {1})
+        self.mock_dirty_records.flush.assert_called_once()
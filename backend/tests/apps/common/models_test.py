@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -33,6 +33,14 @@ class TestBulkSaveModel:
 
         assert len(mock_objects) == 0
 
+    def test_bulk_save_sends_post_bulk_save(self, mock_model, mock_objects):
+        saved_objects = list(mock_objects)
+
+        with patch("apps.common.models.post_bulk_save") as mock_post_bulk_save:
+            BulkSaveModel.bulk_save(mock_model, mock_objects)
+
+        mock_post_bulk_save.send.assert_called_once_with(sender=mock_model, objects=saved_objects)
+
     def test_bulk_save_default_fields(self, mock_model, mock_objects):
         BulkSaveModel.bulk_save(mock_model, mock_objects)
 
@@ -40,3 +48,31 @@ class TestBulkSaveModel:
         mock_model.objects.bulk_update.assert_called_once()
 
         assert len(mock_objects) == 0
+
+    def test_bulk_save_m2m(self):
+        field = MagicMock()
+        field.field.m2m_field_name.return_value = "issue"
+        field.field.m2m_reverse_field_name.return_value = "user"
+        through = field.through
+        through.objects.filter.return_value.values_list.return_value = [
+            (1, 10, 100),
+            (2, 10, 101),
+        ]
+        relations = {10: {100, 102}, 11: set()}
+
+        BulkSaveModel.bulk_save_m2m(field, relations)
+
+        assert "issue_id__in" in through.objects.filter.call_args_list[0][1]
+        through.objects.filter.assert_any_call(pk__in=[2])
+        through.objects.filter.return_value.delete.assert_called_once()
+        list(through.objects.bulk_create.call_args[0][0])
+        through.assert_called_once_with(issue_id=10, user_id=102)
+        assert through.objects.bulk_create.call_args[1]["ignore_conflicts"]
+        assert len(relations) == 0
+
+    def test_bulk_save_m2m_empty(self):
+        field = MagicMock()
+
+        BulkSaveModel.bulk_save_m2m(field, {})
+
+        field.through.objects.filter.assert_not_called()
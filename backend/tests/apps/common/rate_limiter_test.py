@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from apps.common.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    @patch("apps.common.rate_limiter.time")
+    def test_acquire_burst(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1, capacity=3)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        mock_time.sleep.assert_not_called()
+
+    @patch("apps.common.rate_limiter.time")
+    def test_acquire_waits_for_refill(self, mock_time):
+        now = [100.0]
+        mock_time.monotonic.side_effect = lambda: now[0]
+        mock_time.sleep.side_effect = lambda delay: now.__setitem__(0, now[0] + delay)
+        bucket = TokenBucket(rate=2, capacity=1)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_time.sleep.assert_called_once_with(0.5)
+        assert bucket.tokens == 0
+
+    @patch("apps.common.rate_limiter.time")
+    def test_pause(self, mock_time):
+        now = [100.0]
+        mock_time.monotonic.side_effect = lambda: now[0]
+        mock_time.sleep.side_effect = lambda delay: now.__setitem__(0, now[0] + delay)
+        bucket = TokenBucket(rate=2, capacity=3)
+
+        bucket.pause(30)
+        bucket.acquire()
+
+        mock_time.sleep.assert_called_once_with(30)
@@ -1,8 +1,51 @@
 """Tests for core index utilities."""
 
+from collections import defaultdict
 from unittest.mock import MagicMock, patch
 
-from apps.core.utils.index import DisableIndexing
+import pytest
+from django.db.models.signals import post_save
+
+from apps.common.models import post_bulk_save
+from apps.core.utils.index import DirtyRecords, DisableIndexing, dirty_records
+from apps.github.models.label import Label
+
+
+class FakeRedis:
+    """In-memory Redis sets with pipelines."""
+
+    def __init__(self):
+        self.sets = defaultdict(set)
+        self.commands = []
+
+    def delete(self, key):
+        return int(self.sets.pop(key, None) is not None)
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return [getattr(self, name)(*args) for name, args in commands]
+
+    def pipeline(self):
+        pipeline = MagicMock()
+        for name in ("delete", "sadd", "smembers"):
+            getattr(pipeline, name).side_effect = lambda *args, name=name: self.commands.append(
+                (name, args)
+            )
+        pipeline.execute.side_effect = self.execute
+        return pipeline
+
+    def sadd(self, key, *values):
+        self.sets[key].update(str(value).encode() for value in values)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+
+@pytest.fixture(autouse=True)
+def redis():
+    redis = FakeRedis()
+    with patch("apps.core.utils.index.get_redis_connection", return_value=redis):
+        yield redis
 
 
 class TestDisableIndexing:
@@ -36,3 +79,66 @@ class TestDisableIndexing:
             mock_register.assert_not_called()
 
         mock_register.assert_called_once()
+
+    @patch("apps.core.utils.index.DisableIndexing.unregister_indexes")
+    @patch("apps.core.utils.index.DisableIndexing.register_indexes")
+    @patch("apps.core.utils.index.algolia_engine")
+    def test_disable_indexing_tracks_changed_records(
+        self, mock_algolia_engine, mock_register, mock_unregister
+    ):
+        """Test that objects saved while indexing is disabled are tracked."""
+        mock_algolia_engine.is_registered.side_effect = lambda model: model is Label
+
+        with DisableIndexing(("github",)):
+            assert Label in dirty_records.models
+            post_save.send(sender=Label, instance=MagicMock(pk=1))
+            post_save.send(sender=Label, instance=MagicMock(pk=2))
+
+        assert Label not in dirty_records.models
+        assert dirty_records.pop(Label) == {1, 2}
+
+        post_save.send(sender=Label, instance=MagicMock(pk=3))
+        assert dirty_records.pop(Label) == set()
+
+
+class TestDirtyRecords:
+    """Test the DirtyRecords tracker."""
+
+    def test_add_flush_pop(self):
+        """Test that IDs are added to the Redis set on flush and cleared on pop."""
+        tracker = DirtyRecords()
+
+        tracker.add(Label, [1, 2])
+        assert tracker.pop(Label) == set()
+
+        tracker.flush()
+        tracker.add(Label, [2, 3])
+        tracker.flush()
+
+        assert tracker.pop(Label) == {1, 2, 3}
+        assert tracker.pop(Label) == set()
+
+    def test_flush_without_ids(self, redis):
+        """Test that flushing an empty buffer does not touch Redis."""
+        with patch.object(redis, "pipeline") as mock_pipeline:
+            DirtyRecords().flush()
+
+        mock_pipeline.assert_not_called()
+
+    @patch("apps.core.utils.index.algolia_engine")
+    def test_track_bulk_saved_records(self, mock_algolia_engine):
+        """Test that bulk saved indexable objects are tracked."""
+        mock_algolia_engine.is_registered.return_value = True
+
+        post_bulk_save.send(sender=Label, objects=[MagicMock(pk=1), MagicMock(pk=None)])
+
+        assert dirty_records.pop(Label) == {1}
+
+    @patch("apps.core.utils.index.algolia_engine")
+    def test_track_bulk_saved_records_not_indexed(self, mock_algolia_engine):
+        """Test that bulk saved objects of not indexed models are ignored."""
+        mock_algolia_engine.is_registered.return_value = False
+
+        post_bulk_save.send(sender=Label, objects=[MagicMock(pk=1)])
+
+        assert dirty_records.pop(Label) == set()
@@ -1,8 +1,12 @@
 """Test cases for IssueNode."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import pytest
+
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.issue import IssueNode
+from apps.github.models.issue import Issue
 
 
 class TestIssueNode:
@@ -88,3 +92,29 @@ class TestIssueNode:
 
         result = IssueNode.repository_name(mock_issue)
         assert result is None
+
+    @pytest.mark.parametrize(
+        ("field", "load_batch", "loaded", "expected"),
+        [
+            ("interested_users", "load_interested_users", {1: ["user"]}, [["user"], []]),
+            ("is_merged", "load_merged_issue_ids", {1: True}, [True, False]),
+            ("pull_requests", "load_pull_requests", {2: ["pr"]}, [[], ["pr"]]),
+        ],
+    )
+    def test_batched_fields(self, field, load_batch, loaded, expected):
+        """Test fields are loaded once for sibling issues."""
+        issues = [Mock(spec=Issue, id=i, pk=i) for i in (1, 2)]
+        loader = BatchLoader()
+        loader.register(issues)
+
+        token = batch_loader.set(loader)
+        try:
+            with patch(
+                f"apps.github.api.internal.nodes.issue.{load_batch}", return_value=loaded
+            ) as mock_load_batch:
+                result = [getattr(IssueNode, field)(issue) for issue in issues]
+        finally:
+            batch_loader.reset(token)
+
+        assert result == expected
+        mock_load_batch.assert_called_once_with(issues)
@@ -2,10 +2,12 @@
 
 from unittest.mock import Mock, patch
 
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.organization import (
     OrganizationNode,
     OrganizationStatsNode,
 )
+from apps.github.models.organization import Organization
 
 
 class TestOrganizationNode:
@@ -51,34 +53,29 @@ class TestOrganizationNode:
     @patch("apps.github.models.repository_contributor.RepositoryContributor.objects")
     def test_stats_method_with_data(self, mock_repo_contributor_objects, mock_repository_objects):
         """Test stats method with actual data."""
-        # Mock repository queryset
-        mock_repositories = Mock()
-        mock_repositories.count.return_value = 5
-        mock_repositories.aggregate.return_value = {
-            "total_stars": 100,
-            "total_forks": 50,
-            "total_issues": 25,
-        }
-        mock_repository_objects.filter.return_value = mock_repositories
-
-        # Mock repository contributor queryset
-        mock_contributors = Mock()
-        mock_contributors.values.return_value.distinct.return_value.count.return_value = 15
-        mock_repo_contributor_objects.filter.return_value = mock_contributors
-
-        # Create mock organization
-        mock_organization = Mock()
+        mock_repository_objects.filter.return_value.values.return_value.annotate.return_value = [
+            {
+                "organization_id": 1,
+                "total_repositories": 5,
+                "total_stars": 100,
+                "total_forks": 50,
+                "total_issues": 25,
+            }
+        ]
+        mock_contributors = mock_repo_contributor_objects.filter.return_value
+        mock_contributors.values.return_value.annotate.return_value.values_list.return_value = [
+            (1, 15)
+        ]
+
+        result = OrganizationNode.stats(Mock(id=1, pk=1))
 
-        # Call stats method
-        result = OrganizationNode.stats(mock_organization)
-
-        # Verify result
         assert isinstance(result, OrganizationStatsNode)
         assert result.total_repositories == 5
         assert result.total_contributors == 15
         assert result.total_stars == 100
         assert result.total_forks == 50
         assert result.total_issues == 25
+        mock_repository_objects.filter.assert_called_once_with(organization_id__in=[1])
 
     @patch("apps.github.models.repository.Repository.objects")
     @patch("apps.github.models.repository_contributor.RepositoryContributor.objects")
@@ -86,28 +83,22 @@ class TestOrganizationNode:
         self, mock_repo_contributor_objects, mock_repository_objects
     ):
         """Test stats method when aggregate returns None values."""
-        # Mock repository queryset
-        mock_repositories = Mock()
-        mock_repositories.count.return_value = 3
-        mock_repositories.aggregate.return_value = {
-            "total_stars": None,
-            "total_forks": None,
-            "total_issues": None,
-        }
-        mock_repository_objects.filter.return_value = mock_repositories
-
-        # Mock repository contributor queryset
-        mock_contributors = Mock()
-        mock_contributors.values.return_value.distinct.return_value.count.return_value = 8
-        mock_repo_contributor_objects.filter.return_value = mock_contributors
+        mock_repository_objects.filter.return_value.values.return_value.annotate.return_value = [
+            {
+                "organization_id": 1,
+                "total_repositories": 3,
+                "total_stars": None,
+                "total_forks": None,
+                "total_issues": None,
+            }
+        ]
+        mock_contributors = mock_repo_contributor_objects.filter.return_value
+        mock_contributors.values.return_value.annotate.return_value.values_list.return_value = [
+            (1, 8)
+        ]
+
+        result = OrganizationNode.stats(Mock(id=1, pk=1))
 
-        # Create mock organization
-        mock_organization = Mock()
-
-        # Call stats method
-        result = OrganizationNode.stats(mock_organization)
-
-        # Verify result with default values
         assert isinstance(result, OrganizationStatsNode)
         assert result.total_repositories == 3
         assert result.total_contributors == 8
@@ -115,6 +106,38 @@ class TestOrganizationNode:
         assert result.total_forks == 0
         assert result.total_issues == 0
 
+    @patch("apps.github.models.repository.Repository.objects")
+    @patch("apps.github.models.repository_contributor.RepositoryContributor.objects")
+    def test_stats_method_batched(self, mock_repo_contributor_objects, mock_repository_objects):
+        """Test stats are loaded once for sibling organizations."""
+        mock_repository_objects.filter.return_value.values.return_value.annotate.return_value = [
+            {
+                "organization_id": 1,
+                "total_repositories": 2,
+                "total_stars": 10,
+                "total_forks": 5,
+                "total_issues": 1,
+            }
+        ]
+        mock_contributors = mock_repo_contributor_objects.filter.return_value
+        mock_contributors.values.return_value.annotate.return_value.values_list.return_value = [
+            (1, 4)
+        ]
+        organizations = [Mock(spec=Organization, id=i, pk=i) for i in (1, 2)]
+        loader = BatchLoader()
+        loader.register(organizations)
+
+        token = batch_loader.set(loader)
+        try:
+            result = [OrganizationNode.stats(organization) for organization in organizations]
+        finally:
+            batch_loader.reset(token)
+
+        assert [stats.total_repositories for stats in result] == [2, 0]
+        assert [stats.total_contributors for stats in result] == [4, 0]
+        mock_repository_objects.filter.assert_called_once_with(organization_id__in=[1, 2])
+        mock_repo_contributor_objects.filter.assert_called_once()
+
     def test_url_method(self):
         """Test url method."""
         mock_organization = Mock()
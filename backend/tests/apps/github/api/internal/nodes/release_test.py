@@ -1,9 +1,11 @@
 """Test cases for ReleaseNode."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.release import ReleaseNode
 from apps.github.api.internal.nodes.user import UserNode
+from apps.github.models.release import Release
 
 
 class TestReleaseNode:
@@ -73,35 +75,45 @@ class TestReleaseNode:
         result = ReleaseNode.organization_name(mock_release)
         assert result is None
 
-    def test_project_name_with_project(self):
+    @patch("apps.github.api.internal.nodes.release.Repository.get_projects")
+    def test_project_name_with_project(self, mock_get_projects):
         """Test project_name field when project exists."""
-        mock_release = Mock()
-        mock_repository = Mock()
+        mock_release = Mock(id=1, pk=1, repository_id=2)
         mock_project = Mock()
         mock_project.name = "OWASP Test Project"
-        mock_repository.project = mock_project
-        mock_release.repository = mock_repository
+        mock_get_projects.return_value = {2: mock_project}
 
         result = ReleaseNode.project_name(mock_release)
         assert result == " Test Project"  # OWASP prefix stripped
+        mock_get_projects.assert_called_once_with({2})
 
-    def test_project_name_without_project(self):
+    @patch("apps.github.api.internal.nodes.release.Repository.get_projects")
+    def test_project_name_without_project(self, mock_get_projects):
         """Test project_name field when project doesn't exist."""
-        mock_release = Mock()
-        mock_repository = Mock()
-        mock_repository.project = None
-        mock_release.repository = mock_repository
+        mock_release = Mock(id=1, pk=1, repository_id=2)
+        mock_get_projects.return_value = {}
 
         result = ReleaseNode.project_name(mock_release)
         assert result is None
 
-    def test_project_name_without_repository(self):
-        """Test project_name field when repository doesn't exist."""
-        mock_release = Mock()
-        mock_release.repository = None
-
-        result = ReleaseNode.project_name(mock_release)
-        assert result is None
+    @patch("apps.github.api.internal.nodes.release.Repository.get_projects")
+    def test_project_name_batched(self, mock_get_projects):
+        """Test project_name field loads projects once for sibling releases."""
+        mock_project = Mock()
+        mock_project.name = "OWASP Test Project"
+        mock_get_projects.return_value = {2: mock_project}
+        releases = [Mock(spec=Release, id=i, pk=i, repository_id=2 if i else 3) for i in range(3)]
+        loader = BatchLoader()
+        loader.register(releases)
+
+        token = batch_loader.set(loader)
+        try:
+            result = [ReleaseNode.project_name(release) for release in releases]
+        finally:
+            batch_loader.reset(token)
+
+        assert result == [None, " Test Project", " Test Project"]
+        mock_get_projects.assert_called_once_with({2, 3})
 
     def test_repository_name_with_repository(self):
         """Test repository_name field when repository exists."""
@@ -1,13 +1,15 @@
 """Test cases for RepositoryNode."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.issue import IssueNode
 from apps.github.api.internal.nodes.milestone import MilestoneNode
 from apps.github.api.internal.nodes.organization import OrganizationNode
 from apps.github.api.internal.nodes.release import ReleaseNode
 from apps.github.api.internal.nodes.repository import RepositoryNode
 from apps.github.api.internal.nodes.repository_contributor import RepositoryContributorNode
+from apps.github.models.repository import Repository
 
 
 class TestRepositoryNode:
@@ -101,18 +103,34 @@ class TestRepositoryNode:
         assert field is not None
         assert field.type is str
 
-    def test_issues_method(self):
+    @patch("apps.github.api.internal.nodes.repository.get_top_by")
+    def test_issues_method(self, mock_get_top_by):
         """Test issues method resolution."""
-        mock_repository = Mock()
-        mock_issues = Mock()
-        mock_issues.select_related.return_value.order_by.return_value.__getitem__ = Mock(
-            return_value=[]
-        )
-        mock_repository.issues = mock_issues
+        mock_issues = [Mock()]
+        mock_get_top_by.return_value = {1: mock_issues}
+
+        result = RepositoryNode.issues(Mock(id=1, pk=1))
+
+        assert result == mock_issues
+        _, key, ordering, limit = mock_get_top_by.call_args.args
+        assert (key, ordering, limit) == ("repository_id", ["-created_at"], 5)
 
-        RepositoryNode.issues(mock_repository)
-        mock_issues.select_related.assert_called_with("author")
-        mock_issues.select_related.return_value.order_by.assert_called_with("-created_at")
+    @patch("apps.github.api.internal.nodes.repository.get_top_by")
+    def test_issues_method_batched(self, mock_get_top_by):
+        """Test issues are loaded once for sibling repositories."""
+        mock_get_top_by.return_value = {1: ["issue-1"], 2: ["issue-2"]}
+        repositories = [Mock(spec=Repository, id=i, pk=i) for i in range(1, 4)]
+        loader = BatchLoader()
+        loader.register(repositories)
+
+        token = batch_loader.set(loader)
+        try:
+            result = [RepositoryNode.issues(repository) for repository in repositories]
+        finally:
+            batch_loader.reset(token)
+
+        assert result == [["issue-1"], ["issue-2"], []]
+        mock_get_top_by.assert_called_once()
 
     def test_languages_method(self):
         """Test languages method resolution."""
@@ -122,13 +140,14 @@ class TestRepositoryNode:
         result = RepositoryNode.languages(mock_repository)
         assert result == ["Python", "JavaScript"]
 
-    def test_latest_release_method(self):
+    @patch("apps.github.api.internal.nodes.repository.Repository.get_latest_releases")
+    def test_latest_release_method(self, mock_get_latest_releases):
         """Test latest_release method resolution."""
-        mock_repository = Mock()
-        mock_repository.latest_release = "v1.0.0"
+        mock_get_latest_releases.return_value = {1: "v1.0.0"}
 
-        result = RepositoryNode.latest_release(mock_repository)
+        result = RepositoryNode.latest_release(Mock(id=1, pk=1))
         assert result == "v1.0.0"
+        mock_get_latest_releases.assert_called_once_with([1])
 
     def test_organization_method(self):
         """Test organization method resolution."""
@@ -147,37 +166,36 @@ class TestRepositoryNode:
         result = RepositoryNode.owner_key(mock_repository)
         assert result == "test-owner"
 
-    def test_project_method(self):
+    @patch("apps.github.api.internal.nodes.repository.Repository.get_projects")
+    def test_project_method(self, mock_get_projects):
         """Test project method resolution."""
-        mock_repository = Mock()
         mock_project = Mock()
-        mock_repository.project = mock_project
+        mock_get_projects.return_value = {1: mock_project}
 
-        result = RepositoryNode.project(mock_repository)
+        result = RepositoryNode.project(Mock(id=1, pk=1))
         assert result == mock_project
+        mock_get_projects.assert_called_once_with([1])
 
-    def test_recent_milestones_method(self):
+    @patch("apps.github.api.internal.nodes.repository.get_top_by")
+    def test_recent_milestones_method(self, mock_get_top_by):
         """Test recent_milestones method resolution."""
-        mock_repository = Mock()
-        mock_milestones = Mock()
-        mock_milestones.select_related.return_value.order_by.return_value.__getitem__ = Mock(
-            return_value=[]
-        )
-        mock_repository.recent_milestones = mock_milestones
+        mock_get_top_by.return_value = {}
 
-        RepositoryNode.recent_milestones(mock_repository, limit=3)
-        mock_milestones.select_related.assert_called_with("repository")
-        mock_milestones.select_related.return_value.order_by.assert_called_with("-created_at")
+        result = RepositoryNode.recent_milestones(Mock(id=1, pk=1), limit=3)
 
-    def test_releases_method(self):
+        assert result == []
+        _, key, ordering, limit = mock_get_top_by.call_args.args
+        assert (key, ordering, limit) == ("repository_id", ["-created_at"], 3)
+
+    @patch("apps.github.api.internal.nodes.repository.get_top_by")
+    def test_releases_method(self, mock_get_top_by):
         """Test releases method resolution."""
-        mock_repository = Mock()
-        mock_releases = Mock()
-        mock_releases.order_by.return_value.__getitem__ = Mock(return_value=[])
-        mock_repository.published_releases = mock_releases
+        mock_get_top_by.return_value = {}
+
+        RepositoryNode.releases(Mock(id=1, pk=1))
 
-        RepositoryNode.releases(mock_repository)
-        mock_releases.order_by.assert_called_with("-published_at")
+        _, key, ordering, limit = mock_get_top_by.call_args.args
+        assert (key, ordering, limit) == ("repository_id", ["-published_at"], 5)
 
     def test_top_contributors_method(self):
         """Test top_contributors method resolution."""
@@ -1,9 +1,11 @@
 """Test cases for UserNode."""
 
 import math
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.user import UserNode
+from apps.github.models.user import User
 from apps.nest.api.internal.nodes.badge import BadgeNode
 
 
@@ -55,21 +57,41 @@ class TestUserNode:
         result = UserNode.created_at(mock_user)
         assert math.isclose(result, 1234567890.0)
 
-    def test_issues_count_field(self):
+    @patch("apps.github.api.internal.nodes.user.count_by")
+    def test_issues_count_field(self, mock_count_by):
         """Test issues_count field resolution."""
-        mock_user = Mock()
-        mock_user.idx_issues_count = 42
+        mock_count_by.return_value = {1: 42}
 
-        result = UserNode.issues_count(mock_user)
+        result = UserNode.issues_count(Mock(id=1, pk=1))
         assert result == 42
+        assert mock_count_by.call_args.args[1] == "author_id"
 
-    def test_releases_count_field(self):
+    @patch("apps.github.api.internal.nodes.user.count_by")
+    def test_releases_count_field(self, mock_count_by):
         """Test releases_count field resolution."""
-        mock_user = Mock()
-        mock_user.idx_releases_count = 15
+        mock_count_by.return_value = {1: 15}
 
-        result = UserNode.releases_count(mock_user)
+        result = UserNode.releases_count(Mock(id=1, pk=1))
         assert result == 15
+        assert mock_count_by.call_args.args[1] == "author_id"
+
+    @patch("apps.github.api.internal.nodes.user.count_by")
+    def test_counts_batched(self, mock_count_by):
+        """Test counts are loaded once for sibling users."""
+        mock_count_by.return_value = {1: 5}
+        users = [Mock(spec=User, id=i, pk=i) for i in (1, 2)]
+        loader = BatchLoader()
+        loader.register(users)
+
+        token = batch_loader.set(loader)
+        try:
+            issues_counts = [UserNode.issues_count(user) for user in users]
+            releases_counts = [UserNode.releases_count(user) for user in users]
+        finally:
+            batch_loader.reset(token)
+
+        assert issues_counts == releases_counts == [5, 0]
+        assert mock_count_by.call_count == 2
 
     def test_updated_at_field(self):
         """Test updated_at field resolution."""
@@ -87,53 +109,49 @@ class TestUserNode:
         result = UserNode.url(mock_user)
         assert result == "https://github.com/testuser"
 
-    def test_badge_count_field(self):
+    @patch("apps.github.api.internal.nodes.user.UserBadge.objects")
+    def test_badge_count_field(self, mock_user_badge_objects):
         """Test badge_count field resolution."""
-        mock_user = Mock()
-        mock_badges_queryset = Mock()
-        mock_badges_queryset.filter.return_value.count.return_value = 3
-        mock_user.user_badges = mock_badges_queryset
+        mock_filter = mock_user_badge_objects.filter.return_value
+        mock_filter.values.return_value.annotate.return_value.values_list.return_value = [(1, 3)]
 
-        result = UserNode.badge_count(mock_user)
+        result = UserNode.badge_count(Mock(id=1, pk=1))
         assert result == 3
-        mock_badges_queryset.filter.assert_called_once_with(is_active=True)
-        mock_badges_queryset.filter.return_value.count.assert_called_once()
+        mock_user_badge_objects.filter.assert_called_once_with(is_active=True, user_id__in=[1])
+        mock_filter.values.assert_called_once_with("user_id")
 
-    def test_badges_field_empty(self):
+    @patch("apps.github.api.internal.nodes.user.UserBadge.objects")
+    def test_badges_field_empty(self, mock_user_badge_objects):
         """Test badges field resolution with no badges."""
-        mock_user = Mock()
-        mock_badges_queryset = Mock()
-        mock_filter = mock_badges_queryset.filter.return_value
+        mock_filter = mock_user_badge_objects.filter.return_value
         mock_select_related = mock_filter.select_related.return_value
-        mock_select_related.order_by.return_value = []
-        mock_user.user_badges = mock_badges_queryset
+        mock_select_related.order_by.return_value.annotate.return_value = []
 
-        result = UserNode.badges(mock_user)
+        result = UserNode.badges(Mock(id=1, pk=1))
         assert result == []
-        mock_badges_queryset.filter.assert_called_once_with(is_active=True)
+        mock_user_badge_objects.filter.assert_called_once_with(is_active=True, user_id__in=[1])
         mock_filter.select_related.assert_called_once_with("badge")
         mock_select_related.order_by.assert_called_once_with("badge__weight", "badge__name")
 
-    def test_badges_field_single_badge(self):
+    @patch("apps.github.api.internal.nodes.user.UserBadge.objects")
+    def test_badges_field_single_badge(self, mock_user_badge_objects):
         """Test badges field resolution with single badge."""
-        mock_user = Mock()
         mock_badge = Mock(spec=BadgeNode)
-        mock_user_badge = Mock()
+        mock_user_badge = Mock(batch_key=1)
         mock_user_badge.badge = mock_badge
 
-        mock_badges_queryset = Mock()
-        mock_filter = mock_badges_queryset.filter.return_value
+        mock_filter = mock_user_badge_objects.filter.return_value
         mock_select_related = mock_filter.select_related.return_value
-        mock_select_related.order_by.return_value = [mock_user_badge]
-        mock_user.user_badges = mock_badges_queryset
+        mock_select_related.order_by.return_value.annotate.return_value = [mock_user_badge]
 
-        result = UserNode.badges(mock_user)
+        result = UserNode.badges(Mock(id=1, pk=1))
         assert result == [mock_badge]
-        mock_badges_queryset.filter.assert_called_once_with(is_active=True)
+        mock_user_badge_objects.filter.assert_called_once_with(is_active=True, user_id__in=[1])
         mock_filter.select_related.assert_called_once_with("badge")
         mock_select_related.order_by.assert_called_once_with("badge__weight", "badge__name")
 
-    def test_badges_field_sorted_by_weight_and_name(self):
+    @patch("apps.github.api.internal.nodes.user.UserBadge.objects")
+    def test_badges_field_sorted_by_weight_and_name(self, mock_user_badge_objects):
         """Test badges field resolution with multiple badges sorted by weight and name."""
         # Create mock badges with different weights and names
         mock_badge_high_weight = Mock(spec=BadgeNode)
@@ -153,33 +171,29 @@ class TestUserNode:
         mock_badge_low_weight.name = "Low Weight Badge"
 
         # Create mock user badges
-        mock_user_badge_high = Mock()
+        mock_user_badge_high = Mock(batch_key=1)
         mock_user_badge_high.badge = mock_badge_high_weight
 
-        mock_user_badge_medium_a = Mock()
+        mock_user_badge_medium_a = Mock(batch_key=1)
         mock_user_badge_medium_a.badge = mock_badge_medium_weight_a
 
-        mock_user_badge_medium_b = Mock()
+        mock_user_badge_medium_b = Mock(batch_key=1)
         mock_user_badge_medium_b.badge = mock_badge_medium_weight_b
 
-        mock_user_badge_low = Mock()
+        mock_user_badge_low = Mock(batch_key=1)
         mock_user_badge_low.badge = mock_badge_low_weight
 
         # Set up the mock queryset to return badges in the expected sorted order
         # (lowest weight first, then by name for same weight)
-        mock_badges_queryset = Mock()
-        mock_filter = mock_badges_queryset.filter.return_value
+        mock_filter = mock_user_badge_objects.filter.return_value
         mock_select_related = mock_filter.select_related.return_value
-        mock_select_related.order_by.return_value = [
+        mock_select_related.order_by.return_value.annotate.return_value = [
             mock_user_badge_low,  # weight 10
             mock_user_badge_medium_a,  # weight 50, name "Medium Weight A"
             mock_user_badge_medium_b,  # weight 50, name "Medium Weight B"
             mock_user_badge_high,  # weight 100
         ]
-        mock_user = Mock()
-        mock_user.user_badges = mock_badges_queryset
-
-        result = UserNode.badges(mock_user)
+        result = UserNode.badges(Mock(id=1, pk=1))
 
         # Verify the badges are returned in the correct order
         expected_badges = [
@@ -191,7 +205,7 @@ class TestUserNode:
         assert result == expected_badges
 
         # Verify the queryset was called with correct ordering
-        mock_badges_queryset.filter.assert_called_once_with(is_active=True)
+        mock_user_badge_objects.filter.assert_called_once_with(is_active=True, user_id__in=[1])
         mock_filter.select_related.assert_called_once_with("badge")
         mock_select_related.order_by.assert_called_once_with("badge__weight", "badge__name")
 
@@ -192,6 +192,7 @@ class TestSyncRepository:
             gh_valid,
             repository=mock_common_deps["Repository"].update_data.return_value,
             user=valid_user,
+            save=False,
         )
         mock_common_deps["RepositoryContributor"].bulk_save.assert_called_once_with([gh_valid])
 
@@ -299,7 +300,10 @@ class TestSyncRepository:
         sync_repository(mock_gh_repository)
 
         mock_common_deps["User"].update_data.assert_any_call(gh_assignee)
-        mock_pr_instance.assignees.add.assert_called_once_with(mock_user_instance)
+        mock_common_deps["PullRequest"].bulk_save_m2m.assert_any_call(
+            mock_common_deps["PullRequest"].assignees,
+            {mock_pr_instance.id: {mock_user_instance.id}},
+        )
 
     def test_release_sync_stops_at_existing_release(
         self, mock_common_deps, mock_gh_repository, mock_repo
@@ -339,9 +343,10 @@ class TestSyncRepository:
         mock_gh_repository.get_issues.return_value = [gh_issue]
         gh_pr = gh_item_factory(milestone=gh_item_factory(), labels=[MagicMock()])
         mock_gh_repository.get_pulls.return_value = [gh_pr]
+        mock_label = MagicMock()
         mock_common_deps["Label"].update_data.side_effect = [
             UnknownObjectException(status=404, data={}, headers={}),
-            MagicMock(),
+            mock_label,
         ]
 
         sync_repository(
@@ -364,8 +369,17 @@ class TestSyncRepository:
             mock_common_deps["Milestone"].update_data.return_value.url,
         )
         mock_common_deps["Issue"].update_data.assert_called_once()
-        mock_common_deps["Issue"].update_data.return_value.assignees.add.assert_called_once_with(
-            mock_common_deps["User"].update_data.return_value
+        mock_common_deps["Issue"].bulk_save_m2m.assert_any_call(
+            mock_common_deps["Issue"].assignees,
+            {
+                mock_common_deps["Issue"].update_data.return_value.id: {
+                    mock_common_deps["User"].update_data.return_value.id
+                }
+            },
+        )
+        mock_common_deps["Milestone"].bulk_save_m2m.assert_called_once_with(
+            mock_common_deps["Milestone"].labels,
+            {mock_common_deps["Milestone"].update_data.return_value.id: set()},
         )
         mock_common_deps["PullRequest"].update_data.assert_called_once()
         mock_common_deps["Milestone"].update_data.assert_any_call(
@@ -373,4 +387,7 @@ class TestSyncRepository:
             author=mock_common_deps["User"].update_data.return_value,
             repository=mock_repo,
         )
-        mock_common_deps["PullRequest"].update_data.return_value.labels.add.assert_called_once()
+        mock_common_deps["PullRequest"].bulk_save_m2m.assert_any_call(
+            mock_common_deps["PullRequest"].labels,
+            {mock_common_deps["PullRequest"].update_data.return_value.id: {mock_label.id}},
+        )
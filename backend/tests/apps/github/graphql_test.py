@@ -0,0 +1,353 @@
+from base64 import b64decode
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+from github.GithubException import GithubException, UnknownObjectException
+
+from apps.github.graphql import (
+    GraphQLRepository,
+    parse_datetime,
+    to_label,
+    to_user,
+)
+
+USER_DATA = {
+    "avatarUrl": "https://avatars.githubusercontent.com/u/1",
+    "bio": "Bio",
+    "company": "OWASP",
+    "createdAt": "2020-01-01T00:00:00Z",
+    "databaseId": 1,
+    "email": "",
+    "followers": {"totalCount": 10},
+    "following": {"totalCount": 5},
+    "gists": {"totalCount": 2},
+    "id": "U_1",
+    "isHireable": True,
+    "location": "Earth",
+    "login": "user",
+    "name": "User",
+    "repositories": {"totalCount": 7},
+    "twitterUsername": None,
+    "updatedAt": "2024-01-01T00:00:00Z",
+}
+
+LABEL_DATA = {"color": "ff0000", "description": "Bug", "id": "LA_1", "name": "bug"}
+
+MILESTONE_DATA = {
+    "closedAt": None,
+    "closedIssues": {"totalCount": 1},
+    "closedPullRequests": {"totalCount": 2},
+    "createdAt": "2024-01-01T00:00:00Z",
+    "creator": {"__typename": "User", **USER_DATA},
+    "description": "Milestone",
+    "dueOn": None,
+    "id": "MI_1",
+    "number": 3,
+    "openIssues": {"totalCount": 4},
+    "openPullRequests": {"totalCount": 0},
+    "state": "OPEN",
+    "title": "v1",
+    "updatedAt": "2024-02-01T00:00:00Z",
+    "url": "https://github.com/OWASP/Nest/milestone/3",
+}
+
+REPOSITORY_DATA = {
+    "createdAt": "2020-01-01T00:00:00Z",
+    "defaultBranchRef": {"name": "main", "target": {"history": {"totalCount": 42}}},
+    "description": "Nest",
+    "diskUsage": 1024,
+    "forkCount": 3,
+    "fundingFile": {"text": "custom: https://owasp.org/donate\n"},
+    "hasIssuesEnabled": True,
+    "hasProjectsEnabled": False,
+    "hasWikiEnabled": True,
+    "homepageUrl": "https://nest.owasp.org",
+    "id": "R_1",
+    "isArchived": False,
+    "isFork": False,
+    "isTemplate": False,
+    "languages": {"edges": [{"node": {"name": "Python"}, "size": 100}]},
+    "licenseInfo": {"spdxId": "MIT"},
+    "name": "Nest",
+    "openIssues": {"totalCount": 5},
+    "openPullRequests": {"totalCount": 2},
+    "pushedAt": "2024-03-01T00:00:00Z",
+    "repositoryTopics": {"nodes": [{"topic": {"name": "owasp"}}]},
+    "stargazerCount": 100,
+    "updatedAt": "2024-03-01T00:00:00Z",
+    "watchers": {"totalCount": 9},
+}
+
+
+def connection(nodes, *, end_cursor=None, has_next_page=False):
+    return {
+        "nodes": nodes,
+        "pageInfo": {"endCursor": end_cursor, "hasNextPage": has_next_page},
+    }
+
+
+@pytest.fixture
+def mock_requester():
+    return mock.Mock()
+
+
+@pytest.fixture
+def gh_repository(mock_requester):
+    mock_requester.graphql_query.return_value = ({}, {"data": {"repository": REPOSITORY_DATA}})
+    mock_gh_repository = mock.Mock()
+    mock_gh_repository.full_name = "OWASP/Nest"
+
+    return GraphQLRepository(mock_gh_repository, mock_requester)
+
+
+def test_parse_datetime():
+    assert parse_datetime("2024-01-01T00:00:00Z") == datetime(2024, 1, 1, tzinfo=UTC)
+    assert parse_datetime(None) is None
+
+
+def test_to_label():
+    label = to_label(LABEL_DATA)
+
+    assert label.color == "ff0000"
+    assert label.name == "bug"
+    assert label.raw_data == {"node_id": "LA_1"}
+
+
+def test_to_user():
+    user = to_user(USER_DATA)
+
+    assert user.collaborators is None
+    assert user.followers == 10
+    assert user.hireable
+    assert user.login == "user"
+    assert user.public_gists == 2
+    assert user.public_repos == 7
+    assert user.raw_data == {"node_id": "U_1"}
+    assert user.type == "User"
+
+
+def test_to_user_bot():
+    user = to_user(
+        {
+            "__typename": "Bot",
+            "avatarUrl": "https://avatars.githubusercontent.com/u/2",
+            "createdAt": "2020-01-01T00:00:00Z",
+            "id": "BOT_1",
+            "login": "dependabot",
+            "updatedAt": "2020-01-01T00:00:00Z",
+        }
+    )
+
+    assert user.followers is None
+    assert user.type == "Bot"
+
+
+@pytest.mark.parametrize("data", [None, {}, {"login": "enterprise-user"}])
+def test_to_user_missing(data):
+    assert to_user(data) is None
+
+
+class TestGraphQLRepository:
+    def test_metadata(self, gh_repository, mock_requester):
+        mock_requester.graphql_query.assert_called_once()
+        assert mock_requester.graphql_query.call_args[0][1] == {"name": "Nest", "owner": "OWASP"}
+
+        assert gh_repository.default_branch == "main"
+        assert gh_repository.license.spdx_id == "MIT"
+        assert gh_repository.open_issues_count == 7
+        assert gh_repository.raw_data == {"node_id": "R_1"}
+        assert gh_repository.subscribers_count == 9
+        assert gh_repository.topics == ["owasp"]
+        assert gh_repository.get_commits().totalCount == 42
+        assert gh_repository.get_languages() == {"Python": 100}
+
+    def test_rest_fallback(self, gh_repository):
+        assert gh_repository.get_contributors() is (
+            gh_repository._gh_repository.get_contributors.return_value
+        )
+
+    def test_get_commits_empty_repository(self, gh_repository):
+        gh_repository._data = {**REPOSITORY_DATA, "defaultBranchRef": None}
+        commits = gh_repository.get_commits()
+
+        with pytest.raises(GithubException) as exc_info:
+            _ = commits.totalCount
+
+        assert exc_info.value.status == 409
+
+    def test_get_contents_funding_yml(self, gh_repository):
+        funding_yml = gh_repository.get_contents(".github/FUNDING.yml")
+
+        assert b64decode(funding_yml.content).decode() == "custom: https://owasp.org/donate\n"
+
+    def test_get_contents_funding_yml_missing(self, gh_repository):
+        gh_repository._data = {**REPOSITORY_DATA, "fundingFile": None}
+
+        with pytest.raises(UnknownObjectException):
+            gh_repository.get_contents(".github/FUNDING.yml")
+
+    def test_get_issues_pagination(self, gh_repository, mock_requester):
+        issue = {
+            "activeLockReason": "TOO_HEATED",
+            "assignees": {"nodes": [USER_DATA]},
+            "author": None,
+            "body": "Body",
+            "closedAt": None,
+            "comments": {"totalCount": 3},
+            "createdAt": "2024-01-01T00:00:00Z",
+            "databaseId": 10,
+            "id": "I_1",
+            "labels": {"nodes": [LABEL_DATA]},
+            "locked": True,
+            "milestone": MILESTONE_DATA,
+            "number": 1,
+            "state": "CLOSED",
+            "stateReason": "NOT_PLANNED",
+            "title": "Issue",
+            "updatedAt": "2024-01-02T00:00:00Z",
+            "url": "https://github.com/OWASP/Nest/issues/1",
+        }
+        mock_requester.graphql_query.side_effect = [
+            (
+                {},
+                {
+                    "data": {
+                        "repository": {
+                            "issues": connection([issue], end_cursor="c1", has_next_page=True)
+                        }
+                    }
+                },
+            ),
+            ({}, {"data": {"repository": {"issues": connection([issue])}}}),
+        ]
+
+        issues = list(gh_repository.get_issues())
+
+        assert len(issues) == 2
+        assert mock_requester.graphql_query.call_args[0][1]["after"] == "c1"
+        assert issues[0].active_lock_reason == "too heated"
+        assert issues[0].assignees[0].login == "user"
+        assert issues[0].comments == 3
+        assert issues[0].id == 10
+        assert issues[0].labels[0].name == "bug"
+        assert issues[0].milestone.closed_issues == 3
+        assert issues[0].milestone.open_issues == 4
+        assert issues[0].milestone.state == "open"
+        assert issues[0].pull_request is None
+        assert issues[0].state == "closed"
+        assert issues[0].state_reason == "not_planned"
+        assert issues[0].user is None
+
+    def test_get_issues_is_lazy(self, gh_repository, mock_requester):
+        mock_requester.graphql_query.reset_mock()
+
+        gh_repository.get_issues()
+
+        mock_requester.graphql_query.assert_not_called()
+
+    def test_get_milestone_labels(self, gh_repository, mock_requester):
+        mock_requester.graphql_query.return_value = (
+            {},
+            {"data": {"repository": {"milestones": connection([MILESTONE_DATA])}}},
+        )
+        milestone = next(gh_repository.get_milestones())
+
+        mock_requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "milestone": {
+                            "issues": connection(
+                                [
+                                    {"labels": {"nodes": [LABEL_DATA]}},
+                                    {"labels": {"nodes": [LABEL_DATA]}},
+                                ]
+                            )
+                        }
+                    }
+                }
+            },
+        )
+        labels = milestone.get_labels()
+
+        assert [label.name for label in labels] == ["bug"]
+        assert mock_requester.graphql_query.call_args[0][1]["number"] == 3
+
+    @pytest.mark.parametrize(
+        ("state", "expected_state"),
+        [("OPEN", "open"), ("CLOSED", "closed"), ("MERGED", "closed")],
+    )
+    def test_get_pulls(self, gh_repository, mock_requester, state, expected_state):
+        mock_requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "pullRequests": connection(
+                            [
+                                {
+                                    "assignees": {"nodes": []},
+                                    "author": {"__typename": "User", **USER_DATA},
+                                    "body": "Body",
+                                    "closedAt": None,
+                                    "createdAt": "2024-01-01T00:00:00Z",
+                                    "databaseId": 20,
+                                    "id": "PR_1",
+                                    "labels": {"nodes": []},
+                                    "mergedAt": None,
+                                    "milestone": None,
+                                    "number": 2,
+                                    "state": state,
+                                    "title": "PR",
+                                    "updatedAt": "2024-01-02T00:00:00Z",
+                                    "url": "https://github.com/OWASP/Nest/pull/2",
+                                }
+                            ]
+                        )
+                    }
+                }
+            },
+        )
+
+        pull_request = next(gh_repository.get_pulls())
+
+        assert pull_request.milestone is None
+        assert pull_request.raw_data == {"node_id": "PR_1"}
+        assert pull_request.state == expected_state
+        assert pull_request.user.login == "user"
+
+    def test_get_releases(self, gh_repository, mock_requester):
+        mock_requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "releases": connection(
+                            [
+                                {
+                                    "author": USER_DATA,
+                                    "createdAt": "2024-01-01T00:00:00Z",
+                                    "databaseId": 30,
+                                    "description": "Notes",
+                                    "id": "RE_1",
+                                    "isDraft": False,
+                                    "isPrerelease": True,
+                                    "name": "v1.0.0",
+                                    "publishedAt": "2024-01-01T00:00:00Z",
+                                    "tagName": "v1.0.0",
+                                }
+                            ]
+                        )
+                    }
+                }
+            },
+        )
+
+        release = next(gh_repository.get_releases())
+
+        assert release.body == "Notes"
+        assert release.prerelease
+        assert release.tag_name == "v1.0.0"
+        assert release.title == "v1.0.0"
@@ -0,0 +1,170 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+from github import Github
+from requests.structures import CaseInsensitiveDict
+
+from apps.github import http_cache
+from apps.github.http_cache import (
+    CachedHTTPSConnection,
+    ConditionalCacheAdapter,
+    HttpCacheStats,
+    get_cache_key,
+    get_expires_at,
+)
+
+URL = "https://raw.githubusercontent.com/OWASP/www-project-nest/main/index.md"
+
+
+def make_response(status_code, headers=None, content=b""):
+    response = requests.Response()
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.status_code = status_code
+    return response
+
+
+class TestConditionalCacheAdapter:
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        with patch("apps.github.http_cache.cache") as mock_cache:
+            storage = {}
+            mock_cache.get.side_effect = storage.get
+            mock_cache.set.side_effect = lambda key, value, **_: storage.update({key: value})
+            yield storage
+
+    @pytest.fixture(autouse=True)
+    def stats(self):
+        stats = HttpCacheStats()
+        with patch("apps.github.http_cache.stats", stats):
+            yield stats
+
+    @pytest.fixture
+    def request_(self):
+        return requests.Request("GET", URL).prepare()
+
+    def test_send_miss_and_not_modified(self, request_, stats):
+        adapter = ConditionalCacheAdapter()
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            side_effect=[
+                make_response(200, {"ETag": '"abc"'}, b"# Nest"),
+                make_response(304, {"ETag": '"abc"', "X-RateLimit-Remaining": "4999"}),
+            ],
+        ) as mock_send:
+            assert adapter.send(request_).text == "# Nest"
+
+            request_.headers.pop("If-None-Match", None)
+            response = adapter.send(request_)
+
+        assert response.status_code == requests.codes.ok
+        assert response.text == "# Nest"
+        assert response.headers["X-RateLimit-Remaining"] == "4999"
+        assert mock_send.call_args[0][0].headers["If-None-Match"] == '"abc"'
+        assert stats.counter == {"misses": 1, "not_modified": 1}
+
+    def test_send_fresh_hit(self, request_, stats):
+        adapter = ConditionalCacheAdapter()
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            return_value=make_response(
+                200, {"Cache-Control": "max-age=300", "ETag": '"abc"'}, b"# Nest"
+            ),
+        ) as mock_send:
+            adapter.send(request_)
+            response = adapter.send(request_)
+
+        mock_send.assert_called_once()
+        assert response.text == "# Nest"
+        assert stats.counter == {"hits": 1, "misses": 1}
+
+    def test_send_scoped_to_identity(self, request_, stats):
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            return_value=make_response(
+                200, {"Cache-Control": "max-age=300", "ETag": '"abc"'}, b"# Nest"
+            ),
+        ) as mock_send:
+            ConditionalCacheAdapter(identity="app:1:2").send(request_)
+            ConditionalCacheAdapter(identity="app:1:3").send(request_)
+
+        assert mock_send.call_count == 2
+        assert stats.counter == {"misses": 2}
+
+    def test_send_non_get_request(self, cache):
+        request = requests.Request("POST", URL, data="{}").prepare()
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            return_value=make_response(200, {"ETag": '"abc"'}),
+        ):
+            ConditionalCacheAdapter().send(request)
+
+        assert not cache
+
+    def test_send_without_validators(self, request_, cache):
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            return_value=make_response(200),
+        ):
+            ConditionalCacheAdapter().send(request_)
+
+        assert not cache
+
+
+@pytest.mark.parametrize(
+    ("cache_control", "is_fresh"),
+    [
+        ("private, max-age=60, s-maxage=60", True),
+        ("max-age=60, no-cache", False),
+        ("", False),
+    ],
+)
+def test_get_expires_at(cache_control, is_fresh):
+    assert (get_expires_at({"Cache-Control": cache_control}) > 0) is is_fresh
+
+
+def test_get_cache_key_uses_authorization_without_identity():
+    request = requests.Request("GET", URL, headers={"Authorization": "token a"}).prepare()
+    other_request = requests.Request("GET", URL, headers={"Authorization": "token b"}).prepare()
+
+    assert get_cache_key(request) != get_cache_key(other_request)
+    assert get_cache_key(request, identity="pat:1") == get_cache_key(
+        other_request, identity="pat:1"
+    )
+
+
+def test_cached_https_connection_uses_shared_session():
+    with patch("apps.github.http_cache.get_session") as mock_get_session:
+        connection = CachedHTTPSConnection("api.github.com", identity="pat:1", retry=3)
+        connection.close()
+
+    mock_get_session.assert_called_once_with(identity="pat:1", max_retries=3)
+    assert connection.session == mock_get_session.return_value
+    mock_get_session.return_value.close.assert_not_called()
+
+
+def test_stats_str():
+    stats = HttpCacheStats()
+    stats.increment("hits")
+    stats.increment("not_modified")
+
+    assert str(stats) == "1 hits, 0 misses, 1 not modified (304)"
+
+    stats.reset()
+    assert not stats.counter
+
+
+def test_install():
+    client = Github()
+    http_cache.install(client, "pat:1")
+
+    connection_class = client.requester._Requester__connectionClass
+    assert connection_class.func is CachedHTTPSConnection
+    assert connection_class.keywords == {"identity": "pat:1"}
+    assert http_cache.Requester._Requester__httpsConnectionClass is not CachedHTTPSConnection
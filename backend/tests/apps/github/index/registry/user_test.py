@@ -1,9 +1,10 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from django.db.models import Q
 
 from apps.github.index.registry.user import UserIndex
+from apps.github.models.repository import Repository
+from apps.github.models.repository_contributor import RepositoryContributor
 from apps.github.models.user import User
 
 
@@ -32,19 +33,69 @@ class TestUserIndex:
         UserIndex.update_synonyms()
         mock_reindex_synonyms.assert_called_once_with("github", "users")
 
-    @patch("apps.github.models.user.User.get_non_indexable_logins", return_value=["user2"])
-    def test_get_entities(self, mock_get_non_indexable_logins, user_index):
-        """Test that get_entities constructs the correct queryset by excluding.
-
-        bots and non-indexable users.
-        """
+    def test_get_entities(self, user_index):
+        """Test that get_entities returns indexable users only."""
         mock_user_manager = MagicMock()
-        mock_user_manager.exclude.return_value = "final_queryset"
+        mock_user_manager.indexable.return_value = "final_queryset"
 
         with patch.object(User, "objects", mock_user_manager):
             queryset = user_index.get_entities()
 
-            mock_user_manager.exclude.assert_called_once_with(
-                Q(is_bot=True) | Q(login__in=["user2"])
-            )
+            mock_user_manager.indexable.assert_called_once_with()
             assert queryset == "final_queryset"
+
+    @patch("apps.github.models.user.User.get_non_indexable_logins", return_value=set())
+    @patch("apps.github.index.registry.user.Repository.get_latest_releases")
+    @patch("apps.github.index.registry.user.RepositoryContributor")
+    @patch("apps.github.index.registry.user.Issue")
+    @patch("apps.github.index.registry.user.UserBadge")
+    def test_prefetch_index_fields(
+        self,
+        mock_user_badge,
+        mock_issue,
+        mock_repository_contributor,
+        mock_get_latest_releases,
+        mock_get_non_indexable_logins,
+        user_index,
+    ):
+        """Test that index fields are computed in bulk for a batch of users."""
+        user = User(id=1, login="user")
+        other_user = User(id=2, login="other-user")
+        repository = Repository(
+            id=10, key="Repo", name="repo", owner=User(login="OWASP"), stars_count=5
+        )
+        rc = RepositoryContributor(contributions_count=7, repository=repository, user_id=user.id)
+        release = MagicMock(summary="v1.0.0")
+
+        badges = mock_user_badge.objects.filter.return_value.values.return_value
+        badges.annotate.return_value.values_list.return_value = [(1, 2)]
+        issues = mock_issue.objects.filter.return_value.values.return_value
+        issues.annotate.return_value.values_list.return_value = [(2, 4)]
+        contributions = mock_repository_contributor.objects.filter.return_value
+        contributions = contributions.exclude.return_value.annotate.return_value
+        contributions = contributions.filter.return_value
+        contributions.order_by.return_value.select_related.return_value = [rc]
+        mock_get_latest_releases.return_value = {10: release}
+
+        user_index.prefetch_index_fields((user, other_user))
+
+        mock_get_latest_releases.assert_called_once_with({10})
+        assert user.idx_badge_count == 2
+        assert user.idx_issues_count == 0
+        assert user.idx_contributions == [
+            {
+                "contributions_count": 7,
+                "repository_contributors_count": 0,
+                "repository_description": "",
+                "repository_forks_count": 0,
+                "repository_key": "repo",
+                "repository_name": "repo",
+                "repository_latest_release": "v1.0.0",
+                "repository_license": "",
+                "repository_owner_key": "owasp",
+                "repository_stars_count": 5,
+            }
+        ]
+        assert other_user.idx_badge_count == 0
+        assert other_user.idx_issues_count == 4
+        assert other_user.idx_contributions == []
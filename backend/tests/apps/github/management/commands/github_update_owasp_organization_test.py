@@ -7,6 +7,7 @@ from apps.github.management.commands.github_update_owasp_organization import (
     Command,
     Committee,
     Project,
+    RateLimitBudget,
     Repository,
 )
 
@@ -23,6 +24,22 @@ from apps.github.management.commands.github_update_owasp_organization import (
                 "help": "The OWASP organization's repository name (e.g. Nest, www-project-nest')",
             },
         ),
+        (
+            "--workers",
+            {
+                "default": 1,
+                "required": False,
+                "type": int,
+                "help": "The number of repositories to sync concurrently",
+            },
+        ),
+        (
+            "--use-graphql",
+            {
+                "action": "store_true",
+                "help": "Fetch repository data using GitHub GraphQL API",
+            },
+        ),
     ],
 )
 def test_add_arguments(argument_name, expected_properties):
@@ -247,3 +264,101 @@ def test_handle_full_sync_with_errors_and_repo_linking(
         )
         mock_project_objects.all.assert_called_once()
         mock_project.repositories.add.assert_called_once_with(mock_project.owasp_repository)
+
+
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.connection")
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.Organization")
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.get_github_client")
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.sync_repository")
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.logger")
+def test_handle_concurrent_sync(
+    mock_logger,
+    mock_sync_repository,
+    mock_get_github_client,
+    mock_organization,
+    mock_connection,
+    command,
+):
+    mock_gh_client = mock.Mock()
+    mock_gh_client.rate_limiting = (5000, 5000)
+    mock_gh_client.rate_limiting_resettime = 0
+    mock_get_github_client.return_value = mock_gh_client
+    mock_org = mock.Mock()
+    mock_org.public_repos = 3
+    mock_gh_client.get_organization.return_value = mock_org
+
+    def create_mock_repo(name):
+        mock_repo = mock.Mock()
+        mock_repo.name = name
+        return mock_repo
+
+    class PaginatedListMock(list):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.totalCount = len(self)
+
+    mock_org.get_repos.return_value = PaginatedListMock(
+        [
+            create_mock_repo("www-project-test"),
+            create_mock_repo("www-chapter-error"),
+            create_mock_repo("www-committee-test"),
+        ]
+    )
+    mock_gh_client.get_repo.side_effect = lambda full_name: create_mock_repo(
+        full_name.removeprefix("OWASP/")
+    )
+
+    def sync_repository(gh_repository, organization=None):
+        if gh_repository.name == "www-chapter-error":
+            message = "Sync failed"
+            raise ValueError(message)
+        return organization, mock.Mock()
+
+    mock_sync_repository.side_effect = sync_repository
+
+    with (
+        mock.patch.object(Project, "bulk_save") as mock_project_bulk_save,
+        mock.patch.object(Chapter, "bulk_save") as mock_chapter_bulk_save,
+        mock.patch.object(Committee, "bulk_save") as mock_committee_bulk_save,
+        mock.patch.object(Project, "update_data") as mock_project_update,
+        mock.patch.object(Chapter, "update_data") as mock_chapter_update,
+        mock.patch.object(Committee, "update_data") as mock_committee_update,
+        mock.patch.object(Project, "objects") as mock_project_objects,
+        mock.patch.object(Repository, "objects") as mock_repository_objects,
+        mock.patch("builtins.print"),
+    ):
+        mock_project_objects.all.return_value = []
+        mock_repository_objects.filter.return_value.count.return_value = 3
+
+        command.handle(repository=None, offset=0, workers=2)
+
+        mock_organization.update_data.assert_called_once_with(mock_org)
+        assert mock_sync_repository.call_count == 3
+        for call in mock_sync_repository.call_args_list:
+            assert call.kwargs["organization"] == mock_organization.update_data.return_value
+
+        mock_logger.exception.assert_called_once_with(
+            "Error syncing repository %s", "https://github.com/OWASP/www-chapter-error"
+        )
+        mock_chapter_update.assert_not_called()
+        mock_project_bulk_save.assert_called_once_with([mock_project_update.return_value])
+        mock_chapter_bulk_save.assert_called_once_with([])
+        mock_committee_bulk_save.assert_called_once_with([mock_committee_update.return_value])
+        assert mock_connection.close.call_count == 3
+
+
+@mock.patch("apps.github.management.commands.github_update_owasp_organization.time")
+def test_rate_limit_budget_wait(mock_time):
+    mock_time.time.return_value = 100
+    mock_gh = mock.Mock()
+    mock_gh.rate_limiting = (10, 5000)
+    mock_gh.rate_limiting_resettime = 160
+
+    budget = RateLimitBudget(threshold=100)
+    budget.wait()
+    mock_time.sleep.assert_not_called()
+
+    budget.update(mock_gh)
+    budget.wait()
+    mock_time.sleep.assert_called_once_with(60)
+    assert budget.remaining is None
@@ -1,9 +1,15 @@
 from unittest import mock
 
 import pytest
+from django.db import IntegrityError
 from github.GithubException import UnknownObjectException
 
-from apps.github.models.common import GenericUserModel, NodeModel
+from apps.github.models.common import (
+    GenericUserModel,
+    IdentityMap,
+    NodeModel,
+    use_identity_map,
+)
 
 
 class TestGenericUserModel(GenericUserModel):
@@ -118,3 +124,98 @@ class TestNodeModelMethods:
             side_effect=UnknownObjectException(404, "Not Found")
         )
         assert TestNodeModel.get_node_id(mock_node) is None
+
+    def test_get_node_id_none(self):
+        assert TestNodeModel.get_node_id(None) is None
+
+
+class TestIdentityMap:
+    @pytest.fixture
+    def model(self):
+        class Model:
+            identity_fields = ("node_id",)
+            objects = mock.Mock()
+            _meta = mock.Mock()
+
+            def __init__(self, node_id, pk=None):
+                self.node_id = node_id
+                self.pk = pk
+
+        primary_key_field = mock.Mock(primary_key=True)
+        name_field = mock.Mock(auto_now_add=False, primary_key=False)
+        name_field.name = "name"
+        created_at_field = mock.Mock(auto_now_add=True, primary_key=False)
+        created_at_field.name = "nest_created_at"
+        Model._meta.concrete_fields = [primary_key_field, name_field, created_at_field]
+        Model._meta.get_field.return_value.attname = "node_id"
+        return Model
+
+    def test_get_loads_once(self, model):
+        instance = model("node-1")
+        model.objects.filter.return_value.first.return_value = instance
+        identity_map = IdentityMap()
+
+        assert identity_map.get(model, node_id="node-1") is instance
+        assert identity_map.get(model, node_id="node-1") is instance
+        model.objects.filter.assert_called_once_with(node_id="node-1")
+
+    def test_prefetch_node_ids(self, model):
+        instance = model("node-1")
+        model.objects.filter.return_value = [instance]
+        identity_map = IdentityMap()
+
+        identity_map.prefetch(model, node_ids=["node-1", "node-2", None])
+        identity_map.prefetch(model, node_ids=["node-1", "node-2"])
+
+        model.objects.filter.assert_called_once_with(node_id__in={"node-1", "node-2"})
+        assert identity_map.get(model, node_id="node-1") is instance
+        assert identity_map.get(model, node_id="node-2") is None
+
+    def test_save_defers_existing_instances(self, model):
+        identity_map = IdentityMap()
+        identity_map.save(model("node-1", pk=1))
+        model.objects.bulk_create.assert_not_called()
+
+        identity_map.flush()
+        model.objects.bulk_create.assert_called_once()
+        assert model.objects.bulk_create.call_args.kwargs["update_fields"] == ["name"]
+        assert model.objects.bulk_create.call_args.kwargs["unique_fields"] == ("node_id",)
+        assert not identity_map.pending
+
+    @mock.patch("apps.github.models.common.post_bulk_save")
+    def test_flush_sends_post_bulk_save(self, mock_post_bulk_save, model):
+        identity_map = IdentityMap()
+        instance = model("node-1", pk=1)
+        identity_map.save(instance)
+
+        identity_map.flush()
+
+        mock_post_bulk_save.send.assert_called_once_with(sender=model, objects=[instance])
+
+    def test_save_flushes_new_instances(self, model):
+        identity_map = IdentityMap()
+        instance = model("node-1")
+
+        identity_map.save(instance)
+
+        model.objects.bulk_create.assert_called_once()
+        assert list(model.objects.bulk_create.call_args.args[0]) == [instance]
+
+    def test_flush_error_drops_unsaved_instances(self, model):
+        identity_map = IdentityMap()
+        model.objects.bulk_create.side_effect = IntegrityError
+
+        with pytest.raises(IntegrityError):
+            identity_map.save(model("node-1"))
+
+        assert ("node-1",) not in identity_map.objects[model]
+
+    def test_use_identity_map(self):
+        assert IdentityMap.current() is None
+
+        with use_identity_map() as identity_map:
+            assert IdentityMap.current() is identity_map
+            with use_identity_map() as nested_identity_map:
+                assert nested_identity_map is identity_map
+
+        assert IdentityMap.current() is None
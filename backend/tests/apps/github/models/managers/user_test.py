@@ -0,0 +1,46 @@
+"""Tests for User managers."""
+
+from unittest import mock
+
+from apps.github.models.managers.user import UserManager, UserQuerySet
+
+
+class TestUserQuerySet:
+    def test_indexable_excludes_non_indexable_users(self):
+        """Tests that indexable excludes bots and non-indexable logins."""
+        mock_queryset = mock.Mock(spec=UserQuerySet)
+        mock_queryset.model = mock.Mock()
+        mock_queryset.model.get_non_indexable_logins.return_value = frozenset({"OWASP"})
+
+        UserQuerySet.indexable(mock_queryset)
+
+        mock_queryset.exclude.assert_called_once()
+        q_object = str(mock_queryset.exclude.call_args[0][0])
+        assert "is_bot" in q_object
+        assert "login__endswith" in q_object
+        assert "OWASP" in q_object
+
+
+class TestUserManager:
+    def test_get_queryset_returns_custom_queryset(self):
+        manager = UserManager()
+        manager.model = mock.Mock()
+        manager._db = None
+
+        with mock.patch("apps.github.models.managers.user.UserQuerySet") as mock_queryset_class:
+            result = manager.get_queryset()
+
+            mock_queryset_class.assert_called_once_with(manager.model, using=None)
+            assert result == mock_queryset_class.return_value
+
+    def test_indexable_delegates_to_queryset(self):
+        manager = UserManager()
+        manager.model = mock.Mock()
+
+        mock_queryset = mock.Mock()
+
+        with mock.patch.object(manager, "get_queryset", return_value=mock_queryset):
+            result = manager.indexable()
+
+            mock_queryset.indexable.assert_called_once()
+            assert result == mock_queryset.indexable.return_value
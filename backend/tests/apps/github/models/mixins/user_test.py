@@ -59,6 +59,12 @@ def user_index_mixin_instance():
 
 
 class TestUserIndexMixin:
+    @pytest.fixture(autouse=True)
+    def _clear_non_indexable_logins_cache(self):
+        User.clear_non_indexable_logins_cache()
+        yield
+        User.clear_non_indexable_logins_cache()
+
     @pytest.mark.parametrize(
         ("login", "expected_indexable"),
         [
@@ -76,6 +76,24 @@ class TestRepositoryModel:
         mock_gh_repository.latest_release = mock_release
         assert mock_gh_repository.latest_release == mock_release
 
+    @patch("apps.github.models.repository.Release.objects")
+    def test_get_latest_releases(self, mock_release_objects):
+        release = Mock(repository_id=1)
+        mock_release_objects.filter.return_value.order_by.return_value.distinct.return_value = [
+            release
+        ]
+
+        assert Repository.get_latest_releases({1, 2}) == {1: release}
+        mock_release_objects.filter.assert_called_once_with(
+            is_draft=False,
+            is_pre_release=False,
+            published_at__isnull=False,
+            repository_id__in={1, 2},
+        )
+        mock_release_objects.filter.return_value.order_by.assert_called_once_with(
+            "repository_id", "-published_at"
+        )
+
 
 class TestRepositoryFromGithub:
     @pytest.fixture(autouse=True)
@@ -1,6 +1,8 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from django.conf import settings
+from django.core.cache import cache
 
 from apps.github.models.user import User
 from apps.owasp.models.chapter import Chapter
@@ -9,6 +11,12 @@ from apps.owasp.models.project import Project
 
 
 class TestUserModel:
+    @pytest.fixture(autouse=True)
+    def _clear_non_indexable_logins_cache(self):
+        User.clear_non_indexable_logins_cache()
+        yield
+        User.clear_non_indexable_logins_cache()
+
     @pytest.mark.parametrize(
         ("name", "login", "expected_str"),
         [
@@ -70,6 +78,43 @@ class TestUserModel:
         mock_get.assert_called_once_with(node_id="67890")
         assert updated_user.node_id == "67890"
 
+    @patch("apps.github.models.user.IdentityMap.current")
+    def test_update_data_identity_map_unchanged_user(self, mock_current):
+        gh_user_mock = Mock(updated_at="2024-01-01T00:00:00Z")
+        gh_user_mock.raw_data = {"node_id": "12345"}
+        mock_user = Mock(spec=User, updated_at="2024-01-01T00:00:00Z")
+        mock_current.return_value.get.return_value = mock_user
+
+        assert User.update_data(gh_user_mock) is mock_user
+
+        mock_current.return_value.get.assert_called_once_with(User, node_id="12345")
+        mock_user.from_github.assert_not_called()
+        mock_current.return_value.save.assert_not_called()
+
+    @patch("apps.github.models.user.IdentityMap.current")
+    def test_update_data_identity_map_changed_user(self, mock_current):
+        gh_user_mock = Mock(updated_at="2024-02-01T00:00:00Z")
+        gh_user_mock.raw_data = {"node_id": "12345"}
+        mock_user = Mock(spec=User, updated_at="2024-01-01T00:00:00Z")
+        mock_current.return_value.get.return_value = mock_user
+
+        assert User.update_data(gh_user_mock) is mock_user
+
+        mock_user.from_github.assert_called_once_with(gh_user_mock)
+        mock_current.return_value.save.assert_called_once_with(mock_user)
+
+    @patch("apps.github.models.user.IdentityMap.current")
+    def test_update_data_identity_map_new_user(self, mock_current):
+        gh_user_mock = Mock()
+        gh_user_mock.raw_data = {"node_id": "67890"}
+        mock_current.return_value.get.return_value = None
+
+        with patch.object(User, "from_github"):
+            user = User.update_data(gh_user_mock)
+
+        assert user.node_id == "67890"
+        mock_current.return_value.save.assert_called_once_with(user)
+
     def test_issues_property(self):
         """Test the issues property."""
         user = User(login="test-user")
@@ -215,3 +260,33 @@ class TestUserModel:
             "org2",
         }
         assert User.get_non_indexable_logins() == expected_logins
+
+    @patch("apps.github.models.user.Organization.get_logins")
+    def test_get_non_indexable_logins_cache(self, mock_get_logins):
+        """Test that non-indexable logins are cached until the cache is cleared."""
+        mock_get_logins.return_value = {"org1"}
+        assert "org1" in User.get_non_indexable_logins()
+
+        mock_get_logins.return_value = {"org2"}
+        assert "org2" not in User.get_non_indexable_logins()
+        mock_get_logins.assert_called_once()
+
+        User.clear_non_indexable_logins_cache()
+        assert "org2" in User.get_non_indexable_logins()
+
+    @patch("apps.github.models.user.Organization.get_logins")
+    def test_get_non_indexable_logins_in_process_copy(self, mock_get_logins):
+        """Test that the in-process copy is reused until the cache version changes."""
+        mock_get_logins.return_value = {"org1"}
+        User.get_non_indexable_logins()
+
+        with patch("apps.github.models.user.cache.get_or_set") as mock_get_or_set:
+            assert "org1" in User.get_non_indexable_logins()
+            mock_get_or_set.assert_not_called()
+
+        # Another process clearing the cache only changes the shared version and logins.
+        mock_get_logins.return_value = {"org2"}
+        cache.delete(settings.GITHUB_NON_INDEXABLE_LOGINS_CACHE_KEY)
+        cache.set(settings.GITHUB_NON_INDEXABLE_LOGINS_VERSION_CACHE_KEY, "other-process")
+
+        assert "org2" in User.get_non_indexable_logins()
@@ -0,0 +1,18 @@
+from unittest.mock import patch
+
+from django.db.models.signals import post_delete, post_save
+
+from apps.common.models import post_bulk_save
+from apps.github.models.organization import Organization
+
+
+class TestOrganizationChangeHandler:
+    @patch("apps.github.signals.organization.User.clear_non_indexable_logins_cache")
+    def test_organization_change_clears_cache(self, mock_clear_cache):
+        """Test that organization changes clear non-indexable logins cache."""
+        post_bulk_save.send(sender=Organization, objects=[])
+        for signal in (post_delete, post_save):
+            # Other receivers (e.g. Algolia indexing) expect a real instance.
+            signal.send_robust(sender=Organization, instance=None)
+
+        assert mock_clear_cache.call_count == 3
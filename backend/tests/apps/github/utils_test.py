@@ -9,6 +9,7 @@ from apps.github.utils import (
     get_repository_file_content,
     get_repository_path,
     normalize_url,
+    use_file_content_cache,
 )
 
 
@@ -59,16 +60,44 @@ class TestUtils:
         content = "Hello, World!"
         response = MagicMock()
         response.text = content
-        mocker.patch("requests.get", return_value=response)
+        mocker.patch("apps.github.utils.get_session").return_value.get.return_value = response
         result = get_repository_file_content(url)
         assert result == content
 
     def test_get_repository_file_content_exception(self, mocker):
         url = "https://example.com/file.txt"
-        mocker.patch("requests.get", side_effect=RequestException("Test exception"))
+        mocker.patch(
+            "apps.github.utils.get_session"
+        ).return_value.get.side_effect = RequestException("Test exception")
         result = get_repository_file_content(url)
         assert result == ""
 
+    def test_get_repository_file_content_cache(self, mocker):
+        url = "https://example.com/file.txt"
+        mock_get = mocker.patch("apps.github.utils.get_session").return_value.get
+        mock_get.return_value.text = "Hello, World!"
+
+        with use_file_content_cache() as file_content_cache:
+            assert get_repository_file_content(url) == "Hello, World!"
+            with use_file_content_cache():
+                assert get_repository_file_content(url) == "Hello, World!"
+
+        assert file_content_cache == {url: "Hello, World!"}
+        mock_get.assert_called_once_with(url, timeout=30)
+
+        get_repository_file_content(url)
+        assert mock_get.call_count == 2
+
+    def test_get_repository_file_content_cache_exception(self, mocker):
+        url = "https://example.com/file.txt"
+        mock_get = mocker.patch("apps.github.utils.get_session").return_value.get
+        mock_get.side_effect = RequestException("Test exception")
+
+        with use_file_content_cache() as file_content_cache:
+            assert get_repository_file_content(url) == ""
+
+        assert not file_content_cache
+
     @pytest.mark.parametrize(
         ("url", "expected"),
         [
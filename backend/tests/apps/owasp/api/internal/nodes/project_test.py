@@ -1,5 +1,10 @@
 """Test cases for ProjectNode."""
 
+from unittest.mock import Mock, patch
+
+import pytest
+
+from apps.common.loaders import BatchLoader, batch_loader
 from apps.github.api.internal.nodes.issue import IssueNode
 from apps.github.api.internal.nodes.milestone import MilestoneNode
 from apps.github.api.internal.nodes.pull_request import PullRequestNode
@@ -7,6 +12,7 @@ from apps.github.api.internal.nodes.release import ReleaseNode
 from apps.github.api.internal.nodes.repository import RepositoryNode
 from apps.owasp.api.internal.nodes.project import ProjectNode
 from apps.owasp.api.internal.nodes.project_health_metrics import ProjectHealthMetricsNode
+from apps.owasp.models.project import Project
 
 
 class TestProjectNode:
@@ -144,3 +150,36 @@ class TestProjectNode:
         assert result["releases"] == 10
         assert result["total"] == 185
         assert "pull_requests" not in result
+
+    @pytest.mark.parametrize(
+        ("field_name", "loader_name", "default"),
+        [
+            ("issues_count", "count_by", 0),
+            ("recent_issues", "get_top_by", []),
+            ("recent_milestones", "get_top_by", []),
+            ("recent_pull_requests", "get_top_by", []),
+            ("recent_releases", "get_top_by", []),
+            ("repositories", "group_by", []),
+            ("repositories_count", "count_by", 0),
+        ],
+    )
+    def test_batched_fields(self, field_name, loader_name, default):
+        """Test related data is loaded once for sibling projects."""
+        projects = [Mock(spec=Project, id=i, pk=i) for i in (1, 2)]
+        loader = BatchLoader()
+        loader.register(projects)
+        resolver = self._get_field_by_name(field_name).base_resolver.wrapped_func
+
+        token = batch_loader.set(loader)
+        try:
+            with patch(
+                f"apps.owasp.api.internal.nodes.project.{loader_name}",
+                return_value={1: "value"},
+            ) as mock_loader:
+                result = [resolver(project) for project in projects]
+        finally:
+            batch_loader.reset(token)
+
+        assert result == ["value", default]
+        mock_loader.assert_called_once()
+        assert mock_loader.call_args.args[1] in {"project", "repository__project"}
@@ -1,7 +1,9 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from apps.github.models.repository import Repository
+from apps.github.models.user import User
 from apps.owasp.index.registry.project import ProjectIndex
 from apps.owasp.models.project import Project
 
@@ -50,9 +52,83 @@ class TestProjectIndex:
             mock_manager.prefetch_related.assert_called_once_with(
                 "organizations",
                 "repositories",
+                "repositories__owner",
             )
             mock_manager.prefetch_related.return_value.filter.assert_called_once_with(
                 organizations__isnull=False
             )
             mock_manager.prefetch_related.return_value.filter.return_value.distinct.assert_called_once()
             assert queryset == "final_queryset"
+
+    @patch("apps.owasp.index.registry.project.settings")
+    @patch("apps.owasp.index.registry.project.ProjectHealthMetrics")
+    @patch("apps.owasp.index.registry.project.RepositoryContributor")
+    @patch("apps.owasp.index.registry.project.Repository.get_latest_releases")
+    @patch("apps.owasp.index.registry.project.Issue")
+    def test_prefetch_index_fields(
+        self,
+        mock_issue,
+        mock_get_latest_releases,
+        mock_repository_contributor,
+        mock_project_health_metrics,
+        mock_settings,
+        project_index,
+    ):
+        """Test that index fields are computed in bulk for a batch of projects."""
+        mock_settings.IS_PRODUCTION_ENVIRONMENT = False
+        owner = User(login="OWASP")
+        repositories = [
+            Repository(id=i, key=f"Repo-{i}", name=f"repo-{i}", owner=owner, stars_count=i)
+            for i in range(1, 6)
+        ]
+        project = Project(id=1, key="www-project-test")
+        other_project = Project(id=2, key="www-project-other")
+        release = MagicMock(summary="v1.0.0")
+
+        issues = mock_issue.open_issues.filter.return_value.values.return_value
+        issues.annotate.return_value.values_list.return_value = [(1, 2), (5, 3)]
+        mock_get_latest_releases.return_value = {5: release}
+        contributors = mock_repository_contributor.objects.by_humans.return_value
+        contributors = contributors.to_community_repositories.return_value.annotate.return_value
+        contributors = contributors.filter.return_value.filter.return_value
+        contributors.values.return_value.annotate.return_value.order_by.return_value = [
+            {
+                "project_key": "www-project-www-project-test",
+                "total_contributions": 10,
+                "user__avatar_url": "https://example.com/avatar.png",
+                "user__login": "user",
+                "user__name": "User",
+            }
+        ]
+        health_metrics = mock_project_health_metrics.objects.filter.return_value
+        health_metrics = health_metrics.order_by.return_value
+        health_metrics.distinct.return_value.values_list.return_value = [(1, 75.0)]
+
+        with patch.object(Project, "repositories", new_callable=PropertyMock) as mock_prop:
+            mock_prop.return_value.all.side_effect = [repositories, []]
+            project_index.prefetch_index_fields((project, other_project))
+
+        mock_get_latest_releases.assert_called_once_with({2, 3, 4, 5})
+        assert project.idx_health_score == 75.0
+        assert project.idx_issues_count == 5
+        assert [r["key"] for r in project.idx_repositories] == [
+            "repo-5",
+            "repo-4",
+            "repo-3",
+            "repo-2",
+        ]
+        assert project.idx_repositories[0]["latest_release"] == "v1.0.0"
+        assert project.idx_repositories[0]["owner_key"] == "owasp"
+        assert project.idx_repositories[1]["latest_release"] == ""
+        assert project.idx_top_contributors == [
+            {
+                "avatar_url": "https://example.com/avatar.png",
+                "contributions_count": 10,
+                "login": "user",
+                "name": "User",
+            }
+        ]
+        assert other_project.idx_health_score is None
+        assert other_project.idx_issues_count == 0
+        assert other_project.idx_repositories == []
+        assert other_project.idx_top_contributors == []
@@ -78,8 +78,8 @@ class TestProjectModel:
         mock_save.assert_called_once_with(update_fields=("is_active",))
 
     @patch("apps.owasp.models.project.Project.objects.get")
-    @patch("apps.github.utils.requests.get")
-    def test_update_data_project_does_not_exist(self, mock_requests_get, mock_get):
+    @patch("apps.github.utils.get_session")
+    def test_update_data_project_does_not_exist(self, mock_get_session, mock_get):
         """Test updating project data when the project doesn't exist."""
         mock_get.side_effect = Project.DoesNotExist
 
@@ -88,7 +88,7 @@ class TestProjectModel:
         # Project Title
         Some project description
         """
-        mock_requests_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         # Setup test data
         gh_repository_mock = Mock()
@@ -0,0 +1,42 @@
+"""Test cases for the generate_sitemap command."""
+
+from datetime import UTC, datetime
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from apps.sitemap.utils import get_cache_key
+from apps.sitemap.views.base import BaseSitemap
+
+
+class ItemSitemap(BaseSitemap):
+    limit = 1
+    prefix = "/items"
+
+    def items(self):
+        return [
+            MagicMock(nest_key="a", updated_at=datetime(2025, 1, 1, tzinfo=UTC)),
+            MagicMock(nest_key="b", updated_at=datetime(2025, 1, 2, tzinfo=UTC)),
+        ]
+
+
+class TestGenerateSitemapCommand:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    @patch("apps.sitemap.management.commands.generate_sitemap.sitemaps", {"items": ItemSitemap})
+    def test_handle(self):
+        with patch("sys.stdout", new=StringIO()) as mock_stdout:
+            call_command("generate_sitemap")
+
+        assert b"<sitemapindex" in cache.get(get_cache_key("/sitemap.xml"))
+        assert b"/items/a" in cache.get(get_cache_key("/sitemap/items.xml", 1))
+        assert b"/items/b" in cache.get(get_cache_key("/sitemap/items.xml", 2))
+        assert cache.get(get_cache_key("/sitemap/items.xml", 3)) is None
+        assert "items: 2 page(s), 2 URL(s)" in mock_stdout.getvalue()
@@ -0,0 +1,64 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from django.conf import settings
+
+from apps.sitemap.utils import (
+    SITEMAP_CHUNK_SIZE,
+    get_cache_key,
+    get_section_path,
+    iter_urlset,
+    render_url,
+)
+from apps.sitemap.views.base import BaseSitemap
+
+
+class ItemSitemap(BaseSitemap):
+    prefix = "/items"
+
+
+def test_get_cache_key():
+    assert get_cache_key("/sitemap.xml") == f"{settings.SITEMAP_CACHE_PREFIX}-/sitemap.xml-1"
+    assert get_cache_key("/sitemap.xml", 2) == f"{settings.SITEMAP_CACHE_PREFIX}-/sitemap.xml-2"
+
+
+def test_get_section_path():
+    assert get_section_path("members") == "/sitemap/members.xml"
+
+
+def test_render_url():
+    item = MagicMock(nest_key="a&b", updated_at=datetime(2025, 1, 1, tzinfo=UTC))
+
+    assert render_url(ItemSitemap(), item) == (
+        "  <url>\n"
+        f"    <loc>{settings.SITE_URL}/items/a&amp;b</loc>\n"
+        "    <lastmod>2025-01-01T00:00:00+00:00</lastmod>\n"
+        "    <changefreq>weekly</changefreq>\n"
+        "    <priority>0.7</priority>\n"
+        "  </url>\n"
+    )
+
+
+def test_render_url_without_lastmod():
+    item = MagicMock(nest_key="a", updated_at=None, created_at=None)
+
+    assert "<lastmod>" not in render_url(ItemSitemap(), item)
+
+
+def test_iter_urlset_chunks():
+    sitemap = ItemSitemap()
+    items = [
+        MagicMock(nest_key=str(i), updated_at=datetime(2025, 1, 1, tzinfo=UTC))
+        for i in range(SITEMAP_CHUNK_SIZE + 1)
+    ]
+    paginator = MagicMock()
+    paginator.page.return_value.object_list = items
+
+    chunks = list(iter_urlset({sitemap: paginator}))
+
+    paginator.page.assert_called_once_with(1)
+    assert len(chunks) == 4
+    assert chunks[0].startswith('<?xml version="1.0" encoding="utf-8"?>')
+    assert chunks[1].count("<url>") == SITEMAP_CHUNK_SIZE
+    assert chunks[2].count("<url>") == 1
+    assert chunks[3] == "</urlset>\n"
@@ -1,24 +1,66 @@
-from http import HTTPStatus
-from unittest.mock import patch
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
 
-from django.http import HttpResponse
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.test import RequestFactory
 
-from apps.sitemap.views import StaticSitemap, cached_sitemap_view
+from apps.sitemap.utils import get_cache_key
+from apps.sitemap.views import cached_sitemap_index_view, cached_sitemap_view
+from apps.sitemap.views.base import BaseSitemap
+
+
+class ItemSitemap(BaseSitemap):
+    limit = 1
+    prefix = "/items"
+
+    def items(self):
+        return [
+            MagicMock(nest_key="a", updated_at=datetime(2025, 1, 1, tzinfo=UTC)),
+            MagicMock(nest_key="b", updated_at=datetime(2025, 1, 2, tzinfo=UTC)),
+        ]
 
 
 class TestCachedSitemapView:
-    def test_cached_sitemap_view_returns_view(self):
-        sitemaps = {"static": StaticSitemap()}
-        view = cached_sitemap_view(sitemaps)
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        yield
+        cache.clear()
+
+    def test_cached_sitemap_view_streams_and_caches(self):
+        view = cached_sitemap_view({"items": ItemSitemap})
+
+        response = view(self.factory.get("/sitemap/items.xml", {"p": 2}))
+
+        assert isinstance(response, StreamingHttpResponse)
+        content = b"".join(response.streaming_content)
+        assert f"<loc>{settings.SITE_URL}/items/b</loc>".encode() in content
+        assert b"/items/a" not in content
+        assert cache.get(get_cache_key("/sitemap/items.xml", 2)) == content
+
+        response = view(self.factory.get("/sitemap/items.xml", {"p": 2}))
+
+        assert isinstance(response, HttpResponse)
+        assert response.content == content
+
+    @pytest.mark.parametrize("page", ["0", "3", "abc"])
+    def test_cached_sitemap_view_invalid_page(self, page):
+        view = cached_sitemap_view({"items": ItemSitemap})
+
+        with pytest.raises(Http404):
+            view(self.factory.get("/sitemap/items.xml", {"p": page}))
 
-        assert callable(view)
+    def test_cached_sitemap_index_view(self):
+        view = cached_sitemap_index_view({"items": ItemSitemap})
 
-        factory = RequestFactory()
-        request = factory.get("/sitemap.xml")
-        with patch("apps.sitemap.views.sitemap") as mock_sitemap:
-            mock_sitemap.return_value = HttpResponse("ok")
-            response = view(request)
+        response = view(self.factory.get("/sitemap.xml"))
+        content = b"".join(response.streaming_content).decode()
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.content == b"ok"
+        assert "<sitemapindex" in content
+        assert f"<loc>{settings.SITE_URL}/sitemap/items.xml</loc>" in content
+        assert f"<loc>{settings.SITE_URL}/sitemap/items.xml?p=2</loc>" in content
+        assert cache.get(get_cache_key("/sitemap.xml")) == content.encode()
@@ -15,11 +15,16 @@ class TestMemberSitemap:
 
     @patch("apps.sitemap.views.member.User")
     def test_items(self, mock_user):
-        mock_obj = MagicMock(is_indexable=True)
-        mock_user.objects.filter.return_value.order_by.return_value = [mock_obj]
+        mock_obj = MagicMock()
+        mock_queryset = mock_user.objects.indexable.return_value.only.return_value
+        mock_queryset.order_by.return_value = [mock_obj]
         sitemap = MemberSitemap()
 
         assert list(sitemap.items()) == [mock_obj]
+        mock_user.objects.indexable.return_value.only.assert_called_once_with(
+            "created_at", "login", "updated_at"
+        )
+        mock_queryset.order_by.assert_called_once_with("-updated_at", "-created_at")
 
     def test_limit(self):
         sitemap = MemberSitemap()
@@ -18,15 +18,21 @@ class TestRepositorySitemap:
 
     @patch("apps.sitemap.views.repository.Repository")
     def test_items(self, mock_repository):
-        mock_obj = MagicMock(is_indexable=True)
-        mock_queryset = MagicMock()
-        mock_queryset.__iter__ = lambda _: iter([mock_obj])
-        mock_repository.objects.order_by.return_value = mock_queryset
+        mock_obj = MagicMock()
+        mock_queryset = mock_repository.objects.filter.return_value.select_related.return_value
+        mock_queryset.only.return_value.distinct.return_value.order_by.return_value = [mock_obj]
 
         sitemap = RepositorySitemap()
 
         result = list(sitemap.items())
         assert result == [mock_obj]
+        mock_repository.objects.filter.assert_called_once_with(
+            is_archived=False,
+            is_empty=False,
+            is_template=False,
+            organization__isnull=False,
+            project__isnull=False,
+        )
 
     def test_lastmod(self):
         dt = timezone.now()
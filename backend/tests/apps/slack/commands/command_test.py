@@ -97,3 +97,19 @@ class TestCommandBase:
         command_instance.handler(ack=ack, command=mock_command_payload, client=mock_client)
         ack.assert_called_once()
         mock_client.chat_postMessage.assert_not_called()
+
+    def test_handler_enqueues_command(
+        self, mocker, settings, command_instance, mock_command_payload
+    ):
+        """Tests that the command is processed in the background when the queue is enabled."""
+        settings.SLACK_COMMANDS_ENABLED = True
+        settings.SLACK_QUEUE_ENABLED = True
+        mock_enqueue_command = mocker.patch("apps.slack.commands.command.enqueue_command")
+        ack = MagicMock()
+        mock_client = MagicMock()
+
+        command_instance.handler(ack=ack, command=mock_command_payload, client=mock_client)
+
+        ack.assert_called_once()
+        mock_enqueue_command.assert_called_once_with(command_instance, mock_command_payload)
+        mock_client.chat_postMessage.assert_not_called()
@@ -162,6 +162,48 @@ class TestQuestionDetector:
 
         assert detector.is_owasp_question(question.lower()), f"Failed for: {question}"
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "thanks!",
+            "lol :joy:",
+            "<https://owasp.org/?page=1>",
+            "sure, sounds good <@U123ABC>",
+            "good morning everyone",
+        ],
+    )
+    def test_is_owasp_question_rejected_by_prefilter(self, detector, text, monkeypatch):
+        """Test that obvious non-questions are rejected before retrieval and OpenAI calls."""
+        mock_openai_method = MagicMock(return_value=True)
+        monkeypatch.setattr(detector, "is_owasp_question_with_openai", mock_openai_method)
+
+        assert not detector.is_owasp_question(text)
+        detector.retriever.retrieve.assert_not_called()
+        mock_openai_method.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("What is Python?", True),
+            ("how do I cook pasta", True),
+            ("I need help with threat modeling", True),
+            ("<@U123ABC> what's the best owasp tool", True),
+            ("honest opinion on lunch", False),
+            ("ok", False),
+        ],
+    )
+    def test_is_question_candidate(self, detector, text, expected):
+        """Test the local question pre-filter."""
+        assert detector.is_question_candidate(text) is expected
+
+    def test_is_question_candidate_stats(self, detector):
+        """Test that the pre-filter pass-through stats are tracked."""
+        detector.is_question_candidate("What is OWASP?")
+        detector.is_question_candidate("thanks!")
+        detector.is_question_candidate("thank you!")
+
+        assert detector.prefilter_stats == {True: 1, False: 2}
+
     def test_mocked_initialization(self):
         """Test with mocked QuestionDetector initialization."""
         with (
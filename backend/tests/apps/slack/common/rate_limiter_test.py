@@ -0,0 +1,65 @@
+"""Tests for the Slack Web API rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from apps.slack.common.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+
+    @pytest.fixture
+    def rate_limiter(self):
+        """Return a RateLimiter instance."""
+        return RateLimiter()
+
+    @pytest.fixture
+    def mock_sleep(self):
+        """Patch the token bucket clock so that sleeping advances it."""
+        now = [100.0]
+        with patch("apps.common.rate_limiter.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: now[0]
+            mock_time.sleep.side_effect = lambda delay: now.__setitem__(0, now[0] + delay)
+            yield mock_time.sleep
+
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            ("conversations_history", 50 / 60),
+            ("search_messages", 20 / 60),
+            ("users_info", 100 / 60),
+            ("unknown_method", 50 / 60),
+        ],
+    )
+    def test_get_rate(self, method, expected):
+        """Test that rates follow the method rate limit tier."""
+        assert RateLimiter.get_rate(method) == pytest.approx(expected)
+
+    def test_get_bucket(self, rate_limiter):
+        """Test that each method gets its own bucket."""
+        bucket = rate_limiter.get_bucket("users_info")
+
+        assert rate_limiter.get_bucket("users_info") is bucket
+        assert rate_limiter.get_bucket("conversations_history") is not bucket
+        assert bucket.rate == pytest.approx(100 / 60)
+
+    def test_wait_spaces_calls_per_method(self, mock_sleep, rate_limiter):
+        """Test that calls of a method are spaced while other methods are not blocked."""
+        rate_limiter.wait("conversations_history")
+        rate_limiter.wait("users_info")
+        mock_sleep.assert_not_called()
+
+        rate_limiter.wait("conversations_history")
+        rate_limiter.wait("conversations_history")
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == pytest.approx([1.2, 1.2])
+
+    def test_pause(self, mock_sleep, rate_limiter):
+        """Test that a paused method waits for the pause to end."""
+        rate_limiter.pause("conversations_replies", 30)
+        rate_limiter.wait("conversations_replies")
+        rate_limiter.wait("users_info")
+
+        mock_sleep.assert_called_once_with(pytest.approx(30))
@@ -32,6 +32,10 @@ class TestEventBase:
         """Tests that the direct_message_template_path is derived correctly."""
         assert event_instance.direct_message_template_path == Path("events/mock_event.jinja")
 
+    def test_get_debounce_key_is_none_by_default(self, event_instance):
+        """Tests that debounced events aren't collapsed by default."""
+        assert event_instance.get_debounce_key({"user": "U1"}) is None
+
     def test_ephemeral_message_template_path_is_none_by_default(self, event_instance):
         """Tests that the ephemeral message path is None by default."""
         assert event_instance.ephemeral_message_template_path is None
@@ -47,6 +51,39 @@ class TestEventBase:
         ack.assert_called_once()
         mock_handle_event.assert_not_called()
 
+    def test_handler_enqueues_event(
+        self, mocker, settings, event_instance, mock_event_payload, mock_client
+    ):
+        """Tests that the event is processed in the background when the queue is enabled."""
+        settings.SLACK_EVENTS_ENABLED = True
+        settings.SLACK_QUEUE_ENABLED = True
+        mock_enqueue_event = mocker.patch("apps.slack.events.event.enqueue_event")
+        ack = MagicMock()
+        with patch.object(event_instance, "handle_event") as mock_handle_event:
+            event_instance.handler(event=mock_event_payload, client=mock_client, ack=ack)
+        ack.assert_called_once()
+        mock_enqueue_event.assert_called_once_with(event_instance, mock_event_payload)
+        mock_handle_event.assert_not_called()
+
+    def test_handler_ignores_event_retry(
+        self, mocker, settings, event_instance, mock_event_payload, mock_client
+    ):
+        """Tests that a retried event is acknowledged but not handled again."""
+        settings.SLACK_EVENTS_ENABLED = True
+        mock_is_duplicate_event = mocker.patch(
+            "apps.slack.events.event.is_duplicate_event", return_value=True
+        )
+        ack = MagicMock()
+        body = {"event_id": "Ev123"}
+        request = MagicMock(headers={"x-slack-retry-num": ["1"]})
+        with patch.object(event_instance, "handle_event") as mock_handle_event:
+            event_instance.handler(
+                event=mock_event_payload, client=mock_client, ack=ack, body=body, request=request
+            )
+        ack.assert_called_once()
+        mock_is_duplicate_event.assert_called_once_with(body, "1")
+        mock_handle_event.assert_not_called()
+
     def test_handler_catches_and_logs_generic_exception(
         self, mocker, settings, event_instance, mock_event_payload, mock_client
     ):
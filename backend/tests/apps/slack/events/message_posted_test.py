@@ -46,6 +46,19 @@ class TestMessagePosted:
         assert message_handler.event_type == "message"
         assert message_handler.question_detector is not None
 
+    @pytest.mark.parametrize(
+        ("event", "expected_key"),
+        [
+            ({"user": "U1", "ts": "1.0"}, "user:U1"),
+            ({"user": "U1", "thread_ts": "1.0", "ts": "2.0"}, "thread:1.0"),
+            ({"user": "U1", "subtype": "channel_join"}, None),
+            ({"bot_id": "B1"}, None),
+        ],
+    )
+    def test_get_debounce_key(self, message_handler, event, expected_key):
+        """Test that messages are collapsed per thread and per user."""
+        assert message_handler.get_debounce_key(event) == expected_key
+
     def test_handle_event_ignores_subtype_messages(self, message_handler):
         """Test that messages with subtype are ignored."""
         event = {
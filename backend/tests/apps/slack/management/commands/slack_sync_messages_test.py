@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock
 
 from django.core.management import call_command
+from slack_sdk.errors import SlackApiError
 
 from apps.slack.management.commands.slack_sync_messages import Command
 
@@ -26,7 +27,7 @@ class TestPopulateSlackMessages:
         mock_queryset.exists.return_value = True
         mock_queryset.__iter__.return_value = [mock_workspace_instance]
         mock_workspace.objects.all.return_value = mock_queryset
-        mock_conversation.objects.filter.return_value = [MagicMock()]
+        mock_conversation.objects.filter.return_value = [MagicMock(latest_synced_message_ts="")]
 
         mock_client_instance = MagicMock()
         mock_webclient.return_value = mock_client_instance
@@ -48,6 +49,7 @@ class TestPopulateSlackMessages:
 
         mock_message_with_replies = MagicMock()
         mock_message_with_replies.has_replies = True
+        mock_message_with_replies.raw_data = {}
         mock_message_without_replies = MagicMock()
         mock_message_without_replies.has_replies = False
 
@@ -90,3 +92,51 @@ class TestPopulateSlackMessages:
 
         mock_logger.error.assert_called_once_with("test_method API call failed")
         mock_stdout.write.assert_called_once()
+
+    def test_fetch_messages_advances_latest_synced_message_ts(self, mocker):
+        """Tests that the latest synced timestamp is saved once the history walk succeeds."""
+        mocker.patch(f"{self.target_module}.Message")
+        conversation = MagicMock(latest_synced_message_ts="100.000")
+        command = Command()
+        command.stdout = MagicMock()
+        mocker.patch.object(Command, "_create_message", return_value=None)
+        mocker.patch.object(
+            Command,
+            "_call_slack_api",
+            side_effect=[
+                {"messages": [{"ts": "300.000"}], "response_metadata": {"next_cursor": "c"}},
+                {"messages": [{"ts": "200.000"}]},
+            ],
+        )
+
+        command._fetch_messages(
+            batch_size=2, client=MagicMock(), conversation=conversation, delay=0, max_retries=1
+        )
+
+        assert command._call_slack_api.call_args_list[0].kwargs["oldest"] == "100.000"
+        assert conversation.latest_synced_message_ts == "300.000"
+        conversation.save.assert_called_once_with(update_fields=["latest_synced_message_ts"])
+
+    def test_fetch_messages_keeps_latest_synced_message_ts_on_error(self, mocker):
+        """Tests that an interrupted history walk doesn't advance the latest synced timestamp."""
+        mocker.patch(f"{self.target_module}.Message")
+        conversation = MagicMock(latest_synced_message_ts="")
+        command = Command()
+        command.stdout = MagicMock()
+        mocker.patch.object(Command, "_create_message", return_value=None)
+        mocker.patch.object(
+            Command,
+            "_call_slack_api",
+            side_effect=[
+                {"messages": [{"ts": "300.000"}], "response_metadata": {"next_cursor": "c"}},
+                SlackApiError("error", {"error": "internal_error"}),
+            ],
+        )
+
+        command._fetch_messages(
+            batch_size=1, client=MagicMock(), conversation=conversation, delay=0, max_retries=1
+        )
+
+        assert command._call_slack_api.call_args_list[0].kwargs["oldest"] == "0"
+        assert conversation.latest_synced_message_ts == ""
+        conversation.save.assert_not_called()
@@ -0,0 +1,178 @@
+"""Tests for Slack events and commands background processing."""
+
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.slack.services.handlers import (
+    enqueue_command,
+    enqueue_event,
+    is_duplicate_event,
+    process_command,
+    process_debounced_events,
+    process_event,
+)
+
+
+class MockEvent:
+    event_type = "message"
+    is_debounced = False
+
+
+class MockCommand:
+    pass
+
+
+MOCK_EVENT_PATH = f"{__name__}.MockEvent"
+
+
+class TestIsDuplicateEvent:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def test_first_delivery(self):
+        assert not is_duplicate_event({"event_id": "Ev1"})
+
+    def test_retry(self):
+        assert not is_duplicate_event({"event_id": "Ev2"})
+        assert is_duplicate_event({"event_id": "Ev2"}, "1")
+
+    def test_retry_of_missed_event(self):
+        assert not is_duplicate_event({"event_id": "Ev3"}, "2")
+
+    def test_without_event_id(self):
+        assert not is_duplicate_event({})
+        assert not is_duplicate_event({})
+
+
+@patch("apps.slack.services.handlers.django_rq")
+class TestEnqueue:
+    def test_enqueue_command(self, mock_django_rq):
+        command = {"user_id": "U123"}
+
+        enqueue_command(MockCommand(), command)
+
+        mock_django_rq.get_queue.assert_called_once_with("ai")
+        mock_django_rq.get_queue.return_value.enqueue.assert_called_once_with(
+            process_command, f"{__name__}.MockCommand", command
+        )
+
+    def test_enqueue_event(self, mock_django_rq):
+        event = {"channel": "C123"}
+
+        enqueue_event(MockEvent(), event)
+
+        mock_queue = mock_django_rq.get_queue.return_value
+        mock_queue.enqueue.assert_called_once_with(process_event, MOCK_EVENT_PATH, event)
+        mock_queue.connection.rpush.assert_not_called()
+
+    def test_enqueue_debounced_event(self, mock_django_rq, settings):
+        settings.SLACK_EVENTS_DEBOUNCE_SECONDS = 5
+        handler = MockEvent()
+        handler.is_debounced = True
+        event = {"channel": "C123", "text": "Hello"}
+        mock_queue = mock_django_rq.get_queue.return_value
+        mock_queue.connection.set.return_value = True
+
+        enqueue_event(handler, event)
+
+        mock_queue.connection.rpush.assert_called_once_with(
+            "slack:events:message:C123", json.dumps(event)
+        )
+        mock_queue.connection.set.assert_called_once_with(
+            "slack:events:message:C123:scheduled", 1, nx=True, ex=50
+        )
+        mock_queue.enqueue_in.assert_called_once_with(
+            timedelta(seconds=5),
+            process_debounced_events,
+            MOCK_EVENT_PATH,
+            "slack:events:message:C123",
+        )
+        mock_queue.enqueue.assert_not_called()
+
+    def test_enqueue_debounced_event_already_scheduled(self, mock_django_rq):
+        handler = MockEvent()
+        handler.is_debounced = True
+        mock_queue = mock_django_rq.get_queue.return_value
+        mock_queue.connection.set.return_value = False
+
+        enqueue_event(handler, {"channel": "C123"})
+
+        mock_queue.connection.rpush.assert_called_once()
+        mock_queue.enqueue_in.assert_not_called()
+
+
+@patch("apps.slack.services.handlers.SlackConfig")
+@patch("apps.slack.services.handlers.get_handler")
+class TestProcess:
+    def test_process_command(self, mock_get_handler, mock_slack_config):
+        command = {"user_id": "U123"}
+
+        process_command("path.Command", command)
+
+        mock_get_handler.assert_called_once_with("path.Command")
+        mock_get_handler.return_value.process_command.assert_called_once_with(
+            command, mock_slack_config.app.client
+        )
+
+    def test_process_event(self, mock_get_handler, mock_slack_config):
+        event = {"channel": "C123"}
+
+        process_event("path.Event", event)
+
+        mock_get_handler.return_value.process_event.assert_called_once_with(
+            event, mock_slack_config.app.client
+        )
+
+    def test_process_event_without_app(self, mock_get_handler, mock_slack_config):
+        mock_slack_config.app = None
+
+        process_event("path.Event", {})
+
+        mock_get_handler.assert_not_called()
+
+    @patch("apps.slack.services.handlers.django_rq")
+    def test_process_debounced_events(self, mock_django_rq, mock_get_handler, mock_slack_config):
+        events = [{"text": "first"}, {"text": "second"}]
+        mock_get_handler.return_value.get_debounce_key.return_value = None
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute.return_value = [[json.dumps(event) for event in events], 2]
+        mock_django_rq.get_connection.return_value.pipeline.return_value = mock_pipeline
+
+        process_debounced_events("path.Event", "slack:events:message:C123")
+
+        mock_pipeline.lrange.assert_called_once_with("slack:events:message:C123", 0, -1)
+        mock_pipeline.delete.assert_called_once_with(
+            "slack:events:message:C123", "slack:events:message:C123:scheduled"
+        )
+        mock_get_handler.assert_called_once_with("path.Event")
+        assert mock_get_handler.return_value.process_event.call_args_list == [
+            ((event, mock_slack_config.app.client),) for event in events
+        ]
+
+    @patch("apps.slack.services.handlers.django_rq")
+    def test_process_debounced_events_collapses_by_key(
+        self, mock_django_rq, mock_get_handler, mock_slack_config
+    ):
+        events = [
+            {"user": "U1", "text": "first"},
+            {"user": "U2", "text": "second"},
+            {"text": "no key"},
+            {"user": "U1", "text": "third"},
+        ]
+        mock_get_handler.return_value.get_debounce_key.side_effect = lambda event: event.get(
+            "user"
+        )
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute.return_value = [[json.dumps(event) for event in events], 2]
+        mock_django_rq.get_connection.return_value.pipeline.return_value = mock_pipeline
+
+        process_debounced_events("path.Event", "slack:events:message:C123")
+
+        assert mock_get_handler.return_value.process_event.call_args_list == [
+            ((event, mock_slack_config.app.client),) for event in events[1:]
+        ]